@@ -0,0 +1,115 @@
+"""JSON リクエストボディの読み込みとバリデーション."""
+
+from typing import Any, List, Optional, Type, TypeVar
+
+from fastapi import Depends, Request, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import get_settings
+from app.utils.exceptions import RequestBodyException
+
+M = TypeVar("M", bound=BaseModel)
+
+# ボディ全体が JSON オブジェクトとして読めないことを表すエラー種別
+MALFORMED_ERROR_TYPES = frozenset({"json_invalid", "model_type"})
+
+
+def JsonBody(
+    model: Type[M],
+    max_bytes: Optional[int] = None,
+    limit_setting: str = "REQUEST_BODY_MAX_BYTES",
+) -> Any:
+    """リクエストボディを model として受け取る依存性.
+
+    ボディを 1 回だけバイト列として読み込み、model_validate_json で
+    JSON のパースとバリデーションを 1 パスで行う。
+    不正なボディは RequestBodyException となり、
+    request_body_exception_handler が 400 / 413 のレスポンスを返す。
+
+    Args:
+        model: バリデーションに使う Pydantic モデル
+        max_bytes: ボディの上限バイト数（None の場合は limit_setting の設定値）
+        limit_setting: 上限バイト数の設定項目（import 時ではなくリクエスト時に読む）
+
+    Example:
+        >>> async def create_task(task_create: TaskCreate = JsonBody(TaskCreate)): ...
+    """
+
+    async def dependency(request: Request) -> M:
+        limit = (
+            getattr(get_settings(), limit_setting) if max_bytes is None else max_bytes
+        )
+        return parse_body(model, await read_body(request, limit))
+
+    return Depends(dependency)
+
+
+async def read_body(request: Request, max_bytes: int) -> bytes:
+    """上限を超えない範囲でボディを読み込む.
+
+    Content-Length が上限を超える場合は読み込まずに、
+    宣言がない（chunked など）場合は上限を超えた時点で読み込みをやめる。
+
+    Raises:
+        RequestBodyException: ボディが上限を超えた場合（413）
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise body_too_large(max_bytes)
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise body_too_large(max_bytes)
+    return bytes(body)
+
+
+def parse_body(model: Type[M], body: bytes) -> M:
+    """JSON のバイト列を model にバリデーション.
+
+    Raises:
+        RequestBodyException: JSON オブジェクトでない場合（「リクエストボディが不正です」）、
+            フィールドの検証に失敗した場合（「入力データが正しくありません」）
+    """
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+        malformed = [
+            error["msg"] for error in errors if error["type"] in MALFORMED_ERROR_TYPES
+        ]
+        if malformed:
+            raise RequestBodyException(malformed)
+        raise RequestBodyException(
+            format_validation_errors(errors), message="入力データが正しくありません"
+        )
+
+
+def format_validation_errors(errors: List[Any]) -> List[str]:
+    """バリデーションエラーを「フィールド: メッセージ」の形式にする."""
+    messages = []
+    for error in errors:
+        field = error["loc"][0] if error["loc"] else "unknown"
+        messages.append(f"{field}: {error['msg']}")
+    return messages
+
+
+def body_too_large(max_bytes: int) -> RequestBodyException:
+    """ボディが上限を超えた場合の例外."""
+    return RequestBodyException(
+        [f"リクエストボディは {max_bytes} バイト以内である必要があります"],
+        message="リクエストボディが大きすぎます",
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+    )
+
+
+async def request_body_exception_handler(
+    request: Request, exc: RequestBodyException
+) -> JSONResponse:
+    """RequestBodyException をエラーレスポンスに変換."""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"errors": exc.errors, "message": exc.message},
+    )
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from urllib.parse import urlencode
 
 from app.database import get_session
-from app.core.config import settings
+from app.core.config import get_settings
 from app.services.auth_service import auth_service
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -20,6 +20,7 @@ def generate_state() -> str:
 @router.get("/google/login")
 async def google_login(request: Request):
     """Initiate Google OAuth2 authentication flow"""
+    settings = get_settings()
     state = generate_state()
     redirect_uri = f"{settings.BACKEND_URL}/api/auth/google/callback"
 
@@ -56,6 +57,7 @@ async def google_callback(
     request: Request, code: str, state: str, db: AsyncSession = Depends(get_session)
 ):
     """Handle the callback from Google after user consent"""
+    settings = get_settings()
     stored_state = request.cookies.get("oauth_state")
     if not stored_state or stored_state != state:
         raise HTTPException(
@@ -97,6 +99,7 @@ async def google_callback(
 @router.post("/logout")
 async def logout():
     """Log out user by clearing their session cookie"""
+    settings = get_settings()
     response = JSONResponse(content={"message": "Successfully logged out"})
 
     delete_params = {
@@ -0,0 +1,70 @@
+"""ダッシュボード関連エンドポイント."""
+
+from fastapi import APIRouter, Query
+
+from app.database import async_session_factory
+from app.schemas.dashboard import (
+    DashboardLatestRefuel,
+    DashboardNote,
+    DashboardResponse,
+    DashboardVehicle,
+)
+from app.schemas.task import TaskResponse
+from app.security.deps import CurrentUser
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("", response_model=dict)
+async def get_dashboard(
+    current_user: CurrentUser,
+    task_limit: int = Query(5, ge=1, le=50, description="期日が近いタスクの取得数"),
+    note_limit: int = Query(5, ge=1, le=50, description="最近のノートの取得数"),
+) -> dict:
+    """ホーム画面用のダッシュボードを取得.
+
+    タスク件数・期日が近いタスク・車ごとの最新給油・最近更新されたノートを
+    1 リクエストで返します。各集計は別セッションで並行実行されます。
+
+    Args:
+        task_limit: 期日が近いタスクの取得数（デフォルト 5、最大 50）
+        note_limit: 最近のノートの取得数（デフォルト 5、最大 50）
+
+    Returns:
+        {
+            "data": DashboardResponse,
+            "message": "ダッシュボードを取得しました"
+        }
+    """
+    service = DashboardService(async_session_factory)
+    summary = await service.get_summary(
+        user_id=current_user.id, task_limit=task_limit, note_limit=note_limit
+    )
+
+    dashboard_response = DashboardResponse(
+        open_task_count=summary.open_task_count,
+        overdue_task_count=summary.overdue_task_count,
+        upcoming_tasks=[
+            TaskResponse.model_validate(task) for task in summary.upcoming_tasks
+        ],
+        vehicles=[
+            DashboardVehicle(
+                id=item.vehicle.id,
+                name=item.vehicle.name,
+                seq=item.vehicle.seq,
+                maker=item.vehicle.maker,
+                model=item.vehicle.model,
+                latest_refuel=DashboardLatestRefuel.model_validate(item.latest_refuel)
+                if item.latest_refuel
+                else None,
+            )
+            for item in summary.vehicles
+        ],
+        recent_notes=[DashboardNote.model_validate(note) for note in summary.recent_notes],
+    )
+
+    return {
+        "data": dashboard_response,
+        "message": "ダッシュボードを取得しました",
+    }
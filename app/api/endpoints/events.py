@@ -0,0 +1,71 @@
+"""変更通知（Server-Sent Events）エンドポイント."""
+
+from typing import Union
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+
+from app.core.config import get_settings
+from app.database import get_session
+from app.security.deps import CurrentUser
+from app.services.change_events import get_change_event_broker
+from app.utils.exceptions import ServiceUnavailableException
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+@router.get("", response_model=None)
+async def get_events(
+    current_user: CurrentUser,
+    db_session: AsyncSession = Depends(get_session),
+) -> Union[StreamingResponse, JSONResponse]:
+    """変更通知のストリーム
+
+    ログインユーザーのタスク・車・燃費記録・ノート・ノートカテゴリが
+    作成・更新・削除されるたびに、変更された行を Server-Sent Events で通知します
+
+    Args:
+        db_session: データベースセッション（認証のみに使用）
+
+    Returns:
+        text/event-stream
+            event: change（data: {"resource", "id", "op", "version"}）
+            event: reset（通知を取りこぼしたため、差分同期で再取得する）
+
+    Raises:
+        503: 変更通知が無効、または接続数が上限に達しています
+    """
+    change_event_broker = get_change_event_broker()
+    if change_event_broker is None:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "error": "変更通知は無効です",
+                "message": "変更通知を利用できません",
+            },
+        )
+    try:
+        subscription = change_event_broker.subscribe(current_user.id)
+    except ServiceUnavailableException as e:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "error": str(e),
+                "message": "変更通知を利用できません",
+            },
+        )
+
+    # ストリーム中に接続プールの接続を保持しないよう、認証に使ったセッションを閉じる
+    await db_session.close()
+
+    return StreamingResponse(
+        change_event_broker.stream(
+            subscription, get_settings().EVENTS_HEARTBEAT_SECONDS
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # ストリームが始まらずに終わった場合も購読を解除する
+        background=BackgroundTask(change_event_broker.unsubscribe, subscription),
+    )
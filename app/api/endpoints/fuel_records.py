@@ -1,13 +1,13 @@
 """燃費記録関連エンドポイント."""
 
-from typing import Union
+from typing import Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
-from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.body import JsonBody
 from app.database import get_session
 from app.schemas.fuel_record import (
     FuelRecordCreate,
@@ -16,6 +16,7 @@ from app.schemas.fuel_record import (
 )
 from app.security.deps import CurrentUser
 from app.services.fuel_record_service import FuelRecordService
+from app.services.response_cache import FUEL_RECORD, cached_response
 from app.utils.exceptions import NotFoundException
 
 router = APIRouter(
@@ -25,19 +26,20 @@ router = APIRouter(
 
 
 @router.get("", response_model=dict)
+@cached_response(FUEL_RECORD, coalesce=True)
 async def list_fuel_records(
     current_user: CurrentUser,
-    vehicle_id: UUID = Query(..., description="車 ID"),
+    vehicle_id: Optional[UUID] = Query(None, description="車 ID（省略時はすべての車）"),
     skip: int = Query(0, ge=0, description="スキップするレコード数"),
     limit: int = Query(100, ge=1, le=1000, description="取得するレコード数"),
     db_session: AsyncSession = Depends(get_session),
 ) -> dict:
     """燃費記録一覧取得
 
-    指定した車の燃費記録を取得します（新規順）
+    指定した車（省略時はすべての車）の燃費記録を取得します（新規順）
 
     Args:
-        vehicle_id: 車 ID
+        vehicle_id: 車 ID（省略時はすべての車）
         skip: スキップするレコード数（デフォルト 0）
         limit: 取得するレコード数（デフォルト 100、最大 1000）
         db_session: データベースセッション
@@ -49,36 +51,15 @@ async def list_fuel_records(
         }
     """
     service = FuelRecordService(db_session)
-    fuel_records = await service.list_fuel_records(
+    fuel_records = await service.list_fuel_record_rows(
         user_id=current_user.id,
         vehicle_id=vehicle_id,
         limit=limit,
         offset=skip,
     )
 
-    fuel_record_responses = [
-        FuelRecordResponse(
-            id=item.record.id,
-            vehicle_id=item.record.vehicle_id,
-            user_id=item.record.user_id,
-            refuel_datetime=item.record.refuel_datetime,
-            total_mileage=item.record.total_mileage,
-            fuel_type=item.record.fuel_type,
-            unit_price=item.record.unit_price,
-            total_cost=item.record.total_cost,
-            is_full_tank=item.record.is_full_tank,
-            gas_station_name=item.record.gas_station_name,
-            distance_traveled=item.distance_traveled,
-            fuel_amount=item.fuel_amount,
-            fuel_efficiency=item.fuel_efficiency,
-            created_at=item.record.created_at,
-            updated_at=item.record.updated_at,
-        )
-        for item in fuel_records
-    ]
-
     return {
-        "data": fuel_record_responses,
+        "data": fuel_records,
         "message": "燃費記録一覧を取得しました",
     }
 
@@ -86,7 +67,7 @@ async def list_fuel_records(
 @router.post("", response_model=None, status_code=status.HTTP_201_CREATED)
 async def create_fuel_record(
     current_user: CurrentUser,
-    request: Request,
+    fuel_record_create: FuelRecordCreate = JsonBody(FuelRecordCreate),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """燃費記録作成
@@ -95,7 +76,7 @@ async def create_fuel_record(
     新規燃費記録を作成します。作成された燃費記録はレスポンス本体に返されます
 
     Args:
-        request: リクエストオブジェクト
+        fuel_record_create: 燃費記録作成データ
         db_session: データベースセッション
 
     Returns:
@@ -105,37 +86,9 @@ async def create_fuel_record(
         }
 
     Raises:
-        422: リクエストボディのバリデーションエラー
+        400: リクエストボディのバリデーションエラー
+        413: リクエストボディが大きすぎます
     """
-    try:
-        # JSON をパースして FuelRecordCreate にバリデーション
-        body = await request.json()
-        fuel_record_create = FuelRecordCreate(**body)
-    except ValidationError as e:
-        # Pydantic バリデーションエラーを 400 で返す
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
-        # JSON パースエラーなど
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
-            },
-        )
-
     service = FuelRecordService(db_session)
     fuel_record = await service.create_fuel_record(fuel_record_create, current_user.id)
 
@@ -148,6 +101,7 @@ async def create_fuel_record(
 
 
 @router.get("/{fuel_record_id}", response_model=None)
+@cached_response(FUEL_RECORD)
 async def get_fuel_record(
     current_user: CurrentUser,
     fuel_record_id: UUID,
@@ -194,7 +148,7 @@ async def get_fuel_record(
 async def update_fuel_record(
     current_user: CurrentUser,
     fuel_record_id: UUID,
-    request: Request,
+    fuel_record_update: FuelRecordUpdate = JsonBody(FuelRecordUpdate),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """燃費記録更新
@@ -204,7 +158,7 @@ async def update_fuel_record(
 
     Args:
         fuel_record_id: 燃費記録 ID
-        request: リクエストオブジェクト
+        fuel_record_update: 燃費記録更新データ
         db_session: データベースセッション
 
     Returns:
@@ -216,36 +170,8 @@ async def update_fuel_record(
     Raises:
         400: リクエストボディのバリデーションエラー
         404: 燃費記録が見つかりません
+        413: リクエストボディが大きすぎます
     """
-    try:
-        # JSON をパースして FuelRecordUpdate にバリデーション
-        body = await request.json()
-        fuel_record_update = FuelRecordUpdate(**body)
-    except ValidationError as e:
-        # Pydantic バリデーションエラーを 400 で返す
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
-        # JSON パースエラーなど
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
-            },
-        )
-
     service = FuelRecordService(db_session)
     try:
         fuel_record = await service.update_fuel_record(
@@ -0,0 +1,61 @@
+"""liveness / readiness プローブ・メトリクス用エンドポイント."""
+
+from typing import Union
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from app.database import statement_cache_stats
+from app.services.health_service import get_health_checker
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/livez")
+async def livez() -> dict:
+    """liveness プローブ.
+
+    プロセスがリクエストに応答できることのみを示し、DB には接続しない。
+    """
+    return {"status": "ok"}
+
+
+@router.get("/readyz", response_model=None)
+async def readyz() -> Union[dict, JSONResponse]:
+    """readiness プローブ.
+
+    DB ping とコネクションプールの状態を確認する（結果は一定間隔キャッシュ）。
+    プール枯渇中・DB 接続不可・シャットダウン中は 503 を返す。
+
+    Returns:
+        {
+            "status": "ready" | "not_ready",
+            "checks": {"pool": "ok", "database": "ok"}
+        }
+    """
+    result = await get_health_checker().check_readiness()
+    if not result.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "not_ready", "checks": result.checks},
+        )
+
+    return {"status": "ready", "checks": result.checks}
+
+
+@router.get("/metrics")
+async def metrics() -> dict:
+    """プロセス内のメトリクス.
+
+    SQLAlchemy のコンパイル済み SQL キャッシュのヒット数・ヒット率を返す
+    （ワーカープロセスごとの起動時からの累計、DB には接続しない）。
+
+    Returns:
+        {
+            "sql_compiled_cache": {
+                "hits": int, "misses": int, "hit_rate": float,
+                "size": int, "capacity": int
+            }
+        }
+    """
+    return {"sql_compiled_cache": statement_cache_stats.snapshot()}
@@ -1,48 +1,60 @@
 """ノートカテゴリ関連エンドポイント."""
 
-from typing import List, Union
+from typing import Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
-from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.body import JsonBody
 from app.database import get_session
-from app.models.note_category import NoteCategory
 from app.schemas.note_category import (
     NoteCategoryCreate,
     NoteCategoryResponse,
     NoteCategoryUpdate,
 )
 from app.security.deps import CurrentUser
-from app.services.note_category_service import NoteCategoryService
+from app.services.note_category_service import (
+    NoteCategoryList,
+    NoteCategoryService,
+)
+from app.services.response_cache import NOTE_CATEGORY, cached_response
 from app.utils.exceptions import NotFoundException
 
 router = APIRouter(prefix="/note-categories", tags=["note-categories"])
 
 
 @router.get("", response_model=dict)
+@cached_response(NOTE_CATEGORY, coalesce=True)
 async def list_categories(
     current_user: CurrentUser,
     skip: int = Query(0, ge=0, description="スキップするレコード数"),
     limit: int = Query(100, ge=1, le=1000, description="取得するレコード数"),
     db_session: AsyncSession = Depends(get_session),
 ) -> dict:
-    """カテゴリ一覧を取得."""
+    """カテゴリ一覧を取得.
+
+    各カテゴリにはノート数（note_count）が含まれ、
+    未分類ノートの件数は uncategorized_count で返します。
+    """
     service = NoteCategoryService(db_session)
-    categories: List[NoteCategory] = await service.list_categories(
+    category_list: NoteCategoryList = await service.list_categories(
         user_id=current_user.id,
         skip=skip,
         limit=limit,
     )
 
     category_responses = [
-        NoteCategoryResponse.model_validate(category) for category in categories
+        NoteCategoryResponse.model_validate(item.category).model_copy(
+            update={"note_count": item.note_count}
+        )
+        for item in category_list.categories
     ]
 
     return {
         "data": category_responses,
+        "uncategorized_count": category_list.uncategorized_count,
         "message": "カテゴリ一覧を取得しました",
     }
 
@@ -50,36 +62,10 @@ async def list_categories(
 @router.post("", response_model=None, status_code=status.HTTP_201_CREATED)
 async def create_category(
     current_user: CurrentUser,
-    request: Request,
+    category_create: NoteCategoryCreate = JsonBody(NoteCategoryCreate),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """新規カテゴリを作成."""
-    try:
-        body = await request.json()
-        category_create = NoteCategoryCreate(**body)
-    except ValidationError as e:
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
-            },
-        )
-
     service = NoteCategoryService(db_session)
     created_category = await service.create_category(category_create, current_user.id)
 
@@ -90,6 +76,7 @@ async def create_category(
 
 
 @router.get("/{category_id}", response_model=None)
+@cached_response(NOTE_CATEGORY)
 async def get_category(
     current_user: CurrentUser,
     category_id: UUID,
@@ -118,36 +105,10 @@ async def get_category(
 async def update_category(
     current_user: CurrentUser,
     category_id: UUID,
-    request: Request,
+    category_update: NoteCategoryUpdate = JsonBody(NoteCategoryUpdate),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """カテゴリを更新."""
-    try:
-        body = await request.json()
-        category_update = NoteCategoryUpdate(**body)
-    except ValidationError as e:
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
-            },
-        )
-
     service = NoteCategoryService(db_session)
     try:
         updated_category = await service.update_category(
@@ -3,17 +3,34 @@
 from typing import List, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
-from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.body import JsonBody
 from app.database import get_session
-from app.models.note import Note
-from app.schemas.note import NoteCreate, NoteResponse, NoteUpdate
+from app.schemas.note import (
+    NoteBodyPatch,
+    NoteBodyPatchResponse,
+    NoteCreate,
+    NoteDetailResponse,
+    NoteResponse,
+    NoteSummaryResponse,
+    NoteUpdate,
+    compute_body_hash,
+)
 from app.security.deps import CurrentUser
-from app.services.note_service import NoteService
-from app.utils.exceptions import NotFoundException
+from app.services.note_service import (
+    DEFAULT_EXCERPT_LENGTH,
+    NoteService,
+    NoteWithCategory,
+)
+from app.services.response_cache import NOTE, cached_response
+from app.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
 
 router = APIRouter(prefix="/notes", tags=["notes"])
 
@@ -28,25 +45,57 @@ def _not_found_message(error: NotFoundException) -> str:
 
 
 @router.get("", response_model=dict)
+@cached_response(NOTE, coalesce=True)
 async def list_notes(
     current_user: CurrentUser,
     skip: int = Query(0, ge=0, description="スキップするレコード数"),
     limit: int = Query(100, ge=1, le=1000, description="取得するレコード数"),
+    summary: bool = Query(False, description="本文の代わりに抜粋を返す"),
+    excerpt_length: int = Query(
+        DEFAULT_EXCERPT_LENGTH, ge=1, le=1000, description="抜粋の文字数"
+    ),
     db_session: AsyncSession = Depends(get_session),
 ) -> dict:
     """ノート一覧を取得.
 
     既定の並び順はカテゴリ名の昇順、次にタイトルの昇順。
     カテゴリ未設定のノートは末尾に並びます。
+    各ノートにはカテゴリ名（category_name）が含まれます。
+
+    summary=true の場合、本文（body）は返さず先頭 excerpt_length 文字の
+    抜粋（excerpt）を返します。本文全体は GET /notes/{note_id} で取得します。
     """
     service = NoteService(db_session)
-    notes: List[Note] = await service.list_notes(
+    notes: List[NoteWithCategory] = await service.list_notes(
         user_id=current_user.id,
         skip=skip,
         limit=limit,
+        summary=summary,
+        excerpt_length=excerpt_length,
     )
 
-    note_responses = [NoteResponse.model_validate(note) for note in notes]
+    note_responses: List[Union[NoteResponse, NoteSummaryResponse]]
+    if summary:
+        note_responses = [
+            NoteSummaryResponse(
+                id=item.note.id,
+                user_id=item.note.user_id,
+                category_id=item.note.category_id,
+                category_name=item.category_name,
+                title=item.note.title,
+                excerpt=item.excerpt or "",
+                created_at=item.note.created_at,
+                updated_at=item.note.updated_at,
+            )
+            for item in notes
+        ]
+    else:
+        note_responses = [
+            NoteResponse.model_validate(item.note).model_copy(
+                update={"category_name": item.category_name}
+            )
+            for item in notes
+        ]
 
     return {
         "data": note_responses,
@@ -57,36 +106,12 @@ async def list_notes(
 @router.post("", response_model=None, status_code=status.HTTP_201_CREATED)
 async def create_note(
     current_user: CurrentUser,
-    request: Request,
+    note_create: NoteCreate = JsonBody(
+        NoteCreate, limit_setting="NOTE_REQUEST_BODY_MAX_BYTES"
+    ),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """新規ノートを作成."""
-    try:
-        body = await request.json()
-        note_create = NoteCreate(**body)
-    except ValidationError as e:
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
-            },
-        )
-
     service = NoteService(db_session)
     try:
         created_note = await service.create_note(note_create, current_user.id)
@@ -100,12 +125,13 @@ async def create_note(
         )
 
     return {
-        "data": NoteResponse.model_validate(created_note),
+        "data": NoteDetailResponse.model_validate(created_note),
         "message": "ノートが作成されました",
     }
 
 
 @router.get("/{note_id}", response_model=None)
+@cached_response(NOTE)
 async def get_note(
     current_user: CurrentUser,
     note_id: UUID,
@@ -125,7 +151,7 @@ async def get_note(
         )
 
     return {
-        "data": NoteResponse.model_validate(note),
+        "data": NoteDetailResponse.model_validate(note),
         "message": "ノートが取得されました",
     }
 
@@ -134,39 +160,49 @@ async def get_note(
 async def update_note(
     current_user: CurrentUser,
     note_id: UUID,
-    request: Request,
+    note_update: NoteUpdate = JsonBody(
+        NoteUpdate, limit_setting="NOTE_REQUEST_BODY_MAX_BYTES"
+    ),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """ノートを更新."""
+    service = NoteService(db_session)
     try:
-        body = await request.json()
-        note_update = NoteUpdate(**body)
-    except ValidationError as e:
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
+        updated_note = await service.update_note(note_id, note_update, current_user.id)
+    except NotFoundException as e:
         return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_404_NOT_FOUND,
             content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
+                "error": str(e),
+                "message": _not_found_message(e),
             },
         )
 
+    return {
+        "data": NoteDetailResponse.model_validate(updated_note),
+        "message": "ノートが更新されました",
+    }
+
+
+@router.patch("/{note_id}/body", response_model=None)
+async def patch_note_body(
+    current_user: CurrentUser,
+    note_id: UUID,
+    note_patch: NoteBodyPatch = JsonBody(
+        NoteBodyPatch, limit_setting="NOTE_REQUEST_BODY_MAX_BYTES"
+    ),
+    db_session: AsyncSession = Depends(get_session),
+) -> Union[dict, JSONResponse]:
+    """ノート本文を差分で更新.
+
+    base_hash（取得時の body_hash）を基準とした範囲置換を適用します。
+    基準の本文が更新されている場合は 409 を返します。
+    """
     service = NoteService(db_session)
     try:
-        updated_note = await service.update_note(note_id, note_update, current_user.id)
+        updated_note = await service.patch_note_body(
+            note_id, note_patch, current_user.id
+        )
     except NotFoundException as e:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -175,9 +211,29 @@ async def update_note(
                 "message": _not_found_message(e),
             },
         )
+    except ConflictException as e:
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={
+                "error": str(e),
+                "message": "ノートが他の変更で更新されています",
+            },
+        )
+    except ValidationException as e:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "errors": [str(e)],
+                "message": "入力データが正しくありません",
+            },
+        )
 
     return {
-        "data": NoteResponse.model_validate(updated_note),
+        "data": NoteBodyPatchResponse(
+            id=updated_note.id,
+            body_hash=compute_body_hash(updated_note.body),
+            updated_at=updated_note.updated_at,
+        ),
         "message": "ノートが更新されました",
     }
 
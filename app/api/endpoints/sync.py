@@ -0,0 +1,103 @@
+"""差分同期関連エンドポイント."""
+
+from typing import Optional, Union
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_session
+from app.models.vehicle import Vehicle
+from app.schemas.fuel_record import FuelRecordResponse
+from app.schemas.note import NoteResponse
+from app.schemas.note_category import NoteCategoryResponse
+from app.schemas.sync import SyncChangedRecords, SyncDeletedRecords, SyncResponse
+from app.schemas.task import TaskResponse
+from app.schemas.vehicle import VehicleResponse
+from app.security.deps import CurrentUser
+from app.services.sync_service import SyncService, decode_sync_token
+from app.utils.exceptions import ValidationException
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+def _vehicle_response(vehicle: Vehicle) -> VehicleResponse:
+    """Vehicle を VehicleResponse に変換."""
+    return VehicleResponse(
+        id=str(vehicle.id),
+        user_id=str(vehicle.user_id),
+        name=vehicle.name,
+        seq=vehicle.seq,
+        maker=vehicle.maker,
+        model=vehicle.model,
+        year=vehicle.year,
+        number=vehicle.number,
+        tank_capacity=vehicle.tank_capacity,
+        created_at=vehicle.created_at.isoformat(),  # type: ignore[union-attr]
+        updated_at=vehicle.updated_at.isoformat(),  # type: ignore[union-attr]
+    )
+
+
+@router.get("", response_model=None)
+async def get_sync(
+    current_user: CurrentUser,
+    since: Optional[str] = Query(
+        None, description="前回の同期で返されたトークン（省略時は全件）"
+    ),
+    db_session: AsyncSession = Depends(get_session),
+) -> Union[dict, JSONResponse]:
+    """差分同期
+
+    前回の同期以降に作成・更新・削除されたタスク・車・燃費記録・ノート・
+    ノートカテゴリと、次回の同期に使うトークンを返します
+
+    Args:
+        since: 前回の同期で返されたトークン（省略時は全件）
+        db_session: データベースセッション
+
+    Returns:
+        {
+            "data": SyncResponse,
+            "message": "同期データを取得しました"
+        }
+
+    Raises:
+        400: トークンが正しくありません
+    """
+    try:
+        position = decode_sync_token(since) if since else None
+    except ValidationException as e:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "error": str(e),
+                "message": "入力データが正しくありません",
+            },
+        )
+
+    changes = await SyncService(db_session).get_changes(current_user.id, position)
+    changed = changes.changed
+
+    sync_response = SyncResponse(
+        token=changes.token,
+        reset=changes.reset,
+        changed=SyncChangedRecords(
+            tasks=[TaskResponse.model_validate(task) for task in changed["tasks"]],
+            vehicles=[_vehicle_response(vehicle) for vehicle in changed["vehicles"]],
+            fuel_records=[
+                FuelRecordResponse.model_validate(record)
+                for record in changed["fuel_records"]
+            ],
+            notes=[NoteResponse.model_validate(note) for note in changed["notes"]],
+            note_categories=[
+                NoteCategoryResponse.model_validate(category)
+                for category in changed["note_categories"]
+            ],
+        ),
+        deleted=SyncDeletedRecords(**changes.deleted),
+    )
+
+    return {
+        "data": sync_response,
+        "message": "同期データを取得しました",
+    }
@@ -1,26 +1,33 @@
 """タスク関連エンドポイント."""
 
-from datetime import datetime
-from typing import List, Optional, Union
+from datetime import date, datetime
+from typing import Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
-from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.body import JsonBody
+from app.core.config import get_settings
 from app.database import get_session
 from app.models.base import JST
 from app.models.task import Task
 from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.services.response_cache import TASK, cached_response
 from app.services.task_service import TaskService
 from app.security.deps import CurrentUser
-from app.utils.exceptions import NotFoundException
+from app.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
 @router.get("", response_model=dict)
+@cached_response(TASK, vary_by_date=True, coalesce=True)
 async def list_tasks(
     current_user: CurrentUser,
     skip: int = Query(0, ge=0, description="スキップするレコード数"),
@@ -29,6 +36,25 @@ async def list_tasks(
         None,
         description="完了状態でフィルタ（true: 完了のみ、false: 未完了のみ、指定なし: 全件）",
     ),
+    due_before: Optional[date] = Query(
+        None, description="期日がこの日以前のタスクのみ（YYYY-MM-DD）"
+    ),
+    due_after: Optional[date] = Query(
+        None, description="期日がこの日以降のタスクのみ（YYYY-MM-DD）"
+    ),
+    overdue: Optional[bool] = Query(
+        None,
+        description="true: 期限切れ（未完了かつ期日が今日より前）のみ、false: 期限切れ以外",
+    ),
+    completed_since: Optional[datetime] = Query(
+        None, description="完了日時がこの日時以降のタスクのみ（ISO 8601）"
+    ),
+    q: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=255,
+        description="タイトルまたは説明に含まれる文字列",
+    ),
     db_session: AsyncSession = Depends(get_session),
 ) -> dict:
     """タスク一覧を取得.
@@ -36,10 +62,19 @@ async def list_tasks(
     期日が近い順（昇順）でソートされ、期日なしのタスクは
     作成日時の古い順で期日ありのタスクの後に表示されます。
 
+    繰り返しタスクは期間（due_after〜due_before、省略時は今日から
+    TASK_RECURRENCE_HORIZON_DAYS 日後まで）内の未完了の発生分が
+    recurrence_parent_id / occurrence_date 付きで含まれます。
+
     Args:
         skip: スキップするレコード数（デフォルト 0）
         limit: 取得するレコード数（デフォルト 100、最大 1000）
         is_completed: 完了状態でフィルタ（true: 完了のみ、false: 未完了のみ、指定なし: 全件）
+        due_before: 期日がこの日以前のタスクのみ
+        due_after: 期日がこの日以降のタスクのみ
+        overdue: 期限切れのタスクのみ（false で期限切れ以外）
+        completed_since: 完了日時がこの日時以降のタスクのみ
+        q: タイトルまたは説明に含まれる文字列（大文字小文字を区別しない）
         db_session: データベースセッション
 
     Returns:
@@ -48,30 +83,23 @@ async def list_tasks(
             "message": "タスク一覧を取得しました"
         }
     """
+    # 一覧は列を絞った TaskRow を読み込み、そのまま JSON にする
     service = TaskService(db_session)
-    tasks: List[Task] = await service.list_tasks(
-        user_id=current_user.id, skip=skip, limit=limit, is_completed=is_completed
+    task_rows = await service.list_task_rows(
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        is_completed=is_completed,
+        due_before=due_before,
+        due_after=due_after,
+        overdue=overdue,
+        completed_since=completed_since,
+        q=q,
+        recurrence_horizon_days=get_settings().TASK_RECURRENCE_HORIZON_DAYS,
     )
 
-    # Task を TaskResponse に変換
-    task_responses = [
-        TaskResponse(
-            id=task.id,
-            user_id=task.user_id,
-            title=task.title,
-            description=task.description,
-            is_completed=task.is_completed,
-            completed_at=task.completed_at,
-            due_date=task.due_date,
-            order=task.order,
-            created_at=task.created_at or datetime.now(JST),
-            updated_at=task.updated_at or datetime.now(JST),
-        )
-        for task in tasks
-    ]
-
     return {
-        "data": task_responses,
+        "data": task_rows,
         "message": "タスク一覧を取得しました",
     }
 
@@ -79,7 +107,7 @@ async def list_tasks(
 @router.post("", response_model=None, status_code=status.HTTP_201_CREATED)
 async def create_task(
     current_user: CurrentUser,
-    request: Request,
+    task_create: TaskCreate = JsonBody(TaskCreate),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """新規タスクを作成.
@@ -88,7 +116,7 @@ async def create_task(
     新規タスクを作成します。作成されたタスクはレスポンス本体に返されます。
 
     Args:
-        request: リクエストオブジェクト
+        task_create: タスク作成データ
         db_session: データベースセッション
 
     Returns:
@@ -98,37 +126,9 @@ async def create_task(
         }
 
     Raises:
-        422: リクエストボディのバリデーションエラー
+        400: リクエストボディのバリデーションエラー
+        413: リクエストボディが大きすぎます
     """
-    try:
-        # JSON をパースして TaskCreate にバリデーション
-        body = await request.json()
-        task_create = TaskCreate(**body)
-    except ValidationError as e:
-        # Pydantic バリデーションエラーを 400 で返す
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
-        # JSON パースエラーなど
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
-            },
-        )
-
     service = TaskService(db_session)
     created_task: Task = await service.create_task(task_create, current_user.id)
 
@@ -144,6 +144,9 @@ async def create_task(
         order=created_task.order,
         created_at=created_task.created_at or datetime.now(JST),
         updated_at=created_task.updated_at or datetime.now(JST),
+        recurrence_rule=created_task.recurrence_rule,
+        recurrence_parent_id=created_task.recurrence_parent_id,
+        occurrence_date=created_task.occurrence_date,
     )
 
     return {
@@ -153,6 +156,7 @@ async def create_task(
 
 
 @router.get("/{task_id}", response_model=None)
+@cached_response(TASK, vary_by_date=True)
 async def get_task(
     current_user: CurrentUser,
     task_id: UUID,
@@ -199,6 +203,9 @@ async def get_task(
         order=task.order,
         created_at=task.created_at or datetime.now(JST),
         updated_at=task.updated_at or datetime.now(JST),
+        recurrence_rule=task.recurrence_rule,
+        recurrence_parent_id=task.recurrence_parent_id,
+        occurrence_date=task.occurrence_date,
     )
 
     return {
@@ -211,7 +218,7 @@ async def get_task(
 async def update_task(
     current_user: CurrentUser,
     task_id: UUID,
-    request: Request,
+    task_update: TaskUpdate = JsonBody(TaskUpdate),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """タスクを更新.
@@ -221,7 +228,7 @@ async def update_task(
 
     Args:
         task_id: タスク ID
-        request: リクエストオブジェクト
+        task_update: タスク更新データ
         db_session: データベースセッション
 
     Returns:
@@ -231,42 +238,90 @@ async def update_task(
         }
 
     Raises:
-        400: リクエストボディのバリデーションエラー
+        400: リクエストボディのバリデーションエラー、繰り返しの指定が不正
         404: タスクが見つかりません
+        413: リクエストボディが大きすぎます
     """
+    service = TaskService(db_session)
     try:
-        # JSON をパースして TaskUpdate にバリデーション
-        body = await request.json()
-        task_update = TaskUpdate(**body)
-    except ValidationError as e:
-        # Pydantic バリデーションエラーを 400 で返す
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
+        updated_task: Task = await service.update_task(
+            task_id, task_update, current_user.id
+        )
+    except NotFoundException as e:
         return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_404_NOT_FOUND,
             content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
+                "error": str(e),
+                "message": "タスクが見つかりません",
             },
         )
-    except Exception as e:
-        # JSON パースエラーなど
+    except ValidationException as e:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
+                "error": str(e),
+                "message": "入力データが正しくありません",
             },
         )
 
+    # Task を TaskResponse に変換
+    task_response = TaskResponse(
+        id=updated_task.id,
+        user_id=updated_task.user_id,
+        title=updated_task.title,
+        description=updated_task.description,
+        is_completed=updated_task.is_completed,
+        completed_at=updated_task.completed_at,
+        due_date=updated_task.due_date,
+        order=updated_task.order,
+        created_at=updated_task.created_at or datetime.now(JST),
+        updated_at=updated_task.updated_at or datetime.now(JST),
+        recurrence_rule=updated_task.recurrence_rule,
+        recurrence_parent_id=updated_task.recurrence_parent_id,
+        occurrence_date=updated_task.occurrence_date,
+    )
+
+    return {
+        "data": task_response,
+        "message": "タスクが更新されました",
+    }
+
+
+@router.put("/{task_id}/occurrences/{occurrence_date}", response_model=None)
+async def update_task_occurrence(
+    current_user: CurrentUser,
+    task_id: UUID,
+    occurrence_date: date,
+    task_update: TaskUpdate = JsonBody(TaskUpdate),
+    db_session: AsyncSession = Depends(get_session),
+) -> Union[dict, JSONResponse]:
+    """繰り返しタスクの発生分を更新.
+
+    指定した発生日の発生分を完了・変更します（例: {"is_completed": true}）。
+    未保存の発生分はこの時点でタスクとして保存されます。
+
+    Args:
+        task_id: 繰り返しシリーズのタスク ID
+        occurrence_date: 発生日（YYYY-MM-DD）
+        task_update: タスク更新データ
+        db_session: データベースセッション
+
+    Returns:
+        {
+            "data": TaskResponse,
+            "message": "タスクが更新されました"
+        }
+
+    Raises:
+        400: リクエストボディのバリデーションエラー
+        404: 繰り返しタスクまたは発生分が見つかりません
+        409: 同じ発生分が同時に更新されました
+        413: リクエストボディが大きすぎます
+    """
     service = TaskService(db_session)
     try:
-        updated_task: Task = await service.update_task(
-            task_id, task_update, current_user.id
+        updated_task: Task = await service.update_occurrence(
+            task_id, occurrence_date, task_update, current_user.id
         )
     except NotFoundException as e:
         return JSONResponse(
@@ -276,6 +331,22 @@ async def update_task(
                 "message": "タスクが見つかりません",
             },
         )
+    except ValidationException as e:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "error": str(e),
+                "message": "入力データが正しくありません",
+            },
+        )
+    except ConflictException as e:
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={
+                "error": str(e),
+                "message": "タスクが同時に更新されました",
+            },
+        )
 
     # Task を TaskResponse に変換
     task_response = TaskResponse(
@@ -289,6 +360,9 @@ async def update_task(
         order=updated_task.order,
         created_at=updated_task.created_at or datetime.now(JST),
         updated_at=updated_task.updated_at or datetime.now(JST),
+        recurrence_rule=updated_task.recurrence_rule,
+        recurrence_parent_id=updated_task.recurrence_parent_id,
+        occurrence_date=updated_task.occurrence_date,
     )
 
     return {
@@ -297,6 +371,57 @@ async def update_task(
     }
 
 
+@router.delete(
+    "/{task_id}/occurrences/{occurrence_date}",
+    response_model=None,
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def skip_task_occurrence(
+    current_user: CurrentUser,
+    task_id: UUID,
+    occurrence_date: date,
+    db_session: AsyncSession = Depends(get_session),
+) -> Union[None, JSONResponse]:
+    """繰り返しタスクの発生分をスキップ.
+
+    指定した発生日の発生分を一覧に展開しないようにします。
+    シリーズ自体は削除されません。
+
+    Args:
+        task_id: 繰り返しシリーズのタスク ID
+        occurrence_date: 発生日（YYYY-MM-DD）
+        db_session: データベースセッション
+
+    Returns:
+        204 No Content
+
+    Raises:
+        404: 繰り返しタスクまたは発生分が見つかりません
+        409: 同じ発生分が同時に更新されました
+    """
+    service = TaskService(db_session)
+    try:
+        await service.skip_occurrence(task_id, occurrence_date, current_user.id)
+    except NotFoundException as e:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={
+                "error": str(e),
+                "message": "タスクが見つかりません",
+            },
+        )
+    except ConflictException as e:
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={
+                "error": str(e),
+                "message": "タスクが同時に更新されました",
+            },
+        )
+
+    return None
+
+
 @router.delete(
     "/{task_id}", response_model=None, status_code=status.HTTP_204_NO_CONTENT
 )
@@ -1,18 +1,24 @@
 """車両関連エンドポイント."""
 
 from datetime import datetime
-from typing import List, Union
+from typing import Literal, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
-from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.body import JsonBody
 from app.database import get_session
 from app.models.base import JST
 from app.models.vehicle import Vehicle
-from app.schemas.vehicle import VehicleCreate, VehicleResponse, VehicleUpdate
+from app.schemas.vehicle import (
+    VehicleCreate,
+    VehicleResponse,
+    VehicleUpdate,
+)
+from app.services.fuel_rollup_service import FuelRollupService, Granularity
+from app.services.response_cache import FUEL_RECORD, VEHICLE, cached_response
 from app.services.vehicle_service import VehicleService
 from app.security.deps import CurrentUser
 from app.utils.exceptions import NotFoundException
@@ -21,19 +27,27 @@ router = APIRouter(prefix="/vehicles", tags=["vehicles"])
 
 
 @router.get("", response_model=dict)
+@cached_response(VEHICLE, coalesce=True)
 async def list_vehicles(
     current_user: CurrentUser,
     skip: int = Query(0, ge=0, description="スキップするレコード数"),
     limit: int = Query(100, ge=1, le=1000, description="取得するレコード数"),
+    include: Optional[Literal["fuel_summary"]] = Query(
+        None,
+        description="追加で含める情報（fuel_summary: 最新走行距離・最終給油日時・直近燃費）",
+    ),
     db_session: AsyncSession = Depends(get_session),
 ) -> dict:
     """所有する車一覧を取得.
 
     作成日時の新しい順でソートされて返されます。
+    include=fuel_summary を指定すると、車ごとの最新給油サマリーを
+    1 クエリでまとめて取得して fuel_summary に含めます。
 
     Args:
         skip: スキップするレコード数（デフォルト 0）
         limit: 取得するレコード数（デフォルト 100、最大 1000）
+        include: 追加で含める情報（fuel_summary）
         db_session: データベースセッション
 
     Returns:
@@ -43,34 +57,15 @@ async def list_vehicles(
         }
     """
     service = VehicleService(db_session)
-    vehicles: List[Vehicle] = await service.list_vehicles(
-        user_id=current_user.id, skip=skip, limit=limit
+    vehicles = await service.list_vehicle_rows(
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        include_fuel_summary=include == "fuel_summary",
     )
 
-    # Vehicle を VehicleResponse に変換
-    vehicle_responses = [
-        VehicleResponse(
-            id=str(vehicle.id),
-            user_id=str(vehicle.user_id),
-            name=vehicle.name,
-            seq=vehicle.seq,
-            maker=vehicle.maker,
-            model=vehicle.model,
-            year=vehicle.year,
-            number=vehicle.number,
-            tank_capacity=vehicle.tank_capacity,
-            created_at=vehicle.created_at.isoformat()
-            if vehicle.created_at
-            else datetime.now(JST).isoformat(),
-            updated_at=vehicle.updated_at.isoformat()
-            if vehicle.updated_at
-            else datetime.now(JST).isoformat(),
-        )
-        for vehicle in vehicles
-    ]
-
     return {
-        "data": vehicle_responses,
+        "data": vehicles,
         "message": "車一覧を取得しました",
     }
 
@@ -78,7 +73,7 @@ async def list_vehicles(
 @router.post("", response_model=None, status_code=status.HTTP_201_CREATED)
 async def create_vehicle(
     current_user: CurrentUser,
-    request: Request,
+    vehicle_create: VehicleCreate = JsonBody(VehicleCreate),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """新規車を作成.
@@ -87,7 +82,7 @@ async def create_vehicle(
     新規車を作成します。作成された車はレスポンス本体に返されます。
 
     Args:
-        request: リクエストオブジェクト
+        vehicle_create: 車作成データ
         db_session: データベースセッション
 
     Returns:
@@ -97,37 +92,9 @@ async def create_vehicle(
         }
 
     Raises:
-        422: リクエストボディのバリデーションエラー
+        400: リクエストボディのバリデーションエラー
+        413: リクエストボディが大きすぎます
     """
-    try:
-        # JSON をパースして VehicleCreate にバリデーション
-        body = await request.json()
-        vehicle_create = VehicleCreate(**body)
-    except ValidationError as e:
-        # Pydantic バリデーションエラーを 400 で返す
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
-        # JSON パースエラーなど
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
-            },
-        )
-
     service = VehicleService(db_session)
     created_vehicle: Vehicle = await service.create_vehicle(
         vehicle_create, current_user.id
@@ -159,6 +126,7 @@ async def create_vehicle(
 
 
 @router.get("/{vehicle_id}", response_model=None)
+@cached_response(VEHICLE)
 async def get_vehicle(
     current_user: CurrentUser,
     vehicle_id: UUID,
@@ -218,11 +186,62 @@ async def get_vehicle(
     }
 
 
+@router.get("/{vehicle_id}/fuel-rollups", response_model=None)
+@cached_response(FUEL_RECORD)
+async def list_fuel_rollups(
+    current_user: CurrentUser,
+    vehicle_id: UUID,
+    granularity: Granularity = Query(
+        "month", description="集計単位（month: 月ごと、week: 週ごと、JST）"
+    ),
+    db_session: AsyncSession = Depends(get_session),
+) -> Union[dict, JSONResponse]:
+    """車の給油を期間ごとに集計して取得.
+
+    月（または週）ごとの給油回数・総費用・給油量・走行距離・平均単価を
+    期間の古い順で返します。燃費記録の書き込み時に更新される集計テーブルを
+    読むため、記録の件数によらず期間の数だけの行を取得します。
+
+    Args:
+        vehicle_id: 車 ID
+        granularity: 集計単位（month / week、デフォルト month）
+        db_session: データベースセッション
+
+    Returns:
+        {
+            "data": [FuelRollupRow, ...],
+            "message": "給油の集計を取得しました"
+        }
+
+    Raises:
+        404: 車が見つかりません
+    """
+    try:
+        await VehicleService(db_session).get_vehicle(vehicle_id, current_user.id)
+    except NotFoundException as e:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={
+                "error": str(e),
+                "message": "車が見つかりません",
+            },
+        )
+
+    rollups = await FuelRollupService(db_session).list_rollups(
+        current_user.id, vehicle_id, granularity
+    )
+
+    return {
+        "data": rollups,
+        "message": "給油の集計を取得しました",
+    }
+
+
 @router.put("/{vehicle_id}", response_model=None)
 async def update_vehicle(
     current_user: CurrentUser,
     vehicle_id: UUID,
-    request: Request,
+    vehicle_update: VehicleUpdate = JsonBody(VehicleUpdate),
     db_session: AsyncSession = Depends(get_session),
 ) -> Union[dict, JSONResponse]:
     """車情報を更新.
@@ -232,7 +251,7 @@ async def update_vehicle(
 
     Args:
         vehicle_id: 車 ID
-        request: リクエストオブジェクト
+        vehicle_update: 車更新データ
         db_session: データベースセッション
 
     Returns:
@@ -244,36 +263,8 @@ async def update_vehicle(
     Raises:
         400: リクエストボディのバリデーションエラー
         404: 車が見つかりません
+        413: リクエストボディが大きすぎます
     """
-    try:
-        # JSON をパースして VehicleUpdate にバリデーション
-        body = await request.json()
-        vehicle_update = VehicleUpdate(**body)
-    except ValidationError as e:
-        # Pydantic バリデーションエラーを 400 で返す
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            msg = error["msg"]
-            error_messages.append(f"{field}: {msg}")
-
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": error_messages,
-                "message": "入力データが正しくありません",
-            },
-        )
-    except Exception as e:
-        # JSON パースエラーなど
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "errors": [str(e)],
-                "message": "リクエストボディが不正です",
-            },
-        )
-
     service = VehicleService(db_session)
     try:
         updated_vehicle: Vehicle = await service.update_vehicle(
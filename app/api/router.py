@@ -4,9 +4,12 @@ from fastapi import APIRouter
 
 from app.api.endpoints import (
     auth,
+    dashboard,
+    events,
     fuel_records,
     note_categories,
     notes,
+    sync,
     tasks,
     users,
     vehicles,
@@ -42,3 +45,12 @@ router.include_router(note_categories.router)
 
 # ノートエンドポイントを登録
 router.include_router(notes.router)
+
+# ダッシュボードエンドポイントを登録
+router.include_router(dashboard.router)
+
+# 差分同期エンドポイントを登録
+router.include_router(sync.router)
+
+# 変更通知エンドポイントを登録
+router.include_router(events.router)
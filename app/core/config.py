@@ -1,5 +1,8 @@
 """Pydantic Settings を使用したアプリケーション設定."""
 
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,6 +20,13 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
 
+    # コネクションプール設定
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    # SQLAlchemy のコンパイル済み SQL キャッシュの件数（ヒット率は /metrics で確認）
+    DB_QUERY_CACHE_SIZE: int = 500
+
     @property
     def database_url(self) -> str:
         """個別の要素からデータベース URL を組み立てる."""
@@ -50,6 +60,98 @@ class Settings(BaseSettings):
     ENVIRONMENT: str
     LOG_LEVEL: str
 
+    # レスポンス圧縮設定
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESSION_LEVEL: int = 6
+    BROTLI_COMPRESSION_QUALITY: int = 4
+
+    # 本番サーバー設定（app/server.py）
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0  # 0 の場合は利用可能な CPU コア数
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE_TIMEOUT: int = 5
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+    SERVER_MAX_REQUESTS: int = 0  # 0 の場合はワーカーを再生成しない
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    # X-Forwarded-For / X-Forwarded-Proto を信頼するプロキシの IP（カンマ区切り、"*" はすべて）
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+    SERVER_ACCESS_LOG: bool = True
+
+    # ヘルスチェック設定（/readyz の DB 確認結果をキャッシュする秒数とタイムアウト）
+    HEALTH_CHECK_INTERVAL: float = 5.0
+    HEALTH_CHECK_TIMEOUT: float = 2.0
+
+    # アーカイブ設定（論理削除から保管日数を過ぎた行を *_archive テーブルへ移動）
+    # ARCHIVE_INTERVAL_SECONDS が 0 の場合はバックグラウンド実行しない
+    ARCHIVE_RETENTION_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_INTERVAL_SECONDS: float = 0
+
+    # バックグラウンドジョブ設定（app/services/job_queue.py）
+    # JOB_BACKEND=postgres で job テーブルを使う永続キュー、JOB_WORKERS=0 で無効（その場で実行）
+    JOB_BACKEND: Literal["memory", "postgres"] = "memory"
+    JOB_WORKERS: int = 2
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BACKOFF_SECONDS: float = 1.0
+    JOB_RETRY_BACKOFF_MAX_SECONDS: float = 60.0
+    JOB_QUEUE_MAXSIZE: int = 1000
+    JOB_DRAIN_TIMEOUT_SECONDS: float = 10.0
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_LEASE_SECONDS: float = 300.0
+
+    # 繰り返しタスク設定（一覧で期間未指定時に発生分を展開する日数）
+    TASK_RECURRENCE_HORIZON_DAYS: int = 30
+
+    # レート制限設定（app/middleware/rate_limit.py、ユーザーごとのトークンバケット）
+    # RATE_LIMIT_BACKEND=none で無効、memory はワーカープロセスごと、redis は全ワーカーで共有
+    RATE_LIMIT_BACKEND: Literal["none", "memory", "redis"] = "memory"
+    RATE_LIMIT_REDIS_URL: str = ""
+    RATE_LIMIT_READ_PER_MINUTE: float = 600
+    RATE_LIMIT_READ_BURST: int = 100
+    RATE_LIMIT_WRITE_PER_MINUTE: float = 120
+    RATE_LIMIT_WRITE_BURST: int = 20
+    RATE_LIMIT_EXPORT_PER_MINUTE: float = 6
+    RATE_LIMIT_EXPORT_BURST: int = 2
+
+    # レスポンスキャッシュ設定（app/services/response_cache.py）
+    # memory はプロセス内のため SERVER_WORKERS=1 のみ（複数ワーカーでは redis（CACHE_REDIS_URL））
+    CACHE_BACKEND: Literal["none", "memory", "redis"] = "none"
+    CACHE_TTL_SECONDS: float = 300.0
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_REDIS_URL: str = ""
+    # 燃費計算結果をプロセス内に保持する車の数（app/services/fuel_efficiency.py、0 で無効）
+    # 他のワーカーでの書き込みを検知するため CACHE_BACKEND=redis が必要（それ以外では使わない）
+    FUEL_HISTORY_CACHE_SIZE: int = 0
+
+    # リクエストボディの上限バイト数（app/api/body.py、超えた場合は 413）
+    # ノートは本文を含むため別の上限
+    REQUEST_BODY_MAX_BYTES: int = 64 * 1024
+    NOTE_REQUEST_BODY_MAX_BYTES: int = 1024 * 1024
+
+    # 変更通知設定（app/services/change_events.py、GET /api/events）
+    # EVENTS_BACKEND=none で無効、memory はワーカープロセスごと（SERVER_WORKERS=1 のみ）、
+    # postgres は LISTEN / NOTIFY で全ワーカーへ配信
+    EVENTS_BACKEND: Literal["none", "memory", "postgres"] = "none"
+    EVENTS_MAX_CONNECTIONS: int = 1000
+    EVENTS_MAX_CONNECTIONS_PER_USER: int = 10
+    EVENTS_QUEUE_SIZE: int = 100
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    EVENTS_RECONNECT_SECONDS: float = 5.0
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """設定インスタンスを取得（初回呼び出し時に生成してキャッシュ）."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    """グローバル設定インスタンス ``settings`` を初回アクセス時に生成.
 
-# グローバル設定インスタンス
-settings = Settings()
+    ``from app.core.config import settings`` は従来通り利用できるが、
+    モジュールの import だけでは環境変数・.env を読み込まない。
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
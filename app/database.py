@@ -1,21 +1,95 @@
 """データベース接続とセッション管理."""
 
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
-
-# 非同期エンジンを作成
-engine: AsyncEngine = create_async_engine(
-    settings.database_url,
-    echo=settings.LOG_LEVEL == "DEBUG",
-    future=True,
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
+from app.core.config import get_settings
 
-# 非同期セッションファクトリを作成
-async_session_factory = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
-)
+
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """非同期エンジンを取得（初回呼び出し時に生成してキャッシュ）."""
+    settings = get_settings()
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.LOG_LEVEL == "DEBUG",
+        future=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    )
+    event.listen(engine.sync_engine, "before_cursor_execute", _record_statement_cache)
+    return engine
+
+
+@lru_cache
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """非同期セッションファクトリを取得（初回呼び出し時に生成してキャッシュ）."""
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
+
+
+def async_session_factory() -> AsyncSession:
+    """新しい非同期セッションを作成.
+
+    import 時にエンジンを作らないよう、ファクトリの生成は初回の呼び出しまで遅らせる。
+    """
+    return get_session_factory()()
+
+
+@dataclass
+class StatementCacheStats:
+    """SQL コンパイル済みキャッシュのヒット数（プロセス内の累計）."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """ヒット率（実行がない場合は 0）."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def record(self, context: Any) -> None:
+        """1 回の実行のキャッシュ結果を記録（キャッシュ対象外の実行は数えない）."""
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is CACHE_HIT:
+            self.hits += 1
+        elif cache_hit is CACHE_MISS:
+            self.misses += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """メトリクスとして返す値."""
+        compiled_cache = get_engine().sync_engine._compiled_cache
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "size": len(compiled_cache) if compiled_cache is not None else 0,
+            "capacity": get_settings().DB_QUERY_CACHE_SIZE,
+        }
+
+
+statement_cache_stats = StatementCacheStats()
+
+
+def _record_statement_cache(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    statement_cache_stats.record(context)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
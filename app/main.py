@@ -1,35 +1,157 @@
-"""FastAPI アプリケーションインスタンスとスタートアップ/シャットダウンイベント."""
+"""FastAPI アプリケーションの生成とスタートアップ/シャットダウンイベント."""
+
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
+from app.core.config import get_settings
+from app.api.body import request_body_exception_handler
+from app.api.endpoints import health
 from app.api.router import router
+from app.database import async_session_factory, get_engine
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.rate_limit import (
+    EXPORT,
+    READ,
+    WRITE,
+    RateLimitMiddleware,
+    RateLimitRule,
+    create_rate_limit_store,
+)
+from app.services.archive_service import run_archive_job
+from app.services.change_events import get_change_event_broker
+from app.services.fuel_efficiency import configure_fuel_history_cache
+from app.services.health_service import get_health_checker
+from app.services.job_queue import get_job_queue
+from app.services.response_cache import configure_response_cache
+from app.utils.exceptions import RequestBodyException
 from app.utils.logging import setup_logging
 
-# ロギング設定
-setup_logging()
 
-# FastAPI アプリを作成
-app = FastAPI(
-    title="ynym Portal Backend",
-    description="ynym portal 向け FastAPI バックエンドシステム",
-    version="0.1.0",
-)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """アプリケーションのスタートアップ/シャットダウン処理."""
+    settings = get_settings()
+    job_queue = get_job_queue()
+    change_event_broker = get_change_event_broker()
+    await job_queue.start()
+    if change_event_broker is not None:
+        await change_event_broker.start()
+
+    archive_task = None
+    if settings.ARCHIVE_INTERVAL_SECONDS > 0:
+        archive_task = asyncio.create_task(
+            run_archive_job(
+                async_session_factory,
+                retention_days=settings.ARCHIVE_RETENTION_DAYS,
+                batch_size=settings.ARCHIVE_BATCH_SIZE,
+                interval=settings.ARCHIVE_INTERVAL_SECONDS,
+            )
+        )
+
+    yield
+
+    # シャットダウン: readiness を落とし、バックグラウンド処理を止めてから接続プールを破棄
+    get_health_checker().start_draining()
+    if change_event_broker is not None:
+        await change_event_broker.stop()
+    if archive_task is not None:
+        archive_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await archive_task
+    await job_queue.stop(settings.JOB_DRAIN_TIMEOUT_SECONDS)
+    await get_engine().dispose()
+
+
+def create_app() -> FastAPI:
+    """FastAPI アプリを作成.
+
+    設定の読み込み・ミドルウェアの構成はここで行い、モジュールの import だけでは
+    Settings もデータベースエンジンも生成しない（エンジンは初回の接続時に生成）。
+    """
+    settings = get_settings()
+
+    # ロギング設定
+    setup_logging()
+
+    # プロセス内のキャッシュを設定から構成
+    configure_response_cache()
+    configure_fuel_history_cache()
+
+    app = FastAPI(
+        title="ynym Portal Backend",
+        description="ynym portal 向け FastAPI バックエンドシステム",
+        version="0.1.0",
+        lifespan=lifespan,
+    )
+
+    # レート制限ミドルウェア設定（CORS より内側に置き、429 にも CORS ヘッダを付ける）
+    if settings.RATE_LIMIT_BACKEND != "none":
+        app.add_middleware(
+            RateLimitMiddleware,
+            store=create_rate_limit_store(
+                settings.RATE_LIMIT_BACKEND, settings.RATE_LIMIT_REDIS_URL
+            ),
+            rules={
+                READ: RateLimitRule(
+                    settings.RATE_LIMIT_READ_PER_MINUTE, settings.RATE_LIMIT_READ_BURST
+                ),
+                WRITE: RateLimitRule(
+                    settings.RATE_LIMIT_WRITE_PER_MINUTE,
+                    settings.RATE_LIMIT_WRITE_BURST,
+                ),
+                EXPORT: RateLimitRule(
+                    settings.RATE_LIMIT_EXPORT_PER_MINUTE,
+                    settings.RATE_LIMIT_EXPORT_BURST,
+                ),
+            },
+        )
+
+    # CORS ミドルウェア設定
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],  # すべてのHTTPメソッドを許可
+        allow_headers=["*"],  # すべてのヘッダーを許可
+    )
+
+    # レスポンス圧縮ミドルウェア設定（br / gzip）
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.GZIP_COMPRESSION_LEVEL,
+        brotli_quality=settings.BROTLI_COMPRESSION_QUALITY,
+    )
+
+    # リクエストボディのエラー（app/api/body.py の JsonBody）を 400 / 413 で返す
+    app.add_exception_handler(RequestBodyException, request_body_exception_handler)
+
+    # ルータをマウント
+    app.include_router(router, prefix="/api")
+
+    # liveness / readiness プローブ・メトリクス（/livez, /readyz, /metrics）
+    app.include_router(health.router)
+
+    @app.get("/health")
+    async def health_check() -> dict:
+        """ヘルスチェックエンドポイント."""
+        return {"status": "ok", "environment": get_settings().ENVIRONMENT}
+
+    return app
 
-# CORS ミドルウェア設定
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],  # すべてのHTTPメソッドを許可
-    allow_headers=["*"],  # すべてのヘッダーを許可
-)
 
-# ルータをマウント
-app.include_router(router, prefix="/api")
+@lru_cache
+def get_app() -> FastAPI:
+    """プロセスで共有するアプリを取得（初回呼び出し時に生成してキャッシュ）."""
+    return create_app()
 
 
-@app.get("/health")
-async def health_check() -> dict:
-    """ヘルスチェックエンドポイント."""
-    return {"status": "ok", "environment": settings.ENVIRONMENT}
+def __getattr__(name: str) -> FastAPI:
+    """``uvicorn app.main:app`` 用のアプリ ``app`` を初回アクセス時に生成."""
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
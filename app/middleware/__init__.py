@@ -0,0 +1,6 @@
+"""ASGI ミドルウェアパッケージ."""
+
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+
+__all__ = ["CompressionMiddleware", "RateLimitMiddleware"]
@@ -0,0 +1,238 @@
+"""Accept-Encoding ネゴシエーションによるレスポンス圧縮ミドルウェア."""
+
+import zlib
+from typing import Optional, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 未インストールの環境では gzip のみ
+    brotli = None
+
+# 圧縮対象とする Content-Type（前方一致）
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+# 逐次配信が前提のため圧縮しない Content-Type
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """利用可能なエンコーディングを優先度順に返す."""
+    if brotli is not None:
+        return ("br", "gzip")
+    return ("gzip",)
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding ヘッダから使用するエンコーディングを選択.
+
+    q 値が最大のものを選び、同値の場合は br を gzip より優先する。
+    q=0 が指定されたエンコーディングは使用しない。
+
+    Args:
+        accept_encoding: Accept-Encoding ヘッダ値
+
+    Returns:
+        "br" / "gzip"、圧縮できない場合は None
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        parts = [part.strip() for part in item.split(";")]
+        name = parts[0].lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in supported_encodings():
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor(Protocol):
+    """ストリーム圧縮器のインターフェース."""
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    """zlib による gzip ストリーム圧縮器."""
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    """brotli ストリーム圧縮器."""
+
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """br / gzip でレスポンスを圧縮する ASGI ミドルウェア.
+
+    - 単一ボディのレスポンスは minimum_size 未満なら圧縮しない
+    - StreamingResponse はチャンクごとに圧縮してフラッシュする
+    - 既に Content-Encoding が付与されたレスポンスや SSE は対象外
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        """初期化.
+
+        Args:
+            app: ラップする ASGI アプリケーション
+            minimum_size: 圧縮対象とする最小バイト数
+            gzip_level: gzip 圧縮レベル（1-9）
+            brotli_quality: brotli 圧縮品質（0-11）
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def create_compressor(self, encoding: str) -> _Compressor:
+        """エンコーディングに対応する圧縮器を生成."""
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+
+class _CompressionResponder:
+    """1 リクエスト分の送信メッセージを圧縮して中継する."""
+
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str, send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream_send = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # ボディを見るまで送信を保留する
+            self.start_message = message
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self.downstream_send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.compressor is None:
+            assert self.start_message is not None
+            headers = MutableHeaders(raw=self.start_message["headers"])
+
+            if not self._should_compress(headers, body, more_body):
+                self.passthrough = True
+                await self.downstream_send(self.start_message)
+                await self.downstream_send(message)
+                return
+
+            self.compressor = self.middleware.create_compressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body:
+                compressed = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self.downstream_send(self.start_message)
+                await self.downstream_send(
+                    {"type": "http.response.body", "body": compressed}
+                )
+                return
+
+            # ストリーミング: 長さは確定しないため Content-Length を外す
+            del headers["Content-Length"]
+            await self.downstream_send(self.start_message)
+
+        if more_body:
+            chunk = self.compressor.compress(body) + self.compressor.flush()
+        else:
+            chunk = self.compressor.compress(body) + self.compressor.finish()
+        await self.downstream_send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
+
+    def _should_compress(
+        self, headers: MutableHeaders, body: bytes, more_body: bool
+    ) -> bool:
+        """レスポンスが圧縮対象か判定."""
+        if "content-encoding" in headers:
+            return False
+
+        content_type = headers.get("content-type", "").lower()
+        if content_type.startswith(EXCLUDED_CONTENT_TYPES):
+            return False
+        if not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+            return False
+
+        # 単一ボディは小さければ圧縮しない（ストリーミングは常に圧縮）
+        if not more_body and len(body) < self.middleware.minimum_size:
+            return False
+        return True
@@ -0,0 +1,253 @@
+"""ユーザーごとのトークンバケットによるレート制限ミドルウェア."""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.security.jwt import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+# ルートグループ名
+READ = "read"
+WRITE = "write"
+EXPORT = "export"
+
+# 書き込みとして扱う HTTP メソッド
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# レート制限の対象外とするパス（プローブ・ヘルスチェック・メトリクス）
+EXEMPT_PATHS = frozenset({"/health", "/livez", "/readyz", "/api/health", "/metrics"})
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """ルートグループごとの予算（毎分 per_minute 回、最大 burst 回まで連続可）."""
+
+    per_minute: float
+    burst: int
+
+    @property
+    def rate(self) -> float:
+        """1 秒あたりに補充されるトークン数."""
+        return self.per_minute / 60
+
+
+def classify_request(method: str, path: str) -> Optional[str]:
+    """リクエストのルートグループを判定（対象外は None）.
+
+    パスに export セグメントを含むものはエクスポート、
+    POST / PUT / PATCH / DELETE は書き込み、それ以外は読み込みとして扱う。
+    CORS のプリフライト（OPTIONS）とヘルスチェックは対象外。
+    """
+    if method == "OPTIONS" or path in EXEMPT_PATHS:
+        return None
+    if "export" in path.split("/"):
+        return EXPORT
+    if method in WRITE_METHODS:
+        return WRITE
+    return READ
+
+
+class RateLimitStore(Protocol):
+    """トークンバケットの保存先のインターフェース."""
+
+    async def take(self, key: str, rule: RateLimitRule) -> float:
+        """トークンを 1 つ消費し、待つべき秒数を返す（消費できた場合は 0）."""
+        ...
+
+
+class InMemoryRateLimitStore:
+    """
+    プロセス内のトークンバケット.
+
+    バケット数が max_keys を超えると最も長く使われていないものから削除する
+    （削除されたバケットは満杯から再開するため、制限が緩む方向にのみ働く）。
+    ワーカープロセスごとに独立するため、実効の予算はワーカー数倍になる。
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 100000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化.
+
+        Args:
+            max_keys: 保持する最大バケット数
+            clock: 補充の計算に使う時計（テスト用）
+        """
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, rule: RateLimitRule) -> float:
+        """トークンを 1 つ消費."""
+        now = self.clock()
+        tokens, updated_at = self._buckets.get(key, (float(rule.burst), now))
+        tokens = min(float(rule.burst), tokens + (now - updated_at) * rule.rate)
+
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / rule.rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+class SharedRateLimitClient(Protocol):
+    """共有ストアのクライアント（redis.asyncio.Redis と同じ呼び出し方）."""
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        """Lua スクリプトを実行."""
+        ...
+
+
+# トークンバケットを 1 回のスクリプト実行で読み書きする（他のワーカーと競合しない）
+# 時刻は Redis サーバーの TIME を使い、ワーカー間の時計のずれの影響を受けない
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or burst
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class SharedRateLimitStore:
+    """
+    プロセス間で共有するトークンバケット（Redis など）.
+
+    client は SharedRateLimitClient を満たすものであればよく、
+    テストではプロセス内のフェイクに差し替えられる。
+    """
+
+    def __init__(self, client: SharedRateLimitClient, prefix: str = "ynym:") -> None:
+        """初期化.
+
+        Args:
+            client: 共有ストアのクライアント
+            prefix: 他の用途のキーと衝突しないよう付ける接頭辞
+        """
+        self.client = client
+        self.prefix = prefix
+
+    async def take(self, key: str, rule: RateLimitRule) -> float:
+        """トークンを 1 つ消費."""
+        wait = await self.client.eval(
+            TOKEN_BUCKET_SCRIPT, 1, self.prefix + key, rule.rate, rule.burst
+        )
+        return float(wait)
+
+
+class RateLimitMiddleware:
+    """ユーザーごと・ルートグループごとにリクエスト数を制限する ASGI ミドルウェア.
+
+    - ユーザーは access_token Cookie の JWT（署名検証のみ、DB は参照しない）で識別する
+    - Cookie がない・無効な場合はクライアントの IP アドレス単位で制限する
+    - 予算を超えたリクエストはルーティング前（DB セッションを開く前）に 429 を返す
+    - ストアのエラー時は制限せずに通す
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: RateLimitStore,
+        rules: Dict[str, RateLimitRule],
+    ) -> None:
+        """初期化.
+
+        Args:
+            app: ラップする ASGI アプリケーション
+            store: トークンバケットの保存先
+            rules: ルートグループ名 → 予算（含まれないグループは制限しない）
+        """
+        self.app = app
+        self.store = store
+        self.rules = rules
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        group = classify_request(scope["method"], scope["path"])
+        rule = self.rules.get(group) if group is not None else None
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = f"ratelimit:{group}:{client_key(scope)}"
+        try:
+            wait = await self.store.take(key, rule)
+        except Exception:
+            logger.exception("レート制限の確認に失敗しました")
+            wait = 0.0
+
+        if wait > 0:
+            await too_many_requests(wait)(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def client_key(scope: Scope) -> str:
+    """レート制限の単位（ログイン中のユーザー、なければ IP アドレス）."""
+    cookies = cookie_parser(Headers(scope=scope).get("cookie", ""))
+    token = cookies.get("access_token")
+    if token:
+        try:
+            subject = decode_access_token(token).get("sub")
+        except Exception:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def too_many_requests(wait: float) -> JSONResponse:
+    """429 Too Many Requests（Retry-After 付き）."""
+    return JSONResponse(
+        status_code=429,
+        content={
+            "error": "Too Many Requests",
+            "message": "リクエストが多すぎます。しばらくしてから再度お試しください",
+        },
+        headers={"Retry-After": str(max(1, math.ceil(wait)))},
+    )
+
+
+def create_rate_limit_store(backend: str, redis_url: str = "") -> RateLimitStore:
+    """設定に対応するストアを生成（backend: memory / redis）."""
+    if backend == "redis":
+        # redis は任意依存のため、使用する場合のみ import
+        import redis.asyncio as redis
+
+        return SharedRateLimitStore(redis.Redis.from_url(redis_url))
+    return InMemoryRateLimitStore()
+
@@ -0,0 +1,47 @@
+"""論理削除済みレコードのアーカイブテーブル定義."""
+
+from sqlalchemy import Column, DateTime, MetaData, Table, func
+from sqlmodel import SQLModel
+
+from app.models.fuel_record import FuelRecord
+from app.models.vehicle import Vehicle
+
+# アーカイブテーブルはマイグレーション（008）で作成するため、
+# SQLModel.metadata とは別のメタデータに登録する
+archive_metadata = MetaData()
+
+
+def _build_archive_table(model: type[SQLModel]) -> Table:
+    """元テーブルと同じカラムに archived_at を加えたアーカイブテーブルを定義."""
+    source: Table = model.__table__  # type: ignore[attr-defined]
+    return Table(
+        f"{source.name}_archive",
+        archive_metadata,
+        *(
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.name == "id",
+                nullable=column.nullable,
+            )
+            for column in source.columns
+        ),
+        Column(
+            "archived_at",
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+    )
+
+
+fuel_record_archive = _build_archive_table(FuelRecord)
+vehicle_archive = _build_archive_table(Vehicle)
+
+# 元モデル → アーカイブテーブル
+# タスクは物理削除のため対象外（論理削除済みは繰り返しタスクのスキップ済み発生分のみで、
+# 移動すると再び展開される。task_archive は 017 で削除）
+ARCHIVE_TABLES: dict[type[SQLModel], Table] = {
+    FuelRecord: fuel_record_archive,
+    Vehicle: vehicle_archive,
+}
@@ -5,6 +5,7 @@ from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import DateTime
+from sqlalchemy.orm import declared_attr
 from sqlmodel import Field
 
 from app.models.base import UUIDModel
@@ -27,9 +28,20 @@ class FuelRecord(UUIDModel, table=True):
         is_full_tank: 満タン給油フラグ（True=満タン、False=一部給油）
         gas_station_name: ガソリンスタンド名（オプション、255 字以内）
         deleted_at: 論理削除日時（初期バージョンは未使用、将来対応）
+
+    Note:
+        テーブルは refuel_datetime で年単位（JST）にレンジパーティション化されている
+        （migrations/009_partition_fuel_record.sql）。パーティションキーを含める必要が
+        あるため DB 上の主キーは (id, refuel_datetime) だが、ORM の識別子は id のみ。
     """
 
     __tablename__ = "fuel_record"
+    __table_args__ = {"postgresql_partition_by": "RANGE (refuel_datetime)"}
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        """ORM の主キーは id のみとする."""
+        return {"primary_key": [cls.__table__.c.id]}  # type: ignore[attr-defined]
 
     # Foreign Keys
     vehicle_id: UUID = Field(
@@ -44,7 +56,8 @@ class FuelRecord(UUIDModel, table=True):
     # Core Fields
     refuel_datetime: datetime = Field(
         sa_type=DateTime(timezone=True),
-        description="給油日時（必須、日本時間 JST）",
+        primary_key=True,
+        description="給油日時（必須、日本時間 JST、パーティションキー）",
     )
     total_mileage: int = Field(
         gt=0,
@@ -0,0 +1,42 @@
+"""燃費記録の期間別集計モデル."""
+
+from datetime import date
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+
+class FuelRollup(SQLModel, table=True):
+    """
+    車ごと・期間ごと（JST の月 / 週）の給油の集計モデル.
+
+    燃費記録の作成・更新・削除のたびに、影響する期間の行だけを
+    差分で更新する（app/services/fuel_rollup_service.py）。
+    集計済みの行を読むだけで長期間のグラフを描けるよう、燃費記録を走査しない。
+
+    Attributes:
+        vehicle_id: 車 ID
+        granularity: 集計単位（month / week）
+        period_start: 期間の開始日（JST、月は 1 日、週は月曜日）
+        user_id: ユーザー ID
+        record_count: 期間内の給油回数
+        total_cost: 総費用の合計（円）
+        fuel_centilitres: 給油量の合計（0.01L 単位）
+        distance_traveled: 走行距離の合計（km、直前の給油からの差分。車の最初の給油は 0）
+    """
+
+    __tablename__ = "fuel_rollup"
+
+    vehicle_id: UUID = Field(primary_key=True, description="車 ID")
+    granularity: str = Field(
+        primary_key=True, max_length=10, description="集計単位（month / week）"
+    )
+    period_start: date = Field(
+        primary_key=True,
+        description="期間の開始日（JST、月は 1 日、週は月曜日）",
+    )
+    user_id: UUID = Field(index=True, description="ユーザー ID")
+    record_count: int = Field(default=0, description="期間内の給油回数")
+    total_cost: int = Field(default=0, description="総費用の合計（円）")
+    fuel_centilitres: int = Field(default=0, description="給油量の合計（0.01L 単位）")
+    distance_traveled: int = Field(default=0, description="走行距離の合計（km）")
@@ -0,0 +1,49 @@
+"""バックグラウンドジョブモデル."""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field
+
+from app.models.base import UUIDModel
+
+
+class Job(UUIDModel, table=True):
+    """
+    永続ジョブキューのジョブモデル.
+
+    JOB_BACKEND=postgres の場合に使用する。ワーカーは
+    SELECT ... FOR UPDATE SKIP LOCKED で実行可能なジョブを 1 件ずつ取得し、
+    run_at をリース期限まで進めてから実行する（プロセスが落ちても
+    リース切れで再実行される）。
+
+    Attributes:
+        name: ジョブ名（登録済みハンドラ名）
+        payload: ハンドラへ渡す引数（JSON）
+        attempts: 実行回数
+        run_at: 次に実行可能になる日時（実行中はリース期限）
+        last_error: 直近の失敗内容
+        failed_at: 最大試行回数を超えて破棄された日時
+    """
+
+    __tablename__ = "job"
+
+    name: str = Field(max_length=100, description="ジョブ名（登録済みハンドラ名）")
+    payload: Dict[str, Any] = Field(
+        default_factory=dict,
+        sa_type=JSONB,
+        description="ハンドラへ渡す引数（JSON）",
+    )
+    attempts: int = Field(default=0, description="実行回数")
+    run_at: datetime = Field(
+        sa_type=DateTime(timezone=True),
+        description="次に実行可能になる日時（実行中はリース期限）",
+    )
+    last_error: Optional[str] = Field(default=None, description="直近の失敗内容")
+    failed_at: Optional[datetime] = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        description="最大試行回数を超えて破棄された日時",
+    )
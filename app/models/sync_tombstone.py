@@ -0,0 +1,42 @@
+"""物理削除の記録モデル."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime
+from sqlmodel import Field, SQLModel
+
+from app.models.base import JST
+
+
+class SyncTombstone(SQLModel, table=True):
+    """
+    物理削除された行の記録モデル.
+
+    差分同期（GET /api/sync）で、行が残らない削除（タスク・ノート・ノートカテゴリ）を
+    クライアントに伝えるために、削除と同じトランザクションで記録する。
+    保管期間（ARCHIVE_RETENTION_DAYS）を過ぎた記録はアーカイブ処理で削除する。
+
+    Attributes:
+        resource: リソース（task / note / note_category）
+        record_id: 削除された行の ID
+        user_id: ユーザー ID
+        deleted_at: 削除日時（日本時間 JST）
+    """
+
+    __tablename__ = "sync_tombstone"
+
+    resource: str = Field(
+        primary_key=True,
+        max_length=32,
+        description="リソース（task / note / note_category）",
+    )
+    record_id: UUID = Field(primary_key=True, description="削除された行の ID")
+    user_id: UUID = Field(index=True, description="ユーザー ID")
+    deleted_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(JST),
+        sa_type=DateTime(timezone=True),
+        nullable=False,
+        description="削除日時（日本時間 JST）",
+    )
@@ -25,6 +25,9 @@ class Task(UUIDModel, table=True):
         due_date: タスク期日（オプション、YYYY-MM-DD 形式）
         order: ドラッグ&ドロップ用表示順序（将来の UI ソート対応）
         deleted_at: 論理削除日時（初期バージョンは未使用、将来対応）
+        recurrence_rule: 繰り返しルール（RRULE、シリーズのみ。due_date が開始日）
+        recurrence_parent_id: 発生分の元シリーズ ID（例外・完了を保存した行のみ）
+        occurrence_date: 発生分の本来の発生日（例外・完了を保存した行のみ）
     """
 
     __tablename__ = "task"
@@ -79,3 +82,18 @@ class Task(UUIDModel, table=True):
         index=True,
         description="論理削除日時（日本時間 JST、初期バージョンは未使用、将来対応）",
     )
+
+    # Recurrence
+    recurrence_rule: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        description="繰り返しルール（RRULE、シリーズのみ。due_date が開始日）",
+    )
+    recurrence_parent_id: Optional[UUID] = Field(
+        default=None,
+        description="発生分の元シリーズ ID（例外・完了を保存した行のみ）",
+    )
+    occurrence_date: Optional[date] = Field(
+        default=None,
+        description="発生分の本来の発生日（例外・完了を保存した行のみ）",
+    )
@@ -0,0 +1,69 @@
+"""アーカイブ済みレコードの復元コマンド（運用者向け）.
+
+ArchiveService.restore() で *_archive テーブルの行を元テーブルへ戻し、
+論理削除を解除する。CACHE_BACKEND=redis の場合は実行中のワーカーの
+レスポンスキャッシュも無効化される。
+
+Usage:
+    python -m app.restore vehicle <record_id> <user_id>
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Optional, Sequence
+from uuid import UUID
+
+from app.database import async_session_factory, get_engine
+from app.models.archive import ARCHIVE_TABLES
+from app.services.archive_service import ArchiveService
+from app.services.response_cache import configure_response_cache
+from app.utils.exceptions import NotFoundException
+
+# テーブル名 → 元モデル
+RESTORABLE_MODELS = {
+    model.__tablename__: model  # type: ignore[attr-defined]
+    for model in ARCHIVE_TABLES
+}
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """コマンドライン引数を解析."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.restore",
+        description="アーカイブ済みレコードを元テーブルへ戻す",
+    )
+    parser.add_argument("table", choices=sorted(RESTORABLE_MODELS))
+    parser.add_argument("record_id", type=UUID)
+    parser.add_argument("user_id", type=UUID)
+    return parser.parse_args(argv)
+
+
+async def restore(table: str, record_id: UUID, user_id: UUID) -> None:
+    """レコードを復元（見つからない場合は NotFoundException）."""
+    # 他のワーカーと同じ共有キャッシュのバージョンを更新する
+    configure_response_cache()
+    try:
+        async with async_session_factory() as session:
+            await ArchiveService(session).restore(
+                RESTORABLE_MODELS[table], record_id, user_id
+            )
+    finally:
+        # イベントループを閉じる前に接続プールを閉じる
+        await get_engine().dispose()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """復元を実行し、終了コードを返す."""
+    args = parse_args(argv)
+    try:
+        asyncio.run(restore(args.table, args.record_id, args.user_id))
+    except NotFoundException as exc:
+        print(exc.message, file=sys.stderr)
+        return 1
+    print(f"{args.table} {args.record_id} を復元しました")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
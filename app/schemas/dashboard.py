@@ -0,0 +1,71 @@
+"""ダッシュボード関連の Pydantic スキーマ."""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.task import TaskResponse
+
+
+class DashboardLatestRefuel(BaseModel):
+    """車ごとの最新給油スキーマ."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(description="燃費記録 ID（UUID）")
+    refuel_datetime: datetime = Field(description="給油日時")
+    total_mileage: int = Field(description="総走行距離（km）")
+    fuel_type: str = Field(description="燃料タイプ")
+    unit_price: int = Field(description="単価（円/L）")
+    total_cost: int = Field(description="総費用（円）")
+    is_full_tank: bool = Field(description="満タンかどうか")
+
+
+class DashboardVehicle(BaseModel):
+    """ダッシュボード用の車スキーマ."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(description="車 ID（UUID）")
+    name: str = Field(description="車名")
+    seq: int = Field(description="表示順序")
+    maker: str = Field(description="メーカー")
+    model: str = Field(description="型式")
+    latest_refuel: Optional[DashboardLatestRefuel] = Field(
+        default=None, description="最新の給油（記録がなければ null）"
+    )
+
+
+class DashboardNote(BaseModel):
+    """ダッシュボード用のノートスキーマ（本文を含まない）."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(description="ノート ID（UUID）")
+    title: str = Field(description="タイトル")
+    category_id: Optional[UUID] = Field(description="カテゴリ ID（任意）")
+    updated_at: datetime = Field(description="更新日時（JST）")
+
+
+class DashboardResponse(BaseModel):
+    """ダッシュボードレスポンススキーマ.
+
+    GET /dashboard のレスポンスで使用される。
+    """
+
+    open_task_count: int = Field(
+        description=(
+            "未完了タスク数（繰り返しタスクは今日の前後 "
+            "TASK_RECURRENCE_HORIZON_DAYS 日の発生分）"
+        )
+    )
+    overdue_task_count: int = Field(description="期限切れの未完了タスク数")
+    upcoming_tasks: List[TaskResponse] = Field(
+        description="期日が近い未完了タスク（繰り返しタスクの発生分を含む、期日の昇順）"
+    )
+    vehicles: List[DashboardVehicle] = Field(description="車一覧と最新の給油")
+    recent_notes: List[DashboardNote] = Field(
+        description="最近更新されたノート（更新日時の降順）"
+    )
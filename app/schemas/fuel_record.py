@@ -165,7 +165,10 @@ class FuelRecordResponse(BaseModel):
     )
     fuel_efficiency: Optional[float] = Field(
         default=None,
-        description="燃費（km/L）: 走行距離 / 給油量（小数点2桁）",
+        description=(
+            "燃費（km/L）: 満タン給油の記録のみ、直前の満タン給油からの走行距離 / "
+            "その間の給油量の合計（小数点2桁）"
+        ),
     )
     created_at: datetime = Field(description="作成日時（JST）")
     updated_at: datetime = Field(description="更新日時（JST）")
@@ -1,10 +1,23 @@
 """ノート関連の Pydantic スキーマ."""
 
+import hashlib
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+
+def compute_body_hash(body: str) -> str:
+    """本文のバージョンハッシュ（UTF-8 の SHA-256 16 進文字列）を計算."""
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
 
 
 class NoteCreate(BaseModel):
@@ -77,5 +90,104 @@ class NoteResponse(BaseModel):
     category_id: Optional[UUID] = Field(description="カテゴリ ID（任意）")
     title: str = Field(description="タイトル")
     body: str = Field(description="本文")
+    category_name: Optional[str] = Field(
+        default=None, description="カテゴリ名（一覧取得時のみ、未分類は null）"
+    )
+    created_at: datetime = Field(description="作成日時（JST）")
+    updated_at: datetime = Field(description="更新日時（JST）")
+
+
+class NoteDetailResponse(NoteResponse):
+    """ノート 1 件のレスポンススキーマ（本文のバージョンハッシュ付き）.
+
+    作成・取得・更新のレスポンスで使用される。一覧では本文ごとのハッシュ計算を
+    避けるため含めない（NoteResponse）。
+    """
+
+    @computed_field(  # type: ignore[prop-decorator]
+        description="本文のバージョンハッシュ（差分更新の base_hash に使用）"
+    )
+    @property
+    def body_hash(self) -> str:
+        """本文のバージョンハッシュ."""
+        return compute_body_hash(self.body)
+
+
+class NoteBodyEdit(BaseModel):
+    """本文の範囲置換スキーマ.
+
+    start と end は更新前の本文における位置で、JavaScript の文字列の
+    インデックスと同じ UTF-16 コードユニット単位（絵文字などは 2 単位）。
+    [start, end) の範囲を text で置き換える。
+    """
+
+    start: int = Field(
+        ..., ge=0, description="置換開始位置（含む、UTF-16 コードユニット単位）"
+    )
+    end: int = Field(
+        ..., ge=0, description="置換終了位置（含まない、UTF-16 コードユニット単位）"
+    )
+    text: str = Field(default="", description="置換後の文字列（空文字で削除）")
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "NoteBodyEdit":
+        """範囲のバリデーション."""
+        if self.end < self.start:
+            raise ValueError("end は start 以上である必要があります")
+        return self
+
+
+class NoteBodyPatch(BaseModel):
+    """本文の差分更新スキーマ."""
+
+    base_hash: str = Field(
+        ...,
+        min_length=64,
+        max_length=64,
+        description="差分の基準となる本文のバージョンハッシュ",
+    )
+    edits: List[NoteBodyEdit] = Field(
+        ..., min_length=1, description="範囲置換のリスト（範囲は重複不可）"
+    )
+
+    @model_validator(mode="after")
+    def validate_edits(self) -> "NoteBodyPatch":
+        """範囲が重複していないことを検証."""
+        ordered = sorted(self.edits, key=lambda edit: (edit.start, edit.end))
+        for previous, current in zip(ordered, ordered[1:]):
+            if current.start < previous.end:
+                raise ValueError("置換範囲が重複しています")
+        return self
+
+
+class NoteBodyPatchResponse(BaseModel):
+    """本文の差分更新レスポンススキーマ.
+
+    自動保存の往復を小さく保つため、本文は含めない。
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(description="ノート ID（UUID）")
+    body_hash: str = Field(description="更新後の本文のバージョンハッシュ")
+    updated_at: datetime = Field(description="更新日時（JST）")
+
+
+class NoteSummaryResponse(BaseModel):
+    """ノート要約レスポンススキーマ（本文の代わりに抜粋を含む）.
+
+    GET /notes?summary=true のレスポンスで使用される。
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(description="ノート ID（UUID）")
+    user_id: UUID = Field(description="所有者ユーザー ID（UUID）")
+    category_id: Optional[UUID] = Field(description="カテゴリ ID（任意）")
+    category_name: Optional[str] = Field(
+        default=None, description="カテゴリ名（未分類は null）"
+    )
+    title: str = Field(description="タイトル")
+    excerpt: str = Field(description="本文の先頭部分")
     created_at: datetime = Field(description="作成日時（JST）")
     updated_at: datetime = Field(description="更新日時（JST）")
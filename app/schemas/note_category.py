@@ -56,5 +56,8 @@ class NoteCategoryResponse(BaseModel):
     id: UUID = Field(description="カテゴリ ID（UUID）")
     user_id: UUID = Field(description="所有者ユーザー ID（UUID）")
     name: str = Field(description="カテゴリ名")
+    note_count: Optional[int] = Field(
+        default=None, description="カテゴリに属するノート数（一覧取得時のみ）"
+    )
     created_at: datetime = Field(description="作成日時（JST）")
     updated_at: datetime = Field(description="更新日時（JST）")
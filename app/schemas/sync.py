@@ -0,0 +1,51 @@
+"""差分同期関連の Pydantic スキーマ."""
+
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.schemas.fuel_record import FuelRecordResponse
+from app.schemas.note import NoteResponse
+from app.schemas.note_category import NoteCategoryResponse
+from app.schemas.task import TaskResponse
+from app.schemas.vehicle import VehicleResponse
+
+
+class SyncChangedRecords(BaseModel):
+    """前回の同期以降に作成・更新された行."""
+
+    tasks: List[TaskResponse] = Field(description="タスク（保存済みの行のみ）")
+    vehicles: List[VehicleResponse] = Field(description="車")
+    fuel_records: List[FuelRecordResponse] = Field(
+        description="燃費記録（走行距離・給油量・燃費は含まない）"
+    )
+    notes: List[NoteResponse] = Field(description="ノート")
+    note_categories: List[NoteCategoryResponse] = Field(description="ノートカテゴリ")
+
+
+class SyncDeletedRecords(BaseModel):
+    """前回の同期以降に削除された行の ID."""
+
+    tasks: List[UUID] = Field(description="タスク ID")
+    vehicles: List[UUID] = Field(description="車 ID")
+    fuel_records: List[UUID] = Field(description="燃費記録 ID")
+    notes: List[UUID] = Field(description="ノート ID")
+    note_categories: List[UUID] = Field(description="ノートカテゴリ ID")
+
+
+class SyncResponse(BaseModel):
+    """差分同期レスポンススキーマ.
+
+    GET /sync のレスポンスで使用される。
+    """
+
+    token: str = Field(description="次回の同期で since に指定するトークン")
+    reset: bool = Field(
+        description=(
+            "True の場合 changed は全件のため、クライアントは手元のデータを置き換える"
+            "（初回、またはトークンが保管期間より古い場合）"
+        )
+    )
+    changed: SyncChangedRecords = Field(description="作成・更新された行")
+    deleted: SyncDeletedRecords = Field(description="削除された行の ID")
@@ -4,7 +4,16 @@ from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from app.utils.recurrence import RecurrenceRule
+
+
+def normalize_recurrence_rule(v: Optional[str]) -> Optional[str]:
+    """繰り返しルールを検証して正規化した文字列を返す."""
+    if v is None or not v.strip():
+        return None
+    return str(RecurrenceRule.parse(v))
 
 
 class TaskCreate(BaseModel):
@@ -33,6 +42,11 @@ class TaskCreate(BaseModel):
         default=False,
         description="完了状態（デフォルト: False）",
     )
+    recurrence_rule: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        description="繰り返しルール（RRULE 形式、例: FREQ=WEEKLY;BYDAY=MO。due_date が開始日）",
+    )
 
     @field_validator("title")
     @classmethod
@@ -54,6 +68,19 @@ class TaskCreate(BaseModel):
             return v.strip() if v.strip() else None
         return v
 
+    @field_validator("recurrence_rule")
+    @classmethod
+    def validate_recurrence_rule(cls, v: Optional[str]) -> Optional[str]:
+        """繰り返しルールのバリデーション."""
+        return normalize_recurrence_rule(v)
+
+    @model_validator(mode="after")
+    def validate_recurrence_start(self) -> "TaskCreate":
+        """繰り返しタスクには開始日となる期日が必要."""
+        if self.recurrence_rule is not None and self.due_date is None:
+            raise ValueError("繰り返しタスクには期日（開始日）が必要です")
+        return self
+
 
 class TaskUpdate(BaseModel):
     """
@@ -82,6 +109,11 @@ class TaskUpdate(BaseModel):
         default=None,
         description="期日（オプション、YYYY-MM-DD 形式）",
     )
+    recurrence_rule: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        description="繰り返しルール（オプション、null で繰り返しを解除）",
+    )
 
     @field_validator("title")
     @classmethod
@@ -105,6 +137,12 @@ class TaskUpdate(BaseModel):
             return v.strip() if v.strip() else None
         return v
 
+    @field_validator("recurrence_rule")
+    @classmethod
+    def validate_recurrence_rule(cls, v: Optional[str]) -> Optional[str]:
+        """繰り返しルールのバリデーション."""
+        return normalize_recurrence_rule(v)
+
 
 class TaskResponse(BaseModel):
     """
@@ -127,3 +165,12 @@ class TaskResponse(BaseModel):
     order: int = Field(description="表示順序")
     created_at: datetime = Field(description="作成日時（ISO 8601 形式、JST）")
     updated_at: datetime = Field(description="更新日時（ISO 8601 形式、JST）")
+    recurrence_rule: Optional[str] = Field(
+        default=None, description="繰り返しルール（シリーズのみ）"
+    )
+    recurrence_parent_id: Optional[UUID] = Field(
+        default=None, description="元シリーズ ID（繰り返しタスクの発生分のみ）"
+    )
+    occurrence_date: Optional[date] = Field(
+        default=None, description="本来の発生日（繰り返しタスクの発生分のみ）"
+    )
@@ -1,5 +1,6 @@
 """Vehicle（車）スキーマ."""
 
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, field_validator
@@ -161,6 +162,20 @@ class VehicleUpdate(BaseModel):
         return v
 
 
+class VehicleFuelSummary(BaseModel):
+    """車の最新給油サマリースキーマ.
+
+    Attributes:
+        latest_mileage: 最新の総走行距離（km）
+        last_refuel_datetime: 最終給油日時
+        recent_fuel_efficiency: 直近の燃費（km/L、最新の満タン給油の満タン法の燃費）
+    """
+
+    latest_mileage: int
+    last_refuel_datetime: datetime
+    recent_fuel_efficiency: Optional[float] = None
+
+
 class VehicleResponse(BaseModel):
     """車レスポンススキーマ.
 
@@ -176,6 +191,7 @@ class VehicleResponse(BaseModel):
         tank_capacity: タンク容量
         created_at: 作成日時（ISO 8601）
         updated_at: 更新日時（ISO 8601）
+        fuel_summary: 最新給油サマリー（include=fuel_summary 指定時のみ）
     """
 
     id: str
@@ -189,6 +205,7 @@ class VehicleResponse(BaseModel):
     tank_capacity: Optional[float] = None
     created_at: str
     updated_at: str
+    fuel_summary: Optional[VehicleFuelSummary] = None
 
     class Config:
         """Pydantic 設定."""
@@ -1,13 +1,14 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 from jose import JWTError, jwt
-from app.core.config import settings
+from app.core.config import get_settings
 
 
 def create_access_token(
     data: Dict[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create JWT access token"""
+    settings = get_settings()
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -25,6 +26,7 @@ def create_access_token(
 
 def decode_access_token(token: str) -> Dict[str, Any]:
     """Decode and validate JWT token"""
+    settings = get_settings()
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
@@ -1,9 +1,21 @@
 """パスワードハッシング・検証ユーティリティ."""
 
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-# パスワードハッシング用コンテキストを作成
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@lru_cache
+def get_pwd_context() -> "CryptContext":
+    """パスワードハッシング用コンテキストを取得.
+
+    passlib / bcrypt の import は重いため、初回利用時まで遅延させる。
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def hash_password(password: str) -> str:
@@ -15,7 +27,7 @@ def hash_password(password: str) -> str:
     Returns:
         ハッシュ化されたパスワード
     """
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -28,4 +40,4 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         パスワードがマッチした場合は True、そうでない場合は False
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
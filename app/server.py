@@ -0,0 +1,270 @@
+"""本番用サーバーエントリポイント（pre-fork マルチワーカー）.
+
+親プロセスでアプリケーションを import して待ち受けソケットを作成し、
+``gc.freeze()`` の後に CPU コア数分のワーカーを fork する。
+各ワーカーは uvloop / httptools を使う uvicorn サーバーとして動作し、
+SERVER_MAX_REQUESTS 件を処理すると自ら終了して親に再生成される。
+
+Usage:
+    python -m app.server
+"""
+
+import gc
+import importlib.util
+import logging
+import os
+import random
+import signal
+import socket
+import time
+from pathlib import Path
+from typing import Optional
+
+import uvicorn
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# cgroup v2 の CPU クォータ設定ファイル
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+
+def available_cpu_count(cpu_max_path: Path = CGROUP_CPU_MAX) -> int:
+    """プロセスが実際に使える CPU コア数を取得.
+
+    CPU アフィニティとコンテナの cgroup クォータの小さい方を返す。
+
+    Args:
+        cpu_max_path: cgroup v2 の cpu.max ファイルパス
+
+    Returns:
+        1 以上のコア数
+    """
+    if hasattr(os, "sched_getaffinity"):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = os.cpu_count() or 1
+
+    try:
+        quota, period = cpu_max_path.read_text().split()[:2]
+        if quota != "max":
+            count = min(count, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+
+    return max(1, count)
+
+
+def resolve_worker_count(settings: Settings) -> int:
+    """ワーカー数を決定（SERVER_WORKERS が 0 の場合は CPU コア数）."""
+    if settings.SERVER_WORKERS > 0:
+        return settings.SERVER_WORKERS
+    return available_cpu_count()
+
+
+def check_worker_settings(settings: Settings) -> None:
+    """ワーカー数と両立しない設定を起動前に拒否.
+
+    Raises:
+        ValueError: EVENTS_BACKEND=memory で複数ワーカーを起動する場合
+            （他のワーカーが処理した書き込みが変更通知のストリームに届かない）、
+            CACHE_BACKEND=memory で複数ワーカーを起動する場合
+            （他のワーカーが処理した書き込みでキャッシュが無効化されない）
+    """
+    if resolve_worker_count(settings) <= 1:
+        return
+    if settings.EVENTS_BACKEND == "memory":
+        raise ValueError(
+            "EVENTS_BACKEND=memory は SERVER_WORKERS=1 でのみ使用できます"
+            "（複数ワーカーでは postgres を指定してください）"
+        )
+    if settings.CACHE_BACKEND == "memory":
+        raise ValueError(
+            "CACHE_BACKEND=memory は SERVER_WORKERS=1 でのみ使用できます"
+            "（複数ワーカーでは redis を指定してください）"
+        )
+
+
+def build_uvicorn_config(settings: Settings, app: object) -> uvicorn.Config:
+    """ワーカー用の uvicorn 設定を生成.
+
+    uvloop / httptools がインストールされていれば使用する。
+    最大リクエスト数にはワーカーごとにゆらぎを加え、一斉再起動を避ける。
+    X-Forwarded-For は SERVER_FORWARDED_ALLOW_IPS のプロキシからのものだけを信頼する。
+    """
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+    limit_max_requests: Optional[int] = None
+    if settings.SERVER_MAX_REQUESTS > 0:
+        limit_max_requests = settings.SERVER_MAX_REQUESTS + random.randint(
+            0, settings.SERVER_MAX_REQUESTS_JITTER
+        )
+
+    return uvicorn.Config(
+        app,
+        loop=loop,
+        http=http,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        limit_max_requests=limit_max_requests,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        access_log=settings.SERVER_ACCESS_LOG,
+    )
+
+
+def create_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """全ワーカーで共有する待ち受けソケットを作成."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class DrainingServer(uvicorn.Server):
+    """終了シグナル受信と同時に readiness を落とす uvicorn サーバー.
+
+    uvicorn は接続が閉じ終わってから lifespan のシャットダウンを実行するため、
+    シグナルを受けた時点で /readyz を 503 にしてドレインを早める。
+    終わらない変更通知のストリームも、このときに終了させる。
+    """
+
+    def handle_exit(self, sig: int, frame: object) -> None:
+        from app.services.change_events import get_change_event_broker
+        from app.services.health_service import get_health_checker
+
+        get_health_checker().start_draining()
+        change_event_broker = get_change_event_broker()
+        if change_event_broker is not None:
+            change_event_broker.close_all_threadsafe()
+        super().handle_exit(sig, frame)
+
+
+class Supervisor:
+    """ワーカープロセスを fork・監視・再生成する親プロセス."""
+
+    def __init__(self, settings: Settings, app: object, sock: socket.socket) -> None:
+        """初期化.
+
+        Args:
+            settings: アプリケーション設定
+            app: fork 前に読み込み済みの ASGI アプリケーション
+            sock: 共有する待ち受けソケット
+        """
+        self.settings = settings
+        self.app = app
+        self.sock = sock
+        self.worker_count = resolve_worker_count(settings)
+        self.workers: dict[int, int] = {}  # pid -> ワーカー番号
+        self.should_exit = False
+
+    def run(self) -> None:
+        """ワーカーを起動し、終了シグナルを受けるまで監視する."""
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        signal.signal(signal.SIGINT, self._handle_exit)
+
+        logger.info("Starting %d workers (pid %d)", self.worker_count, os.getpid())
+        for index in range(self.worker_count):
+            self._spawn(index)
+
+        while not self.should_exit:
+            self._reap_and_respawn()
+            time.sleep(0.5)
+
+        self._shutdown()
+
+    def _spawn(self, index: int) -> None:
+        """ワーカーを 1 つ fork."""
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker()
+        self.workers[pid] = index
+
+    def _run_worker(self) -> None:
+        """子プロセス側: uvicorn サーバーを実行して終了."""
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        exit_code = 0
+        try:
+            server = DrainingServer(build_uvicorn_config(self.settings, self.app))
+            server.run(sockets=[self.sock])
+        except BaseException:
+            logger.exception("Worker %d crashed", os.getpid())
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _reap_and_respawn(self) -> None:
+        """終了したワーカー（最大リクエスト到達・異常終了）を再生成."""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            index = self.workers.pop(pid, None)
+            if index is None or self.should_exit:
+                continue
+            logger.info(
+                "Worker %d exited (status %d), respawning",
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+            self._spawn(index)
+
+    def _handle_exit(self, signum: int, frame: object) -> None:
+        """終了シグナルを受けたら監視ループを止める."""
+        self.should_exit = True
+
+    def _shutdown(self) -> None:
+        """全ワーカーに SIGTERM を送り、猶予時間内に終了しなければ SIGKILL."""
+        for pid in self.workers:
+            os.kill(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.settings.SERVER_GRACEFUL_TIMEOUT
+        while self.workers and time.monotonic() < deadline:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                time.sleep(0.1)
+                continue
+            self.workers.pop(pid, None)
+
+        for pid in self.workers:
+            logger.warning("Worker %d did not exit in time, killing", pid)
+            os.kill(pid, signal.SIGKILL)
+        self.sock.close()
+
+
+def main() -> None:
+    """サーバーを起動."""
+    settings = get_settings()
+    check_worker_settings(settings)
+
+    # fork 前にアプリを生成し、import 済みのオブジェクトをワーカー間で共有する
+    from app.main import get_app
+
+    app = get_app()
+
+    sock = create_socket(
+        settings.SERVER_HOST, settings.SERVER_PORT, settings.SERVER_BACKLOG
+    )
+
+    # 読み込み済みオブジェクトを GC 対象外の世代に移し、
+    # fork 後の GC による copy-on-write ページの複製を防ぐ
+    gc.collect()
+    gc.freeze()
+
+    Supervisor(settings, app, sock).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""論理削除済みレコードのアーカイブサービス."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, insert, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from app.models.archive import ARCHIVE_TABLES
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.services.fuel_efficiency import fuel_history_cache
+from app.services.fuel_rollup_service import FuelRollupService, RollupRecord
+from app.services.response_cache import RESOURCES, response_cache
+from app.services.sync_service import SyncService
+from app.utils.exceptions import NotFoundException
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveService:
+    """論理削除済みレコードをアーカイブテーブルへ移動するビジネスロジック層.
+
+    deleted_at から一定日数が経過したレコードを
+    DELETE ... RETURNING と INSERT ... SELECT を組み合わせた 1 文で
+    *_archive テーブルへ移動し、元テーブルとインデックスを小さく保つ。
+    """
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        """初期化.
+
+        Args:
+            db_session: データベースセッション
+        """
+        self.db_session = db_session
+
+    async def archive_batch(
+        self,
+        model: type[SQLModel],
+        cutoff: datetime,
+        batch_size: int,
+    ) -> int:
+        """cutoff より前に論理削除されたレコードを最大 batch_size 件移動してコミット.
+
+        対象行は FOR UPDATE SKIP LOCKED で選ぶため、
+        複数ワーカーが同時に実行しても同じ行を奪い合わない。
+
+        Returns:
+            移動した件数
+        """
+        source = model.__table__  # type: ignore[attr-defined]
+        archive = ARCHIVE_TABLES[model]
+        column_names = [column.name for column in source.columns]
+
+        target_ids = (
+            select(source.c.id)
+            .where(source.c.deleted_at < cutoff)
+            .order_by(source.c.deleted_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(source)
+            .where(source.c.id.in_(target_ids.scalar_subquery()))
+            .returning(*source.columns)
+            .cte("moved")
+        )
+        stmt = insert(archive).from_select(
+            column_names, select(*(moved.c[name] for name in column_names))
+        )
+
+        result = await self.db_session.execute(stmt)
+        await self.db_session.commit()
+        return result.rowcount
+
+    async def archive_deleted(
+        self,
+        retention_days: int,
+        batch_size: int,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """全対象テーブルで retention_days 日より前に論理削除されたレコードを移動.
+
+        バッチごとにコミットし、ロックとトランザクションを短く保つ。
+
+        Returns:
+            テーブル名ごとの移動件数
+        """
+        cutoff = (now or datetime.now(JST)) - timedelta(days=retention_days)
+        totals: Dict[str, int] = {}
+        for model in ARCHIVE_TABLES:
+            total = 0
+            while True:
+                moved = await self.archive_batch(model, cutoff, batch_size)
+                total += moved
+                if moved < batch_size:
+                    break
+            totals[model.__tablename__] = total  # type: ignore[attr-defined]
+        # 差分同期の物理削除の記録も同じ保管期間で削除する
+        totals["sync_tombstone"] = await SyncService(self.db_session).prune_tombstones(
+            cutoff
+        )
+        return totals
+
+    async def restore(
+        self,
+        model: type[SQLModel],
+        record_id: UUID,
+        user_id: UUID,
+    ) -> None:
+        """アーカイブ済みレコードを元テーブルへ戻し、論理削除を解除.
+
+        Raises:
+            NotFoundException: アーカイブにレコードが見つからない場合
+        """
+        source = model.__table__  # type: ignore[attr-defined]
+        archive = ARCHIVE_TABLES[model]
+        column_names = [column.name for column in source.columns]
+
+        restored = (
+            delete(archive)
+            .where(archive.c.id == record_id)
+            .where(archive.c.user_id == user_id)
+            .returning(*(archive.c[name] for name in column_names))
+            .cte("restored")
+        )
+        # updated_at も更新し、差分同期で復元した行を返す
+        replaced = {
+            "deleted_at": null(),
+            "updated_at": literal(datetime.now(JST), type_=source.c.updated_at.type),
+        }
+        stmt = insert(source).from_select(
+            column_names,
+            select(
+                *(
+                    replaced[name].label(name) if name in replaced else restored.c[name]
+                    for name in column_names
+                )
+            ),
+        )
+
+        result = await self.db_session.execute(stmt)
+        if result.rowcount == 0:
+            await self.db_session.rollback()
+            raise NotFoundException(
+                f"アーカイブ済みの {source.name} ID {record_id} が見つかりません"
+            )
+        if model is FuelRecord:
+            # 論理削除時に期間別集計から除いた給油を戻す
+            restored_record = await self.db_session.get(FuelRecord, record_id)
+            if restored_record is not None:
+                await FuelRollupService(self.db_session).record_added(
+                    RollupRecord.of(restored_record)
+                )
+        await self.db_session.commit()
+        # 復元は稀なため、依存関係を考えずユーザーのキャッシュをすべて無効化する
+        await response_cache.bump(user_id, *RESOURCES)
+        fuel_history_cache.invalidate(user_id)
+
+
+async def run_archive_job(
+    session_factory: Callable[[], AsyncSession],
+    retention_days: int,
+    batch_size: int,
+    interval: float,
+) -> None:
+    """アーカイブ処理を interval 秒ごとに実行し続ける（キャンセルで停止）."""
+    while True:
+        try:
+            async with session_factory() as session:
+                totals = await ArchiveService(session).archive_deleted(
+                    retention_days=retention_days, batch_size=batch_size
+                )
+            if any(totals.values()):
+                logger.info("論理削除済みレコードをアーカイブしました: %s", totals)
+        except Exception:
+            logger.exception("アーカイブ処理に失敗しました")
+        await asyncio.sleep(interval)
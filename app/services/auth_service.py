@@ -1,11 +1,20 @@
-import httpx
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.schemas.user import UserCreate
+from app.services.job_queue import get_job_queue, job_handler
 from app.services.user_service import UserService
 from app.security.jwt import create_access_token
+from app.utils.exceptions import ServiceUnavailableException
+
+UPDATE_USER_PROFILE_JOB = "update_user_profile"
+
+
+@job_handler(UPDATE_USER_PROFILE_JOB)
+async def update_user_profile(db: AsyncSession, payload: dict) -> None:
+    """Background job: refresh a returning user's Google profile."""
+    await UserService(db).update_profile(**payload)
 
 
 class AuthService:
@@ -13,7 +22,8 @@ class AuthService:
     Auth Service with the goal to
         - 1 : Fetching Google's access token using the OAuth code
         - 2 : Retrieving user profile info from Google's userinfo endpoint
-        - 3 : Using user_service.get_or_create()  to persist or fetch the user
+        - 3 : Creating the user on first login (profile refreshes of
+              returning users run as a background job)
         - 4 : Generating a JWT session token
     """
 
@@ -52,13 +62,28 @@ class AuthService:
         user_in = UserCreate(
             email=email, name=name or email.split("@")[0], avatar_url=picture
         )
-        user = await UserService(db).get_or_create(user_in=user_in)
+        user_service = UserService(db)
+        user = await user_service.get_by_email(email=email)
+        if user is None:
+            # First login: the user must exist before the JWT can be used
+            user = await user_service.get_or_create(user_in=user_in)
+        elif (user.name, user.avatar_url) != (user_in.name, user_in.avatar_url):
+            # Profile refresh is not needed for the response; defer it
+            profile = user_in.model_dump()
+            try:
+                await get_job_queue().enqueue(UPDATE_USER_PROFILE_JOB, **profile)
+            except ServiceUnavailableException:
+                await user_service.update_profile(**profile)
         # --- Step 4 : Create JWT session token ---
         jwt_token = create_access_token(data={"sub": user.email})
         return jwt_token
 
     async def _exchange_code_for_token(self, code: str) -> dict:
         """Exchanges OAuth code for access token."""
+        # httpx はログイン時にしか使わないため、起動を速くする目的で遅延 import
+        import httpx
+
+        settings = get_settings()
         redirect_uri = f"{settings.BACKEND_URL}/api/auth/google/callback"
 
         print(f"DEBUG: AuthService token exchange redirect_uri: {redirect_uri}")
@@ -85,6 +110,8 @@ class AuthService:
 
     async def _fetch_user_info(self, access_token: str) -> dict:
         """Fetches user profile from Google."""
+        import httpx
+
         async with httpx.AsyncClient() as client:
             response = await client.get(
                 self.GOOGLE_USERINFO_URL,
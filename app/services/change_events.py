@@ -0,0 +1,495 @@
+"""ユーザーごとの変更通知（Server-Sent Events）."""
+
+import asyncio
+import json
+import logging
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime
+from typing import Any, AsyncIterator, Literal, Optional, Union
+from uuid import UUID
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import get_settings
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.models.note import Note
+from app.models.note_category import NoteCategory
+from app.models.task import Task
+from app.models.vehicle import Vehicle
+from app.services.response_cache import (
+    FUEL_RECORD,
+    NOTE,
+    NOTE_CATEGORY,
+    TASK,
+    VEHICLE,
+)
+from app.utils.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+# 変更を通知するモデル → リソース名（レスポンスキャッシュと同じ）
+EVENT_RESOURCES: dict[type, str] = {
+    Task: TASK,
+    Vehicle: VEHICLE,
+    FuelRecord: FUEL_RECORD,
+    Note: NOTE,
+    NoteCategory: NOTE_CATEGORY,
+}
+
+# ワーカー間で変更を配信する LISTEN / NOTIFY のチャネル
+CHANNEL = "ynym_change_events"
+
+# NOTIFY の payload の上限（PostgreSQL の既定は 8000 バイト未満）
+NOTIFY_PAYLOAD_MAX_BYTES = 7900
+
+ChangeOp = Literal["create", "update", "delete"]
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    """1 行の変更通知."""
+
+    user_id: UUID
+    resource: str
+    id: UUID
+    op: ChangeOp
+    version: str  # 変更後の updated_at（削除は削除日時）の ISO 8601
+
+    def as_dict(self) -> dict[str, str]:
+        """クライアントに送る項目（user_id は含めない）."""
+        return {
+            "resource": self.resource,
+            "id": str(self.id),
+            "op": self.op,
+            "version": self.version,
+        }
+
+    def to_payload(self) -> str:
+        """NOTIFY で送る JSON."""
+        return json.dumps(
+            {"user_id": str(self.user_id), **self.as_dict()}, separators=(",", ":")
+        )
+
+    @classmethod
+    def from_payload(cls, item: dict[str, Any]) -> "ChangeEvent":
+        """to_payload() の JSON を読み込んだ dict から復元."""
+        return cls(
+            user_id=UUID(item["user_id"]),
+            resource=item["resource"],
+            id=UUID(item["id"]),
+            op=item["op"],
+            version=item["version"],
+        )
+
+
+def collect_changes(session: Session) -> list[ChangeEvent]:
+    """flush される（された）行の変更通知.
+
+    session.new / dirty / deleted のうち EVENT_RESOURCES のモデルを対象とし、
+    deleted_at が設定された更新（論理削除）は delete として扱う。
+    値は読み込み済みの属性だけから取り、遅延ロードの SQL は発行しない。
+    """
+    now = datetime.now(JST)
+    events: list[ChangeEvent] = []
+    groups: tuple[tuple[ChangeOp, Any], ...] = (
+        ("create", session.new),
+        ("update", session.dirty),
+        ("delete", session.deleted),
+    )
+    for op, objects in groups:
+        for obj in objects:
+            resource = EVENT_RESOURCES.get(type(obj))
+            if resource is None:
+                continue
+            if op == "update" and not session.is_modified(obj):
+                continue
+            values = inspect(obj).dict
+            if op == "update" and values.get("deleted_at") is not None:
+                op_of_row: ChangeOp = "delete"
+            else:
+                op_of_row = op
+            changed_at = now if op_of_row == "delete" else values.get("updated_at")
+            events.append(
+                ChangeEvent(
+                    user_id=values["user_id"],
+                    resource=resource,
+                    id=values["id"],
+                    op=op_of_row,
+                    version=(changed_at or now).isoformat(),
+                )
+            )
+    return events
+
+
+def encode_batches(
+    events: list[ChangeEvent], max_bytes: int = NOTIFY_PAYLOAD_MAX_BYTES
+) -> list[str]:
+    """変更通知を max_bytes 以下の JSON 配列に分割."""
+    batches: list[str] = []
+    current: list[str] = []
+    size = 2  # "[" と "]"
+    for change in events:
+        item = change.to_payload()
+        if current and size + len(item) + 1 > max_bytes:
+            batches.append("[" + ",".join(current) + "]")
+            current, size = [], 2
+        current.append(item)
+        size += len(item) + 1
+    if current:
+        batches.append("[" + ",".join(current) + "]")
+    return batches
+
+
+# 購読のキューに入れる制御用の値
+RESET = object()  # 取りこぼしがあった（クライアントは差分同期で再取得する）
+CLOSE = object()  # ストリームを終了する
+
+QueueItem = Union[ChangeEvent, object]
+
+
+class Subscription:
+    """
+    1 本の SSE 接続の購読.
+
+    配信（put）は待たずにキューへ入れる。キューが満杯になった（クライアントの
+    読み込みが追いつかない）場合は、溜まっている変更を捨てて RESET を入れ、
+    メモリを増やさずにクライアントへ再同期を促す。
+    """
+
+    def __init__(self, user_id: UUID, queue_size: int) -> None:
+        """初期化.
+
+        Args:
+            user_id: ユーザー ID
+            queue_size: 送信待ちの変更の上限
+        """
+        self.user_id = user_id
+        self.closed = False
+        self._queue: asyncio.Queue[QueueItem] = asyncio.Queue(maxsize=queue_size)
+
+    def put(self, item: QueueItem) -> None:
+        """変更・RESET をキューへ入れる（満杯の場合は RESET に置き換える）."""
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._replace_with(RESET)
+
+    def close(self) -> None:
+        """ストリームを終了させる（送信待ちの変更は捨てる）."""
+        if self.closed:
+            return
+        self.closed = True
+        self._replace_with(CLOSE)
+
+    async def get(self) -> QueueItem:
+        """次の変更・RESET・CLOSE を待つ."""
+        return await self._queue.get()
+
+    def _replace_with(self, item: QueueItem) -> None:
+        """キューを空にして item だけを入れる."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(item)
+
+
+class ChangeEventBroker:
+    """
+    プロセス内の変更通知の配信.
+
+    install() で SQLAlchemy の Session にイベントを登録し、flush された
+    タスク・車・燃費記録・ノート・ノートカテゴリの変更をコミット後に
+    同じユーザーの購読へ配信する。ロールバックされた変更は配信しない。
+    Core の一括更新（アーカイブなど）は通知しない。
+    プロセス間で共有されないため、複数ワーカーで動かす場合は
+    PostgresChangeEventBroker を使う。
+
+    接続数はプロセスごとに max_connections、ユーザーごとに
+    max_connections_per_user までとし、超えた場合は
+    ServiceUnavailableException を送出する。
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 1000,
+        max_connections_per_user: int = 10,
+        queue_size: int = 100,
+    ) -> None:
+        """初期化.
+
+        Args:
+            max_connections: プロセス全体の接続数の上限
+            max_connections_per_user: ユーザーごとの接続数の上限
+            queue_size: 接続ごとの送信待ちの変更の上限
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_user = max_connections_per_user
+        self.queue_size = queue_size
+        self._subscriptions: dict[UUID, set[Subscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def connection_count(self) -> int:
+        """接続中の購読数."""
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    def install(self, session_class: type[Session] = Session) -> None:
+        """session_class の flush・コミットで変更を通知するようにする."""
+        event.listen(session_class, "after_flush", self._after_flush)
+        event.listen(session_class, "after_commit", self._after_commit)
+        event.listen(
+            session_class, "after_transaction_end", self._after_transaction_end
+        )
+
+    async def start(self) -> None:
+        """配信を開始（lifespan のスタートアップで呼ぶ）."""
+        self._loop = asyncio.get_running_loop()
+
+    async def stop(self) -> None:
+        """すべてのストリームを終了させる（lifespan のシャットダウンで呼ぶ）."""
+        self.close_all()
+
+    def close_all_threadsafe(self) -> None:
+        """シグナルハンドラなど、イベントループの外からすべてのストリームを終了させる."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.close_all)
+
+    def close_all(self) -> None:
+        """すべてのストリームを終了させる."""
+        for subs in list(self._subscriptions.values()):
+            for subscription in list(subs):
+                subscription.close()
+
+    def subscribe(self, user_id: UUID) -> Subscription:
+        """購読を開始.
+
+        Raises:
+            ServiceUnavailableException: 接続数が上限に達している場合
+        """
+        if self.connection_count >= self.max_connections:
+            raise ServiceUnavailableException("変更通知の接続数が上限に達しています")
+        subs = self._subscriptions.setdefault(user_id, set())
+        if len(subs) >= self.max_connections_per_user:
+            raise ServiceUnavailableException(
+                "ユーザーごとの変更通知の接続数が上限に達しています"
+            )
+        subscription = Subscription(user_id, self.queue_size)
+        subs.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """購読を終了（何度呼んでもよい）."""
+        subscription.close()
+        subs = self._subscriptions.get(subscription.user_id)
+        if subs is None:
+            return
+        subs.discard(subscription)
+        if not subs:
+            del self._subscriptions[subscription.user_id]
+
+    def publish(self, change: ChangeEvent) -> None:
+        """同じユーザーの購読へ変更を配信（待たない）."""
+        for subscription in self._subscriptions.get(change.user_id, ()):
+            subscription.put(change)
+
+    def reset_all(self) -> None:
+        """すべての購読に再同期を促す（変更を取りこぼした可能性がある場合）."""
+        for subs in self._subscriptions.values():
+            for subscription in subs:
+                subscription.put(RESET)
+
+    async def stream(
+        self, subscription: Subscription, heartbeat: float
+    ) -> AsyncIterator[str]:
+        """購読を SSE のメッセージとして送る.
+
+        heartbeat 秒ごとにコメント行を送り、プロキシのタイムアウトを防ぐとともに
+        切断されたクライアントを書き込みエラーで検出する。
+        終了（CLOSE・切断によるキャンセル）時に購読を解除する。
+        """
+        try:
+            # ヘッダーをすぐに送り、接続の確立をクライアントへ知らせる
+            yield ": connected\n\n"
+            while True:
+                try:
+                    async with asyncio.timeout(heartbeat):
+                        item = await subscription.get()
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if item is CLOSE:
+                    return
+                if item is RESET:
+                    yield "event: reset\ndata: {}\n\n"
+                elif isinstance(item, ChangeEvent):
+                    data = json.dumps(item.as_dict(), separators=(",", ":"))
+                    yield f"event: change\ndata: {data}\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        """flush した行の変更をコミットまで保持."""
+        changes = collect_changes(session)
+        if changes:
+            self._stage(session, changes)
+
+    def _stage(self, session: Session, changes: list[ChangeEvent]) -> None:
+        """変更を session.info（キーはブローカー自身）に保持し、コミット後に配信する."""
+        session.info.setdefault(self, []).extend(changes)
+
+    def _after_commit(self, session: Session) -> None:
+        """コミットした変更を配信（SAVEPOINT の解放では配信しない）."""
+        if session.in_nested_transaction():
+            return
+        for change in session.info.pop(self, ()):
+            self.publish(change)
+
+    def _after_transaction_end(self, session: Session, transaction: Any) -> None:
+        """コミットされずに終わったトランザクションの変更を捨てる."""
+        if transaction.parent is None:
+            session.info.pop(self, None)
+
+
+class PostgresChangeEventBroker(ChangeEventBroker):
+    """
+    PostgreSQL の LISTEN / NOTIFY で全ワーカーへ配信する変更通知.
+
+    flush した変更は同じトランザクションで pg_notify() に渡すため、
+    コミットされた場合だけ（コミット順に）全ワーカーへ届く。各ワーカーは
+    専用の接続で LISTEN し、受け取った変更を自分の購読へ配信する。
+    接続が切れた場合は reconnect_interval 秒後に接続し直し、その間の通知は
+    届かないため、接続し直した時点ですべての購読に RESET を送る。
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        max_connections: int = 1000,
+        max_connections_per_user: int = 10,
+        queue_size: int = 100,
+        reconnect_interval: float = 5.0,
+        keepalive_interval: float = 30.0,
+    ) -> None:
+        """初期化.
+
+        Args:
+            database_url: LISTEN する接続の URL
+            max_connections: プロセス全体の接続数の上限
+            max_connections_per_user: ユーザーごとの接続数の上限
+            queue_size: 接続ごとの送信待ちの変更の上限
+            reconnect_interval: LISTEN の接続が切れてから接続し直すまでの秒数
+            keepalive_interval: LISTEN の接続を確認する間隔（秒）
+        """
+        super().__init__(
+            max_connections=max_connections,
+            max_connections_per_user=max_connections_per_user,
+            queue_size=queue_size,
+        )
+        self.database_url = database_url
+        self.reconnect_interval = reconnect_interval
+        self.keepalive_interval = keepalive_interval
+        self._engine: Optional[AsyncEngine] = None
+        self._listener: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        """LISTEN を開始."""
+        await super().start()
+        if self._listener is not None:
+            return
+        # アプリの接続プールを使わず、LISTEN 専用の接続を 1 本持つ
+        self._engine = create_async_engine(self.database_url, poolclass=NullPool)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """すべてのストリームを終了させ、LISTEN を止める."""
+        await super().stop()
+        if self._listener is not None:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    def dispatch(self, payload: str) -> None:
+        """NOTIFY で受け取った変更を購読へ配信（壊れた payload は捨てる）."""
+        try:
+            changes = [ChangeEvent.from_payload(item) for item in json.loads(payload)]
+        except (TypeError, ValueError, KeyError):
+            logger.warning("変更通知の payload を読み込めませんでした: %.200s", payload)
+            return
+        for change in changes:
+            self.publish(change)
+
+    def _stage(self, session: Session, changes: list[ChangeEvent]) -> None:
+        """変更を同じトランザクションで NOTIFY（コミット時に配信される）."""
+        connection = session.connection()
+        for payload in encode_batches(changes):
+            connection.execute(select(func.pg_notify(CHANNEL, payload)))
+
+    def _after_commit(self, session: Session) -> None:
+        """LISTEN で受け取って配信するため何もしない."""
+
+    async def _listen(self) -> None:
+        """LISTEN の接続を保ち、切れた場合は接続し直す."""
+        assert self._engine is not None
+        while True:
+            try:
+                async with self._engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    driver = raw.driver_connection
+                    lost = asyncio.Event()
+                    driver.add_termination_listener(lambda _: lost.set())
+                    await driver.add_listener(CHANNEL, self._on_notify)
+                    # 切れていた間の通知は届かないため、LISTEN し直してから再同期を促す
+                    self.reset_all()
+                    while not lost.is_set():
+                        with suppress(TimeoutError):
+                            async with asyncio.timeout(self.keepalive_interval):
+                                await lost.wait()
+                        if not lost.is_set():
+                            await conn.exec_driver_sql("SELECT 1")
+            except Exception:
+                logger.exception("変更通知の LISTEN 接続が切れました")
+            await asyncio.sleep(self.reconnect_interval)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """asyncpg の通知コールバック."""
+        self.dispatch(payload)
+
+
+@lru_cache
+def get_change_event_broker() -> Optional[ChangeEventBroker]:
+    """変更通知のブローカーを取得（初回呼び出し時に生成してキャッシュ、無効なら None）.
+
+    生成時に Session のイベントに登録するため、コミットを通知するには
+    アプリの起動時（lifespan）に呼び出しておく。
+    """
+    settings = get_settings()
+    broker: ChangeEventBroker
+    if settings.EVENTS_BACKEND == "none":
+        return None
+    if settings.EVENTS_BACKEND == "postgres":
+        broker = PostgresChangeEventBroker(
+            settings.database_url,
+            max_connections=settings.EVENTS_MAX_CONNECTIONS,
+            max_connections_per_user=settings.EVENTS_MAX_CONNECTIONS_PER_USER,
+            queue_size=settings.EVENTS_QUEUE_SIZE,
+            reconnect_interval=settings.EVENTS_RECONNECT_SECONDS,
+        )
+    else:
+        broker = ChangeEventBroker(
+            max_connections=settings.EVENTS_MAX_CONNECTIONS,
+            max_connections_per_user=settings.EVENTS_MAX_CONNECTIONS_PER_USER,
+            queue_size=settings.EVENTS_QUEUE_SIZE,
+        )
+    broker.install()
+    return broker
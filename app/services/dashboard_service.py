@@ -0,0 +1,205 @@
+"""ダッシュボード集約サービス."""
+
+import asyncio
+import heapq
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, asc, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlmodel import col
+
+from app.core.config import get_settings
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.models.note import Note
+from app.models.task import Task
+from app.models.vehicle import Vehicle
+from app.services.task_service import TaskService
+
+
+@dataclass
+class VehicleWithLatestRefuel:
+    """最新給油付きの車."""
+
+    vehicle: Vehicle
+    latest_refuel: Optional[FuelRecord]
+
+
+@dataclass
+class DashboardSummary:
+    """ダッシュボード集約結果."""
+
+    open_task_count: int
+    overdue_task_count: int
+    upcoming_tasks: List[Task]
+    vehicles: List[VehicleWithLatestRefuel]
+    recent_notes: List[Any]
+
+
+class DashboardService:
+    """ダッシュボード集約ビジネスロジック層.
+
+    1 つの AsyncSession では複数クエリを同時に実行できないため、
+    サブクエリごとにセッションファクトリからセッションを取得し、
+    asyncio.gather で並行実行する。
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """初期化.
+
+        Args:
+            session_factory: セッションファクトリ（サブクエリごとに 1 セッション）
+        """
+        self.session_factory = session_factory
+
+    async def get_summary(
+        self,
+        user_id: UUID,
+        task_limit: int = 5,
+        note_limit: int = 5,
+        today: Optional[date] = None,
+    ) -> DashboardSummary:
+        """ダッシュボード集約結果を取得.
+
+        繰り返しタスクは TaskService の一覧と同じく未保存の発生分を展開して数える。
+        展開する期間は今日の前後 TASK_RECURRENCE_HORIZON_DAYS 日（設定）
+        （GET /api/tasks?overdue=true と ?is_completed=false で展開される発生分）で、
+        今日より前の発生分は期限切れとして数える。
+
+        Args:
+            user_id: ユーザー ID
+            task_limit: 取得する期日が近いタスク数
+            note_limit: 取得する最近更新されたノート数
+            today: 期限切れ判定の基準日（省略時は JST の今日）
+
+        Returns:
+            DashboardSummary
+        """
+        today = today or datetime.now(JST).date()
+
+        (
+            (open_count, overdue_count),
+            upcoming,
+            occurrences,
+            vehicles,
+            notes,
+        ) = await asyncio.gather(
+            self._count_tasks(user_id, today),
+            self._list_upcoming_tasks(user_id, task_limit),
+            self._list_occurrences(user_id, today),
+            self._list_vehicles_with_latest_refuel(user_id),
+            self._list_recent_notes(user_id, note_limit),
+        )
+
+        overdue_occurrences = sum(1 for task in occurrences if task.due_date < today)
+        # どちらも (期日, 作成日時) の昇順のため、合流して先頭 task_limit 件を取る
+        merged = heapq.merge(
+            upcoming, occurrences, key=lambda task: (task.due_date, task.created_at)
+        )
+
+        return DashboardSummary(
+            open_task_count=open_count + len(occurrences),
+            overdue_task_count=overdue_count + overdue_occurrences,
+            upcoming_tasks=list(islice(merged, task_limit)),
+            vehicles=vehicles,
+            recent_notes=notes,
+        )
+
+    async def _count_tasks(self, user_id: UUID, today: date) -> tuple[int, int]:
+        """未完了タスク数と期限切れタスク数を 1 クエリで取得."""
+        is_open = col(Task.is_completed).is_(False)
+        stmt = select(
+            func.count().filter(is_open),
+            func.count().filter(and_(is_open, col(Task.due_date) < today)),
+        ).where(
+            col(Task.user_id) == user_id,
+            col(Task.deleted_at).is_(None),
+            # 繰り返しシリーズ行は除く（発生分は _list_occurrences で展開する）
+            col(Task.recurrence_rule).is_(None),
+        )
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            open_count, overdue_count = result.one()
+        return open_count or 0, overdue_count or 0
+
+    async def _list_upcoming_tasks(self, user_id: UUID, limit: int) -> List[Task]:
+        """期日が近い未完了タスクを取得."""
+        stmt = (
+            select(Task)
+            .where(
+                col(Task.user_id) == user_id,
+                col(Task.deleted_at).is_(None),
+                col(Task.is_completed).is_(False),
+                col(Task.due_date).is_not(None),
+                col(Task.recurrence_rule).is_(None),  # 繰り返しシリーズ行は除く
+            )
+            .order_by(asc(col(Task.due_date)), asc(col(Task.created_at)))
+            .limit(limit)
+        )
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
+    async def _list_occurrences(self, user_id: UUID, today: date) -> List[Task]:
+        """今日の前後の繰り返しタスクの未保存の発生分を期日順に取得."""
+        horizon = timedelta(days=get_settings().TASK_RECURRENCE_HORIZON_DAYS)
+        async with self.session_factory() as session:
+            return await TaskService(session).list_pending_occurrences(
+                user_id, today - horizon, today + horizon
+            )
+
+    async def _list_vehicles_with_latest_refuel(
+        self, user_id: UUID
+    ) -> List[VehicleWithLatestRefuel]:
+        """車一覧を最新給油（DISTINCT ON）と結合して取得."""
+        latest = (
+            select(FuelRecord)
+            .where(
+                col(FuelRecord.user_id) == user_id,
+                col(FuelRecord.deleted_at).is_(None),
+            )
+            .order_by(
+                col(FuelRecord.vehicle_id), desc(col(FuelRecord.refuel_datetime))
+            )
+            .distinct(col(FuelRecord.vehicle_id))
+            .subquery()
+        )
+        latest_refuel = aliased(FuelRecord, latest)
+
+        stmt = (
+            select(Vehicle, latest_refuel)
+            .outerjoin(latest_refuel, latest_refuel.vehicle_id == Vehicle.id)
+            .where(
+                col(Vehicle.user_id) == user_id,
+                col(Vehicle.deleted_at).is_(None),
+            )
+            .order_by(asc(col(Vehicle.seq)))
+        )
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            return [
+                VehicleWithLatestRefuel(vehicle=vehicle, latest_refuel=refuel)
+                for vehicle, refuel in result.all()
+            ]
+
+    async def _list_recent_notes(self, user_id: UUID, limit: int) -> List[Any]:
+        """最近更新されたノートを本文なしで取得."""
+        stmt = (
+            select(
+                col(Note.id),
+                col(Note.title),
+                col(Note.category_id),
+                col(Note.updated_at),
+            )
+            .where(col(Note.user_id) == user_id)
+            .order_by(desc(col(Note.updated_at)))
+            .limit(limit)
+        )
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            return list(result.all())
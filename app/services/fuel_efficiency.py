@@ -0,0 +1,196 @@
+"""満タン法（満タン給油から次の満タン給油まで）による燃費計算."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import accumulate, compress, pairwise
+from typing import Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.core.config import get_settings
+
+
+def fuel_amount(total_cost: int, unit_price: int) -> Optional[float]:
+    """給油量（L）: 総費用 / 単価（小数点2桁、単価が 0 以下なら None）."""
+    if unit_price > 0:
+        return round(total_cost / unit_price, 2)
+    return None
+
+
+def fuel_centilitres(total_cost: int, unit_price: int) -> int:
+    """給油量（0.01L 単位、四捨五入した整数、単価が 0 以下なら 0）.
+
+    区間・期間の給油量の合計で誤差が積み重ならないよう整数で計算する
+    （SQL 側の集計も同じ式 (total_cost * 200 + unit_price) / (2 * unit_price) を使う）。
+    """
+    if unit_price <= 0:
+        return 0
+    return (total_cost * 200 + unit_price) // (2 * unit_price)
+
+
+def tank_to_tank_efficiency(distance: int, centilitres: int) -> Optional[float]:
+    """満タン給油の区間の燃費（km/L、小数点2桁、給油量が 0 以下なら None）."""
+    if centilitres <= 0:
+        return None
+    return round(distance / (centilitres / 100), 2)
+
+
+@dataclass(slots=True)
+class FuelHistoryMetrics:
+    """
+    車 1 台分の給油履歴（給油日時の昇順）の計算結果.
+
+    各リストは履歴と同じ順序・同じ長さで、index で記録 ID から位置を引く。
+    """
+
+    index: dict[UUID, int]
+    distances: list[int]
+    fuel_amounts: list[Optional[float]]
+    fuel_efficiencies: list[Optional[float]]
+
+    def get(
+        self, record_id: UUID
+    ) -> Tuple[Optional[int], Optional[float], Optional[float]]:
+        """記録の (走行距離, 給油量, 燃費)（履歴にない記録は None の組）."""
+        i = self.index.get(record_id)
+        if i is None:
+            return None, None, None
+        return self.distances[i], self.fuel_amounts[i], self.fuel_efficiencies[i]
+
+
+def compute_fuel_history(
+    record_ids: Sequence[UUID],
+    total_mileages: Sequence[int],
+    total_costs: Sequence[int],
+    unit_prices: Sequence[int],
+    full_tanks: Sequence[bool],
+) -> FuelHistoryMetrics:
+    """給油履歴の走行距離・給油量・燃費を計算.
+
+    - 走行距離: 直前の記録との総走行距離の差（最初の記録は総走行距離）
+    - 給油量: 総費用 / 単価
+    - 燃費: 満タン給油の記録についてのみ、直前の満タン給油からの走行距離を
+      その間（直前の満タン給油の次から今回まで）の給油量の合計で割った値。
+      一部給油の記録、最初の満タン給油、区間内に給油量が不明な記録がある場合は None
+
+    区間の給油量は累積和の差で求めるため、区間を走査し直さずに計算できる
+    （給油量は 0.01L 単位の整数で累積し、丸め誤差を持ち込まない）。
+
+    Args:
+        record_ids: 記録 ID（給油日時の昇順、以下同じ）
+        total_mileages: 総走行距離
+        total_costs: 総費用
+        unit_prices: 単価
+        full_tanks: 満タン給油かどうか
+
+    Returns:
+        記録ごとの計算結果
+    """
+    distances = [
+        mileage - previous
+        for mileage, previous in zip(total_mileages, [0, *total_mileages[:-1]])
+    ]
+    amounts = [
+        fuel_amount(cost, price) for cost, price in zip(total_costs, unit_prices)
+    ]
+
+    # 先頭から k 件までの給油量の合計（0.01L 単位）と給油量が不明な記録の件数
+    litres = list(
+        accumulate(map(fuel_centilitres, total_costs, unit_prices), initial=0)
+    )
+    unknown = list(accumulate((a is None for a in amounts), initial=0))
+
+    # 隣り合う満タン給油の組 (start, end) ごとに区間 (start, end] の給油量を差で求める
+    efficiencies: list[Optional[float]] = [None] * len(amounts)
+    full_positions = list(compress(range(len(amounts)), full_tanks))
+    for start, end in pairwise(full_positions):
+        if unknown[end + 1] == unknown[start + 1]:
+            efficiencies[end] = tank_to_tank_efficiency(
+                total_mileages[end] - total_mileages[start],
+                litres[end + 1] - litres[start + 1],
+            )
+
+    return FuelHistoryMetrics(
+        index={record_id: i for i, record_id in enumerate(record_ids)},
+        distances=distances,
+        fuel_amounts=amounts,
+        fuel_efficiencies=efficiencies,
+    )
+
+
+# (トークン, 計算結果)
+CacheEntry = Tuple[bytes, FuelHistoryMetrics]
+
+
+class FuelHistoryCache:
+    """
+    車ごとの FuelHistoryMetrics のプロセス内 LRU キャッシュ.
+
+    燃費記録の書き込み時に invalidate() で車単位に無効化する。
+    エントリは token（共有のレスポンスキャッシュのバージョン）と組で保存し、
+    他のワーカーでの書き込みでバージョンが変わったものは使わない。
+    """
+
+    def __init__(self, max_vehicles: int = 1000) -> None:
+        """初期化.
+
+        Args:
+            max_vehicles: 保持する最大の車の数（0 でキャッシュ無効）
+        """
+        self.max_vehicles = max_vehicles
+        self.generation = 0
+        self._entries: "OrderedDict[Tuple[UUID, UUID], CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """保持している車の数."""
+        return len(self._entries)
+
+    def get(
+        self, user_id: UUID, vehicle_id: UUID, token: bytes
+    ) -> Optional[FuelHistoryMetrics]:
+        """キャッシュ済みの計算結果を取得し、最近使った車として扱う."""
+        key = (user_id, vehicle_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != token:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(
+        self,
+        user_id: UUID,
+        vehicle_id: UUID,
+        token: bytes,
+        metrics: FuelHistoryMetrics,
+        generation: int,
+    ) -> None:
+        """計算結果を保存し、上限を超えた分を古い順に削除.
+
+        generation は履歴の読み込み前に取得した値で、その後に無効化があった場合は
+        書き込み前の履歴から計算した可能性があるため保存しない。
+        """
+        if self.max_vehicles <= 0 or generation != self.generation:
+            return
+        key = (user_id, vehicle_id)
+        self._entries[key] = (token, metrics)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_vehicles:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID, vehicle_id: Optional[UUID] = None) -> None:
+        """車（None の場合はユーザーのすべての車）の計算結果を削除."""
+        self.generation += 1
+        if vehicle_id is not None:
+            self._entries.pop((user_id, vehicle_id), None)
+            return
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+
+
+def configure_fuel_history_cache() -> None:
+    """設定から燃費計算キャッシュの上限を設定（create_app() から呼ぶ）."""
+    fuel_history_cache.max_vehicles = get_settings().FUEL_HISTORY_CACHE_SIZE
+
+
+#  ---  Singleton instance ----
+# import 時には設定を読まず、configure_fuel_history_cache() まではキャッシュ無効
+fuel_history_cache = FuelHistoryCache(max_vehicles=0)
@@ -1,14 +1,54 @@
 """燃費記録サービス."""
 
+import logging
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Awaitable, Callable, Optional, TypeVar, Union
 from uuid import UUID
 
-from sqlalchemy import asc, select, desc
+from sqlalchemy import (
+    BigInteger,
+    Row,
+    Subquery,
+    asc,
+    case,
+    cast,
+    desc,
+    func,
+    lambda_stmt,
+    select,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.models.base import JST
 from app.models.fuel_record import FuelRecord
 from app.schemas.fuel_record import FuelRecordCreate, FuelRecordUpdate
+from app.services.fuel_efficiency import (
+    FuelHistoryMetrics,
+    compute_fuel_history,
+    fuel_amount,
+    fuel_history_cache,
+    tank_to_tank_efficiency,
+)
+from app.services.fuel_rollup_service import FuelRollupService, RollupRecord
+from app.services.response_cache import FUEL_RECORD, VEHICLE, response_cache
+
+logger = logging.getLogger(__name__)
+
+# 作成済みと確認できた fuel_record パーティションの年（JST、プロセス内キャッシュ）
+_known_partition_years: set[int] = set()
+
+# パーティションのない年への書き込みの SQLSTATE（check_violation、fuel_record に CHECK 制約はない）
+MISSING_PARTITION_SQLSTATE = "23514"
+
+T = TypeVar("T")
+
+
+def _is_missing_partition(error: IntegrityError) -> bool:
+    """パーティションのない年への書き込みによるエラーかどうか."""
+    return getattr(error.orig, "sqlstate", None) == MISSING_PARTITION_SQLSTATE
 
 
 @dataclass
@@ -21,6 +61,206 @@ class FuelRecordWithCalculation:
     fuel_efficiency: Optional[float]
 
 
+@dataclass(slots=True)
+class FuelRecordRow:
+    """
+    一覧用の燃費記録（FuelRecordResponse と同じ項目）.
+
+    必要な列だけを Core で取得した行から直接組み立てるため、
+    ORM エンティティの生成やセッションのアイデンティティマップへの登録を伴わない。
+    """
+
+    id: UUID
+    vehicle_id: UUID
+    user_id: UUID
+    refuel_datetime: datetime
+    total_mileage: int
+    fuel_type: str
+    unit_price: int
+    total_cost: int
+    is_full_tank: bool
+    gas_station_name: Optional[str]
+    distance_traveled: Optional[int]
+    fuel_amount: Optional[float]
+    fuel_efficiency: Optional[float]
+    created_at: datetime
+    updated_at: datetime
+
+
+# FuelRecordRow の計算項目以外に対応する列（この順序で select する）
+FUEL_RECORD_ROW_COLUMNS = (
+    FuelRecord.id,
+    FuelRecord.vehicle_id,
+    FuelRecord.user_id,
+    FuelRecord.refuel_datetime,
+    FuelRecord.total_mileage,
+    FuelRecord.fuel_type,
+    FuelRecord.unit_price,
+    FuelRecord.total_cost,
+    FuelRecord.is_full_tank,
+    FuelRecord.gas_station_name,
+    FuelRecord.created_at,
+    FuelRecord.updated_at,
+)
+
+
+# 燃費計算に使う履歴の列（この順序で select し、列ごとに compute_fuel_history へ渡す）
+FUEL_HISTORY_COLUMNS = (
+    FuelRecord.id,
+    FuelRecord.total_mileage,
+    FuelRecord.total_cost,
+    FuelRecord.unit_price,
+    FuelRecord.is_full_tank,
+)
+
+
+def _fuel_history_window(user_id: UUID) -> Subquery:
+    """ユーザーの全車の給油履歴に、燃費計算用の列を窓関数で付けたサブクエリ.
+
+    車ごとに (給油日時, ID) の順に並べ、FuelRecord の全列に加えて次の列を持つ。
+
+    - distance_traveled: 直前の記録との総走行距離の差（最初の記録は総走行距離）
+    - fuel_centilitres: 給油量（0.01L 単位、fuel_centilitres() と同じ計算）
+    - unknown_amount: 給油量が不明（単価が 0 以下）なら 1
+    - full_tanks_before: それより前の満タン給油の件数
+
+    満タン給油の記録では、(vehicle_id, full_tanks_before) が同じ行がちょうど
+    直前の満タン給油の次から今回までの区間になる。
+    """
+    ordered = {
+        "partition_by": FuelRecord.vehicle_id,
+        "order_by": (FuelRecord.refuel_datetime, FuelRecord.id),
+    }
+    return (
+        select(
+            *FuelRecord.__table__.columns,  # type: ignore[attr-defined]
+            (
+                FuelRecord.total_mileage
+                - func.lag(FuelRecord.total_mileage, 1, 0).over(**ordered)
+            ).label("distance_traveled"),
+            case(
+                (
+                    FuelRecord.unit_price > 0,
+                    (
+                        cast(FuelRecord.total_cost, BigInteger) * 200
+                        + FuelRecord.unit_price
+                    )
+                    // (2 * FuelRecord.unit_price),
+                ),
+                else_=0,
+            ).label("fuel_centilitres"),
+            case((FuelRecord.unit_price > 0, 0), else_=1).label("unknown_amount"),
+            func.count()
+            .filter(FuelRecord.is_full_tank)
+            .over(**ordered, rows=(None, -1))
+            .label("full_tanks_before"),
+        )
+        .where(
+            FuelRecord.user_id == user_id,
+            FuelRecord.deleted_at.is_(None),
+        )
+        .subquery("history")
+    )
+
+
+def _interval_columns(history: Subquery) -> tuple:
+    """history の各行の計算項目と、その行で終わる満タン給油の区間の合計."""
+    interval = {"partition_by": (history.c.vehicle_id, history.c.full_tanks_before)}
+    return (
+        history.c.distance_traveled,
+        history.c.full_tanks_before,
+        func.sum(history.c.distance_traveled)
+        .over(**interval)
+        .label("interval_distance"),
+        # bigint の sum は numeric になるため整数に戻す
+        cast(func.sum(history.c.fuel_centilitres).over(**interval), BigInteger).label(
+            "interval_centilitres"
+        ),
+        func.sum(history.c.unknown_amount).over(**interval).label("interval_unknown"),
+    )
+
+
+def latest_full_tank_intervals(user_id: UUID) -> Subquery:
+    """車ごとの最新の満タン給油の区間のサブクエリ（車一覧の直近の燃費用）.
+
+    _fuel_history_window() の満タン給油の記録のうち車ごとに最新の 1 件について、
+    vehicle_id と _interval_columns() の列を持つ。燃費は interval_efficiency() で
+    求め、燃費記録一覧のその記録の燃費と同じ値になる。
+    """
+    history = _fuel_history_window(user_id)
+    intervals = select(
+        history.c.vehicle_id,
+        history.c.id,
+        history.c.refuel_datetime,
+        history.c.is_full_tank,
+        *_interval_columns(history),
+    ).subquery("intervals")
+    return (
+        select(
+            intervals.c.vehicle_id,
+            intervals.c.full_tanks_before,
+            intervals.c.interval_distance,
+            intervals.c.interval_centilitres,
+            intervals.c.interval_unknown,
+        )
+        .where(intervals.c.is_full_tank)
+        .distinct(intervals.c.vehicle_id)
+        .order_by(
+            intervals.c.vehicle_id,
+            desc(intervals.c.refuel_datetime),
+            desc(intervals.c.id),
+        )
+        .subquery("latest_full_tank")
+    )
+
+
+def interval_efficiency(row: Row) -> Optional[float]:
+    """_interval_columns() を含む満タン給油の行の燃費.
+
+    最初の満タン給油、区間内に給油量が不明な記録がある場合、
+    満タン給油の記録がない場合（外部結合の NULL）は None。
+    """
+    if not row.full_tanks_before or row.interval_unknown != 0:
+        return None
+    return tank_to_tank_efficiency(row.interval_distance, row.interval_centilitres)
+
+
+def _window_metrics(
+    record: Union[FuelRecord, Row], row: Row
+) -> tuple[Optional[int], Optional[float], Optional[float]]:
+    """_interval_columns() を含む行の (走行距離, 給油量, 燃費).
+
+    compute_fuel_history() と同じく満タン法で、区間の走行距離は
+    各記録の走行距離の合計（= 今回と直前の満タン給油の総走行距離の差）。
+
+    Args:
+        record: 燃費記録（またはその列を含む行）
+        row: _interval_columns() を含む行
+    """
+    return (
+        row.distance_traveled,
+        fuel_amount(record.total_cost, record.unit_price),
+        interval_efficiency(row) if record.is_full_tank else None,
+    )
+
+
+async def _history_token(user_id: UUID) -> Optional[bytes]:
+    """燃費計算結果のキャッシュに使うトークン（キャッシュしない場合は None）.
+
+    共有のレスポンスキャッシュ（redis）の給油記録のバージョンを使い、
+    他のワーカーでの書き込み後に古い計算結果を使わないようにする。
+    バージョンがプロセス内にしかない場合（none・memory）は他のワーカーでの
+    書き込みを検知できないため、キャッシュしない。
+    """
+    if not response_cache.shared:
+        return None
+    try:
+        return await response_cache.version(user_id, FUEL_RECORD)
+    except Exception:
+        logger.exception("燃費計算結果のキャッシュのバージョン取得に失敗しました")
+        return None
+
+
 class FuelRecordService:
     """燃費記録管理サービス.
 
@@ -46,104 +286,186 @@ class FuelRecordService:
 
         Args:
             user_id: ユーザー ID.
-            vehicle_id: 車 ID（オプション）.
+            vehicle_id: 車 ID（オプション、省略時はすべての車）.
             limit: 取得件数.
             offset: オフセット.
 
         Returns:
             燃費計算結果付き燃費記録リスト（新規順）.
         """
-        query = select(FuelRecord).where(
-            FuelRecord.user_id == user_id,
-            FuelRecord.deleted_at.is_(None),
-        )
-
-        if vehicle_id:
-            query = query.where(FuelRecord.vehicle_id == vehicle_id)
-
-        query = (
-            query.order_by(desc(FuelRecord.refuel_datetime)).limit(limit).offset(offset)
+        if vehicle_id is None:
+            return await self._list_all_vehicles(user_id, limit, offset)
+
+        query = lambda_stmt(
+            lambda: select(FuelRecord)
+            .where(
+                FuelRecord.user_id == user_id,
+                FuelRecord.vehicle_id == vehicle_id,
+                FuelRecord.deleted_at.is_(None),
+            )
+            .order_by(desc(FuelRecord.refuel_datetime))
+            .limit(limit)
+            .offset(offset)
         )
 
         result = await self.db_session.execute(query)
         records = list(result.scalars().all())
+        if not records:
+            return []
 
-        # 燃費計算のため、同じ車両の全レコードを取得（給油日時の昇順）
-        if vehicle_id and records:
-            all_records_query = (
-                select(FuelRecord)
-                .where(
-                    FuelRecord.user_id == user_id,
-                    FuelRecord.vehicle_id == vehicle_id,
-                    FuelRecord.deleted_at.is_(None),
+        history = await self.get_fuel_history(user_id, vehicle_id)
+        results = []
+        for record in records:
+            distance_traveled, fuel_amount, fuel_efficiency = history.get(record.id)
+            results.append(
+                FuelRecordWithCalculation(
+                    record=record,
+                    distance_traveled=distance_traveled,
+                    fuel_amount=fuel_amount,
+                    fuel_efficiency=fuel_efficiency,
                 )
-                .order_by(asc(FuelRecord.refuel_datetime))
             )
-            all_result = await self.db_session.execute(all_records_query)
-            all_records = list(all_result.scalars().all())
-
-            return self._calculate_fuel_efficiency(records, all_records)
+        return results
 
-        # vehicle_id が指定されていない場合は計算なし
+    async def _list_all_vehicles(
+        self, user_id: UUID, limit: int, offset: int
+    ) -> list[FuelRecordWithCalculation]:
+        """全車の燃費記録一覧（燃費計算付き、1 回の窓関数クエリで計算）."""
+        history = _fuel_history_window(user_id)
+        record = aliased(FuelRecord, history)
+        query = (
+            select(record, *_interval_columns(history))
+            .order_by(desc(history.c.refuel_datetime))
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.db_session.execute(query)
         return [
-            FuelRecordWithCalculation(
-                record=r,
-                distance_traveled=None,
-                fuel_amount=None,
-                fuel_efficiency=None,
-            )
-            for r in records
+            FuelRecordWithCalculation(row[0], *_window_metrics(row[0], row))
+            for row in result.all()
         ]
 
-    def _calculate_fuel_efficiency(
+    async def list_fuel_record_rows(
         self,
-        records: list[FuelRecord],
-        all_records: list[FuelRecord],
-    ) -> list[FuelRecordWithCalculation]:
-        """燃費を計算.
+        user_id: UUID,
+        vehicle_id: Optional[UUID] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[FuelRecordRow]:
+        """燃費記録一覧を FuelRecordRow で取得（一覧 API 用の読み取り専用パス）.
+
+        並び順と燃費計算は list_fuel_records と同じ。レスポンスに含める列だけを
+        取得する。
 
         Args:
-            records: 返却対象のレコード.
-            all_records: 同じ車両の全レコード（給油日時の昇順）.
+            user_id: ユーザー ID.
+            vehicle_id: 車 ID（オプション、省略時はすべての車）.
+            limit: 取得件数.
+            offset: オフセット.
 
         Returns:
-            燃費計算結果付きレコードリスト.
+            FuelRecordRow のリスト（新規順）.
         """
-        # レコードIDから前回レコードへのマッピングを作成
-        prev_record_map: dict[UUID, Optional[FuelRecord]] = {}
-        for i, rec in enumerate(all_records):
-            prev_record_map[rec.id] = all_records[i - 1] if i > 0 else None
+        if vehicle_id is None:
+            return await self._list_all_vehicle_rows(user_id, limit, offset)
+
+        query = lambda_stmt(
+            lambda: select(*FUEL_RECORD_ROW_COLUMNS)
+            .where(
+                FuelRecord.user_id == user_id,
+                FuelRecord.vehicle_id == vehicle_id,
+                FuelRecord.deleted_at.is_(None),
+            )
+            .order_by(desc(FuelRecord.refuel_datetime))
+            .limit(limit)
+            .offset(offset)
+        )
 
-        results = []
-        for record in records:
-            prev_record = prev_record_map.get(record.id)
+        result = await self.db_session.execute(query)
+        rows = result.all()
+        if not rows:
+            return []
+
+        history = await self.get_fuel_history(user_id, vehicle_id)
+        fuel_records = []
+        for row in rows:
+            distance_traveled, fuel_amount, fuel_efficiency = history.get(row.id)
+            fuel_records.append(
+                FuelRecordRow(
+                    *row[:10],
+                    distance_traveled,
+                    fuel_amount,
+                    fuel_efficiency,
+                    row.created_at,
+                    row.updated_at,
+                )
+            )
+        return fuel_records
+
+    async def _list_all_vehicle_rows(
+        self, user_id: UUID, limit: int, offset: int
+    ) -> list[FuelRecordRow]:
+        """全車の燃費記録一覧を FuelRecordRow で取得（1 回の窓関数クエリで計算）.
+
+        燃費はページ外の記録にも依存するため、窓関数はユーザーの全履歴に対して
+        計算し、その結果を新規順に並べてからページを切り出す。
+        """
+        history = _fuel_history_window(user_id)
+        query = (
+            select(
+                *(history.c[column.key] for column in FUEL_RECORD_ROW_COLUMNS),
+                *_interval_columns(history),
+            )
+            .order_by(desc(history.c.refuel_datetime))
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.db_session.execute(query)
+        return [
+            FuelRecordRow(
+                *row[:10], *_window_metrics(row, row), row.created_at, row.updated_at
+            )
+            for row in result.all()
+        ]
 
-            # 走行距離: 前回データがあれば差分、なければ総走行距離
-            if prev_record:
-                distance_traveled = record.total_mileage - prev_record.total_mileage
-            else:
-                distance_traveled = record.total_mileage
+    async def get_fuel_history(
+        self, user_id: UUID, vehicle_id: UUID
+    ) -> FuelHistoryMetrics:
+        """車の全給油履歴の燃費計算結果を取得（車ごとにキャッシュ）.
 
-            # 給油量: 総費用 / 単価
-            fuel_amount: Optional[float] = None
-            if record.unit_price > 0:
-                fuel_amount = round(record.total_cost / record.unit_price, 2)
+        燃費は満タン法（直前の満タン給油からの走行距離 / その間の給油量の合計）で
+        計算するため、ページ外の記録も含めて履歴全体から求める。
 
-            # 燃費: 走行距離 / 給油量（小数点2桁）
-            fuel_efficiency: Optional[float] = None
-            if fuel_amount and fuel_amount > 0:
-                fuel_efficiency = round(distance_traveled / fuel_amount, 2)
+        Args:
+            user_id: ユーザー ID.
+            vehicle_id: 車 ID.
 
-            results.append(
-                FuelRecordWithCalculation(
-                    record=record,
-                    distance_traveled=distance_traveled,
-                    fuel_amount=fuel_amount,
-                    fuel_efficiency=fuel_efficiency,
-                )
+        Returns:
+            記録 ID ごとの走行距離・給油量・燃費.
+        """
+        generation = fuel_history_cache.generation
+        token = await _history_token(user_id)
+        if token is not None:
+            cached = fuel_history_cache.get(user_id, vehicle_id, token)
+            if cached is not None:
+                return cached
+
+        query = lambda_stmt(
+            lambda: select(*FUEL_HISTORY_COLUMNS)
+            .where(
+                FuelRecord.user_id == user_id,
+                FuelRecord.vehicle_id == vehicle_id,
+                FuelRecord.deleted_at.is_(None),
             )
+            .order_by(asc(FuelRecord.refuel_datetime), asc(FuelRecord.id))
+        )
+        rows = (await self.db_session.execute(query)).all()
+        columns = list(zip(*rows)) if rows else [[]] * len(FUEL_HISTORY_COLUMNS)
+        history = compute_fuel_history(*columns)
 
-        return results
+        if token is not None:
+            fuel_history_cache.set(user_id, vehicle_id, token, history, generation)
+        return history
 
     async def get_fuel_record(
         self,
@@ -159,15 +481,49 @@ class FuelRecordService:
         Returns:
             燃費記録、見つからない場合は None.
         """
-        query = select(FuelRecord).where(
-            FuelRecord.id == fuel_record_id,
-            FuelRecord.user_id == user_id,
-            FuelRecord.deleted_at.is_(None),
+        query = lambda_stmt(
+            lambda: select(FuelRecord).where(
+                FuelRecord.id == fuel_record_id,
+                FuelRecord.user_id == user_id,
+                FuelRecord.deleted_at.is_(None),
+            )
         )
 
         result = await self.db_session.execute(query)
         return result.scalar_one_or_none()
 
+    async def _ensure_partition(self, refuel_datetime: datetime) -> Optional[int]:
+        """給油日時を含む年のパーティションを作成（作成済みと確認済みなら何もしない）.
+
+        Returns:
+            新たに確認した年（コミット後に記録する）、確認済みなら None.
+        """
+        year = refuel_datetime.astimezone(JST).year
+        if year in _known_partition_years:
+            return None
+        await self.db_session.execute(
+            select(func.ensure_fuel_record_partition(refuel_datetime))
+        )
+        return year
+
+    async def _retry_on_missing_partition(
+        self, write: Callable[[], Awaitable[T]]
+    ) -> T:
+        """パーティションのない年への書き込みに失敗した場合、確認し直して 1 回だけ再実行.
+
+        確認済みの年のパーティションが detach_fuel_record_partitions_before() で
+        切り離されると、_ensure_partition() を省略した書き込みが失敗するため、
+        確認済みの年を忘れてからやり直す。
+        """
+        try:
+            return await write()
+        except IntegrityError as e:
+            if not _is_missing_partition(e):
+                raise
+            await self.db_session.rollback()
+            _known_partition_years.clear()
+            return await write()
+
     async def create_fuel_record(
         self,
         fuel_record_create: FuelRecordCreate,
@@ -182,6 +538,14 @@ class FuelRecordService:
         Returns:
             作成された燃費記録.
         """
+        return await self._retry_on_missing_partition(
+            lambda: self._create_fuel_record(fuel_record_create, user_id)
+        )
+
+    async def _create_fuel_record(
+        self, fuel_record_create: FuelRecordCreate, user_id: UUID
+    ) -> FuelRecord:
+        """燃費記録作成（create_fuel_record の本体）."""
         fuel_record = FuelRecord(
             user_id=user_id,
             vehicle_id=fuel_record_create.vehicle_id,
@@ -193,8 +557,16 @@ class FuelRecordService:
             is_full_tank=fuel_record_create.is_full_tank,
             gas_station_name=fuel_record_create.gas_station_name,
         )
+        new_year = await self._ensure_partition(fuel_record.refuel_datetime)
         self.db_session.add(fuel_record)
+        await FuelRollupService(self.db_session).record_added(
+            RollupRecord.of(fuel_record)
+        )
         await self.db_session.commit()
+        await response_cache.bump(user_id, FUEL_RECORD, VEHICLE)
+        fuel_history_cache.invalidate(user_id, fuel_record.vehicle_id)
+        if new_year is not None:
+            _known_partition_years.add(new_year)
         await self.db_session.refresh(fuel_record)
         return fuel_record
 
@@ -214,17 +586,43 @@ class FuelRecordService:
         Returns:
             更新された燃費記録、見つからない場合は None.
         """
+        return await self._retry_on_missing_partition(
+            lambda: self._update_fuel_record(
+                fuel_record_id, fuel_record_update, user_id
+            )
+        )
+
+    async def _update_fuel_record(
+        self,
+        fuel_record_id: UUID,
+        fuel_record_update: FuelRecordUpdate,
+        user_id: UUID,
+    ) -> Optional[FuelRecord]:
+        """燃費記録更新（update_fuel_record の本体）."""
         fuel_record = await self.get_fuel_record(fuel_record_id, user_id)
         if not fuel_record:
             return None
 
+        before = RollupRecord.of(fuel_record)
         update_data = fuel_record_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             if value is not None:
                 setattr(fuel_record, key, value)
 
+        # 給油日時の変更で行が別の年のパーティションへ移動する場合に備える
+        new_year = None
+        if update_data.get("refuel_datetime") is not None:
+            new_year = await self._ensure_partition(fuel_record.refuel_datetime)
+
         self.db_session.add(fuel_record)
+        await FuelRollupService(self.db_session).record_updated(
+            before, RollupRecord.of(fuel_record)
+        )
         await self.db_session.commit()
+        await response_cache.bump(user_id, FUEL_RECORD, VEHICLE)
+        fuel_history_cache.invalidate(user_id, fuel_record.vehicle_id)
+        if new_year is not None:
+            _known_partition_years.add(new_year)
         await self.db_session.refresh(fuel_record)
         return fuel_record
 
@@ -246,10 +644,13 @@ class FuelRecordService:
         if not fuel_record:
             return False
 
-        from datetime import datetime
-        from app.models.base import JST
-
         fuel_record.deleted_at = datetime.now(JST)
         self.db_session.add(fuel_record)
+        await FuelRollupService(self.db_session).record_removed(
+            RollupRecord.of(fuel_record)
+        )
         await self.db_session.commit()
+        await response_cache.bump(user_id, FUEL_RECORD, VEHICLE)
+        fuel_history_cache.invalidate(user_id, fuel_record.vehicle_id)
         return True
+
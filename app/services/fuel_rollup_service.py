@@ -0,0 +1,268 @@
+"""燃費記録の期間別集計サービス."""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Literal, Optional
+from uuid import UUID
+
+from sqlalchemy import asc, desc, func, lambda_stmt, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.models.fuel_rollup import FuelRollup
+from app.services.fuel_efficiency import fuel_centilitres
+
+Granularity = Literal["month", "week"]
+GRANULARITIES: tuple[Granularity, ...] = ("month", "week")
+
+# 差分で加算する集計列
+ROLLUP_COLUMNS = ("record_count", "total_cost", "fuel_centilitres", "distance_traveled")
+
+
+def period_start(refuel_datetime: datetime, granularity: Granularity) -> date:
+    """給油日時を含む期間の開始日（JST、月は 1 日、週は月曜日）."""
+    local_date = refuel_datetime.astimezone(JST).date()
+    if granularity == "month":
+        return local_date.replace(day=1)
+    return local_date - timedelta(days=local_date.weekday())
+
+
+def _average_unit_price(total_cost: int, centilitres: int) -> Optional[float]:
+    """給油量で重み付けした平均単価（円/L、小数点2桁）."""
+    if centilitres <= 0:
+        return None
+    return round(total_cost * 100 / centilitres, 2)
+
+
+@dataclass(frozen=True, slots=True)
+class RollupRecord:
+    """集計に使う燃費記録の値（更新前の値を保持するためのスナップショット）."""
+
+    id: UUID
+    vehicle_id: UUID
+    user_id: UUID
+    refuel_datetime: datetime
+    total_mileage: int
+    total_cost: int
+    unit_price: int
+
+    @classmethod
+    def of(cls, record: FuelRecord) -> "RollupRecord":
+        """燃費記録の現在の値."""
+        return cls(
+            id=record.id,
+            vehicle_id=record.vehicle_id,
+            user_id=record.user_id,
+            refuel_datetime=record.refuel_datetime,
+            total_mileage=record.total_mileage,
+            total_cost=record.total_cost,
+            unit_price=record.unit_price,
+        )
+
+
+def rollup_deltas(
+    record: RollupRecord,
+    previous_mileage: Optional[int],
+    following: Optional[tuple[int, datetime]],
+    sign: int,
+) -> dict[tuple[str, date], list[int]]:
+    """記録 1 件の追加（sign=1）・削除（sign=-1）による期間ごとの差分.
+
+    Args:
+        record: 追加・削除する記録
+        previous_mileage: 直前の給油の総走行距離（なければ None）
+        following: 直後の給油の (総走行距離, 給油日時)（なければ None）
+        sign: 追加は 1、削除は -1
+
+    Returns:
+        (集計単位, 期間の開始日) → ROLLUP_COLUMNS の順の差分
+    """
+    deltas: dict[tuple[str, date], list[int]] = {}
+
+    def add(refuel_datetime: datetime, values: tuple[int, int, int, int]) -> None:
+        for granularity in GRANULARITIES:
+            key = (granularity, period_start(refuel_datetime, granularity))
+            current = deltas.setdefault(key, [0, 0, 0, 0])
+            for i, value in enumerate(values):
+                current[i] += sign * value
+
+    add(
+        record.refuel_datetime,
+        (
+            1,
+            record.total_cost,
+            fuel_centilitres(record.total_cost, record.unit_price),
+            _distance(record.total_mileage, previous_mileage),
+        ),
+    )
+    if following is not None:
+        # 次の給油の走行距離は、record がある場合は record との差、ない場合は直前の給油との差
+        next_mileage, next_refuel_datetime = following
+        after = _distance(next_mileage, record.total_mileage)
+        before = _distance(next_mileage, previous_mileage)
+        add(next_refuel_datetime, (0, 0, 0, after - before))
+    return deltas
+
+
+def _distance(mileage: int, previous_mileage: Optional[int]) -> int:
+    """直前の給油からの走行距離（車の最初の給油は 0）."""
+    return mileage - previous_mileage if previous_mileage is not None else 0
+
+
+@dataclass(slots=True)
+class FuelRollupRow:
+    """期間ごとの集計（API のレスポンス項目）."""
+
+    period_start: date
+    record_count: int
+    total_cost: int
+    fuel_amount: float
+    distance_traveled: int
+    average_unit_price: Optional[float]
+
+
+class FuelRollupService:
+    """
+    燃費記録の期間別集計（fuel_rollup テーブル）を管理するサービス.
+
+    燃費記録の書き込みと同じトランザクションで record_added() / record_removed() を
+    呼び出すと、影響する期間の行だけを差分で更新する。走行距離は直前の給油との
+    差分のため、記録の追加・削除では次の給油の走行距離（とその期間）も変わる。
+    更新は「更新前の値の削除 + 更新後の値の追加」として扱う。
+    """
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        """初期化.
+
+        Args:
+            db_session: データベースセッション
+        """
+        self.db_session = db_session
+
+    async def record_added(self, record: RollupRecord) -> None:
+        """記録の追加（作成・論理削除の解除）を集計に反映."""
+        await self._apply(record, sign=1)
+
+    async def record_removed(self, record: RollupRecord) -> None:
+        """記録の削除（論理削除）を集計に反映."""
+        await self._apply(record, sign=-1)
+
+    async def record_updated(self, before: RollupRecord, after: RollupRecord) -> None:
+        """記録の更新を集計に反映（集計に関わる値が変わらない場合は何もしない）."""
+        if before == after:
+            return
+        await self.record_removed(before)
+        await self.record_added(after)
+
+    async def list_rollups(
+        self, user_id: UUID, vehicle_id: UUID, granularity: Granularity
+    ) -> list[FuelRollupRow]:
+        """車の期間ごとの集計を取得（期間の昇順、給油のない期間は含まない）.
+
+        Args:
+            user_id: ユーザー ID
+            vehicle_id: 車 ID
+            granularity: 集計単位（month / week）
+
+        Returns:
+            期間ごとの集計のリスト
+        """
+        stmt = lambda_stmt(
+            lambda: select(
+                FuelRollup.period_start,
+                FuelRollup.record_count,
+                FuelRollup.total_cost,
+                FuelRollup.fuel_centilitres,
+                FuelRollup.distance_traveled,
+            )
+            .where(
+                FuelRollup.vehicle_id == vehicle_id,
+                FuelRollup.user_id == user_id,
+                FuelRollup.granularity == granularity,
+                FuelRollup.record_count > 0,
+            )
+            .order_by(asc(FuelRollup.period_start))
+        )
+        result = await self.db_session.execute(stmt)
+        return [
+            FuelRollupRow(
+                period_start=row.period_start,
+                record_count=row.record_count,
+                total_cost=row.total_cost,
+                fuel_amount=row.fuel_centilitres / 100,
+                distance_traveled=row.distance_traveled,
+                average_unit_price=_average_unit_price(
+                    row.total_cost, row.fuel_centilitres
+                ),
+            )
+            for row in result.all()
+        ]
+
+    async def _apply(self, record: RollupRecord, sign: int) -> None:
+        """記録 1 件の追加（sign=1）・削除（sign=-1）による差分を加算."""
+        # 同じ車への書き込みを直列化し、前後の給油を取り違えないようにする
+        await self.db_session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(str(record.vehicle_id))))
+        )
+        previous, following = await self._neighbours(record)
+        deltas = rollup_deltas(record, previous, following, sign)
+
+        rows = [
+            {
+                "vehicle_id": record.vehicle_id,
+                "granularity": granularity,
+                "period_start": start,
+                "user_id": record.user_id,
+                **dict(zip(ROLLUP_COLUMNS, values)),
+            }
+            for (granularity, start), values in deltas.items()
+            if any(values)
+        ]
+        if not rows:
+            return
+        stmt = insert(FuelRollup).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["vehicle_id", "granularity", "period_start"],
+            set_={
+                name: getattr(FuelRollup, name) + stmt.excluded[name]
+                for name in ROLLUP_COLUMNS
+            },
+        )
+        await self.db_session.execute(stmt)
+
+    async def _neighbours(
+        self, record: RollupRecord
+    ) -> tuple[Optional[int], Optional[tuple[int, datetime]]]:
+        """record の直前の給油の総走行距離と、直後の給油の (総走行距離, 給油日時).
+
+        同じ車の論理削除されていない記録を (給油日時, ID) の順に並べたときの前後で、
+        record 自身は含めない。
+        """
+        same_vehicle = (
+            FuelRecord.user_id == record.user_id,
+            FuelRecord.vehicle_id == record.vehicle_id,
+            FuelRecord.deleted_at.is_(None),
+            FuelRecord.id != record.id,
+        )
+        position = tuple_(FuelRecord.refuel_datetime, FuelRecord.id)
+        key = tuple_(record.refuel_datetime, record.id)
+
+        previous = await self.db_session.execute(
+            select(FuelRecord.total_mileage)
+            .where(*same_vehicle, position < key)
+            .order_by(desc(FuelRecord.refuel_datetime), desc(FuelRecord.id))
+            .limit(1)
+        )
+        following = await self.db_session.execute(
+            select(FuelRecord.total_mileage, FuelRecord.refuel_datetime)
+            .where(*same_vehicle, position > key)
+            .order_by(asc(FuelRecord.refuel_datetime), asc(FuelRecord.id))
+            .limit(1)
+        )
+        next_row = following.one_or_none()
+        return (
+            previous.scalar_one_or_none(),
+            (next_row.total_mileage, next_row.refuel_datetime) if next_row else None,
+        )
@@ -0,0 +1,141 @@
+"""ヘルスチェック（liveness / readiness）サービス."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import get_settings
+from app.database import get_engine
+
+
+@dataclass
+class ReadinessResult:
+    """readiness チェック結果."""
+
+    ready: bool
+    checks: dict[str, str] = field(default_factory=dict)
+    checked_at: float = 0.0
+
+
+class HealthChecker:
+    """DB 疎通とコネクションプールの状態から readiness を判定する.
+
+    頻繁なプローブで DB に負荷をかけないよう、チェック結果は
+    cache_interval 秒間キャッシュし、同時に来たプローブは 1 回の
+    チェック結果を共有する。シャットダウン中（ドレイン中）は
+    キャッシュに関係なく常に not ready を返す。
+    """
+
+    def __init__(
+        self,
+        db_engine: AsyncEngine,
+        pool_capacity: int,
+        cache_interval: float = 5.0,
+        timeout: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化.
+
+        Args:
+            db_engine: 確認対象の非同期エンジン
+            pool_capacity: プールが貸し出せる最大接続数（pool_size + max_overflow）
+            cache_interval: チェック結果をキャッシュする秒数
+            timeout: DB ping のタイムアウト秒数
+            clock: 経過時間の計測に使う時計（テスト用）
+        """
+        self.db_engine = db_engine
+        self.pool_capacity = pool_capacity
+        self.cache_interval = cache_interval
+        self.timeout = timeout
+        self.clock = clock
+        self._draining = False
+        self._cached: Optional[ReadinessResult] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def draining(self) -> bool:
+        """シャットダウンに向けてドレイン中かどうか."""
+        return self._draining
+
+    def start_draining(self) -> None:
+        """ドレインを開始し、以降の readiness を not ready にする."""
+        self._draining = True
+
+    async def check_readiness(self) -> ReadinessResult:
+        """readiness を判定（キャッシュが有効ならそれを返す）."""
+        if self._draining:
+            return ReadinessResult(
+                ready=False, checks={"app": "draining"}, checked_at=self.clock()
+            )
+
+        cached = self._cached
+        if cached is not None and self.clock() - cached.checked_at < self.cache_interval:
+            return cached
+
+        async with self._lock:
+            # ロック待ちの間に他のプローブが更新していればそれを使う
+            cached = self._cached
+            if (
+                cached is not None
+                and self.clock() - cached.checked_at < self.cache_interval
+            ):
+                return cached
+
+            self._cached = await self._run_checks()
+            return self._cached
+
+    async def _run_checks(self) -> ReadinessResult:
+        """プールと DB の状態を確認."""
+        checks: dict[str, str] = {}
+
+        pool_status = self._check_pool()
+        checks["pool"] = pool_status
+        if pool_status != "ok":
+            # プール枯渇時は ping も接続待ちになるため実行しない
+            checks["database"] = "skipped"
+            return ReadinessResult(ready=False, checks=checks, checked_at=self.clock())
+
+        checks["database"] = await self._ping_database()
+        return ReadinessResult(
+            ready=checks["database"] == "ok",
+            checks=checks,
+            checked_at=self.clock(),
+        )
+
+    def _check_pool(self) -> str:
+        """貸し出し中の接続数がプール上限に達していないか確認."""
+        checkedout = getattr(self.db_engine.pool, "checkedout", None)
+        if checkedout is None:
+            return "ok"
+        if checkedout() >= self.pool_capacity:
+            return "exhausted"
+        return "ok"
+
+    async def _ping_database(self) -> str:
+        """SELECT 1 で DB 疎通を確認."""
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self.db_engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except TimeoutError:
+            return "timeout"
+        except Exception:
+            return "error"
+        return "ok"
+
+
+@lru_cache
+def get_health_checker() -> HealthChecker:
+    """ヘルスチェッカーを取得（初回呼び出し時に生成してキャッシュ）."""
+    settings = get_settings()
+    return HealthChecker(
+        get_engine(),
+        pool_capacity=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+        cache_interval=settings.HEALTH_CHECK_INTERVAL,
+        timeout=settings.HEALTH_CHECK_TIMEOUT,
+    )
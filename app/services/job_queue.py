@@ -0,0 +1,451 @@
+"""バックグラウンドジョブキュー."""
+
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from app.core.config import get_settings
+from app.database import async_session_factory
+from app.models.base import JST
+from app.models.job import Job
+from app.utils.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+# ジョブハンドラ: ジョブ専用のセッションと payload を受け取る
+JobHandler = Callable[[AsyncSession, Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class QueuedJob:
+    """キューに積まれたジョブ."""
+
+    name: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    id: Optional[UUID] = None
+
+
+def retry_delay(attempts: int, base: float, maximum: float) -> float:
+    """attempts 回目の失敗後の再実行までの秒数（指数バックオフ、上限 maximum）."""
+    return min(maximum, base * 2 ** (attempts - 1))
+
+
+class JobQueue:
+    """
+    プロセス内のジョブキュー.
+
+    リクエスト処理から切り離したい処理を asyncio.Queue に積み、
+    lifespan で起動した workers 個のワーカーが実行する。
+    失敗したジョブは指数バックオフで max_attempts 回まで再実行する。
+    停止時は新規受付を止め、積まれているジョブを drain_timeout 秒まで処理してから終了する。
+
+    workers が 0 の場合は起動せず、enqueue は ServiceUnavailableException を送出する
+    （呼び出し側はその場で実行するなどのフォールバックを行う）。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        workers: int = 2,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+        retry_backoff_max: float = 60.0,
+        maxsize: int = 1000,
+    ) -> None:
+        """初期化.
+
+        Args:
+            session_factory: ジョブごとのセッションを作るファクトリ
+            workers: ワーカー数（0 で無効）
+            max_attempts: 最大試行回数
+            retry_backoff: 再実行までの初回待ち秒数（失敗ごとに 2 倍）
+            retry_backoff_max: 再実行までの待ち秒数の上限
+            maxsize: キューに積めるジョブ数の上限
+        """
+        self.session_factory = session_factory
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.maxsize = maxsize
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queue: Optional[asyncio.Queue[QueuedJob]] = None
+        self._worker_tasks: List[asyncio.Task[None]] = []
+        self._retry_tasks: Set[asyncio.Task[None]] = set()
+        self._accepting = False
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def running(self) -> bool:
+        """ジョブを受け付けているかどうか."""
+        return self._accepting
+
+    def register(self, name: str, handler: JobHandler) -> None:
+        """ジョブ名にハンドラを登録."""
+        if name in self._handlers:
+            raise ValueError(f"ジョブ {name} は既に登録されています")
+        self._handlers[name] = handler
+
+    def handler(self, name: str) -> Callable[[JobHandler], JobHandler]:
+        """ハンドラを登録するデコレータ."""
+
+        def decorator(handler: JobHandler) -> JobHandler:
+            self.register(name, handler)
+            return handler
+
+        return decorator
+
+    async def enqueue(self, name: str, /, **payload: Any) -> None:
+        """
+        ジョブを積む.
+
+        Raises:
+            ValueError: 未登録のジョブ名の場合
+            ServiceUnavailableException: キューが停止中または満杯の場合
+        """
+        if name not in self._handlers:
+            raise ValueError(f"未登録のジョブです: {name}")
+        if not self._accepting:
+            raise ServiceUnavailableException("ジョブキューが停止しています")
+        await self._put(QueuedJob(name=name, payload=payload))
+
+    async def start(self) -> None:
+        """ワーカーを起動（workers が 0 の場合は何もしない）."""
+        if self.workers <= 0 or self._accepting:
+            return
+        # イベントループに紐づくオブジェクトは起動したループで作る
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._accepting = True
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self, drain_timeout: float) -> None:
+        """新規受付を止め、drain_timeout 秒まで処理中・待機中のジョブを完了させてから停止."""
+        if not self._worker_tasks:
+            return
+        self._accepting = False
+        try:
+            async with asyncio.timeout(drain_timeout):
+                await self._drain()
+        except TimeoutError:
+            logger.warning(
+                "ジョブキューの停止がタイムアウトしました（未完了 %d 件）",
+                self._pending_count(),
+            )
+
+        tasks = [*self._worker_tasks, *self._retry_tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._retry_tasks.clear()
+
+    async def _worker(self) -> None:
+        """ジョブを取り出して実行し続ける."""
+        while True:
+            job = await self._next_job()
+            self._in_flight += 1
+            self._idle.clear()
+            try:
+                await self._process(job)
+            except Exception:
+                logger.exception("ジョブ %s の後処理に失敗しました", job.name)
+            finally:
+                self._in_flight -= 1
+                if self._in_flight == 0:
+                    self._idle.set()
+                self._job_done()
+
+    async def _process(self, job: QueuedJob) -> None:
+        """ジョブを 1 回実行し、結果に応じて完了・再実行・破棄する."""
+        try:
+            async with self.session_factory() as session:
+                await self._handlers[job.name](session, job.payload)
+        except Exception as e:
+            if job.attempts >= self.max_attempts:
+                logger.exception(
+                    "ジョブ %s が %d 回失敗したため破棄します", job.name, job.attempts
+                )
+                await self._discard(job, e)
+                return
+            delay = retry_delay(job.attempts, self.retry_backoff, self.retry_backoff_max)
+            logger.warning(
+                "ジョブ %s が失敗しました（%d 回目）。%.1f 秒後に再実行します: %s",
+                job.name,
+                job.attempts,
+                delay,
+                e,
+            )
+            await self._schedule_retry(job, delay, e)
+            return
+        await self._complete(job)
+
+    # --- 以下はバックエンドごとの処理（既定はプロセス内の asyncio.Queue） ---
+
+    async def _put(self, job: QueuedJob) -> None:
+        """ジョブをキューへ追加."""
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise ServiceUnavailableException("ジョブキューが満杯です") from None
+
+    async def _next_job(self) -> QueuedJob:
+        """次のジョブを取り出す（試行回数を加算）."""
+        assert self._queue is not None
+        job = await self._queue.get()
+        job.attempts += 1
+        return job
+
+    def _job_done(self) -> None:
+        """ジョブ 1 件の処理を終えたことを通知."""
+        assert self._queue is not None
+        self._queue.task_done()
+
+    async def _complete(self, job: QueuedJob) -> None:
+        """成功したジョブの後処理."""
+
+    async def _discard(self, job: QueuedJob, error: Exception) -> None:
+        """最大試行回数を超えたジョブの後処理."""
+
+    async def _schedule_retry(
+        self, job: QueuedJob, delay: float, error: Exception
+    ) -> None:
+        """delay 秒後にジョブをキューへ戻す（停止中でも戻す）."""
+
+        async def requeue() -> None:
+            await asyncio.sleep(delay)
+            assert self._queue is not None
+            await self._queue.put(job)
+
+        task = asyncio.create_task(requeue())
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+    async def _drain(self) -> None:
+        """キューが空になり、再実行待ちもなくなるまで待つ."""
+        assert self._queue is not None
+        while True:
+            await self._queue.join()
+            if not self._retry_tasks:
+                return
+            await asyncio.wait(set(self._retry_tasks))
+
+    def _pending_count(self) -> int:
+        """未完了のジョブ数."""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return queued + len(self._retry_tasks) + self._in_flight
+
+
+class PostgresJobQueue(JobQueue):
+    """
+    PostgreSQL の job テーブルを使う永続ジョブキュー.
+
+    ジョブは再起動をまたいで残り、複数プロセスのワーカーで共有される。
+    ワーカーは FOR UPDATE SKIP LOCKED で 1 件ずつ取得し、run_at を
+    lease 秒後へ進めてコミットしてから実行する。成功すると行を削除し、
+    失敗すると run_at をバックオフ後へ戻す。停止時は取得を止め、
+    実行中のジョブの完了だけを待つ（未実行のジョブは DB に残る）。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        workers: int = 2,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+        retry_backoff_max: float = 60.0,
+        poll_interval: float = 1.0,
+        lease: float = 300.0,
+    ) -> None:
+        """初期化.
+
+        Args:
+            session_factory: セッションを作るファクトリ
+            workers: ワーカー数（0 で無効）
+            max_attempts: 最大試行回数
+            retry_backoff: 再実行までの初回待ち秒数（失敗ごとに 2 倍）
+            retry_backoff_max: 再実行までの待ち秒数の上限
+            poll_interval: 実行可能なジョブがないときに DB を確認する間隔（秒）
+            lease: 取得したジョブを他のワーカーに渡さない秒数
+        """
+        super().__init__(
+            session_factory,
+            workers=workers,
+            max_attempts=max_attempts,
+            retry_backoff=retry_backoff,
+            retry_backoff_max=retry_backoff_max,
+        )
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self._wakeup = asyncio.Event()
+
+    async def start(self) -> None:
+        """ワーカーを起動（workers が 0 の場合は何もしない）."""
+        if self.workers <= 0 or self._accepting:
+            return
+        self._wakeup = asyncio.Event()
+        await super().start()
+
+    async def _put(self, job: QueuedJob) -> None:
+        """ジョブを job テーブルへ追加."""
+        async with self.session_factory() as session:
+            session.add(
+                Job(name=job.name, payload=job.payload, run_at=datetime.now(JST))
+            )
+            await session.commit()
+        self._wakeup.set()
+
+    async def _next_job(self) -> QueuedJob:
+        """実行可能なジョブを 1 件取得するまで待つ（停止中は取得しない）."""
+        while True:
+            if self._accepting:
+                try:
+                    job = await self._claim()
+                except Exception:
+                    logger.exception("ジョブの取得に失敗しました")
+                    job = None
+                if job is not None:
+                    return job
+            self._wakeup.clear()
+            with suppress(TimeoutError):
+                async with asyncio.timeout(self.poll_interval):
+                    await self._wakeup.wait()
+
+    async def _claim(self) -> Optional[QueuedJob]:
+        """実行可能なジョブを 1 件ロックして run_at をリース期限へ進める."""
+        claimable = (
+            select(col(Job.id))
+            .where(
+                col(Job.run_at) <= func.now(),
+                col(Job.failed_at).is_(None),
+            )
+            .order_by(col(Job.run_at))
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Job)
+            .where(col(Job.id) == claimable.scalar_subquery())
+            .values(
+                attempts=col(Job.attempts) + 1,
+                run_at=func.now() + timedelta(seconds=self.lease),
+            )
+            .returning(col(Job.id), col(Job.name), col(Job.payload), col(Job.attempts))
+        )
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            row = result.one_or_none()
+            await session.commit()
+        if row is None:
+            return None
+        return QueuedJob(
+            id=row.id, name=row.name, payload=row.payload, attempts=row.attempts
+        )
+
+    def _job_done(self) -> None:
+        """DB 側で管理するため何もしない."""
+
+    async def _complete(self, job: QueuedJob) -> None:
+        """成功したジョブを削除."""
+        async with self.session_factory() as session:
+            await session.execute(delete(Job).where(col(Job.id) == job.id))
+            await session.commit()
+
+    async def _discard(self, job: QueuedJob, error: Exception) -> None:
+        """破棄したジョブは failed_at を記録して残す（調査用）."""
+        async with self.session_factory() as session:
+            await session.execute(
+                update(Job)
+                .where(col(Job.id) == job.id)
+                .values(failed_at=func.now(), last_error=repr(error))
+            )
+            await session.commit()
+
+    async def _schedule_retry(
+        self, job: QueuedJob, delay: float, error: Exception
+    ) -> None:
+        """run_at を delay 秒後へ戻す."""
+        async with self.session_factory() as session:
+            await session.execute(
+                update(Job)
+                .where(col(Job.id) == job.id)
+                .values(
+                    run_at=func.now() + timedelta(seconds=delay),
+                    last_error=repr(error),
+                )
+            )
+            await session.commit()
+
+    async def _drain(self) -> None:
+        """実行中のジョブが終わるまで待つ."""
+        await self._idle.wait()
+
+    def _pending_count(self) -> int:
+        """実行中のジョブ数."""
+        return self._in_flight
+
+
+def _create_job_queue() -> JobQueue:
+    settings = get_settings()
+    if settings.JOB_BACKEND == "postgres":
+        return PostgresJobQueue(
+            async_session_factory,
+            workers=settings.JOB_WORKERS,
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+            retry_backoff=settings.JOB_RETRY_BACKOFF_SECONDS,
+            retry_backoff_max=settings.JOB_RETRY_BACKOFF_MAX_SECONDS,
+            poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+            lease=settings.JOB_LEASE_SECONDS,
+        )
+    return JobQueue(
+        async_session_factory,
+        workers=settings.JOB_WORKERS,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        retry_backoff=settings.JOB_RETRY_BACKOFF_SECONDS,
+        retry_backoff_max=settings.JOB_RETRY_BACKOFF_MAX_SECONDS,
+        maxsize=settings.JOB_QUEUE_MAXSIZE,
+    )
+
+
+# import 時に job_handler() で登録されたハンドラ（キューの生成時にまとめて登録する）
+_registered_handlers: Dict[str, JobHandler] = {}
+
+
+def job_handler(name: str) -> Callable[[JobHandler], JobHandler]:
+    """ジョブハンドラを登録するデコレータ（キューの生成前に import されても登録できる）."""
+
+    def decorator(handler: JobHandler) -> JobHandler:
+        if name in _registered_handlers:
+            raise ValueError(f"ジョブ {name} は既に登録されています")
+        _registered_handlers[name] = handler
+        if get_job_queue.cache_info().currsize:
+            get_job_queue().register(name, handler)
+        return handler
+
+    return decorator
+
+
+@lru_cache
+def get_job_queue() -> JobQueue:
+    """ジョブキューを取得（初回呼び出し時に生成してキャッシュ）."""
+    queue = _create_job_queue()
+    for name, handler in _registered_handlers.items():
+        queue.register(name, handler)
+    return queue
@@ -1,18 +1,37 @@
 """ノートカテゴリ管理サービス."""
 
+from dataclasses import dataclass
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import asc, select, update
+from sqlalchemy import asc, func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col
 
 from app.models.note import Note
 from app.models.note_category import NoteCategory
 from app.schemas.note_category import NoteCategoryCreate, NoteCategoryUpdate
+from app.services.response_cache import NOTE, NOTE_CATEGORY, response_cache
+from app.services.sync_service import SyncService
 from app.utils.exceptions import NotFoundException
 
 
+@dataclass
+class NoteCategoryWithCount:
+    """ノート件数付きカテゴリ."""
+
+    category: NoteCategory
+    note_count: int
+
+
+@dataclass
+class NoteCategoryList:
+    """カテゴリ一覧と未分類ノート件数."""
+
+    categories: List[NoteCategoryWithCount]
+    uncategorized_count: int
+
+
 class NoteCategoryService:
     """ノートカテゴリ管理ビジネスロジック層."""
 
@@ -29,17 +48,59 @@ class NoteCategoryService:
         user_id: UUID,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[NoteCategory]:
-        """カテゴリ一覧を取得."""
+    ) -> NoteCategoryList:
+        """カテゴリ一覧をノート件数付きで取得.
+
+        ノートを category_id で 1 回 GROUP BY した CTE から、
+        カテゴリごとの件数と未分類（category_id が NULL）の件数を
+        同じクエリで取得する。
+        """
+        note_counts = (
+            select(
+                col(Note.category_id).label("category_id"),
+                func.count().label("note_count"),
+            )
+            .where(col(Note.user_id) == user_id)
+            .group_by(col(Note.category_id))
+            .cte("note_counts")
+        )
+        uncategorized_count = (
+            select(note_counts.c.note_count)
+            .where(note_counts.c.category_id.is_(None))
+            .scalar_subquery()
+        )
+
         stmt = (
-            select(NoteCategory)
+            select(
+                NoteCategory,
+                func.coalesce(note_counts.c.note_count, 0).label("note_count"),
+                func.coalesce(uncategorized_count, 0).label("uncategorized_count"),
+            )
+            .outerjoin(note_counts, note_counts.c.category_id == NoteCategory.id)
             .where(col(NoteCategory.user_id) == user_id)
             .order_by(asc(col(NoteCategory.name)))
             .offset(skip)
             .limit(limit)
         )
         result = await self.db_session.execute(stmt)
-        return list(result.scalars().all())
+        rows = result.all()
+
+        if rows:
+            uncategorized = rows[0].uncategorized_count
+        else:
+            # カテゴリが 1 件も返らない場合は未分類件数のみ取得
+            count_result = await self.db_session.execute(
+                select(func.coalesce(uncategorized_count, 0))
+            )
+            uncategorized = count_result.scalar_one()
+
+        return NoteCategoryList(
+            categories=[
+                NoteCategoryWithCount(category=row.NoteCategory, note_count=row.note_count)
+                for row in rows
+            ],
+            uncategorized_count=uncategorized,
+        )
 
     async def get_category(self, category_id: UUID, user_id: UUID) -> NoteCategory:
         """カテゴリを取得.
@@ -47,8 +108,8 @@ class NoteCategoryService:
         Raises:
             NotFoundException: カテゴリが見つからない場合
         """
-        stmt = (
-            select(NoteCategory)
+        stmt = lambda_stmt(
+            lambda: select(NoteCategory)
             .where(col(NoteCategory.id) == category_id)
             .where(col(NoteCategory.user_id) == user_id)
         )
@@ -65,6 +126,7 @@ class NoteCategoryService:
         category = NoteCategory(user_id=user_id, name=category_create.name)
         self.db_session.add(category)
         await self.db_session.commit()
+        await response_cache.bump(user_id, NOTE_CATEGORY, NOTE)
         await self.db_session.refresh(category)
         return category
 
@@ -81,6 +143,7 @@ class NoteCategoryService:
             setattr(category, field, value)
         self.db_session.add(category)
         await self.db_session.commit()
+        await response_cache.bump(user_id, NOTE_CATEGORY, NOTE)
         await self.db_session.refresh(category)
         return category
 
@@ -96,4 +159,8 @@ class NoteCategoryService:
         )
         await self.db_session.execute(stmt)
         await self.db_session.delete(category)
+        await SyncService(self.db_session).record_deleted(
+            user_id, NOTE_CATEGORY, category.id
+        )
         await self.db_session.commit()
+        await response_cache.bump(user_id, NOTE_CATEGORY, NOTE)
@@ -1,17 +1,51 @@
 """ノート管理サービス."""
 
-from typing import List
+from dataclasses import dataclass
+from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import asc, select
+from sqlalchemy import asc, func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from sqlalchemy.sql import nulls_last
 from sqlmodel import col
 
 from app.models.note import Note
 from app.models.note_category import NoteCategory
-from app.schemas.note import NoteCreate, NoteUpdate
-from app.utils.exceptions import NotFoundException
+from app.schemas.note import NoteBodyPatch, NoteCreate, NoteUpdate, compute_body_hash
+from app.services.response_cache import NOTE, NOTE_CATEGORY, response_cache
+from app.services.sync_service import SyncService
+from app.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
+
+# 要約モードで返す本文抜粋の既定文字数
+DEFAULT_EXCERPT_LENGTH = 100
+
+# 本文の差分更新の位置の単位（ブラウザの文字列と同じ UTF-16 コードユニット）
+UTF16 = "utf-16-le"
+
+
+def _splits_surrogate_pair(units: bytes, offset: int) -> bool:
+    """UTF-16 の位置 offset がサロゲートペアの途中（1 文字の前半と後半の間）かどうか."""
+    if not 0 < offset < len(units) // 2:
+        return False
+    unit = int.from_bytes(units[offset * 2 : offset * 2 + 2], "little")
+    return 0xDC00 <= unit <= 0xDFFF
+
+
+@dataclass
+class NoteWithCategory:
+    """カテゴリ名付きノート.
+
+    要約モードでは note.body は読み込まれず、excerpt に本文の先頭が入る。
+    """
+
+    note: Note
+    category_name: Optional[str]
+    excerpt: Optional[str] = None
 
 
 class NoteService:
@@ -30,14 +64,27 @@ class NoteService:
         user_id: UUID,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[Note]:
-        """ノート一覧を取得.
+        summary: bool = False,
+        excerpt_length: int = DEFAULT_EXCERPT_LENGTH,
+    ) -> List[NoteWithCategory]:
+        """ノート一覧をカテゴリ名付きで取得.
 
         既定の並び順はカテゴリ名、次にタイトルの昇順。
         カテゴリ未設定は末尾に配置する。
+        並び替えのために結合したカテゴリ名をそのまま結果に含める。
+
+        summary が True の場合は本文（body）を読み込まず、
+        SQL の left(body, n) で求めた先頭 excerpt_length 文字のみ取得する。
+        本文全体は get_note でのみ取得できる。
         """
+        columns = [Note, col(NoteCategory.name).label("category_name")]
+        if summary:
+            columns.append(
+                func.left(col(Note.body), excerpt_length).label("excerpt")
+            )
+
         stmt = (
-            select(Note)
+            select(*columns)
             .outerjoin(NoteCategory, Note.category_id == NoteCategory.id)
             .where(col(Note.user_id) == user_id)
             .order_by(
@@ -47,8 +94,19 @@ class NoteService:
             .offset(skip)
             .limit(limit)
         )
+        if summary:
+            # 読み込まない本文への誤アクセスは遅延ロードせず例外にする
+            stmt = stmt.options(defer(col(Note.body), raiseload=True))
+
         result = await self.db_session.execute(stmt)
-        return list(result.scalars().all())
+        return [
+            NoteWithCategory(
+                note=row.Note,
+                category_name=row.category_name,
+                excerpt=row.excerpt if summary else None,
+            )
+            for row in result.all()
+        ]
 
     async def get_note(self, note_id: UUID, user_id: UUID) -> Note:
         """ノートを取得.
@@ -56,8 +114,8 @@ class NoteService:
         Raises:
             NotFoundException: ノートが見つからない場合
         """
-        stmt = (
-            select(Note)
+        stmt = lambda_stmt(
+            lambda: select(Note)
             .where(col(Note.id) == note_id)
             .where(col(Note.user_id) == user_id)
         )
@@ -92,6 +150,7 @@ class NoteService:
         )
         self.db_session.add(note)
         await self.db_session.commit()
+        await response_cache.bump(user_id, NOTE, NOTE_CATEGORY)
         await self.db_session.refresh(note)
         return note
 
@@ -112,6 +171,77 @@ class NoteService:
             setattr(note, field, value)
         self.db_session.add(note)
         await self.db_session.commit()
+        await response_cache.bump(user_id, NOTE, NOTE_CATEGORY)
+        await self.db_session.refresh(note)
+        return note
+
+    async def patch_note_body(
+        self,
+        note_id: UUID,
+        note_patch: NoteBodyPatch,
+        user_id: UUID,
+    ) -> Note:
+        """本文を差分（範囲置換）で更新.
+
+        行ロックを取得した上で現在の本文のハッシュを base_hash と比較し、
+        一致した場合のみ範囲置換をサーバー側で適用する。
+        範囲の位置は JavaScript の文字列と同じ UTF-16 コードユニット単位で、
+        絵文字などのサロゲートペアの途中を指す範囲は拒否する。
+
+        Raises:
+            NotFoundException: ノートが見つからない場合
+            ConflictException: 基準の本文が更新されている場合
+            ValidationException: 範囲が本文の長さを超える、または本文が空になる場合
+        """
+        stmt = (
+            select(Note)
+            .where(col(Note.id) == note_id)
+            .where(col(Note.user_id) == user_id)
+            .with_for_update()
+        )
+        result = await self.db_session.execute(stmt)
+        note = result.scalars().one_or_none()
+        if not note:
+            raise NotFoundException(f"ノート ID {note_id} が見つかりません")
+
+        if compute_body_hash(note.body) != note_patch.base_hash:
+            raise ConflictException(f"ノート ID {note_id} の本文は更新されています")
+
+        base = note.body.encode(UTF16)
+        base_length = len(base) // 2
+        edits = sorted(note_patch.edits, key=lambda e: e.start, reverse=True)
+        for edit in edits:
+            if edit.end > base_length:
+                raise ValidationException(
+                    f"置換範囲 {edit.start}-{edit.end} が本文の長さ {base_length} を超えています"
+                )
+            if _splits_surrogate_pair(base, edit.start) or _splits_surrogate_pair(
+                base, edit.end
+            ):
+                raise ValidationException(
+                    f"置換範囲 {edit.start}-{edit.end} が文字の途中を指しています"
+                )
+
+        # 後ろの範囲から適用し、前方の位置がずれないようにする
+        units = base
+        try:
+            for edit in edits:
+                units = (
+                    units[: edit.start * 2]
+                    + edit.text.encode(UTF16)
+                    + units[edit.end * 2 :]
+                )
+        except UnicodeEncodeError as e:
+            raise ValidationException("置換後の文字列に不正な文字が含まれています") from e
+        body = units.decode(UTF16)
+
+        if not body.strip():
+            raise ValidationException("本文は空にできません")
+
+        note.body = body
+        self.db_session.add(note)
+        await self.db_session.commit()
+        await response_cache.bump(user_id, NOTE, NOTE_CATEGORY)
         await self.db_session.refresh(note)
         return note
 
@@ -119,4 +249,6 @@ class NoteService:
         """ノートを削除（物理削除）."""
         note = await self.get_note(note_id, user_id)
         await self.db_session.delete(note)
+        await SyncService(self.db_session).record_deleted(user_id, NOTE, note.id)
         await self.db_session.commit()
+        await response_cache.bump(user_id, NOTE, NOTE_CATEGORY)
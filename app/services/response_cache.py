@@ -0,0 +1,419 @@
+"""ユーザーごとのバージョン付きレスポンスキャッシュ."""
+
+import functools
+import hashlib
+import json
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+from app.core.config import get_settings
+from app.database import async_session_factory
+from app.models.base import JST
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# キャッシュ対象のリソース名（テーブル名と同じ）
+# 車一覧は燃費サマリー、ノート一覧はカテゴリ名、カテゴリ一覧はノート数を含むため、
+# 車と給油記録、ノートとカテゴリは書き込み時に互いのバージョンも更新する
+TASK = "task"
+VEHICLE = "vehicle"
+FUEL_RECORD = "fuel_record"
+NOTE = "note"
+NOTE_CATEGORY = "note_category"
+RESOURCES = (TASK, VEHICLE, FUEL_RECORD, NOTE, NOTE_CATEGORY)
+
+# キャッシュキーに含めない引数（依存性注入される値）
+EXCLUDED_PARAMS = frozenset({"current_user", "db_session", "request"})
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Awaitable[Any]])
+
+
+class CacheBackend(Protocol):
+    """キャッシュバックエンドのインターフェース."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """値を取得（存在しない・期限切れの場合は None）."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """値を保存（ttl 秒で期限切れ、None は無期限）."""
+        ...
+
+    async def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        """キーが存在しない場合のみ保存し、保存したかどうかを返す."""
+        ...
+
+
+class InMemoryCacheBackend:
+    """
+    プロセス内の LRU キャッシュ.
+
+    max_entries を超えると最も長く使われていないキーから削除する。
+    プロセス間で共有されないため、複数ワーカーで動かす場合は
+    書き込みが他のワーカーのキャッシュを無効化できない点に注意する。
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化.
+
+        Args:
+            max_entries: 保持する最大キー数
+            clock: 期限判定に使う時計（テスト用）
+        """
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """保持しているキー数."""
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """値を取得し、最近使ったキーとして扱う."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """値を保存し、上限を超えた分を古い順に削除."""
+        expires_at = self.clock() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        """キーが存在しない場合のみ保存."""
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+
+class SharedCacheClient(Protocol):
+    """共有キャッシュのクライアント（redis.asyncio.Redis と同じ呼び出し方）."""
+
+    async def get(self, name: str) -> Optional[bytes]:
+        """値を取得."""
+        ...
+
+    async def set(
+        self,
+        name: str,
+        value: bytes,
+        ex: Optional[int] = None,
+        nx: bool = False,
+    ) -> Optional[bool]:
+        """値を保存（ex: 期限秒数、nx: 存在しない場合のみ）."""
+        ...
+
+
+class SharedCacheBackend:
+    """
+    プロセス間で共有するキャッシュ（Redis など）のバックエンド.
+
+    client は SharedCacheClient を満たすものであればよく、
+    テストではプロセス内のフェイクに差し替えられる。
+    """
+
+    def __init__(self, client: SharedCacheClient, prefix: str = "ynym:") -> None:
+        """初期化.
+
+        Args:
+            client: 共有キャッシュのクライアント
+            prefix: 他の用途のキーと衝突しないよう付ける接頭辞
+        """
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """値を取得."""
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """値を保存."""
+        await self.client.set(self.prefix + key, value, ex=_ttl_seconds(ttl))
+
+    async def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        """キーが存在しない場合のみ保存."""
+        return bool(
+            await self.client.set(
+                self.prefix + key, value, ex=_ttl_seconds(ttl), nx=True
+            )
+        )
+
+
+class ResponseCache:
+    """
+    (user_id, resource, version, パラメータ) をキーにしたレスポンスキャッシュ.
+
+    各サービスの書き込みメソッドがコミット後に bump() で
+    ユーザー・リソースごとのバージョンを更新すると、それ以前のキーは
+    参照されなくなる（削除せずに O(1) で無効化し、期限切れか LRU で消える）。
+    読み込み側はデータ取得の前にバージョンを読むため、書き込みと並行しても
+    古いデータが新しいバージョンで保存されることはない。
+
+    バージョンは連番ではなくランダムなトークンとし、バージョンのキーが
+    削除された後に過去の値へ戻って古いエントリが復活することを防ぐ。
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: float = 300.0) -> None:
+        """初期化.
+
+        Args:
+            backend: キャッシュバックエンド（None でキャッシュ無効）
+            ttl: エントリの有効秒数
+        """
+        self.backend = backend
+        self.ttl = ttl
+        # 同時に来た同一リクエストの実行中の読み込み（プロセス内）
+        self.flights = SingleFlight()
+
+    @property
+    def enabled(self) -> bool:
+        """キャッシュが有効かどうか."""
+        return self.backend is not None
+
+    @property
+    def shared(self) -> bool:
+        """バージョンをすべてのワーカーで共有しているかどうか（redis の場合のみ）."""
+        return isinstance(self.backend, SharedCacheBackend)
+
+    async def bump(self, user_id: UUID, *resources: str) -> None:
+        """ユーザーのリソースのバージョンを更新し、キャッシュを無効化."""
+        for resource in resources:
+            # 書き込み前に始まった読み込みに、以降のリクエストを合流させない
+            self.flights.forget((user_id, resource))
+            if self.backend is None:
+                continue
+            try:
+                await self.backend.set(
+                    _version_key(user_id, resource), _new_version()
+                )
+            except Exception:
+                # 書き込みはコミット済みのためリクエストは失敗させない
+                # （古いエントリは ttl で期限切れになる）
+                logger.exception(
+                    "キャッシュの無効化に失敗しました: %s %s", user_id, resource
+                )
+
+    async def version(self, user_id: UUID, resource: str) -> bytes:
+        """ユーザーのリソースの現在のバージョンを取得（なければ作成）."""
+        assert self.backend is not None
+        key = _version_key(user_id, resource)
+        current = await self.backend.get(key)
+        if current is not None:
+            return current
+        created = _new_version()
+        if await self.backend.add(key, created):
+            return created
+        # 同時に作成された場合はそちらを使う
+        return await self.backend.get(key) or created
+
+    async def get(
+        self, user_id: UUID, resource: str, version: bytes, params: Any
+    ) -> Optional[bytes]:
+        """キャッシュ済みのレスポンス本文を取得."""
+        assert self.backend is not None
+        return await self.backend.get(_entry_key(user_id, resource, version, params))
+
+    async def set(
+        self, user_id: UUID, resource: str, version: bytes, params: Any, body: bytes
+    ) -> None:
+        """レスポンス本文を保存."""
+        assert self.backend is not None
+        await self.backend.set(
+            _entry_key(user_id, resource, version, params), body, self.ttl
+        )
+
+
+def cached_response(
+    resource: str, vary_by_date: bool = False, coalesce: bool = False
+) -> Callable[[EndpointT], EndpointT]:
+    """
+    GET エンドポイントのレスポンスをキャッシュするデコレータ.
+
+    キーはユーザー ID・リソースのバージョン・エンドポイント名と
+    クエリ/パスパラメータ（current_user, db_session, request を除く引数）。
+    エンドポイントが dict を返した場合のみ JSON 本文を保存し、
+    JSONResponse（404 など）はキャッシュしない。
+
+    coalesce=True のエンドポイントは、同じユーザー・パラメータで同時に来た
+    リクエストを 1 回の実行（DB クエリとシリアライズ）にまとめる
+    （キャッシュが無効な場合も有効）。まとめた実行は先に来たリクエストが
+    切断・終了した後も続くため、リクエストの db_session ではなく
+    専用のセッションで実行する。
+
+    Args:
+        resource: キャッシュを無効化する単位のリソース名
+        vary_by_date: JST の日付もキーに含める（今日を基準にした結果の場合）
+        coalesce: 同時に来た同一のリクエストをまとめる
+    """
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        @functools.wraps(endpoint)
+        async def wrapper(**kwargs: Any) -> Any:
+            cache = response_cache
+            if not cache.enabled and not coalesce:
+                return await endpoint(**kwargs)
+
+            user_id: UUID = kwargs["current_user"].id
+            params = {
+                name: value
+                for name, value in kwargs.items()
+                if name not in EXCLUDED_PARAMS
+            }
+            params["endpoint"] = endpoint.__qualname__
+            if vary_by_date:
+                params["date"] = datetime.now(JST).date()
+
+            def load() -> Awaitable[Any]:
+                return _load(cache, endpoint, kwargs, user_id, resource, params)
+
+            async def load_detached() -> Any:
+                async with async_session_factory() as db_session:
+                    return await _load(
+                        cache,
+                        endpoint,
+                        {**kwargs, "db_session": db_session},
+                        user_id,
+                        resource,
+                        params,
+                    )
+
+            if coalesce:
+                result = await cache.flights.do(
+                    (user_id, resource),
+                    _params_digest(params),
+                    load_detached if "db_session" in kwargs else load,
+                )
+            else:
+                result = await load()
+
+            if isinstance(result, bytes):
+                return Response(content=result, media_type="application/json")
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+async def _load(
+    cache: ResponseCache,
+    endpoint: Callable[..., Awaitable[Any]],
+    kwargs: Dict[str, Any],
+    user_id: UUID,
+    resource: str,
+    params: Dict[str, Any],
+) -> Any:
+    """キャッシュ済みの本文、なければエンドポイントを実行した結果（dict は JSON 本文）."""
+    version: Optional[bytes] = None
+    if cache.enabled:
+        try:
+            version = await cache.version(user_id, resource)
+            body = await cache.get(user_id, resource, version, params)
+        except Exception:
+            logger.exception("キャッシュの取得に失敗しました")
+            version = body = None
+        if body is not None:
+            return body
+
+    result = await endpoint(**kwargs)
+    if not isinstance(result, dict):
+        return result
+
+    body = encode_json(result)
+    if version is not None:
+        try:
+            await cache.set(user_id, resource, version, params, body)
+        except Exception:
+            logger.exception("キャッシュの保存に失敗しました")
+    return body
+
+
+def encode_json(content: Any) -> bytes:
+    """レスポンス本文の JSON を生成.
+
+    Pydantic のシリアライザ（Rust）で直接バイト列にするため、jsonable_encoder で
+    dict に変換してから json.dumps する FastAPI の既定より速い。出力は既定と同じで、
+    Pydantic モデルに加えて dataclass（一覧用の *Row）もそのまま渡せる。
+    """
+    return to_json(content)
+
+
+def _version_key(user_id: UUID, resource: str) -> str:
+    return f"version:{user_id}:{resource}"
+
+
+def _entry_key(user_id: UUID, resource: str, version: bytes, params: Any) -> str:
+    digest = _params_digest(params)
+    return f"response:{user_id}:{resource}:{version.decode()}:{digest}"
+
+
+def _params_digest(params: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(jsonable_encoder(params), sort_keys=True).encode()
+    ).hexdigest()
+
+
+def _new_version() -> bytes:
+    return secrets.token_hex(8).encode()
+
+
+def _ttl_seconds(ttl: Optional[float]) -> Optional[int]:
+    return max(1, int(ttl)) if ttl is not None else None
+
+
+def _create_backend() -> Optional[CacheBackend]:
+    settings = get_settings()
+    if settings.CACHE_BACKEND == "memory":
+        return InMemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+    if settings.CACHE_BACKEND == "redis":
+        # redis は任意依存のため、使用する場合のみ import
+        import redis.asyncio as redis
+
+        return SharedCacheBackend(redis.Redis.from_url(settings.CACHE_REDIS_URL))
+    return None
+
+
+def configure_response_cache() -> None:
+    """設定からレスポンスキャッシュのバックエンド・TTL を設定（create_app() から呼ぶ）."""
+    response_cache.backend = _create_backend()
+    response_cache.ttl = get_settings().CACHE_TTL_SECONDS
+
+
+#  ---  Singleton instance ----
+# import 時には設定を読まず、configure_response_cache() まではキャッシュ無効
+response_cache = ResponseCache(None)
@@ -0,0 +1,285 @@
+"""差分同期サービス."""
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Text,
+    cast,
+    delete,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel, col
+
+from app.core.config import get_settings
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.models.note import Note
+from app.models.note_category import NoteCategory
+from app.models.sync_tombstone import SyncTombstone
+from app.models.task import Task
+from app.models.vehicle import Vehicle
+from app.services.response_cache import NOTE, NOTE_CATEGORY, TASK
+from app.utils.exceptions import ValidationException
+
+# レスポンスのキー → 同期するモデル
+SYNC_MODELS: dict[str, type[SQLModel]] = {
+    "tasks": Task,
+    "vehicles": Vehicle,
+    "fuel_records": FuelRecord,
+    "notes": Note,
+    "note_categories": NoteCategory,
+}
+
+# 物理削除の記録のリソース → レスポンスのキー
+TOMBSTONE_KEYS = {
+    TASK: "tasks",
+    NOTE: "notes",
+    NOTE_CATEGORY: "note_categories",
+}
+
+
+@dataclass(frozen=True)
+class SyncPosition:
+    """同期トークンが表す同期の位置.
+
+    Attributes:
+        xmin: 同期時点で未完了だった最も古いトランザクション ID
+            （次回はこれ以降のトランザクションで書き込まれた行を返す）
+        synced_at: 同期日時（データベースの時刻、保管期間の判定に使用）
+    """
+
+    xmin: int
+    synced_at: datetime
+
+
+def encode_sync_token(position: SyncPosition) -> str:
+    """同期の位置をトークン（クエリパラメータで使える不透明な文字列）に変換."""
+    raw = f"{position.xmin}@{position.synced_at.isoformat()}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> Optional[SyncPosition]:
+    """トークンを同期の位置に変換.
+
+    同期日時だけを持つ以前の形式のトークンは None（全件の再同期）とする。
+
+    Raises:
+        ValidationException: トークンが正しくない場合
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded).decode()
+        xmin, separator, synced_at = raw.partition("@")
+        if not separator:
+            # 以前の形式（同期日時のみ）
+            xmin, synced_at = "0", raw
+        position = SyncPosition(
+            xmin=int(xmin), synced_at=datetime.fromisoformat(synced_at)
+        )
+    except ValueError as e:
+        raise ValidationException("同期トークンが正しくありません") from e
+    if position.synced_at.tzinfo is None or position.xmin < 0:
+        raise ValidationException("同期トークンが正しくありません")
+    return position if separator else None
+
+
+def _sync_xid(table_name: str) -> ColumnElement[int]:
+    """行を最後に書き込んだトランザクション ID の列.
+
+    migrations/015_add_sync_xid.sql のトリガーで設定し、モデルには含めない
+    （アーカイブテーブルへの移動などでモデルの列をそのまま使うため）。
+    """
+    return literal_column(f"{table_name}.sync_xid", BigInteger)
+
+
+@dataclass
+class SyncChanges:
+    """差分同期の結果."""
+
+    token: str
+    reset: bool
+    changed: dict[str, list[Any]]
+    deleted: dict[str, list[UUID]]
+
+
+class SyncService:
+    """
+    差分同期（前回の同期以降に作成・更新・削除された行の取得）のビジネスロジック層.
+
+    変更はコミット順で判定する。各行はトリガーで最後に書き込んだトランザクションの
+    ID（sync_xid）を持ち、同期トークンは同期時点で未完了だった最も古い
+    トランザクション ID（スナップショットの xmin）を持つ。次回の同期では
+    sync_xid がそれ以上の行を返すため、同期中にコミットされた書き込みや
+    ワーカー間の時計のずれで変更を取りこぼさない（同じ行が次の同期でも返ることがある）。
+    論理削除された行は deleted に ID だけを返し、行が残らない物理削除は
+    sync_tombstone の記録から返す（同じ ID の存在する行が変更にあれば、行を優先する）。
+    論理削除された行と物理削除の記録は保管期間（ARCHIVE_RETENTION_DAYS）を過ぎると
+    残らないため、それより古いトークンでは全件を返し reset を True にする。
+    """
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        """初期化.
+
+        Args:
+            db_session: データベースセッション
+        """
+        self.db_session = db_session
+
+    async def get_changes(
+        self,
+        user_id: UUID,
+        since: Optional[SyncPosition] = None,
+    ) -> SyncChanges:
+        """前回の同期以降の変更を取得.
+
+        Args:
+            user_id: ユーザー ID
+            since: 前回の同期の位置（decode_sync_token の結果、None の場合は全件）
+
+        Returns:
+            SyncChanges（reset が True の場合、changed は全件で deleted は空）
+        """
+        # 行を読む前に位置を取得し、以降にコミットされる書き込みを次回の同期に含める
+        result = await self.db_session.execute(
+            select(
+                cast(
+                    cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text),
+                    BigInteger,
+                ),
+                func.now(),
+            )
+        )
+        xmin, now = result.one()
+        horizon = now - timedelta(days=get_settings().ARCHIVE_RETENTION_DAYS)
+        reset = since is None or since.synced_at < horizon
+        after = None if reset else since.xmin  # type: ignore[union-attr]
+
+        changed: dict[str, list[Any]] = {}
+        deleted: dict[str, list[UUID]] = {}
+        for key, model in SYNC_MODELS.items():
+            rows = await self._changed_rows(model, user_id, after)
+            changed[key] = [row for row in rows if _is_live(row)]
+            deleted[key] = [row.id for row in rows if not _is_live(row)]
+
+        if after is not None:
+            stmt = (
+                select(SyncTombstone.resource, SyncTombstone.record_id)
+                .where(
+                    SyncTombstone.user_id == user_id,
+                    _sync_xid(SyncTombstone.__tablename__) >= after,
+                )
+                .order_by(SyncTombstone.deleted_at)
+            )
+            result = await self.db_session.execute(stmt)
+            # 同じ ID で作り直された行がある場合は、記録より存在する行を優先する
+            present = {
+                key: {row.id for row in changed[key]} | set(deleted[key])
+                for key in SYNC_MODELS
+            }
+            for resource, record_id in result.all():
+                key = TOMBSTONE_KEYS[resource]
+                if record_id not in present[key]:
+                    deleted[key].append(record_id)
+
+        return SyncChanges(
+            token=encode_sync_token(SyncPosition(xmin=xmin, synced_at=now)),
+            reset=reset,
+            changed=changed,
+            deleted=deleted,
+        )
+
+    async def _changed_rows(
+        self, model: Any, user_id: UUID, after: Optional[int]
+    ) -> list[Any]:
+        """トランザクション ID が after 以降の行（after が None の場合は論理削除されていない全行）."""
+        stmt = select(model).where(model.user_id == user_id)
+        if after is not None:
+            stmt = stmt.where(_sync_xid(model.__tablename__) >= after)
+        elif hasattr(model, "deleted_at"):
+            stmt = stmt.where(model.deleted_at.is_(None))
+        stmt = stmt.order_by(model.updated_at, model.id)
+        result = await self.db_session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def record_deleted(
+        self, user_id: UUID, resource: str, *record_ids: UUID
+    ) -> None:
+        """物理削除を記録（削除と同じトランザクションでコミットする）.
+
+        繰り返しタスクの発生分は同じ ID が再び作成・削除されることがあるため、
+        既存の記録は削除日時・トランザクション ID を更新する（upsert）。
+
+        Args:
+            user_id: ユーザー ID
+            resource: リソース（TOMBSTONE_KEYS のキー）
+            record_ids: 削除する行の ID
+        """
+        if not record_ids:
+            return
+        now = datetime.now(JST)
+        stmt = insert(SyncTombstone).values(
+            [
+                {
+                    "resource": resource,
+                    "record_id": record_id,
+                    "user_id": user_id,
+                    "deleted_at": now,
+                }
+                for record_id in dict.fromkeys(record_ids)
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["resource", "record_id"],
+            set_={
+                "user_id": stmt.excluded.user_id,
+                "deleted_at": stmt.excluded.deleted_at,
+            },
+        )
+        await self.db_session.execute(stmt)
+
+    async def clear_deleted(
+        self, user_id: UUID, resource: str, *record_ids: UUID
+    ) -> None:
+        """削除した ID の行を再び作成したときに物理削除の記録を削除.
+
+        Args:
+            user_id: ユーザー ID
+            resource: リソース（TOMBSTONE_KEYS のキー）
+            record_ids: 再び作成する行の ID
+        """
+        if not record_ids:
+            return
+        await self.db_session.execute(
+            delete(SyncTombstone).where(
+                col(SyncTombstone.user_id) == user_id,
+                col(SyncTombstone.resource) == resource,
+                col(SyncTombstone.record_id).in_(record_ids),
+            )
+        )
+
+    async def prune_tombstones(self, cutoff: datetime) -> int:
+        """cutoff より前の物理削除の記録を削除.
+
+        Returns:
+            削除した件数
+        """
+        result = await self.db_session.execute(
+            delete(SyncTombstone).where(SyncTombstone.deleted_at < cutoff)
+        )
+        await self.db_session.commit()
+        return result.rowcount
+
+
+def _is_live(row: Any) -> bool:
+    """論理削除されていない行かどうか."""
+    return getattr(row, "deleted_at", None) is None
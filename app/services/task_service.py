@@ -1,16 +1,160 @@
 """タスク管理サービス層."""
 
-from typing import List, Optional
-from uuid import UUID
-
-from sqlalchemy import asc, select
+import heapq
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from uuid import UUID, uuid5
+
+from sqlalchemy import (
+    StatementLambdaElement,
+    and_,
+    asc,
+    delete,
+    false,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.engine import Result
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import nulls_last
 from sqlmodel import col
 
+from app.models.base import JST
 from app.models.task import Task
 from app.schemas.task import TaskCreate, TaskUpdate
-from app.utils.exceptions import NotFoundException
+from app.services.response_cache import TASK, response_cache
+from app.services.sync_service import SyncService
+from app.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
+from app.utils.recurrence import RecurrenceRule
+
+# 繰り返しタスクを展開する既定の日数
+DEFAULT_RECURRENCE_HORIZON_DAYS = 30
+
+
+def build_occurrence(series: Task, occurrence_date: date) -> Task:
+    """
+    繰り返しシリーズの発生分を Task として組み立てる（保存はしない）.
+
+    ID はシリーズ ID と発生日から決まるため、展開した発生分と
+    後から保存した発生分で同じ ID になる。
+
+    Args:
+        series: 繰り返しシリーズ
+        occurrence_date: 発生日
+
+    Returns:
+        発生分の Task
+    """
+    return Task(
+        id=uuid5(series.id, occurrence_date.isoformat()),
+        user_id=series.user_id,
+        title=series.title,
+        description=series.description,
+        is_completed=False,
+        due_date=occurrence_date,
+        order=series.order,
+        created_at=series.created_at,
+        updated_at=series.updated_at,
+        recurrence_parent_id=series.id,
+        occurrence_date=occurrence_date,
+    )
+
+
+@dataclass(slots=True)
+class TaskRow:
+    """
+    一覧用のタスク（TaskResponse と同じ項目）.
+
+    必要な列だけを Core で取得した行から直接組み立てるため、
+    ORM エンティティの生成やセッションのアイデンティティマップへの登録を伴わない。
+    """
+
+    id: UUID
+    user_id: UUID
+    title: str
+    description: Optional[str]
+    is_completed: bool
+    completed_at: Optional[datetime]
+    due_date: Optional[date]
+    order: int
+    created_at: datetime
+    updated_at: datetime
+    recurrence_rule: Optional[str]
+    recurrence_parent_id: Optional[UUID]
+    occurrence_date: Optional[date]
+
+
+# TaskRow の各項目に対応する列（この順序で select し、行をそのまま渡す）
+TASK_ROW_COLUMNS = tuple(
+    Task.__table__.c[field.name]  # type: ignore[attr-defined]
+    for field in fields(TaskRow)
+)
+
+
+def task_row(task: Task) -> TaskRow:
+    """Task を TaskRow に変換（展開した発生分など DB の行がないもの用）."""
+    return TaskRow(*(getattr(task, column.key) for column in TASK_ROW_COLUMNS))
+
+
+def _list_order_key(task: Union[Task, TaskRow]) -> Tuple[bool, date, datetime]:
+    """一覧の並び順（期日昇順・期日なしは最後、次に作成日時）のキー."""
+    return (
+        task.due_date is None,
+        task.due_date or date.min,
+        task.created_at or datetime.min.replace(tzinfo=JST),
+    )
+
+
+def _user_tasks_statement(
+    user_id: UUID, q: Optional[str], rows: bool = False
+) -> StatementLambdaElement:
+    """ユーザーの（論理削除されていない）タスクを取得する lambda ステートメント.
+
+    q を指定した場合はタイトルまたは説明の部分一致で絞り込む
+    （pg_trgm の GIN インデックスで ILIKE を解決）。
+    rows=True の場合は Task ではなく TASK_ROW_COLUMNS の列を取得する。
+    """
+    if rows:
+        stmt = lambda_stmt(
+            lambda: select(*TASK_ROW_COLUMNS).where(
+                col(Task.user_id) == user_id,
+                col(Task.deleted_at).is_(None),
+            )
+        )
+    else:
+        stmt = lambda_stmt(
+            lambda: select(Task).where(
+                col(Task.user_id) == user_id,
+                col(Task.deleted_at).is_(None),  # 論理削除フィルター（将来）
+            )
+        )
+    if q:
+        # autoescape=True と同じエスケープ（lambda 内では値を加工できないため先に行う）
+        pattern = q.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        stmt += lambda s: s.where(
+            or_(
+                col(Task.title).icontains(pattern, escape="/"),
+                col(Task.description).icontains(pattern, escape="/"),
+            )
+        )
+    return stmt
+
+
+def _fetch_tasks(result: Result, rows: bool) -> List[Any]:
+    """実行結果を Task（rows=True の場合は TaskRow）のリストにする."""
+    if rows:
+        return [TaskRow(*row) for row in result.all()]
+    return list(result.scalars().all())
 
 
 class TaskService:
@@ -36,6 +180,13 @@ class TaskService:
         skip: int = 0,
         limit: int = 100,
         is_completed: Optional[bool] = None,
+        due_before: Optional[date] = None,
+        due_after: Optional[date] = None,
+        overdue: Optional[bool] = None,
+        completed_since: Optional[datetime] = None,
+        q: Optional[str] = None,
+        today: Optional[date] = None,
+        recurrence_horizon_days: int = DEFAULT_RECURRENCE_HORIZON_DAYS,
     ) -> List[Task]:
         """
         タスク一覧を取得.
@@ -43,42 +194,268 @@ class TaskService:
         期日が近い順（昇順）でソートされ、期日なしのタスクは
         作成日時の古い順で期日ありのタスクの後に表示される。
 
+        各フィルタは migrations/010_create_task_filter_indexes.sql の
+        インデックスで解決される。
+
+        繰り返しタスクはシリーズ行そのものではなく、期間内の未完了の発生分を
+        その場で展開して同じ並び順に合流させる（保存はしない）。
+        展開する期間は due_after〜due_before で、省略時は今日から
+        recurrence_horizon_days 日後まで（overdue=True の場合は同日数前から昨日まで）。
+        完了・変更・スキップされた発生分は通常のタスク行として保存されており、
+        その発生日は展開しない。
+
         Args:
             user_id: ユーザー ID（将来的に FK として使用）
             skip: スキップするレコード数（ページネーション）
             limit: 取得するレコード数（デフォルト 100、最大 1000）
             is_completed: 完了状態でフィルタ（None: 全件、True: 完了のみ、False: 未完了のみ）
+            due_before: 期日がこの日以前のタスクのみ（期日なしは除外）
+            due_after: 期日がこの日以降のタスクのみ（期日なしは除外）
+            overdue: True: 期限切れ（未完了かつ期日が今日より前）のみ、False: 期限切れ以外
+            completed_since: 完了日時がこの日時以降のタスクのみ
+            q: タイトルまたは説明に含まれる文字列（大文字小文字を区別しない）
+            today: 期限切れ判定の基準日（省略時は JST の今日）
+            recurrence_horizon_days: 繰り返しタスクを展開する既定の日数
 
         Returns:
-            Task のリスト
+            Task のリスト（展開した発生分は保存されていない Task）
 
         Example:
             >>> service = TaskService(db_session)
             >>> tasks = await service.list_tasks(user_id, skip=0, limit=10)
             >>> incomplete_tasks = await service.list_tasks(user_id, is_completed=False)
+            >>> overdue_tasks = await service.list_tasks(user_id, overdue=True)
         """
-        stmt = (
-            select(Task)
-            .where(col(Task.user_id) == user_id)
-            .where(col(Task.deleted_at).is_(None))  # 論理削除フィルター（将来）
+        return await self._list_tasks(
+            user_id,
+            skip=skip,
+            limit=limit,
+            is_completed=is_completed,
+            due_before=due_before,
+            due_after=due_after,
+            overdue=overdue,
+            completed_since=completed_since,
+            q=q,
+            today=today,
+            recurrence_horizon_days=recurrence_horizon_days,
+            rows=False,
         )
 
+    async def list_task_rows(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        is_completed: Optional[bool] = None,
+        due_before: Optional[date] = None,
+        due_after: Optional[date] = None,
+        overdue: Optional[bool] = None,
+        completed_since: Optional[datetime] = None,
+        q: Optional[str] = None,
+        today: Optional[date] = None,
+        recurrence_horizon_days: int = DEFAULT_RECURRENCE_HORIZON_DAYS,
+    ) -> List[TaskRow]:
+        """
+        タスク一覧を TaskRow で取得（一覧 API 用の読み取り専用パス）.
+
+        条件・並び順・繰り返しタスクの展開は list_tasks と同じ。
+        レスポンスに含める列だけを取得し、ORM エンティティを生成しない。
+
+        Returns:
+            TaskRow のリスト
+        """
+        return await self._list_tasks(
+            user_id,
+            skip=skip,
+            limit=limit,
+            is_completed=is_completed,
+            due_before=due_before,
+            due_after=due_after,
+            overdue=overdue,
+            completed_since=completed_since,
+            q=q,
+            today=today,
+            recurrence_horizon_days=recurrence_horizon_days,
+            rows=True,
+        )
+
+    async def _list_tasks(
+        self,
+        user_id: UUID,
+        skip: int,
+        limit: int,
+        is_completed: Optional[bool],
+        due_before: Optional[date],
+        due_after: Optional[date],
+        overdue: Optional[bool],
+        completed_since: Optional[datetime],
+        q: Optional[str],
+        today: Optional[date],
+        recurrence_horizon_days: int,
+        rows: bool,
+    ) -> List[Any]:
+        """list_tasks / list_task_rows の本体（rows=True で TaskRow を返す）."""
+        today = today or datetime.now(JST).date()
+
+        # 展開する発生分は常に未完了のため、完了済みのみを求める場合は展開しない
+        series: List[Task] = []
+        window_start = window_end = today
+        if is_completed is not True and completed_since is None:
+            window_start = due_after or (
+                today - timedelta(days=recurrence_horizon_days) if overdue else today
+            )
+            window_end = due_before or today + timedelta(days=recurrence_horizon_days)
+            if overdue is True:
+                window_end = min(window_end, today - timedelta(days=1))
+            elif overdue is False:
+                window_start = max(window_start, today)
+            if window_start <= window_end:
+                series = await self._list_series(user_id, q, window_end)
+
+        # フィルタの組み合わせごとに構築・キャッシュキー生成が 1 回で済むよう
+        # lambda で組み立てる（値はバインドパラメータとして抽出される）
+        stmt = _user_tasks_statement(user_id, q, rows)
+        stmt += lambda s: s.where(col(Task.recurrence_rule).is_(None))
+
         # is_completed フィルタ
         if is_completed is not None:
-            stmt = stmt.where(col(Task.is_completed) == is_completed)
+            stmt += lambda s: s.where(col(Task.is_completed) == is_completed)
+
+        # 期日の範囲フィルタ（両端を含む）
+        if due_before is not None:
+            stmt += lambda s: s.where(col(Task.due_date) <= due_before)
+        if due_after is not None:
+            stmt += lambda s: s.where(col(Task.due_date) >= due_after)
+
+        # 期限切れフィルタ
+        if overdue is not None:
+            if overdue:
+                # is_completed = false とし、部分インデックスの述語と一致させる
+                stmt += lambda s: s.where(
+                    and_(
+                        col(Task.is_completed) == false(),
+                        col(Task.due_date) < today,
+                    )
+                )
+            else:
+                stmt += lambda s: s.where(
+                    or_(
+                        col(Task.is_completed).is_(True),
+                        col(Task.due_date).is_(None),
+                        col(Task.due_date) >= today,
+                    )
+                )
+
+        # 完了日時フィルタ
+        if completed_since is not None:
+            stmt += lambda s: s.where(col(Task.completed_at) >= completed_since)
+
+        stmt += lambda s: s.order_by(
+            nulls_last(asc(col(Task.due_date))),
+            asc(col(Task.created_at)),
+        )
+
+        if not series:
+            stmt += lambda s: s.offset(skip).limit(limit)
+            result = await self.db_session.execute(stmt)
+            return _fetch_tasks(result, rows)
+
+        # 合流後の先頭 skip + limit 件に入り得るのは各ソースの先頭 skip + limit 件のみ
+        materialized = await self._list_materialized_dates(
+            series, window_start, window_end
+        )
+        fetch = skip + limit
+        stmt += lambda s: s.limit(fetch)
+        result = await self.db_session.execute(stmt)
+        sources: List[Iterable[Any]] = [_fetch_tasks(result, rows)]
+        for task in series:
+            occurrences = self._expand_series(
+                task,
+                window_start,
+                window_end,
+                materialized.get(task.id, set()),
+            )
+            sources.append(map(task_row, occurrences) if rows else occurrences)
+        merged = heapq.merge(*sources, key=_list_order_key)
+        return list(islice(merged, skip, skip + limit))
+
+    async def list_pending_occurrences(
+        self, user_id: UUID, window_start: date, window_end: date
+    ) -> List[Task]:
+        """
+        期間内の繰り返しタスクの未保存（未完了）の発生分を取得.
+
+        list_tasks が一覧に合流させる発生分と同じで、完了・変更・スキップされた
+        発生日は含まない（変更された発生分は通常のタスク行として取得できる）。
+
+        Args:
+            user_id: ユーザー ID
+            window_start: 期間の開始日（含む）
+            window_end: 期間の終了日（含む）
 
-        stmt = (
-            stmt.order_by(
-                nulls_last(asc(col(Task.due_date))),
-                asc(col(Task.created_at)),
+        Returns:
+            発生分の Task のリスト（一覧と同じ並び順、保存されていない Task）
+        """
+        series = await self._list_series(user_id, None, window_end)
+        if not series:
+            return []
+        materialized = await self._list_materialized_dates(
+            series, window_start, window_end
+        )
+        occurrences = (
+            self._expand_series(
+                task, window_start, window_end, materialized.get(task.id, set())
             )
-            .offset(skip)
-            .limit(limit)
+            for task in series
         )
+        return list(heapq.merge(*occurrences, key=_list_order_key))
 
+    async def _list_series(
+        self,
+        user_id: UUID,
+        q: Optional[str],
+        window_end: date,
+    ) -> List[Task]:
+        """期間内に発生分があり得る繰り返しシリーズを取得."""
+        stmt = _user_tasks_statement(user_id, q)
+        stmt += lambda s: s.where(
+            col(Task.recurrence_rule).is_not(None),
+            col(Task.due_date) <= window_end,
+        ).order_by(asc(col(Task.created_at)))
         result = await self.db_session.execute(stmt)
         return list(result.scalars().all())
 
+    async def _list_materialized_dates(
+        self, series: List[Task], window_start: date, window_end: date
+    ) -> Dict[UUID, Set[date]]:
+        """期間内で行として保存済み（完了・変更・スキップ）の発生日をシリーズごとに取得."""
+        stmt = select(
+            col(Task.recurrence_parent_id), col(Task.occurrence_date)
+        ).where(
+            col(Task.recurrence_parent_id).in_([task.id for task in series]),
+            col(Task.occurrence_date) >= window_start,
+            col(Task.occurrence_date) <= window_end,
+        )
+        result = await self.db_session.execute(stmt)
+        materialized: Dict[UUID, Set[date]] = {}
+        for parent_id, occurrence_date in result.all():
+            materialized.setdefault(parent_id, set()).add(occurrence_date)
+        return materialized
+
+    @staticmethod
+    def _expand_series(
+        series: Task,
+        window_start: date,
+        window_end: date,
+        materialized: Set[date],
+    ) -> Iterator[Task]:
+        """シリーズの未保存の発生分を期日順に遅延生成."""
+        rule = RecurrenceRule.parse(series.recurrence_rule or "")
+        start = series.due_date or window_start
+        for occurrence_date in rule.occurrences(start, window_start, window_end):
+            if occurrence_date not in materialized:
+                yield build_occurrence(series, occurrence_date)
+
     async def get_task(self, task_id: UUID, user_id: UUID) -> Task:
         """
         タスクを ID で取得.
@@ -97,8 +474,8 @@ class TaskService:
             >>> service = TaskService(db_session)
             >>> task = await service.get_task(task_id, user_id)
         """
-        stmt = (
-            select(Task)
+        stmt = lambda_stmt(
+            lambda: select(Task)
             .where(col(Task.id) == task_id)
             .where(col(Task.user_id) == user_id)
             .where(col(Task.deleted_at).is_(None))  # 論理削除フィルター（将来）
@@ -131,9 +508,11 @@ class TaskService:
             description=task_create.description,
             due_date=task_create.due_date,
             is_completed=task_create.is_completed or False,
+            recurrence_rule=task_create.recurrence_rule,
         )
         self.db_session.add(task)
         await self.db_session.commit()
+        await response_cache.bump(user_id, TASK)
         await self.db_session.refresh(task)
         return task
 
@@ -146,6 +525,9 @@ class TaskService:
         """
         既存タスクを更新（部分更新対応）.
 
+        recurrence_rule を null にすると繰り返しを解除し、
+        保存済みの発生分は新しい ID の通常のタスクとして残る。
+
         Args:
             task_id: タスク ID
             task_update: タスク更新スキーマ
@@ -156,6 +538,7 @@ class TaskService:
 
         Raises:
             NotFoundException: タスクが見つからない場合
+            ValidationException: 繰り返しの指定が不正な場合（発生分への指定、期日なし）
 
         Example:
             >>> service = TaskService(db_session)
@@ -167,13 +550,169 @@ class TaskService:
         # 更新されたフィールドのみ適用（部分更新）
         update_data = task_update.model_dump(exclude_unset=True)
 
+        if "recurrence_rule" in update_data or "due_date" in update_data:
+            rule = update_data.get("recurrence_rule", task.recurrence_rule)
+            if rule is not None and task.recurrence_parent_id is not None:
+                raise ValidationException("発生分には繰り返しルールを設定できません")
+            if rule is not None and update_data.get("due_date", task.due_date) is None:
+                raise ValidationException("繰り返しタスクには期日（開始日）が必要です")
+            if rule is None and task.recurrence_rule is not None:
+                # 繰り返しの解除: 保存済みの発生分は通常のタスクとして残す
+                await self._detach_occurrences(task)
+
+        self._apply_update(task, update_data)
+
+        self.db_session.add(task)
+        await self.db_session.commit()
+        await response_cache.bump(user_id, TASK)
+        await self.db_session.refresh(task)
+        return task
+
+    async def update_occurrence(
+        self,
+        series_id: UUID,
+        occurrence_date: date,
+        task_update: TaskUpdate,
+        user_id: UUID,
+    ) -> Task:
+        """
+        繰り返しタスクの発生分を更新（完了・変更）.
+
+        発生分が未保存の場合はシリーズから行を作成して保存する。
+        スキップ済みの発生分を更新した場合はスキップを取り消す。
+
+        Args:
+            series_id: 繰り返しシリーズ ID
+            occurrence_date: 発生日
+            task_update: タスク更新スキーマ（recurrence_rule は指定不可）
+            user_id: ユーザー ID（所有権確認用）
+
+        Returns:
+            保存された発生分の Task オブジェクト
+
+        Raises:
+            NotFoundException: シリーズまたは発生日が見つからない場合
+            ValidationException: recurrence_rule を指定した場合
+            ConflictException: 同じ発生分が同時に保存された場合
+
+        Example:
+            >>> service = TaskService(db_session)
+            >>> done = TaskUpdate(is_completed=True)
+            >>> task = await service.update_occurrence(series_id, day, done, user_id)
+        """
+        update_data = task_update.model_dump(exclude_unset=True)
+        if "recurrence_rule" in update_data:
+            raise ValidationException("発生分には繰り返しルールを設定できません")
+
+        task = await self._get_or_build_occurrence(series_id, occurrence_date, user_id)
+        task.deleted_at = None
+        self._apply_update(task, update_data)
+        return await self._save_occurrence(task)
+
+    async def skip_occurrence(
+        self, series_id: UUID, occurrence_date: date, user_id: UUID
+    ) -> None:
+        """
+        繰り返しタスクの発生分をスキップ.
+
+        論理削除した発生分の行を保存し、以降の展開から除外する。
+
+        Args:
+            series_id: 繰り返しシリーズ ID
+            occurrence_date: 発生日
+            user_id: ユーザー ID（所有権確認用）
+
+        Raises:
+            NotFoundException: シリーズまたは発生日が見つからない場合
+            ConflictException: 同じ発生分が同時に保存された場合
+        """
+        task = await self._get_or_build_occurrence(series_id, occurrence_date, user_id)
+        task.deleted_at = datetime.now(JST)
+        await self._save_occurrence(task)
+
+    async def _get_or_build_occurrence(
+        self, series_id: UUID, occurrence_date: date, user_id: UUID
+    ) -> Task:
+        """保存済みの発生分（スキップ済みを含む）を取得し、なければ組み立てる."""
+        series = await self.get_task(series_id, user_id)
+        if series.recurrence_rule is None or series.due_date is None:
+            raise NotFoundException(f"繰り返しタスク ID {series_id} が見つかりません")
+
+        stmt = select(Task).where(
+            col(Task.recurrence_parent_id) == series.id,
+            col(Task.occurrence_date) == occurrence_date,
+        )
+        result = await self.db_session.execute(stmt)
+        task = result.scalars().one_or_none()
+        if task is not None:
+            return task
+
+        rule = RecurrenceRule.parse(series.recurrence_rule)
+        if not rule.is_occurrence(series.due_date, occurrence_date):
+            raise NotFoundException(
+                f"繰り返しタスク ID {series_id} に {occurrence_date} の発生分はありません"
+            )
+        return build_occurrence(series, occurrence_date)
+
+    async def _save_occurrence(self, task: Task) -> Task:
+        """発生分の行を保存.
+
+        発生分の ID は切り離し・削除で記録した ID と同じになることがあるため、
+        その物理削除の記録は同じトランザクションで削除する。
+        """
+        task.updated_at = datetime.now(JST)
+        self.db_session.add(task)
+        await SyncService(self.db_session).clear_deleted(task.user_id, TASK, task.id)
+        try:
+            await self.db_session.commit()
+        except IntegrityError as e:
+            await self.db_session.rollback()
+            raise ConflictException("この発生分は同時に更新されました") from e
+        await response_cache.bump(task.user_id, TASK)
+        await self.db_session.refresh(task)
+        return task
+
+    async def _detach_occurrences(self, series: Task) -> None:
+        """保存済みの発生分をシリーズから切り離し、スキップの記録は削除.
+
+        発生分の ID はシリーズ ID と発生日から決まるため、切り離した行には
+        新しい ID を振る（同じシリーズに再び繰り返しを設定したときに、展開した
+        発生分や後から保存する発生分と ID が重複しないようにする）。
+        差分同期では元の ID を削除、新しい ID を作成として返す。元の ID は
+        繰り返しを再び設定すると同じ発生分で使われるため、削除の記録は上書きする。
+        """
+        skipped = await self.db_session.execute(
+            delete(Task)
+            .where(
+                col(Task.recurrence_parent_id) == series.id,
+                col(Task.deleted_at).is_not(None),
+            )
+            .returning(col(Task.id))
+        )
+        kept = await self.db_session.execute(
+            select(col(Task.id)).where(col(Task.recurrence_parent_id) == series.id)
+        )
+        await SyncService(self.db_session).record_deleted(
+            series.user_id, TASK, *skipped.scalars().all(), *kept.scalars().all()
+        )
+        await self.db_session.execute(
+            update(Task)
+            .where(col(Task.recurrence_parent_id) == series.id)
+            .values(
+                id=func.uuid_generate_v4(),
+                recurrence_parent_id=None,
+                occurrence_date=None,
+                updated_at=datetime.now(JST),
+            )
+        )
+
+    @staticmethod
+    def _apply_update(task: Task, update_data: Dict[str, Any]) -> None:
+        """更新内容を適用（完了状態に合わせて completed_at も更新）."""
         # is_completed が True に変更された場合、completed_at を自動設定
         if "is_completed" in update_data:
             if update_data["is_completed"] and not task.is_completed:
                 # 未完了→完了に変更された場合
-                from datetime import datetime
-                from app.models.base import JST
-
                 update_data["completed_at"] = datetime.now(JST)
             elif not update_data["is_completed"] and task.is_completed:
                 # 完了→未完了に変更された場合、completed_at をクリア
@@ -182,15 +721,12 @@ class TaskService:
         for field, value in update_data.items():
             setattr(task, field, value)
 
-        self.db_session.add(task)
-        await self.db_session.commit()
-        await self.db_session.refresh(task)
-        return task
-
     async def delete_task(self, task_id: UUID, user_id: UUID) -> None:
         """
         タスクを削除（物理削除）.
 
+        繰り返しシリーズを削除した場合、保存済みの発生分は新しい ID の通常のタスクとして残る。
+
         Args:
             task_id: タスク ID
             user_id: ユーザー ID（所有権確認用）
@@ -203,5 +739,10 @@ class TaskService:
             >>> await service.delete_task(task_id, user_id)
         """
         task = await self.get_task(task_id, user_id)
+        if task.recurrence_rule is not None:
+            # 保存済みの発生分（完了済みなど）は通常のタスクとして残す
+            await self._detach_occurrences(task)
         await self.db_session.delete(task)
+        await SyncService(self.db_session).record_deleted(user_id, TASK, task.id)
         await self.db_session.commit()
+        await response_cache.bump(user_id, TASK)
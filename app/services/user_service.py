@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+from sqlalchemy import lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -15,10 +16,23 @@ class UserService:
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
-        stmt = select(User).where(User.email == email)
+        # 認証のたびに実行されるため、構築済みの lambda ステートメントを使う
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
         result = await self.db_session.execute(stmt)
         return result.scalars().one_or_none()
 
+    async def update_profile(
+        self, email: str, name: str, avatar_url: Optional[str]
+    ) -> None:
+        """Update name / avatar of an existing user (no-op if missing or unchanged)."""
+        user = await self.get_by_email(email=email)
+        if user is None or (user.name, user.avatar_url) == (name, avatar_url):
+            return
+        user.name = name
+        user.avatar_url = avatar_url
+        self.db_session.add(user)
+        await self.db_session.commit()
+
     async def get_or_create(self, user_in: UserCreate) -> User:
         """Get existing user or create new one (upsert by email)."""
         user = await self.get_by_email(email=user_in.email)
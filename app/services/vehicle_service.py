@@ -1,16 +1,116 @@
 """Vehicle（車）管理サービス."""
 
-from typing import List
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, asc, desc, select
+from sqlalchemy import and_, asc, desc, lambda_stmt, select, true
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.fuel_record import FuelRecord
 from app.models.vehicle import Vehicle
 from app.schemas.vehicle import VehicleCreate, VehicleUpdate
+from app.services.fuel_record_service import (
+    interval_efficiency,
+    latest_full_tank_intervals,
+)
+from app.services.response_cache import FUEL_RECORD, VEHICLE, response_cache
 from app.utils.exceptions import NotFoundException
 
 
+@dataclass
+class VehicleFuelSummary:
+    """車ごとの最新給油サマリー."""
+
+    latest_mileage: int
+    last_refuel_datetime: datetime
+    recent_fuel_efficiency: Optional[float]
+
+
+@dataclass(slots=True)
+class VehicleRow:
+    """
+    一覧用の車（VehicleResponse と同じ項目）.
+
+    必要な列だけを Core で取得した行から直接組み立てるため、
+    ORM エンティティの生成やセッションのアイデンティティマップへの登録を伴わない。
+    日時は VehicleResponse と同じく ISO 8601 文字列で持つ。
+    """
+
+    id: UUID
+    user_id: UUID
+    name: str
+    seq: int
+    maker: str
+    model: str
+    year: Optional[int]
+    number: Optional[str]
+    tank_capacity: Optional[float]
+    created_at: str
+    updated_at: str
+    fuel_summary: Optional[VehicleFuelSummary] = None
+
+
+# VehicleRow の fuel_summary 以外の項目に対応する列（この順序で select する）
+VEHICLE_ROW_COLUMNS = (
+    Vehicle.id,
+    Vehicle.user_id,
+    Vehicle.name,
+    Vehicle.seq,
+    Vehicle.maker,
+    Vehicle.model,
+    Vehicle.year,
+    Vehicle.number,
+    Vehicle.tank_capacity,
+    Vehicle.created_at,
+    Vehicle.updated_at,
+)
+
+
+def _latest_fuel(user_id: UUID) -> Any:
+    """車ごとの最新給油（給油日時の降順 LIMIT 1）の LATERAL 副問い合わせ."""
+    return (
+        select(FuelRecord.total_mileage, FuelRecord.refuel_datetime)
+        .where(
+            and_(
+                FuelRecord.vehicle_id == Vehicle.id,
+                FuelRecord.user_id == user_id,
+                FuelRecord.deleted_at.is_(None),
+            )
+        )
+        .order_by(desc(FuelRecord.refuel_datetime))
+        .limit(1)
+        .lateral("latest_fuel")
+    )
+
+
+def _summary_columns(user_id: UUID) -> tuple[Any, Any, tuple]:
+    """最新給油サマリー用の (最新給油, 最新の満タン給油の区間, select する列)."""
+    latest_fuel = _latest_fuel(user_id)
+    latest_full_tank = latest_full_tank_intervals(user_id)
+    columns = (
+        latest_fuel,
+        *(column for column in latest_full_tank.c if column.key != "vehicle_id"),
+    )
+    return latest_fuel, latest_full_tank, columns
+
+
+def _fuel_summary(row: Row) -> Optional[VehicleFuelSummary]:
+    """_summary_columns の列を含む行から最新給油サマリーを組み立てる（給油記録がなければ None）.
+
+    直近の燃費は最新の満タン給油の満タン法の燃費（燃費記録一覧のその記録の値）。
+    """
+    if row.total_mileage is None:
+        return None
+    return VehicleFuelSummary(
+        latest_mileage=row.total_mileage,
+        last_refuel_datetime=row.refuel_datetime,
+        recent_fuel_efficiency=interval_efficiency(row),
+    )
+
+
 class VehicleService:
     """車管理サービス."""
 
@@ -22,36 +122,73 @@ class VehicleService:
         """
         self.db_session = db_session
 
-    async def list_vehicles(
+    async def list_vehicle_rows(
         self,
         user_id: UUID,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[Vehicle]:
-        """ユーザーが所有する車一覧を取得.
+        include_fuel_summary: bool = False,
+    ) -> List[VehicleRow]:
+        """ユーザーが所有する車一覧を VehicleRow で取得（一覧 API 用の読み取り専用パス）.
+
+        並び順は seq の昇順。レスポンスに含める列だけを取得し、ORM エンティティを
+        生成しない。include_fuel_summary=True の場合は車ごとの最新給油を
+        LEFT JOIN LATERAL（給油日時の降順 LIMIT 1）で結合し、直近の燃費
+        （最新の満タン給油の満タン法の燃費）も給油履歴の窓関数の集計を結合して
+        全車分を 1 クエリで取得する。
 
         Args:
             user_id: ユーザー ID
             skip: スキップするレコード数
             limit: 取得するレコード数
+            include_fuel_summary: 最新給油サマリーを含めるか
 
         Returns:
-            Vehicle のリスト
+            VehicleRow のリスト
         """
-        stmt = (
-            select(Vehicle)
-            .where(
-                and_(
-                    Vehicle.user_id == user_id,
-                    Vehicle.deleted_at.is_(None),
+        if include_fuel_summary:
+            latest_fuel, latest_full_tank, columns = _summary_columns(user_id)
+            stmt = (
+                select(*VEHICLE_ROW_COLUMNS, *columns)
+                .select_from(Vehicle)
+                .outerjoin(latest_fuel, true())
+                .outerjoin(
+                    latest_full_tank, latest_full_tank.c.vehicle_id == Vehicle.id
+                )
+                .where(
+                    and_(
+                        Vehicle.user_id == user_id,
+                        Vehicle.deleted_at.is_(None),
+                    )
                 )
+                .order_by(asc(Vehicle.seq))
+                .offset(skip)
+                .limit(limit)
+            )
+        else:
+            stmt = lambda_stmt(
+                lambda: select(*VEHICLE_ROW_COLUMNS)
+                .where(
+                    and_(
+                        Vehicle.user_id == user_id,
+                        Vehicle.deleted_at.is_(None),
+                    )
+                )
+                .order_by(asc(Vehicle.seq))
+                .offset(skip)
+                .limit(limit)
             )
-            .order_by(asc(Vehicle.seq))
-            .offset(skip)
-            .limit(limit)
-        )
         result = await self.db_session.execute(stmt)
-        return result.scalars().all()
+
+        return [
+            VehicleRow(
+                *row[:9],
+                created_at=row.created_at.isoformat(),
+                updated_at=row.updated_at.isoformat(),
+                fuel_summary=_fuel_summary(row) if include_fuel_summary else None,
+            )
+            for row in result.all()
+        ]
 
     async def get_vehicle(self, vehicle_id: UUID, user_id: UUID) -> Vehicle:
         """特定の車を取得.
@@ -66,11 +203,13 @@ class VehicleService:
         Raises:
             NotFoundException: 車が見つかりません
         """
-        stmt = select(Vehicle).where(
-            and_(
-                Vehicle.id == vehicle_id,
-                Vehicle.user_id == user_id,
-                Vehicle.deleted_at.is_(None),
+        stmt = lambda_stmt(
+            lambda: select(Vehicle).where(
+                and_(
+                    Vehicle.id == vehicle_id,
+                    Vehicle.user_id == user_id,
+                    Vehicle.deleted_at.is_(None),
+                )
             )
         )
         result = await self.db_session.execute(stmt)
@@ -127,6 +266,7 @@ class VehicleService:
         )
         self.db_session.add(vehicle)
         await self.db_session.commit()
+        await response_cache.bump(user_id, VEHICLE, FUEL_RECORD)
         await self.db_session.refresh(vehicle)
         return vehicle
 
@@ -158,6 +298,7 @@ class VehicleService:
 
         self.db_session.add(vehicle)
         await self.db_session.commit()
+        await response_cache.bump(user_id, VEHICLE, FUEL_RECORD)
         await self.db_session.refresh(vehicle)
         return vehicle
 
@@ -181,3 +322,4 @@ class VehicleService:
 
         self.db_session.add(vehicle)
         await self.db_session.commit()
+        await response_cache.bump(user_id, VEHICLE, FUEL_RECORD)
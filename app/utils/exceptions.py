@@ -1,5 +1,7 @@
 """アプリケーション用のカスタム例外クラス."""
 
+from typing import List
+
 
 class ApplicationException(Exception):
     """アプリケーション用の基本例外クラス."""
@@ -24,6 +26,26 @@ class ValidationException(ApplicationException):
         super().__init__(message, status_code=422)
 
 
+class RequestBodyException(ApplicationException):
+    """リクエストボディが読み込めない・検証に失敗した場合に発生."""
+
+    def __init__(
+        self,
+        errors: List[str],
+        message: str = "リクエストボディが不正です",
+        status_code: int = 400,
+    ):
+        """リクエストボディ例外を初期化.
+
+        Args:
+            errors: エラーの詳細（レスポンスの errors）
+            message: 例外メッセージ
+            status_code: HTTP ステータスコード
+        """
+        self.errors = errors
+        super().__init__(message, status_code=status_code)
+
+
 class NotFoundException(ApplicationException):
     """リソースが見つからない場合に発生."""
 
@@ -32,6 +54,14 @@ class NotFoundException(ApplicationException):
         super().__init__(message, status_code=404)
 
 
+class ConflictException(ApplicationException):
+    """リソースの状態が競合した場合に発生."""
+
+    def __init__(self, message: str = "リソースが更新されています"):
+        """競合例外を初期化."""
+        super().__init__(message, status_code=409)
+
+
 class AuthenticationException(ApplicationException):
     """認証に失敗した場合に発生."""
 
@@ -46,3 +76,11 @@ class AuthorizationException(ApplicationException):
     def __init__(self, message: str = "アクセス権限が不足しています"):
         """認可例外を初期化."""
         super().__init__(message, status_code=403)
+
+
+class ServiceUnavailableException(ApplicationException):
+    """一時的に処理を受け付けられない場合に発生."""
+
+    def __init__(self, message: str = "一時的に処理を受け付けられません"):
+        """利用不可例外を初期化."""
+        super().__init__(message, status_code=503)
@@ -1,12 +1,12 @@
 """ロギング設定."""
 
 import logging
-from app.core.config import settings
+from app.core.config import get_settings
 
 
 def setup_logging() -> None:
     """アプリケーション用のロギングを設定."""
     logging.basicConfig(
-        level=settings.LOG_LEVEL,
+        level=get_settings().LOG_LEVEL,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
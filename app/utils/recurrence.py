@@ -0,0 +1,215 @@
+"""繰り返しルール（RFC 5545 RRULE のサブセット）."""
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+# 対応する FREQ
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+
+# BYDAY の曜日コード（date.weekday() の値）
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+# 展開コストを抑えるための上限
+MAX_INTERVAL = 999
+MAX_COUNT = 1000
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """
+    繰り返しルール.
+
+    FREQ / INTERVAL / BYDAY（WEEKLY のみ）/ COUNT / UNTIL に対応する。
+    開始日（DTSTART）はルールに含めず、シリーズの期日を使用する。
+
+    Attributes:
+        freq: 繰り返し単位（DAILY / WEEKLY / MONTHLY / YEARLY）
+        interval: 間隔（1 以上）
+        by_day: 曜日（date.weekday() の値、昇順）
+        count: 発生回数の上限
+        until: 最終日（この日を含む）
+    """
+
+    freq: str
+    interval: int = 1
+    by_day: Tuple[int, ...] = ()
+    count: Optional[int] = None
+    until: Optional[date] = None
+
+    @classmethod
+    def parse(cls, rule: str) -> "RecurrenceRule":
+        """
+        RRULE 文字列を解析.
+
+        Args:
+            rule: "FREQ=WEEKLY;BYDAY=MO,WE" 形式の文字列（"RRULE:" 接頭辞は任意）
+
+        Returns:
+            RecurrenceRule オブジェクト
+
+        Raises:
+            ValueError: 未対応または不正なルールの場合
+        """
+        text = rule.strip()
+        if text.upper().startswith("RRULE:"):
+            text = text[len("RRULE:") :]
+
+        parts: dict[str, str] = {}
+        for part in text.split(";"):
+            if not part:
+                continue
+            key, sep, value = part.partition("=")
+            key = key.strip().upper()
+            if not sep or not value.strip():
+                raise ValueError(f"繰り返しルールの形式が不正です: {part}")
+            if key in parts:
+                raise ValueError(f"{key} が重複しています")
+            parts[key] = value.strip().upper()
+
+        freq = parts.pop("FREQ", None)
+        if freq not in FREQUENCIES:
+            raise ValueError(
+                "FREQ は DAILY / WEEKLY / MONTHLY / YEARLY のいずれかである必要があります"
+            )
+
+        interval = _parse_positive_int(parts.pop("INTERVAL", "1"), "INTERVAL")
+        if interval > MAX_INTERVAL:
+            raise ValueError(f"INTERVAL は {MAX_INTERVAL} 以下である必要があります")
+
+        by_day: Tuple[int, ...] = ()
+        if "BYDAY" in parts:
+            if freq != "WEEKLY":
+                raise ValueError("BYDAY は FREQ=WEEKLY でのみ指定できます")
+            codes = parts.pop("BYDAY").split(",")
+            if any(code not in WEEKDAYS for code in codes):
+                raise ValueError("BYDAY は MO,TU,WE,TH,FR,SA,SU で指定してください")
+            by_day = tuple(sorted({WEEKDAYS[code] for code in codes}))
+
+        count: Optional[int] = None
+        if "COUNT" in parts:
+            count = _parse_positive_int(parts.pop("COUNT"), "COUNT")
+            if count > MAX_COUNT:
+                raise ValueError(f"COUNT は {MAX_COUNT} 以下である必要があります")
+
+        until: Optional[date] = None
+        if "UNTIL" in parts:
+            if count is not None:
+                raise ValueError("COUNT と UNTIL は同時に指定できません")
+            until = _parse_until(parts.pop("UNTIL"))
+
+        if parts:
+            raise ValueError(f"未対応の項目です: {', '.join(sorted(parts))}")
+
+        return cls(
+            freq=freq, interval=interval, by_day=by_day, count=count, until=until
+        )
+
+    def __str__(self) -> str:
+        """正規化した RRULE 文字列."""
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.by_day:
+            codes = {value: code for code, value in WEEKDAYS.items()}
+            parts.append("BYDAY=" + ",".join(codes[day] for day in self.by_day))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%d}")
+        return ";".join(parts)
+
+    def occurrences(
+        self, start: date, window_start: date, window_end: date
+    ) -> Iterator[date]:
+        """
+        window_start から window_end（両端を含む）までの発生日を昇順で遅延生成.
+
+        COUNT がない場合は期間の手前まで計算で読み飛ばすため、
+        開始日が古いシリーズでも期間外の発生日は展開しない。
+
+        Args:
+            start: シリーズの開始日（DTSTART）
+            window_start: 期間の開始日
+            window_end: 期間の終了日
+
+        Yields:
+            発生日
+        """
+        # COUNT は開始日からの通し番号で判定するため読み飛ばせない
+        seek = window_start if self.count is None else start
+        for index, occurrence in enumerate(self._iter_from(start, seek)):
+            if self.count is not None and index >= self.count:
+                return
+            if occurrence > window_end:
+                return
+            if self.until is not None and occurrence > self.until:
+                return
+            if occurrence >= window_start:
+                yield occurrence
+
+    def is_occurrence(self, start: date, day: date) -> bool:
+        """day がシリーズの発生日かどうか."""
+        return next(self.occurrences(start, day, day), None) == day
+
+    def _iter_from(self, start: date, seek: date) -> Iterator[date]:
+        """seek の少し手前から発生日を昇順で生成（COUNT / UNTIL は考慮しない）."""
+        if self.freq == "DAILY":
+            step = max(0, (seek - start).days // self.interval)
+            while True:
+                yield start + timedelta(days=step * self.interval)
+                step += 1
+
+        elif self.freq == "WEEKLY":
+            days = self.by_day or (start.weekday(),)
+            first_week = start - timedelta(days=start.weekday())
+            step = max(0, (seek - first_week).days // 7 // self.interval)
+            while True:
+                week = first_week + timedelta(weeks=step * self.interval)
+                for weekday in days:
+                    occurrence = week + timedelta(days=weekday)
+                    if occurrence >= start:
+                        yield occurrence
+                step += 1
+
+        elif self.freq == "MONTHLY":
+            months = (seek.year - start.year) * 12 + seek.month - start.month
+            step = max(0, months // self.interval)
+            while True:
+                total = start.month - 1 + step * self.interval
+                year, month = start.year + total // 12, total % 12 + 1
+                if year > date.max.year:
+                    return
+                # 31 日など存在しない日の月は RFC 5545 に従いスキップ
+                if start.day <= calendar.monthrange(year, month)[1]:
+                    yield date(year, month, start.day)
+                step += 1
+
+        else:  # YEARLY
+            step = max(0, (seek.year - start.year) // self.interval)
+            while True:
+                year = start.year + step * self.interval
+                if year > date.max.year:
+                    return
+                # 2/29 はうるう年のみ
+                if start.day <= calendar.monthrange(year, start.month)[1]:
+                    yield date(year, start.month, start.day)
+                step += 1
+
+
+def _parse_positive_int(value: str, name: str) -> int:
+    """1 以上の整数を解析."""
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"{name} は 1 以上の整数である必要があります")
+    return int(value)
+
+
+def _parse_until(value: str) -> date:
+    """UNTIL（YYYYMMDD または YYYYMMDDTHHMMSSZ）を日付として解析."""
+    for fmt in ("%Y%m%d", "%Y%m%dT%H%M%SZ", "%Y%m%dT%H%M%S"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError("UNTIL は YYYYMMDD 形式である必要があります")
@@ -0,0 +1,61 @@
+"""同一キーの同時実行をまとめる singleflight."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    同じキーで同時に呼ばれた処理を 1 回の実行にまとめる.
+
+    実行中のキーで do() が呼ばれると、新たに実行せず先行の結果（例外を含む）を待つ。
+    完了したキーは削除されるため、結果を保持するキャッシュではない。
+    キーは group ごとに管理し、forget(group) で実行中のものを以降の呼び出しから
+    切り離せる（書き込み後の読み込みが書き込み前に始まった実行に合流しないようにする）。
+    """
+
+    def __init__(self) -> None:
+        """初期化."""
+        self._flights: Dict[Hashable, Dict[Hashable, "asyncio.Future"]] = {}
+
+    def __len__(self) -> int:
+        """実行中のキー数."""
+        return sum(len(flights) for flights in self._flights.values())
+
+    async def do(
+        self, group: Hashable, key: Hashable, fn: Callable[[], Awaitable[T]]
+    ) -> T:
+        """実行中の同じキーがあればその結果を、なければ fn() を実行して返す.
+
+        Args:
+            group: キーのグループ（forget() の単位）
+            key: グループ内のキー
+            fn: 実行する処理
+
+        Returns:
+            fn() の結果（先行の呼び出しと共有）
+        """
+        flights = self._flights.setdefault(group, {})
+        flight = flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            flights[key] = flight
+            flight.add_done_callback(lambda _: self._discard(group, key, flight))
+        # 呼び出し元がキャンセルされても、合流している他の呼び出しには影響させない
+        return await asyncio.shield(flight)
+
+    def forget(self, group: Hashable) -> None:
+        """グループの実行中のキーを切り離す（以降の呼び出しは新たに実行）."""
+        self._flights.pop(group, None)
+
+    def _discard(self, group: Hashable, key: Hashable, flight: "asyncio.Future") -> None:
+        flights = self._flights.get(group)
+        if flights is not None and flights.get(key) is flight:
+            del flights[key]
+            if not flights:
+                del self._flights[group]
+        if not flight.cancelled():
+            # 合流した呼び出しがすべてキャンセルされても警告を出さない
+            flight.exception()
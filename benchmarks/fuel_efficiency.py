@@ -0,0 +1,230 @@
+"""燃費計算（満タン法）のベンチマーク.
+
+車 1 台分の給油履歴（既定 100,000 件、約 4 割が一部給油）について、
+履歴全体の燃費計算にかかる Python CPU 時間を比較する。
+
+- per-record: 従来の実装（記録ごとに直前の記録との差分 / 今回の給油量）。
+  is_full_tank を考慮しないため結果は異なるが、計算コストの目安として載せる
+- per-interval: 満タン給油ごとに直前の満タン給油までの区間を走査する素朴な実装
+- prefix-sum: compute_fuel_history（累積和の差で区間の給油量を求める実装）。
+  純 Python のため per-interval との差は小さい
+
+あわせて FuelRecordService.get_fuel_history の初回（インメモリ SQLite からの
+履歴の読み込みと計算）と 2 回目以降（キャッシュ済み）の 1 回あたりの時間を計測する。
+キャッシュは CACHE_BACKEND=redis の場合のみ使うため、共有のバージョンの代わりに
+固定のトークンを使う。
+
+実行方法:
+    uv run python -m benchmarks.fuel_efficiency [--records 100000] [--iterations 5]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.services.fuel_efficiency import (
+    FuelHistoryCache,
+    compute_fuel_history,
+    fuel_amount,
+    fuel_centilitres,
+)
+from app.services import fuel_record_service
+from app.services.fuel_record_service import FuelRecordService
+
+USER_ID = uuid4()
+VEHICLE_ID = uuid4()
+START = datetime(2000, 1, 1, tzinfo=JST)
+
+
+class AsyncSessionAdapter:
+    """同期 Session を AsyncSession と同じ呼び出し方で使うためのラッパー."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    async def execute(self, stmt: Any, *args: Any, **kwargs: Any) -> Any:
+        return self.session.execute(stmt, *args, **kwargs)
+
+
+def generate(records: int) -> dict[str, list]:
+    """給油履歴（給油日時の昇順）の列."""
+    rng = random.Random(46)
+    mileage = 0
+    columns: dict[str, list] = {
+        "id": [],
+        "total_mileage": [],
+        "total_cost": [],
+        "unit_price": [],
+        "is_full_tank": [],
+    }
+    for _ in range(records):
+        mileage += rng.randint(100, 700)
+        columns["id"].append(uuid4())
+        columns["total_mileage"].append(mileage)
+        columns["total_cost"].append(rng.randint(2000, 9000))
+        columns["unit_price"].append(rng.randint(150, 190))
+        columns["is_full_tank"].append(rng.random() < 0.6)
+    return columns
+
+
+# --- 比較対象の実装 ---
+
+
+def calculate_fuel_metrics(
+    total_mileage: int,
+    prev_total_mileage: Optional[int],
+    total_cost: int,
+    unit_price: int,
+) -> tuple[int, Optional[float], Optional[float]]:
+    """従来の FuelRecordService の記録ごとの (走行距離, 給油量, 燃費)."""
+    if prev_total_mileage is not None:
+        distance_traveled = total_mileage - prev_total_mileage
+    else:
+        distance_traveled = total_mileage
+    amount: Optional[float] = None
+    if unit_price > 0:
+        amount = round(total_cost / unit_price, 2)
+    efficiency: Optional[float] = None
+    if amount and amount > 0:
+        efficiency = round(distance_traveled / amount, 2)
+    return distance_traveled, amount, efficiency
+
+
+def per_record(columns: dict[str, list]) -> list[Optional[float]]:
+    """従来の実装（直前の記録との差分 / 今回の給油量）."""
+    ids = columns["id"]
+    prev_mileage: dict[UUID, Optional[int]] = {}
+    for i, record_id in enumerate(ids):
+        prev_mileage[record_id] = columns["total_mileage"][i - 1] if i > 0 else None
+    return [
+        calculate_fuel_metrics(
+            columns["total_mileage"][i],
+            prev_mileage[record_id],
+            columns["total_cost"][i],
+            columns["unit_price"][i],
+        )[2]
+        for i, record_id in enumerate(ids)
+    ]
+
+
+def per_interval(columns: dict[str, list]) -> list[Optional[float]]:
+    """満タン給油ごとに区間を走査する素朴な実装."""
+    mileages = columns["total_mileage"]
+    efficiencies: list[Optional[float]] = []
+    previous_full: Optional[int] = None
+    for j, full in enumerate(columns["is_full_tank"]):
+        efficiency = None
+        if full and previous_full is not None:
+            interval = range(previous_full + 1, j + 1)
+            costs = [columns["total_cost"][k] for k in interval]
+            prices = [columns["unit_price"][k] for k in interval]
+            amounts = list(map(fuel_amount, costs, prices))
+            litres = sum(map(fuel_centilitres, costs, prices)) / 100
+            if None not in amounts and litres > 0:
+                efficiency = round((mileages[j] - mileages[previous_full]) / litres, 2)
+        if full:
+            previous_full = j
+        efficiencies.append(efficiency)
+    return efficiencies
+
+
+def prefix_sum(columns: dict[str, list]) -> list[Optional[float]]:
+    """compute_fuel_history."""
+    return compute_fuel_history(*columns.values()).fuel_efficiencies
+
+
+def measure(run: Callable[[], Any], iterations: int) -> float:
+    """1 回あたりの CPU 時間（ms）."""
+    started = time.process_time()
+    for _ in range(iterations):
+        run()
+    return (time.process_time() - started) / iterations * 1000
+
+
+def seed(engine: Any, columns: dict[str, list]) -> None:
+    """給油履歴を fuel_record テーブルに保存."""
+    FuelRecord.__table__.create(engine)  # type: ignore[attr-defined]
+    rows = [
+        {
+            "id": record_id,
+            "vehicle_id": VEHICLE_ID,
+            "user_id": USER_ID,
+            "refuel_datetime": START + timedelta(hours=i),
+            "total_mileage": columns["total_mileage"][i],
+            "fuel_type": "レギュラー",
+            "unit_price": columns["unit_price"][i],
+            "total_cost": columns["total_cost"][i],
+            "is_full_tank": columns["is_full_tank"][i],
+            "created_at": START,
+            "updated_at": START,
+        }
+        for i, record_id in enumerate(columns["id"])
+    ]
+    with Session(engine) as session:
+        session.execute(insert(FuelRecord), rows)
+        session.commit()
+
+
+async def fixed_token(user_id: UUID) -> bytes:
+    """共有のレスポンスキャッシュのバージョンの代わりの固定トークン."""
+    return b"benchmark"
+
+
+async def measure_service(engine: Any, iterations: int) -> tuple[float, float]:
+    """get_fuel_history の初回（キャッシュなし）と 2 回目以降の時間（ms）."""
+    cache = FuelHistoryCache()
+    fuel_record_service.fuel_history_cache = cache
+    fuel_record_service._history_token = fixed_token  # type: ignore[assignment]
+
+    with Session(engine) as session:
+        service = FuelRecordService(AsyncSessionAdapter(session))  # type: ignore[arg-type]
+        cold = 0.0
+        for _ in range(iterations):
+            cache.invalidate(USER_ID)
+            started = time.perf_counter()
+            await service.get_fuel_history(USER_ID, VEHICLE_ID)
+            cold += time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await service.get_fuel_history(USER_ID, VEHICLE_ID)
+        warm = time.perf_counter() - started
+    return cold / iterations * 1000, warm / iterations * 1000
+
+
+async def main(records: int, iterations: int) -> None:
+    columns = generate(records)
+    assert prefix_sum(columns) == per_interval(columns)
+
+    print(f"{records} records, {sum(columns['is_full_tank'])} full tanks")
+    print(f"{'implementation':<28} {'CPU ms':>10}")
+    for name, run in (
+        ("per-record (previous)", per_record),
+        ("per-interval", per_interval),
+        ("prefix-sum", prefix_sum),
+    ):
+        elapsed = measure(lambda: run(columns), iterations)
+        print(f"{name:<28} {elapsed:>10.1f}")
+
+    engine = create_engine("sqlite://")
+    seed(engine, columns)
+    cold, warm = await measure_service(engine, iterations)
+    print(f"{'get_fuel_history (load)':<28} {cold:>10.1f}")
+    print(f"{'get_fuel_history (cached)':<28} {warm:>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.records, args.iterations))
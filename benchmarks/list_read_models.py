@@ -0,0 +1,263 @@
+"""一覧 API の読み込みパス（ORM エンティティ → 列を絞った *Row）のベンチマーク.
+
+1000 行のページについて、DB からの読み込みからレスポンス本文（JSON）の生成までの
+Python CPU 時間とメモリ割り当てのピークを比較する。
+
+- before: ORM エンティティを読み込み、*Response に詰め替えて jsonable_encoder で JSON にする
+- after: 必要な列だけを Core で読み込んで *Row にし、encode_json で JSON にする
+
+PostgreSQL の代わりにインメモリの SQLite を使う（ドライバの処理時間は含むが、
+どちらのパスにも同じだけかかる）。リクエストごとに新しいセッションを使う。
+
+実行方法:
+    uv run python -m benchmarks.list_read_models [--rows 1000] [--iterations 50]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel
+
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.models.task import Task
+from app.models.vehicle import Vehicle
+from app.schemas.fuel_record import FuelRecordResponse
+from app.schemas.task import TaskResponse
+from app.schemas.vehicle import VehicleResponse
+from app.services.fuel_record_service import FuelRecordService
+from app.services.response_cache import encode_json
+from app.services.task_service import TaskService
+from app.services.vehicle_service import VehicleService
+
+USER_ID = uuid4()
+VEHICLE_ID = uuid4()
+START = datetime(2026, 1, 1, tzinfo=JST)
+
+
+class AsyncSessionAdapter:
+    """同期 Session を AsyncSession と同じ呼び出し方で使うためのラッパー."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    async def execute(self, stmt: Any, *args: Any, **kwargs: Any) -> Any:
+        return self.session.execute(stmt, *args, **kwargs)
+
+
+def seed(engine: Any, rows: int) -> None:
+    """同じユーザーのタスク・車・燃費記録を rows 件ずつ作成."""
+    tables = [model.__table__ for model in (Task, Vehicle, FuelRecord)]  # type: ignore[attr-defined]
+    SQLModel.metadata.create_all(engine, tables=tables)
+    with Session(engine) as session:
+        for i in range(rows):
+            at = START + timedelta(days=i)
+            session.add(
+                Task(
+                    user_id=USER_ID,
+                    title=f"タスク {i}",
+                    description="説明" * 20,
+                    due_date=at.date() if i % 3 else None,
+                    created_at=at,
+                    updated_at=at,
+                )
+            )
+            session.add(
+                Vehicle(
+                    user_id=USER_ID,
+                    name=f"車 {i}",
+                    seq=i,
+                    maker="Toyota",
+                    model="Prius",
+                    year=2020,
+                    tank_capacity=43.0,
+                    created_at=at,
+                    updated_at=at,
+                )
+            )
+            session.add(
+                FuelRecord(
+                    vehicle_id=VEHICLE_ID,
+                    user_id=USER_ID,
+                    refuel_datetime=at,
+                    total_mileage=1000 + i * 500,
+                    fuel_type="レギュラー",
+                    unit_price=170,
+                    total_cost=6800,
+                    created_at=at,
+                    updated_at=at,
+                )
+            )
+        session.commit()
+
+
+# --- before: ORM エンティティを読み込み、*Response に詰め替える従来の実装 ---
+
+
+async def tasks_before(session: Any, rows: int) -> bytes:
+    tasks = await TaskService(session).list_tasks(USER_ID, limit=rows)
+    data = [
+        TaskResponse(
+            id=task.id,
+            user_id=task.user_id,
+            title=task.title,
+            description=task.description,
+            is_completed=task.is_completed,
+            completed_at=task.completed_at,
+            due_date=task.due_date,
+            order=task.order,
+            created_at=task.created_at or datetime.now(JST),
+            updated_at=task.updated_at or datetime.now(JST),
+            recurrence_rule=task.recurrence_rule,
+            recurrence_parent_id=task.recurrence_parent_id,
+            occurrence_date=task.occurrence_date,
+        )
+        for task in tasks
+    ]
+    return JSONResponse(content=jsonable_encoder({"data": data, "message": ""})).body
+
+
+async def vehicles_before(session: Any, rows: int) -> bytes:
+    # ORM エンティティを取得して VehicleResponse に詰め替える従来の一覧
+    result = await session.execute(
+        select(Vehicle)
+        .where(Vehicle.user_id == USER_ID, Vehicle.deleted_at.is_(None))
+        .order_by(Vehicle.seq)
+        .limit(rows)
+    )
+    vehicles = result.scalars().all()
+    data = [
+        VehicleResponse(
+            id=str(vehicle.id),
+            user_id=str(vehicle.user_id),
+            name=vehicle.name,
+            seq=vehicle.seq,
+            maker=vehicle.maker,
+            model=vehicle.model,
+            year=vehicle.year,
+            number=vehicle.number,
+            tank_capacity=vehicle.tank_capacity,
+            created_at=vehicle.created_at.isoformat()
+            if vehicle.created_at
+            else datetime.now(JST).isoformat(),
+            updated_at=vehicle.updated_at.isoformat()
+            if vehicle.updated_at
+            else datetime.now(JST).isoformat(),
+        )
+        for vehicle in vehicles
+    ]
+    return JSONResponse(content=jsonable_encoder({"data": data, "message": ""})).body
+
+
+async def fuel_records_before(session: Any, rows: int) -> bytes:
+    items = await FuelRecordService(session).list_fuel_records(
+        USER_ID, vehicle_id=VEHICLE_ID, limit=rows
+    )
+    data = [
+        FuelRecordResponse(
+            id=item.record.id,
+            vehicle_id=item.record.vehicle_id,
+            user_id=item.record.user_id,
+            refuel_datetime=item.record.refuel_datetime,
+            total_mileage=item.record.total_mileage,
+            fuel_type=item.record.fuel_type,
+            unit_price=item.record.unit_price,
+            total_cost=item.record.total_cost,
+            is_full_tank=item.record.is_full_tank,
+            gas_station_name=item.record.gas_station_name,
+            distance_traveled=item.distance_traveled,
+            fuel_amount=item.fuel_amount,
+            fuel_efficiency=item.fuel_efficiency,
+            created_at=item.record.created_at,
+            updated_at=item.record.updated_at,
+        )
+        for item in items
+    ]
+    return JSONResponse(content=jsonable_encoder({"data": data, "message": ""})).body
+
+
+# --- after: 列を絞った *Row をそのまま JSON にする ---
+
+
+async def tasks_after(session: Any, rows: int) -> bytes:
+    data = await TaskService(session).list_task_rows(USER_ID, limit=rows)
+    return encode_json({"data": data, "message": ""})
+
+
+async def vehicles_after(session: Any, rows: int) -> bytes:
+    data = await VehicleService(session).list_vehicle_rows(USER_ID, limit=rows)
+    return encode_json({"data": data, "message": ""})
+
+
+async def fuel_records_after(session: Any, rows: int) -> bytes:
+    data = await FuelRecordService(session).list_fuel_record_rows(
+        USER_ID, vehicle_id=VEHICLE_ID, limit=rows
+    )
+    return encode_json({"data": data, "message": ""})
+
+
+Page = Callable[[Any, int], Awaitable[bytes]]
+
+
+async def _body(engine: Any, page: Page, rows: int) -> bytes:
+    """新しいセッションで 1 ページ分のレスポンス本文を生成."""
+    with Session(engine) as session:
+        return await page(AsyncSessionAdapter(session), rows)
+
+
+async def measure(engine: Any, page: Page, rows: int, iterations: int) -> tuple:
+    """1 ページあたりの CPU 時間（ms）とメモリ割り当てのピーク（KiB）."""
+    await _body(engine, page, rows)  # SQL のコンパイルなど初回のみの処理は計測から除く
+    started = time.process_time()
+    for _ in range(iterations):
+        await _body(engine, page, rows)
+    cpu_ms = (time.process_time() - started) / iterations * 1000
+
+    tracemalloc.start()
+    await _body(engine, page, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu_ms, peak / 1024
+
+
+async def main(rows: int, iterations: int) -> None:
+    engine = create_engine("sqlite://")
+    seed(engine, rows)
+
+    scenarios = [
+        ("tasks", tasks_before, tasks_after),
+        ("vehicles", vehicles_before, vehicles_after),
+        ("fuel records (vehicle_id)", fuel_records_before, fuel_records_after),
+    ]
+    print(f"{rows} rows per page")
+    print(
+        f"{'list':<27} {'before ms':>10} {'after ms':>9} {'ratio':>6}"
+        f" {'before KiB':>11} {'after KiB':>10} {'ratio':>6}"
+    )
+    for name, before, after in scenarios:
+        # どちらのパスでもレスポンス本文は同じ
+        assert await _body(engine, before, rows) == await _body(engine, after, rows)
+        before_ms, before_kib = await measure(engine, before, rows, iterations)
+        after_ms, after_kib = await measure(engine, after, rows, iterations)
+        print(
+            f"{name:<27} {before_ms:>10.1f} {after_ms:>9.1f}"
+            f" {before_ms / after_ms:>5.2f}x {before_kib:>11.0f} {after_kib:>10.0f}"
+            f" {before_kib / after_kib:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.iterations))
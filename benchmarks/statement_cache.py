@@ -0,0 +1,215 @@
+"""ホットなサービスクエリの SQL 構築コスト（Python CPU）のベンチマーク.
+
+各サービスメソッドがクエリ 1 回ごとに Python 側で使う CPU 時間を、
+select() を毎回組み立てる従来の書き方（before）と、lambda ステートメント
+（after、サービスの実装そのもの）で比較する。
+DB には接続せず、session.execute() で SQLAlchemy が行う処理
+（キャッシュキーの生成とコンパイル済みキャッシュの参照、ミス時のコンパイル）
+までを計測する。select() でもコンパイル結果はキャッシュされる（hit rate は
+before / after とも 100%）ため、差は主にステートメントの構築とキャッシュキーの生成。
+
+実行方法:
+    uv run python -m benchmarks.statement_cache [--iterations 20000]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, asc, false, or_, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.sql import nulls_last
+from sqlalchemy.util import LRUCache
+from sqlmodel import col
+
+from app.models.task import Task
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+from app.services.vehicle_service import VehicleService
+
+DIALECT = postgresql.asyncpg.dialect()  # type: ignore[attr-defined]
+TODAY = date(2026, 10, 19)
+
+
+class EmptyResult:
+    """行のない実行結果."""
+
+    def scalars(self) -> "EmptyResult":
+        return self
+
+    def all(self) -> list:
+        return []
+
+    def one_or_none(self) -> None:
+        return None
+
+
+class CompilingSession:
+    """execute() でキャッシュ付きコンパイルのみを行うセッション."""
+
+    def __init__(self) -> None:
+        self.compiled_cache = LRUCache(500)
+        self.hits = 0
+        self.executions = 0
+
+    async def execute(self, stmt: Any, *args: Any, **kwargs: Any) -> EmptyResult:
+        _, _, cache_hit = stmt._compile_w_cache(
+            DIALECT, compiled_cache=self.compiled_cache, column_keys=[]
+        )
+        self.executions += 1
+        self.hits += cache_hit is CACHE_HIT
+        return EmptyResult()
+
+
+# --- before: select() を毎回組み立てる従来の実装 ---
+
+
+async def get_task_before(session: CompilingSession, task_id: UUID, user_id: UUID) -> None:
+    stmt = (
+        select(Task)
+        .where(col(Task.id) == task_id)
+        .where(col(Task.user_id) == user_id)
+        .where(col(Task.deleted_at).is_(None))
+    )
+    (await session.execute(stmt)).scalars().one_or_none()
+
+
+async def get_vehicle_before(
+    session: CompilingSession, vehicle_id: UUID, user_id: UUID
+) -> None:
+    stmt = select(Vehicle).where(
+        and_(
+            Vehicle.id == vehicle_id,
+            Vehicle.user_id == user_id,
+            Vehicle.deleted_at.is_(None),
+        )
+    )
+    (await session.execute(stmt)).scalars().one_or_none()
+
+
+async def get_by_email_before(session: CompilingSession, email: str) -> None:
+    stmt = select(User).where(User.email == email)
+    (await session.execute(stmt)).scalars().one_or_none()
+
+
+async def list_tasks_before(
+    session: CompilingSession,
+    user_id: UUID,
+    q: Optional[str],
+    overdue: Optional[bool],
+) -> None:
+    conditions = [col(Task.user_id) == user_id, col(Task.deleted_at).is_(None)]
+    if q:
+        conditions.append(
+            or_(
+                col(Task.title).icontains(q, autoescape=True),
+                col(Task.description).icontains(q, autoescape=True),
+            )
+        )
+    stmt = select(Task).where(*conditions, col(Task.recurrence_rule).is_(None))
+    stmt = stmt.where(col(Task.is_completed) == True)  # noqa: E712
+    if overdue:
+        stmt = stmt.where(
+            and_(col(Task.is_completed) == false(), col(Task.due_date) < TODAY)
+        )
+    stmt = stmt.order_by(
+        nulls_last(asc(col(Task.due_date))), asc(col(Task.created_at))
+    )
+    (await session.execute(stmt.offset(0).limit(100))).scalars().all()
+
+
+# --- after: サービスの実装（lambda ステートメント） ---
+
+
+async def list_tasks_after(
+    session: CompilingSession,
+    user_id: UUID,
+    q: Optional[str],
+    overdue: Optional[bool],
+) -> None:
+    # 繰り返しシリーズの取得を除き、通常タスクのクエリだけを比較する
+    await TaskService(session).list_tasks(  # type: ignore[arg-type]
+        user_id, q=q, overdue=overdue, is_completed=True, today=TODAY
+    )
+
+
+def scenarios() -> list:
+    """(名前, before, after) の組."""
+    user_id = uuid4()
+
+    def task_service(session: CompilingSession) -> TaskService:
+        return TaskService(session)  # type: ignore[arg-type]
+
+    def vehicle_service(session: CompilingSession) -> VehicleService:
+        return VehicleService(session)  # type: ignore[arg-type]
+
+    async def get_task_after(session: CompilingSession) -> None:
+        try:
+            await task_service(session).get_task(uuid4(), user_id)
+        except Exception:
+            pass  # 行がないため NotFoundException
+
+    async def get_vehicle_after(session: CompilingSession) -> None:
+        try:
+            await vehicle_service(session).get_vehicle(uuid4(), user_id)
+        except Exception:
+            pass
+
+    return [
+        (
+            "TaskService.get_task",
+            lambda s: get_task_before(s, uuid4(), user_id),
+            get_task_after,
+        ),
+        (
+            "VehicleService.get_vehicle",
+            lambda s: get_vehicle_before(s, uuid4(), user_id),
+            get_vehicle_after,
+        ),
+        (
+            "UserService.get_by_email",
+            lambda s: get_by_email_before(s, "user@example.com"),
+            lambda s: UserService(s).get_by_email("user@example.com"),
+        ),
+        (
+            "TaskService.list_tasks (q, overdue)",
+            lambda s: list_tasks_before(s, user_id, "買い物", True),
+            lambda s: list_tasks_after(s, user_id, "買い物", True),
+        ),
+    ]
+
+
+async def measure(
+    run: Callable[[CompilingSession], Awaitable[Any]], iterations: int
+) -> tuple:
+    """1 回あたりの CPU 時間（µs）とキャッシュヒット率."""
+    session = CompilingSession()
+    await run(session)  # 初回のコンパイルは計測から除く
+    started = time.process_time()
+    for _ in range(iterations):
+        await run(session)
+    elapsed = time.process_time() - started
+    return elapsed / iterations * 1_000_000, session.hits / session.executions
+
+
+async def main(iterations: int) -> None:
+    print(f"{'query':<38} {'before µs':>10} {'after µs':>10} {'ratio':>7} {'hit rate':>15}")
+    for name, before, after in scenarios():
+        before_us, before_hits = await measure(before, iterations)
+        after_us, after_hits = await measure(after, iterations)
+        print(
+            f"{name:<38} {before_us:>10.1f} {after_us:>10.1f} "
+            f"{before_us / after_us:>6.2f}x {before_hits:>7.0%}/{after_hits:<7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    asyncio.run(main(parser.parse_args().iterations))
@@ -0,0 +1,11 @@
+-- FuelRecord（燃費記録）車両別・給油日時インデックス作成 SQL
+-- 日付: 2026-10-19
+-- 説明: 車ごとの最新給油を取得する LEFT JOIN LATERAL
+--       （vehicle_id = ? ORDER BY refuel_datetime DESC LIMIT 1）を
+--       インデックススキャンのみで解決するための複合部分インデックス
+
+CREATE INDEX IF NOT EXISTS idx_fuel_record_vehicle_id_refuel_datetime
+    ON fuel_record(vehicle_id, refuel_datetime DESC)
+    WHERE deleted_at IS NULL;
+
+COMMENT ON INDEX idx_fuel_record_vehicle_id_refuel_datetime IS '車ごとの最新給油取得用（論理削除済みを除く）';
@@ -0,0 +1,4 @@
+-- FuelRecord（燃費記録）車両別・給油日時インデックス ロールバック SQL
+-- 日付: 2026-10-19
+
+DROP INDEX IF EXISTS idx_fuel_record_vehicle_id_refuel_datetime;
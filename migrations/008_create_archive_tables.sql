@@ -0,0 +1,39 @@
+-- 論理削除済みレコードのアーカイブテーブル作成 SQL
+-- 日付: 2026-10-19
+-- 説明: 論理削除から一定日数が経過した fuel_record / vehicle / task の行を
+--       ArchiveService が DELETE ... RETURNING → INSERT で移動する先のテーブル。
+--       元テーブルと同じカラムに archived_at を加える。
+
+CREATE TABLE IF NOT EXISTS fuel_record_archive (
+    LIKE fuel_record INCLUDING DEFAULTS,
+    archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
+
+CREATE TABLE IF NOT EXISTS vehicle_archive (
+    LIKE vehicle INCLUDING DEFAULTS,
+    archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
+
+CREATE TABLE IF NOT EXISTS task_archive (
+    LIKE "task" INCLUDING DEFAULTS,
+    archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
+
+-- インデックス作成（復元時のユーザー別検索と保管期間管理用）
+CREATE INDEX IF NOT EXISTS idx_fuel_record_archive_user_id ON fuel_record_archive(user_id);
+CREATE INDEX IF NOT EXISTS idx_fuel_record_archive_archived_at ON fuel_record_archive(archived_at);
+CREATE INDEX IF NOT EXISTS idx_vehicle_archive_user_id ON vehicle_archive(user_id);
+CREATE INDEX IF NOT EXISTS idx_vehicle_archive_archived_at ON vehicle_archive(archived_at);
+CREATE INDEX IF NOT EXISTS idx_task_archive_user_id ON task_archive(user_id);
+CREATE INDEX IF NOT EXISTS idx_task_archive_archived_at ON task_archive(archived_at);
+
+-- コメント追加（テーブル説明）
+COMMENT ON TABLE fuel_record_archive IS '論理削除後に保管期間を過ぎた燃費記録';
+COMMENT ON TABLE vehicle_archive IS '論理削除後に保管期間を過ぎた車情報';
+COMMENT ON TABLE task_archive IS '論理削除後に保管期間を過ぎたタスク';
+COMMENT ON COLUMN fuel_record_archive.archived_at IS 'アーカイブ日時';
+COMMENT ON COLUMN vehicle_archive.archived_at IS 'アーカイブ日時';
+COMMENT ON COLUMN task_archive.archived_at IS 'アーカイブ日時';
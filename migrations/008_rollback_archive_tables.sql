@@ -0,0 +1,7 @@
+-- 論理削除済みレコードのアーカイブテーブル ロールバック SQL
+-- 日付: 2026-10-19
+-- 注意: アーカイブ済みの行も削除されます。必要に応じて事前に元テーブルへ復元してください。
+
+DROP TABLE IF EXISTS task_archive;
+DROP TABLE IF EXISTS vehicle_archive;
+DROP TABLE IF EXISTS fuel_record_archive;
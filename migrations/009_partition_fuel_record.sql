@@ -0,0 +1,142 @@
+-- FuelRecord（燃費記録）テーブルのパーティション化 SQL
+-- 日付: 2026-10-19
+-- 説明: fuel_record を refuel_datetime による年単位（JST）のレンジパーティションへ移行する。
+--       - 主キーにはパーティションキーを含める必要があるため (id, refuel_datetime) とする
+--       - パーティションは ensure_fuel_record_partition() で作成する
+--         （アプリは未作成の年への書き込み前に呼び出す）
+--       - 古い年は detach_fuel_record_partitions_before() で切り離して保管・削除できる
+-- 前提: 003, 007, 008 が適用済みであること
+
+BEGIN;
+
+-- 既存テーブルを退避（主キー名が新テーブルと衝突しないよう変更）
+ALTER TABLE fuel_record RENAME TO fuel_record_unpartitioned;
+ALTER TABLE fuel_record_unpartitioned
+    RENAME CONSTRAINT fuel_record_pkey TO fuel_record_unpartitioned_pkey;
+
+CREATE TABLE fuel_record (
+    -- Primary Key（パーティションキーを含む）
+    id UUID NOT NULL,
+
+    -- Foreign Keys
+    vehicle_id UUID NOT NULL,
+    user_id UUID NOT NULL,
+
+    -- Core Fields
+    refuel_datetime TIMESTAMP WITH TIME ZONE NOT NULL,
+    total_mileage INTEGER NOT NULL,
+    fuel_type VARCHAR(50) NOT NULL,
+    unit_price INTEGER NOT NULL,
+    total_cost INTEGER NOT NULL,
+
+    -- Status Fields
+    is_full_tank BOOLEAN NOT NULL DEFAULT FALSE,
+    gas_station_name VARCHAR(255),
+
+    -- Soft Delete Support
+    deleted_at TIMESTAMP WITH TIME ZONE,
+
+    -- Timestamps (JST: UTC+9)
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+
+    PRIMARY KEY (id, refuel_datetime)
+) PARTITION BY RANGE (refuel_datetime);
+
+-- 指定日時を含む年（JST）のパーティションを作成（既にあれば何もしない）
+CREATE OR REPLACE FUNCTION ensure_fuel_record_partition(target TIMESTAMP WITH TIME ZONE)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    partition_year INTEGER := EXTRACT(YEAR FROM target AT TIME ZONE 'Asia/Tokyo');
+    partition_name TEXT := format('fuel_record_y%s', partition_year);
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF fuel_record FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        make_timestamptz(partition_year, 1, 1, 0, 0, 0, 'Asia/Tokyo'),
+        make_timestamptz(partition_year + 1, 1, 1, 0, 0, 0, 'Asia/Tokyo')
+    );
+    RETURN partition_name;
+EXCEPTION
+    -- 別の接続が同時に作成した場合
+    WHEN duplicate_table THEN
+        RETURN partition_name;
+END;
+$$;
+
+-- before_year より前の年（JST）のパーティションを切り離し、*_detached に改名する
+-- 切り離したテーブルはアーカイブ（pg_dump 等）後に DROP TABLE で削除できる
+CREATE OR REPLACE FUNCTION detach_fuel_record_partitions_before(before_year INTEGER)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    partition_name TEXT;
+BEGIN
+    FOR partition_name IN
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = 'fuel_record'
+          AND child.relname ~ '^fuel_record_y[0-9]{4}$'
+          AND substring(child.relname FROM 14)::INTEGER < before_year
+        ORDER BY child.relname
+    LOOP
+        EXECUTE format('ALTER TABLE fuel_record DETACH PARTITION %I', partition_name);
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', partition_name, partition_name || '_detached');
+        RETURN NEXT partition_name || '_detached';
+    END LOOP;
+END;
+$$;
+
+-- 既存データの年と、今年・来年のパーティションを作成
+SELECT ensure_fuel_record_partition(refuel_datetime)
+FROM (
+    SELECT DISTINCT ON (EXTRACT(YEAR FROM refuel_datetime AT TIME ZONE 'Asia/Tokyo'))
+        refuel_datetime
+    FROM fuel_record_unpartitioned
+) AS existing_years;
+SELECT ensure_fuel_record_partition(CURRENT_TIMESTAMP);
+SELECT ensure_fuel_record_partition(CURRENT_TIMESTAMP + INTERVAL '1 year');
+
+-- データ移行
+INSERT INTO fuel_record (
+    id, vehicle_id, user_id, refuel_datetime, total_mileage, fuel_type,
+    unit_price, total_cost, is_full_tank, gas_station_name, deleted_at,
+    created_at, updated_at
+)
+SELECT
+    id, vehicle_id, user_id, refuel_datetime, total_mileage, fuel_type,
+    unit_price, total_cost, is_full_tank, gas_station_name, deleted_at,
+    created_at, updated_at
+FROM fuel_record_unpartitioned;
+
+DROP TABLE fuel_record_unpartitioned;
+
+-- インデックス作成（親テーブルに作成し、各パーティションへ自動的に作成される）
+CREATE INDEX idx_fuel_record_vehicle_id ON fuel_record(vehicle_id);
+CREATE INDEX idx_fuel_record_user_id ON fuel_record(user_id);
+CREATE INDEX idx_fuel_record_deleted_at ON fuel_record(deleted_at);
+CREATE INDEX idx_fuel_record_created_at ON fuel_record(created_at DESC);
+CREATE INDEX idx_fuel_record_refuel_datetime ON fuel_record(refuel_datetime DESC);
+CREATE INDEX idx_fuel_record_vehicle_id_refuel_datetime
+    ON fuel_record(vehicle_id, refuel_datetime DESC)
+    WHERE deleted_at IS NULL;
+
+-- コメント追加（テーブル説明）
+COMMENT ON TABLE fuel_record IS 'ユーザーが記録する燃費情報（refuel_datetime で年単位にパーティション化）';
+COMMENT ON COLUMN fuel_record.id IS '燃費記録 ID（UUID、主キー）';
+COMMENT ON COLUMN fuel_record.refuel_datetime IS '給油日時（パーティションキー）';
+COMMENT ON COLUMN fuel_record.deleted_at IS '削除日時（論理削除用）';
+COMMENT ON INDEX idx_fuel_record_vehicle_id_refuel_datetime IS '車ごとの最新給油取得用（論理削除済みを除く）';
+COMMENT ON FUNCTION ensure_fuel_record_partition(TIMESTAMP WITH TIME ZONE) IS '指定日時を含む年の fuel_record パーティションを作成';
+COMMENT ON FUNCTION detach_fuel_record_partitions_before(INTEGER) IS '指定年より前の fuel_record パーティションを切り離す';
+
+COMMIT;
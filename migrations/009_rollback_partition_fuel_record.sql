@@ -0,0 +1,61 @@
+-- FuelRecord（燃費記録）テーブルのパーティション化 ロールバック SQL
+-- 日付: 2026-10-19
+-- 説明: パーティション化された fuel_record を通常のテーブルへ戻す。
+-- 注意: 切り離し済み（*_detached）のパーティションのデータは戻りません。
+
+BEGIN;
+
+ALTER TABLE fuel_record RENAME TO fuel_record_partitioned;
+ALTER TABLE fuel_record_partitioned
+    RENAME CONSTRAINT fuel_record_pkey TO fuel_record_partitioned_pkey;
+
+-- パーティション側のインデックス名と衝突しないよう先に削除
+DROP INDEX IF EXISTS idx_fuel_record_vehicle_id;
+DROP INDEX IF EXISTS idx_fuel_record_user_id;
+DROP INDEX IF EXISTS idx_fuel_record_deleted_at;
+DROP INDEX IF EXISTS idx_fuel_record_created_at;
+DROP INDEX IF EXISTS idx_fuel_record_refuel_datetime;
+DROP INDEX IF EXISTS idx_fuel_record_vehicle_id_refuel_datetime;
+
+CREATE TABLE fuel_record (
+    id UUID NOT NULL PRIMARY KEY,
+    vehicle_id UUID NOT NULL,
+    user_id UUID NOT NULL,
+    refuel_datetime TIMESTAMP WITH TIME ZONE NOT NULL,
+    total_mileage INTEGER NOT NULL,
+    fuel_type VARCHAR(50) NOT NULL,
+    unit_price INTEGER NOT NULL,
+    total_cost INTEGER NOT NULL,
+    is_full_tank BOOLEAN NOT NULL DEFAULT FALSE,
+    gas_station_name VARCHAR(255),
+    deleted_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+INSERT INTO fuel_record (
+    id, vehicle_id, user_id, refuel_datetime, total_mileage, fuel_type,
+    unit_price, total_cost, is_full_tank, gas_station_name, deleted_at,
+    created_at, updated_at
+)
+SELECT
+    id, vehicle_id, user_id, refuel_datetime, total_mileage, fuel_type,
+    unit_price, total_cost, is_full_tank, gas_station_name, deleted_at,
+    created_at, updated_at
+FROM fuel_record_partitioned;
+
+DROP TABLE fuel_record_partitioned;
+DROP FUNCTION IF EXISTS detach_fuel_record_partitions_before(INTEGER);
+DROP FUNCTION IF EXISTS ensure_fuel_record_partition(TIMESTAMP WITH TIME ZONE);
+
+-- 003 / 007 のインデックスを再作成
+CREATE INDEX idx_fuel_record_vehicle_id ON fuel_record(vehicle_id);
+CREATE INDEX idx_fuel_record_user_id ON fuel_record(user_id);
+CREATE INDEX idx_fuel_record_deleted_at ON fuel_record(deleted_at);
+CREATE INDEX idx_fuel_record_created_at ON fuel_record(created_at DESC);
+CREATE INDEX idx_fuel_record_refuel_datetime ON fuel_record(refuel_datetime DESC);
+CREATE INDEX idx_fuel_record_vehicle_id_refuel_datetime
+    ON fuel_record(vehicle_id, refuel_datetime DESC)
+    WHERE deleted_at IS NULL;
+
+COMMIT;
@@ -0,0 +1,35 @@
+-- Task（タスク）一覧フィルタ用インデックス作成 SQL
+-- 日付: 2026-10-19
+-- 説明: GET /api/tasks のフィルタ（due_before / due_after / overdue /
+--       completed_since / q）をそれぞれインデックスで解決する
+--       検証: tests/integration/test_task_query_plans.py
+
+-- テキスト検索（ILIKE '%...%'）用のトライグラム拡張
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- due_before / due_after: ユーザーごとの期日範囲
+CREATE INDEX IF NOT EXISTS idx_task_user_id_due_date
+    ON "task"(user_id, due_date)
+    WHERE deleted_at IS NULL;
+
+-- overdue: 未完了タスクの期日（完了済みを除いた小さな部分インデックス）
+CREATE INDEX IF NOT EXISTS idx_task_user_id_open_due_date
+    ON "task"(user_id, due_date)
+    WHERE deleted_at IS NULL AND is_completed = FALSE;
+
+-- completed_since: ユーザーごとの完了日時
+CREATE INDEX IF NOT EXISTS idx_task_user_id_completed_at
+    ON "task"(user_id, completed_at)
+    WHERE deleted_at IS NULL AND completed_at IS NOT NULL;
+
+-- q: タイトル・説明の部分一致（大文字小文字を区別しない）
+CREATE INDEX IF NOT EXISTS idx_task_title_trgm
+    ON "task" USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_task_description_trgm
+    ON "task" USING GIN (description gin_trgm_ops);
+
+COMMENT ON INDEX idx_task_user_id_due_date IS '期日範囲フィルタ用（論理削除済みを除く）';
+COMMENT ON INDEX idx_task_user_id_open_due_date IS '期限切れフィルタ用（未完了のみ）';
+COMMENT ON INDEX idx_task_user_id_completed_at IS '完了日時フィルタ用（完了済みのみ）';
+COMMENT ON INDEX idx_task_title_trgm IS 'タイトル部分一致検索用（pg_trgm）';
+COMMENT ON INDEX idx_task_description_trgm IS '説明部分一致検索用（pg_trgm）';
@@ -0,0 +1,9 @@
+-- Task（タスク）一覧フィルタ用インデックス ロールバック SQL
+-- 日付: 2026-10-19
+-- 注意: pg_trgm 拡張は他で使われている可能性があるため削除しない
+
+DROP INDEX IF EXISTS idx_task_description_trgm;
+DROP INDEX IF EXISTS idx_task_title_trgm;
+DROP INDEX IF EXISTS idx_task_user_id_completed_at;
+DROP INDEX IF EXISTS idx_task_user_id_open_due_date;
+DROP INDEX IF EXISTS idx_task_user_id_due_date;
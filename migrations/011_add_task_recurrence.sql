@@ -0,0 +1,38 @@
+-- Task（タスク）繰り返し対応 SQL
+-- 日付: 2026-10-19
+-- 説明: 繰り返しタスク（RRULE）のためのカラムとインデックスを追加する。
+--       - シリーズ行は recurrence_rule を持ち、due_date を開始日とする
+--       - 各発生分は一覧取得時に展開し、例外（変更・スキップ）と完了のみを
+--         recurrence_parent_id / occurrence_date を持つ行として保存する
+-- 前提: 001, 008 が適用済みであること
+
+BEGIN;
+
+ALTER TABLE "task"
+    ADD COLUMN recurrence_rule VARCHAR(255),
+    ADD COLUMN recurrence_parent_id UUID,
+    ADD COLUMN occurrence_date DATE;
+
+-- アーカイブテーブルも同じカラム構成に揃える
+ALTER TABLE task_archive
+    ADD COLUMN recurrence_rule VARCHAR(255),
+    ADD COLUMN recurrence_parent_id UUID,
+    ADD COLUMN occurrence_date DATE;
+
+-- 一覧取得時のシリーズ検索（シリーズ行はユーザーあたり少数）
+CREATE INDEX IF NOT EXISTS idx_task_user_id_recurring
+    ON "task"(user_id)
+    WHERE recurrence_rule IS NOT NULL AND deleted_at IS NULL;
+
+-- 発生分は 1 シリーズ・1 発生日につき 1 行
+CREATE UNIQUE INDEX IF NOT EXISTS idx_task_recurrence_parent_id_occurrence_date
+    ON "task"(recurrence_parent_id, occurrence_date)
+    WHERE recurrence_parent_id IS NOT NULL;
+
+COMMENT ON COLUMN "task".recurrence_rule IS '繰り返しルール（RRULE、シリーズのみ）';
+COMMENT ON COLUMN "task".recurrence_parent_id IS '発生分の元シリーズ ID';
+COMMENT ON COLUMN "task".occurrence_date IS '発生分の本来の発生日';
+COMMENT ON INDEX idx_task_user_id_recurring IS 'ユーザーの繰り返しシリーズ検索用';
+COMMENT ON INDEX idx_task_recurrence_parent_id_occurrence_date IS '発生分の例外・完了の一意性と検索用';
+
+COMMIT;
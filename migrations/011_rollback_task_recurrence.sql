@@ -0,0 +1,20 @@
+-- Task（タスク）繰り返し対応 ロールバック SQL
+-- 日付: 2026-10-19
+-- 注意: 保存済みの発生分（例外・完了）の行は通常のタスクとして残ります。
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_task_recurrence_parent_id_occurrence_date;
+DROP INDEX IF EXISTS idx_task_user_id_recurring;
+
+ALTER TABLE task_archive
+    DROP COLUMN IF EXISTS occurrence_date,
+    DROP COLUMN IF EXISTS recurrence_parent_id,
+    DROP COLUMN IF EXISTS recurrence_rule;
+
+ALTER TABLE "task"
+    DROP COLUMN IF EXISTS occurrence_date,
+    DROP COLUMN IF EXISTS recurrence_parent_id,
+    DROP COLUMN IF EXISTS recurrence_rule;
+
+COMMIT;
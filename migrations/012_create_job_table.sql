@@ -0,0 +1,36 @@
+-- Job（バックグラウンドジョブ）テーブル作成 SQL
+-- 日付: 2026-10-19
+-- 説明: JOB_BACKEND=postgres で使う永続ジョブキュー
+--       ワーカーは SELECT ... FOR UPDATE SKIP LOCKED で 1 件ずつ取得し、
+--       run_at をリース期限へ進めてから実行する（app/services/job_queue.py）
+
+CREATE TABLE IF NOT EXISTS job (
+    -- Primary Key
+    id UUID NOT NULL PRIMARY KEY,
+
+    -- Core Fields
+    name VARCHAR(100) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    -- Status Fields
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    last_error TEXT,
+    failed_at TIMESTAMP WITH TIME ZONE,
+
+    -- Timestamps (JST: UTC+9)
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+-- 実行可能なジョブの取得用（破棄済みを除く）
+CREATE INDEX IF NOT EXISTS idx_job_run_at ON job(run_at) WHERE failed_at IS NULL;
+
+-- コメント追加（テーブル説明）
+COMMENT ON TABLE job IS 'バックグラウンドジョブの永続キュー';
+COMMENT ON COLUMN job.name IS 'ジョブ名（登録済みハンドラ名）';
+COMMENT ON COLUMN job.payload IS 'ハンドラへ渡す引数（JSON）';
+COMMENT ON COLUMN job.attempts IS '実行回数';
+COMMENT ON COLUMN job.run_at IS '次に実行可能になる日時（実行中はリース期限）';
+COMMENT ON COLUMN job.last_error IS '直近の失敗内容';
+COMMENT ON COLUMN job.failed_at IS '最大試行回数を超えて破棄された日時';
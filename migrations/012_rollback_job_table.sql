@@ -0,0 +1,3 @@
+-- Job（バックグラウンドジョブ）テーブルロールバック SQL
+
+DROP TABLE IF EXISTS job CASCADE;
@@ -0,0 +1,79 @@
+-- FuelRollup（燃費記録の期間別集計）テーブル作成 SQL
+-- 日付: 2026-10-19
+-- 説明: GET /api/vehicles/{id}/fuel-rollups 用に、車ごと・JST の月 / 週ごとの
+--       給油回数・総費用・給油量・走行距離を保持する。
+--       燃費記録の作成・更新・削除時にアプリが影響する期間の行だけを差分で更新する
+--       （app/services/fuel_rollup_service.py）。ここでは既存の燃費記録から初期値を作成する。
+-- 前提: 009 が適用済みであること
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS fuel_rollup (
+    -- Primary Key
+    vehicle_id UUID NOT NULL,
+    granularity VARCHAR(10) NOT NULL,
+    period_start DATE NOT NULL,
+
+    -- Core Fields
+    user_id UUID NOT NULL,
+    record_count INTEGER NOT NULL DEFAULT 0,
+    total_cost BIGINT NOT NULL DEFAULT 0,
+    fuel_centilitres BIGINT NOT NULL DEFAULT 0,
+    distance_traveled BIGINT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (vehicle_id, granularity, period_start),
+    CONSTRAINT chk_fuel_rollup_granularity CHECK (granularity IN ('month', 'week'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_fuel_rollup_user_id ON fuel_rollup(user_id);
+
+-- 既存の燃費記録から集計（走行距離は車ごとに直前の給油との差分、最初の給油は 0）
+-- 給油量は 総費用 / 単価 を 0.01L 単位で四捨五入した整数（アプリと同じ計算）
+WITH records AS (
+    SELECT
+        vehicle_id,
+        user_id,
+        (refuel_datetime AT TIME ZONE 'Asia/Tokyo') AS refuel_local,
+        total_cost,
+        CASE
+            WHEN unit_price > 0
+                THEN (total_cost::BIGINT * 200 + unit_price) / (2 * unit_price::BIGINT)
+            ELSE 0
+        END AS fuel_centilitres,
+        COALESCE(
+            total_mileage - LAG(total_mileage) OVER (
+                PARTITION BY vehicle_id ORDER BY refuel_datetime, id
+            ),
+            0
+        ) AS distance_traveled
+    FROM fuel_record
+    WHERE deleted_at IS NULL
+),
+periods AS (
+    SELECT 'month' AS granularity, DATE_TRUNC('month', refuel_local)::DATE AS period_start, *
+    FROM records
+    UNION ALL
+    SELECT 'week' AS granularity, DATE_TRUNC('week', refuel_local)::DATE AS period_start, *
+    FROM records
+)
+INSERT INTO fuel_rollup (
+    vehicle_id, granularity, period_start, user_id,
+    record_count, total_cost, fuel_centilitres, distance_traveled
+)
+SELECT
+    vehicle_id, granularity, period_start, user_id,
+    COUNT(*), SUM(total_cost), SUM(fuel_centilitres), SUM(distance_traveled)
+FROM periods
+GROUP BY vehicle_id, granularity, period_start, user_id
+ON CONFLICT (vehicle_id, granularity, period_start) DO NOTHING;
+
+-- コメント追加（テーブル説明）
+COMMENT ON TABLE fuel_rollup IS '車ごと・期間ごと（JST の月 / 週）の給油の集計（燃費記録の書き込み時に差分で更新）';
+COMMENT ON COLUMN fuel_rollup.granularity IS '集計単位（month / week）';
+COMMENT ON COLUMN fuel_rollup.period_start IS '期間の開始日（JST、月は 1 日、週は月曜日）';
+COMMENT ON COLUMN fuel_rollup.record_count IS '期間内の給油回数';
+COMMENT ON COLUMN fuel_rollup.total_cost IS '総費用の合計（円）';
+COMMENT ON COLUMN fuel_rollup.fuel_centilitres IS '給油量の合計（0.01L 単位）';
+COMMENT ON COLUMN fuel_rollup.distance_traveled IS '走行距離の合計（km、直前の給油からの差分）';
+
+COMMIT;
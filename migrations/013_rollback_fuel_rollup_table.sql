@@ -0,0 +1,4 @@
+-- FuelRollup（燃費記録の期間別集計）テーブル ロールバック SQL
+-- 日付: 2026-10-19
+
+DROP TABLE IF EXISTS fuel_rollup CASCADE;
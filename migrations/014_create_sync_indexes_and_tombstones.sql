@@ -0,0 +1,48 @@
+-- 差分同期（GET /api/sync）用のインデックスと削除記録テーブル作成 SQL
+-- 日付: 2026-10-19
+-- 説明: 同期トークン以降に作成・更新・論理削除された行を (user_id, updated_at) の
+--       インデックスで取得する。物理削除（タスク・ノート・ノートカテゴリ）は
+--       sync_tombstone に ID を残し、同じトランザクションで記録する
+--       （app/services/sync_service.py）。
+-- 前提: 009 が適用済みであること（fuel_record はパーティションごとにインデックスを作成）
+
+-- 変更された行の取得: ユーザーごとの更新日時
+CREATE INDEX IF NOT EXISTS idx_task_user_id_updated_at
+    ON "task"(user_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_vehicle_user_id_updated_at
+    ON vehicle(user_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_fuel_record_user_id_updated_at
+    ON fuel_record(user_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_notes_user_id_updated_at
+    ON notes(user_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_note_categories_user_id_updated_at
+    ON note_categories(user_id, updated_at);
+
+-- 物理削除の記録
+CREATE TABLE IF NOT EXISTS sync_tombstone (
+    -- Primary Key
+    resource VARCHAR(32) NOT NULL,
+    record_id UUID NOT NULL,
+
+    -- Core Fields
+    user_id UUID NOT NULL,
+    deleted_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (resource, record_id)
+);
+
+-- 削除された行の取得と、保管期間（ARCHIVE_RETENTION_DAYS）を過ぎた記録の削除
+CREATE INDEX IF NOT EXISTS idx_sync_tombstone_user_id_deleted_at
+    ON sync_tombstone(user_id, deleted_at);
+CREATE INDEX IF NOT EXISTS idx_sync_tombstone_deleted_at
+    ON sync_tombstone(deleted_at);
+
+COMMENT ON INDEX idx_task_user_id_updated_at IS '差分同期用（更新日時）';
+COMMENT ON INDEX idx_vehicle_user_id_updated_at IS '差分同期用（更新日時）';
+COMMENT ON INDEX idx_fuel_record_user_id_updated_at IS '差分同期用（更新日時）';
+COMMENT ON INDEX idx_notes_user_id_updated_at IS '差分同期用（更新日時）';
+COMMENT ON INDEX idx_note_categories_user_id_updated_at IS '差分同期用（更新日時）';
+COMMENT ON TABLE sync_tombstone IS '物理削除された行の記録（差分同期用）';
+COMMENT ON COLUMN sync_tombstone.resource IS 'リソース（task / note / note_category）';
+COMMENT ON COLUMN sync_tombstone.record_id IS '削除された行の ID';
+COMMENT ON COLUMN sync_tombstone.deleted_at IS '削除日時';
@@ -0,0 +1,10 @@
+-- 差分同期（GET /api/sync）用のインデックスと削除記録テーブル ロールバック SQL
+-- 日付: 2026-10-19
+
+DROP TABLE IF EXISTS sync_tombstone CASCADE;
+
+DROP INDEX IF EXISTS idx_note_categories_user_id_updated_at;
+DROP INDEX IF EXISTS idx_notes_user_id_updated_at;
+DROP INDEX IF EXISTS idx_fuel_record_user_id_updated_at;
+DROP INDEX IF EXISTS idx_vehicle_user_id_updated_at;
+DROP INDEX IF EXISTS idx_task_user_id_updated_at;
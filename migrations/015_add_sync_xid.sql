@@ -0,0 +1,70 @@
+-- 差分同期（GET /api/sync）のトランザクション ID 列 追加 SQL
+-- 日付: 2026-10-19
+-- 説明: 同期対象のテーブルと sync_tombstone に、行を最後に書き込んだトランザクションの
+--       ID（sync_xid）を追加し、トリガーで INSERT / UPDATE のたびに設定する。
+--       同期トークンは同期時点のスナップショットの xmin（未完了のトランザクションの
+--       最小 ID）を持ち、次回は sync_xid がそれ以上の行を返す（app/services/sync_service.py）。
+--       アプリの時計（updated_at）ではなくコミット順で判定するため、コミットが遅れた
+--       書き込みやワーカー間の時計のずれで変更を取りこぼさない。
+--       既存の行は 0（次回の同期はトークンの形式が変わるため全件の再同期になる）。
+-- 前提: 014 が適用済みであること、PostgreSQL 13 以上
+--       （pg_current_xact_id()、パーティションテーブルの BEFORE 行トリガー）
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION set_sync_xid() RETURNS trigger AS $$
+BEGIN
+    NEW.sync_xid := pg_current_xact_id()::text::bigint;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+ALTER TABLE "task" ADD COLUMN IF NOT EXISTS sync_xid BIGINT NOT NULL DEFAULT 0;
+ALTER TABLE vehicle ADD COLUMN IF NOT EXISTS sync_xid BIGINT NOT NULL DEFAULT 0;
+ALTER TABLE fuel_record ADD COLUMN IF NOT EXISTS sync_xid BIGINT NOT NULL DEFAULT 0;
+ALTER TABLE notes ADD COLUMN IF NOT EXISTS sync_xid BIGINT NOT NULL DEFAULT 0;
+ALTER TABLE note_categories ADD COLUMN IF NOT EXISTS sync_xid BIGINT NOT NULL DEFAULT 0;
+-- 物理削除の記録は INSERT のみのため既定値で設定する
+ALTER TABLE sync_tombstone
+    ADD COLUMN IF NOT EXISTS sync_xid BIGINT NOT NULL
+    DEFAULT pg_current_xact_id()::text::bigint;
+
+-- fuel_record はパーティションテーブルのため、既存・今後のパーティションにも作成される
+CREATE TRIGGER trg_task_sync_xid
+    BEFORE INSERT OR UPDATE ON "task"
+    FOR EACH ROW EXECUTE FUNCTION set_sync_xid();
+CREATE TRIGGER trg_vehicle_sync_xid
+    BEFORE INSERT OR UPDATE ON vehicle
+    FOR EACH ROW EXECUTE FUNCTION set_sync_xid();
+CREATE TRIGGER trg_fuel_record_sync_xid
+    BEFORE INSERT OR UPDATE ON fuel_record
+    FOR EACH ROW EXECUTE FUNCTION set_sync_xid();
+CREATE TRIGGER trg_notes_sync_xid
+    BEFORE INSERT OR UPDATE ON notes
+    FOR EACH ROW EXECUTE FUNCTION set_sync_xid();
+CREATE TRIGGER trg_note_categories_sync_xid
+    BEFORE INSERT OR UPDATE ON note_categories
+    FOR EACH ROW EXECUTE FUNCTION set_sync_xid();
+
+-- 変更された行の取得: ユーザーごとのトランザクション ID
+CREATE INDEX IF NOT EXISTS idx_task_user_id_sync_xid
+    ON "task"(user_id, sync_xid);
+CREATE INDEX IF NOT EXISTS idx_vehicle_user_id_sync_xid
+    ON vehicle(user_id, sync_xid);
+CREATE INDEX IF NOT EXISTS idx_fuel_record_user_id_sync_xid
+    ON fuel_record(user_id, sync_xid);
+CREATE INDEX IF NOT EXISTS idx_notes_user_id_sync_xid
+    ON notes(user_id, sync_xid);
+CREATE INDEX IF NOT EXISTS idx_note_categories_user_id_sync_xid
+    ON note_categories(user_id, sync_xid);
+CREATE INDEX IF NOT EXISTS idx_sync_tombstone_user_id_sync_xid
+    ON sync_tombstone(user_id, sync_xid);
+
+COMMENT ON COLUMN "task".sync_xid IS '最後に書き込んだトランザクション ID（差分同期用）';
+COMMENT ON COLUMN vehicle.sync_xid IS '最後に書き込んだトランザクション ID（差分同期用）';
+COMMENT ON COLUMN fuel_record.sync_xid IS '最後に書き込んだトランザクション ID（差分同期用）';
+COMMENT ON COLUMN notes.sync_xid IS '最後に書き込んだトランザクション ID（差分同期用）';
+COMMENT ON COLUMN note_categories.sync_xid IS '最後に書き込んだトランザクション ID（差分同期用）';
+COMMENT ON COLUMN sync_tombstone.sync_xid IS '削除したトランザクション ID（差分同期用）';
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- 差分同期（GET /api/sync）のトランザクション ID 列 ロールバック SQL
+-- 日付: 2026-10-19
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_sync_tombstone_sync_xid ON sync_tombstone;
+DROP TRIGGER IF EXISTS trg_note_categories_sync_xid ON note_categories;
+DROP TRIGGER IF EXISTS trg_notes_sync_xid ON notes;
+DROP TRIGGER IF EXISTS trg_fuel_record_sync_xid ON fuel_record;
+DROP TRIGGER IF EXISTS trg_vehicle_sync_xid ON vehicle;
+DROP TRIGGER IF EXISTS trg_task_sync_xid ON "task";
+
+-- 列を削除するとインデックスも削除される
+ALTER TABLE sync_tombstone DROP COLUMN IF EXISTS sync_xid;
+ALTER TABLE note_categories DROP COLUMN IF EXISTS sync_xid;
+ALTER TABLE notes DROP COLUMN IF EXISTS sync_xid;
+ALTER TABLE fuel_record DROP COLUMN IF EXISTS sync_xid;
+ALTER TABLE vehicle DROP COLUMN IF EXISTS sync_xid;
+ALTER TABLE "task" DROP COLUMN IF EXISTS sync_xid;
+
+DROP FUNCTION IF EXISTS set_sync_xid();
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- 物理削除の記録のトランザクション ID トリガー 追加 SQL
+-- 日付: 2026-10-19
+-- 説明: 繰り返しタスクの発生分の ID はシリーズ ID と発生日から決まるため、
+--       同じ ID が削除・再作成・再削除されることがある。物理削除の記録は
+--       INSERT ... ON CONFLICT DO UPDATE で上書きするため（app/services/sync_service.py）、
+--       UPDATE でも sync_xid を削除したトランザクションの ID に更新する。
+-- 前提: 015 が適用済みであること
+
+BEGIN;
+
+CREATE TRIGGER trg_sync_tombstone_sync_xid
+    BEFORE INSERT OR UPDATE ON sync_tombstone
+    FOR EACH ROW EXECUTE FUNCTION set_sync_xid();
+
+COMMIT;
@@ -0,0 +1,8 @@
+-- 物理削除の記録のトランザクション ID トリガー ロールバック SQL
+-- 日付: 2026-10-19
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_sync_tombstone_sync_xid ON sync_tombstone;
+
+COMMIT;
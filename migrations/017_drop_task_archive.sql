@@ -0,0 +1,12 @@
+-- タスクのアーカイブテーブル削除 SQL
+-- 日付: 2026-10-19
+-- 説明: タスク・ノート・カテゴリは物理削除するため、論理削除済みのタスクは
+--       繰り返しタスクのスキップ済み発生分しかない。これを移動すると再び展開されるため
+--       ArchiveService はタスクを移動せず、task_archive は常に空のまま使われない。
+-- 前提: 008 が適用済みであること
+
+BEGIN;
+
+DROP TABLE IF EXISTS task_archive;
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- タスクのアーカイブテーブル削除 ロールバック SQL
+-- 日付: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS task_archive (
+    LIKE "task" INCLUDING DEFAULTS,
+    archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_task_archive_user_id ON task_archive(user_id);
+CREATE INDEX IF NOT EXISTS idx_task_archive_archived_at ON task_archive(archived_at);
+
+COMMENT ON TABLE task_archive IS '論理削除後に保管期間を過ぎたタスク';
+COMMENT ON COLUMN task_archive.archived_at IS 'アーカイブ日時';
+
+COMMIT;
@@ -0,0 +1,136 @@
+"""タスク一覧フィルタのクエリプラン統合テスト.
+
+migrations/010_create_task_filter_indexes.sql のインデックスが
+各フィルタで実際に使われることを EXPLAIN で検証する。
+PostgreSQL に接続できない、またはマイグレーション未適用の場合はスキップする。
+"""
+
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.models.base import JST
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.integration
+
+# プラン検証用ユーザー ID（トランザクションはロールバックされる）
+PLAN_USER_ID = UUID("99999999-9999-9999-9999-999999999999")
+TODAY = date(2026, 10, 19)
+
+SEED_TASKS_SQL = """
+INSERT INTO "task" (
+    id, user_id, title, description, is_completed, completed_at,
+    due_date, "order", created_at, updated_at
+)
+SELECT
+    uuid_generate_v4(),
+    :user_id,
+    'タスク ' || md5(i::text),
+    'メモ ' || md5((i * 7)::text),
+    i % 10 <> 0,
+    CASE WHEN i % 10 <> 0 THEN now() - make_interval(hours => i) END,
+    CAST(:today AS DATE) + (i % 730 - 365),
+    0,
+    now(),
+    now()
+FROM generate_series(1, 5000) AS i
+"""
+
+
+@pytest.fixture
+async def conn() -> AsyncIterator[AsyncConnection]:
+    """テストデータを投入した接続（終了時にロールバック）."""
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    try:
+        connection = await engine.connect()
+    except (OSError, SQLAlchemyError) as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL に接続できません: {e}")
+
+    transaction = await connection.begin()
+    try:
+        applied = await connection.scalar(
+            text("SELECT to_regclass('idx_task_user_id_due_date') IS NOT NULL")
+        )
+        if not applied:
+            pytest.skip("migrations/010_create_task_filter_indexes.sql が未適用です")
+
+        await connection.execute(
+            text(SEED_TASKS_SQL), {"user_id": PLAN_USER_ID, "today": TODAY}
+        )
+        await connection.execute(text('ANALYZE "task"'))
+        yield connection
+    finally:
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
+
+
+async def used_indexes(connection: AsyncConnection, **filters: Any) -> set[str]:
+    """TaskService.list_tasks が組み立てるクエリの EXPLAIN から使用インデックスを集める."""
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    await TaskService(session).list_tasks(PLAN_USER_ID, today=TODAY, **filters)
+    stmt = session.execute.call_args.args[0]
+    sql = str(
+        stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    )
+
+    raw_plan = await connection.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plan = json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan
+
+    names: set[str] = set()
+    stack = [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        if "Index Name" in node:
+            names.add(node["Index Name"])
+        stack.extend(node.get("Plans", []))
+    return names
+
+
+class TestTaskFilterQueryPlans:
+    """タスク一覧フィルタが対応するインデックスを使うことの検証."""
+
+    async def test_due_date_range_uses_due_date_index(
+        self, conn: AsyncConnection
+    ) -> None:
+        """due_before / due_after は (user_id, due_date) インデックスを使う."""
+        indexes = await used_indexes(
+            conn, due_after=TODAY, due_before=TODAY + timedelta(days=6)
+        )
+        assert "idx_task_user_id_due_date" in indexes
+
+    async def test_overdue_uses_open_due_date_index(
+        self, conn: AsyncConnection
+    ) -> None:
+        """overdue は未完了タスクの部分インデックスを使う."""
+        indexes = await used_indexes(conn, overdue=True)
+        assert "idx_task_user_id_open_due_date" in indexes
+
+    async def test_completed_since_uses_completed_at_index(
+        self, conn: AsyncConnection
+    ) -> None:
+        """completed_since は (user_id, completed_at) インデックスを使う."""
+        indexes = await used_indexes(
+            conn, completed_since=datetime.now(JST) - timedelta(hours=3)
+        )
+        assert "idx_task_user_id_completed_at" in indexes
+
+    async def test_text_query_uses_trigram_indexes(
+        self, conn: AsyncConnection
+    ) -> None:
+        """q はタイトル・説明のトライグラムインデックスを使う."""
+        indexes = await used_indexes(conn, q=hashlib.md5(b"42").hexdigest()[:8])
+        assert {"idx_task_title_trgm", "idx_task_description_trgm"} <= indexes
@@ -0,0 +1,180 @@
+"""ArchiveService のユニットテスト."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.models.vehicle import Vehicle
+from app.services.archive_service import ArchiveService, run_archive_job
+from app.utils.exceptions import NotFoundException
+
+TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+TEST_RECORD_ID = UUID("77777777-7777-7777-7777-777777777777")
+
+
+def create_mock_session(rowcount: int = 0) -> AsyncMock:
+    """rowcount を返す execute をモックしたセッション."""
+    result = MagicMock()
+    result.rowcount = rowcount
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def compiled_sql(session: AsyncMock) -> str:
+    """最後に実行された SQL を PostgreSQL 方言でコンパイル."""
+    stmt = session.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestArchiveServiceArchiveBatch:
+    """ArchiveService.archive_batch() のテストケース."""
+
+    async def test_moves_rows_with_delete_returning(self) -> None:
+        """DELETE ... RETURNING を INSERT ... SELECT で受けて 1 文で移動する."""
+        session = create_mock_session(rowcount=3)
+
+        moved = await ArchiveService(session).archive_batch(
+            FuelRecord, datetime(2026, 1, 1, tzinfo=JST), 500
+        )
+
+        assert moved == 3
+        sql = compiled_sql(session)
+        assert sql.startswith("WITH moved AS \n(DELETE FROM fuel_record")
+        assert "RETURNING" in sql
+        assert "INSERT INTO fuel_record_archive" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "fuel_record.deleted_at <" in sql
+        session.commit.assert_awaited_once()
+
+    async def test_supports_vehicles(self) -> None:
+        """車も対応するアーカイブテーブルへ移動する."""
+        session = create_mock_session()
+
+        await ArchiveService(session).archive_batch(
+            Vehicle, datetime(2026, 1, 1, tzinfo=JST), 100
+        )
+
+        assert "INSERT INTO vehicle_archive" in compiled_sql(session)
+
+
+class TestArchiveServiceArchiveDeleted:
+    """ArchiveService.archive_deleted() のテストケース."""
+
+    async def test_repeats_batches_until_short_batch(self) -> None:
+        """バッチが満杯の間は繰り返し、満たなければ次のテーブルへ進む."""
+        session = create_mock_session(rowcount=4)
+        service = ArchiveService(session)
+        service.archive_batch = AsyncMock(side_effect=[2, 2, 1, 2, 0])
+
+        totals = await service.archive_deleted(
+            retention_days=30,
+            batch_size=2,
+            now=datetime(2026, 3, 31, tzinfo=JST),
+        )
+
+        assert totals == {
+            "fuel_record": 5,
+            "vehicle": 2,
+            "sync_tombstone": 4,
+        }
+        # タスクは物理削除のため対象外
+        assert [call.args[0] for call in service.archive_batch.call_args_list] == [
+            FuelRecord,
+            FuelRecord,
+            FuelRecord,
+            Vehicle,
+            Vehicle,
+        ]
+        cutoff = service.archive_batch.call_args_list[0].args[1]
+        assert cutoff == datetime(2026, 3, 1, tzinfo=JST)
+        # 同じ保管期間を過ぎた物理削除の記録も削除する
+        sql = compiled_sql(session)
+        assert sql.startswith("DELETE FROM sync_tombstone")
+        assert session.execute.call_args.args[0].compile().params == {
+            "deleted_at_1": cutoff
+        }
+
+
+class TestArchiveServiceRestore:
+    """ArchiveService.restore() のテストケース."""
+
+    async def test_restore_moves_row_back_and_clears_deleted_at(self) -> None:
+        """アーカイブから元テーブルへ戻し、論理削除を解除する."""
+        session = create_mock_session(rowcount=1)
+
+        await ArchiveService(session).restore(Vehicle, TEST_RECORD_ID, TEST_USER_ID)
+
+        sql = compiled_sql(session)
+        assert "DELETE FROM vehicle_archive" in sql
+        assert "INSERT INTO vehicle" in sql
+        assert "NULL AS deleted_at" in sql
+        # 差分同期で返すよう updated_at は復元時刻にする
+        assert "AS updated_at" in sql
+        assert "restored.updated_at" not in sql
+        assert "vehicle_archive.user_id =" in sql
+        session.commit.assert_awaited_once()
+
+    async def test_restore_missing_row_fails(self) -> None:
+        """アーカイブに存在しない場合は例外."""
+        session = create_mock_session(rowcount=0)
+
+        with pytest.raises(NotFoundException):
+            await ArchiveService(session).restore(
+                Vehicle, TEST_RECORD_ID, TEST_USER_ID
+            )
+
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_called()
+
+    async def test_restore_fuel_record_adds_it_back_to_rollups(self) -> None:
+        """給油を戻すと、コミット前に期間別集計へ加え直す."""
+        session = create_mock_session(rowcount=1)
+        record = MagicMock(spec=FuelRecord)
+        session.get = AsyncMock(return_value=record)
+        rollups = AsyncMock()
+
+        with patch(
+            "app.services.archive_service.FuelRollupService", return_value=rollups
+        ), patch("app.services.archive_service.RollupRecord.of") as snapshot:
+            await ArchiveService(session).restore(
+                FuelRecord, TEST_RECORD_ID, TEST_USER_ID
+            )
+
+        session.get.assert_awaited_once_with(FuelRecord, TEST_RECORD_ID)
+        snapshot.assert_called_once_with(record)
+        rollups.record_added.assert_awaited_once_with(snapshot.return_value)
+        session.commit.assert_awaited_once()
+
+
+class TestRunArchiveJob:
+    """run_archive_job() のテストケース."""
+
+    async def test_job_keeps_running_after_failure(self) -> None:
+        """1 回の失敗でジョブは止まらない."""
+        session = AsyncMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        session_factory = MagicMock(return_value=session_cm)
+
+        archive_deleted = AsyncMock(side_effect=[OSError("db down"), {"vehicle": 1}])
+        sleep = AsyncMock(side_effect=[None, asyncio.CancelledError()])
+
+        with (
+            patch.object(ArchiveService, "archive_deleted", archive_deleted),
+            patch("app.services.archive_service.asyncio.sleep", sleep),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await run_archive_job(
+                session_factory, retention_days=90, batch_size=500, interval=60
+            )
+
+        assert archive_deleted.await_count == 2
+        sleep.assert_awaited_with(60)
@@ -0,0 +1,106 @@
+"""AuthService のユニットテスト."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.user import User
+from app.services.auth_service import UPDATE_USER_PROFILE_JOB, AuthService
+from app.services.job_queue import get_job_queue
+from app.services.user_service import UserService
+from app.utils.exceptions import ServiceUnavailableException
+
+GOOGLE_USER_INFO = {
+    "email": "user@example.com",
+    "name": "新しい名前",
+    "picture": "https://example.com/new.png",
+    "email_verified": True,
+}
+
+
+def create_auth_service() -> AuthService:
+    """Google への通信をモックした AuthService."""
+    service = AuthService()
+    service._exchange_code_for_token = AsyncMock(  # type: ignore[method-assign]
+        return_value={"access_token": "google-token"}
+    )
+    service._fetch_user_info = AsyncMock(  # type: ignore[method-assign]
+        return_value=GOOGLE_USER_INFO
+    )
+    return service
+
+
+class TestAuthServiceProfileUpdate:
+    """ログイン時のプロフィール更新のテストケース."""
+
+    async def test_returning_user_profile_update_is_deferred(self) -> None:
+        """既存ユーザーのプロフィール更新はジョブに積み、リクエスト内で書き込まない."""
+        user = User(email="user@example.com", name="古い名前", avatar_url=None)
+        enqueue = AsyncMock()
+
+        with (
+            patch.object(UserService, "get_by_email", AsyncMock(return_value=user)),
+            patch.object(UserService, "update_profile", AsyncMock()) as update_profile,
+            patch.object(get_job_queue(), "enqueue", enqueue),
+        ):
+            token = await create_auth_service().authenticate_google_user(
+                "code", MagicMock()
+            )
+
+        assert token
+        enqueue.assert_awaited_once_with(
+            UPDATE_USER_PROFILE_JOB,
+            email="user@example.com",
+            name="新しい名前",
+            avatar_url="https://example.com/new.png",
+        )
+        update_profile.assert_not_called()
+
+    async def test_unchanged_profile_is_not_written(self) -> None:
+        """プロフィールが変わっていなければジョブも積まない."""
+        user = User(
+            email="user@example.com",
+            name="新しい名前",
+            avatar_url="https://example.com/new.png",
+        )
+        enqueue = AsyncMock()
+
+        with (
+            patch.object(UserService, "get_by_email", AsyncMock(return_value=user)),
+            patch.object(get_job_queue(), "enqueue", enqueue),
+        ):
+            await create_auth_service().authenticate_google_user("code", MagicMock())
+
+        enqueue.assert_not_called()
+
+    async def test_falls_back_to_inline_update_when_queue_unavailable(self) -> None:
+        """ジョブキューが停止中ならその場で更新する."""
+        user = User(email="user@example.com", name="古い名前", avatar_url=None)
+
+        with (
+            patch.object(UserService, "get_by_email", AsyncMock(return_value=user)),
+            patch.object(UserService, "update_profile", AsyncMock()) as update_profile,
+            patch.object(
+                get_job_queue(),
+                "enqueue",
+                AsyncMock(side_effect=ServiceUnavailableException()),
+            ),
+        ):
+            await create_auth_service().authenticate_google_user("code", MagicMock())
+
+        update_profile.assert_awaited_once()
+
+    async def test_first_login_creates_user_inline(self) -> None:
+        """初回ログインはユーザーをその場で作成する."""
+        user = User(email="user@example.com", name="新しい名前")
+        enqueue = AsyncMock()
+
+        with (
+            patch.object(UserService, "get_by_email", AsyncMock(return_value=None)),
+            patch.object(
+                UserService, "get_or_create", AsyncMock(return_value=user)
+            ) as get_or_create,
+            patch.object(get_job_queue(), "enqueue", enqueue),
+        ):
+            await create_auth_service().authenticate_google_user("code", MagicMock())
+
+        get_or_create.assert_awaited_once()
+        enqueue.assert_not_called()
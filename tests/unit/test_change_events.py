@@ -0,0 +1,243 @@
+"""ChangeEventBroker（変更通知）のユニットテスト."""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models.base import JST
+from app.models.note import Note
+from app.models.vehicle import Vehicle
+from app.services.change_events import (
+    RESET,
+    ChangeEvent,
+    ChangeEventBroker,
+    PostgresChangeEventBroker,
+    collect_changes,
+    encode_batches,
+)
+from app.utils.exceptions import ServiceUnavailableException
+
+TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+OTHER_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440099")
+UPDATED_AT = datetime(2026, 10, 19, 12, 0, tzinfo=JST)
+
+
+class EventSession(Session):
+    """テスト用に変更通知を登録する Session（他のテストの Session に影響しない）."""
+
+
+def change(user_id: UUID = TEST_USER_ID, n: int = 1) -> ChangeEvent:
+    """車の更新の変更通知."""
+    return ChangeEvent(
+        user_id=user_id,
+        resource="vehicle",
+        id=UUID(int=n),
+        op="update",
+        version=UPDATED_AT.isoformat(),
+    )
+
+
+def sqlite_session() -> Session:
+    """車・ノートのテーブルだけを作ったメモリ上の SQLite のセッション."""
+    engine = create_engine("sqlite://")
+    Vehicle.__table__.create(engine)  # type: ignore[attr-defined]
+    Note.__table__.create(engine)  # type: ignore[attr-defined]
+    return EventSession(engine, expire_on_commit=False)
+
+
+def vehicle(n: int = 1) -> Vehicle:
+    """車."""
+    return Vehicle(
+        id=UUID(int=n),
+        user_id=TEST_USER_ID,
+        name=f"車{n}",
+        seq=n,
+        maker="トヨタ",
+        model="プリウス",
+        updated_at=UPDATED_AT,
+    )
+
+
+class TestCollectChanges:
+    """collect_changes / コミット時の配信のテストケース."""
+
+    def test_create_update_and_soft_delete(self) -> None:
+        """作成・更新・論理削除を区別し、変更のない行は通知しない."""
+        session = sqlite_session()
+        created, updated, removed, untouched = (vehicle(n) for n in range(1, 5))
+        session.add_all([updated, removed, untouched])
+        session.commit()
+
+        session.add(created)
+        updated.name = "改名"
+        removed.deleted_at = UPDATED_AT
+        untouched.name = untouched.name
+        changes = collect_changes(session)
+
+        assert {(c.id, c.op) for c in changes} == {
+            (created.id, "create"),
+            (updated.id, "update"),
+            (removed.id, "delete"),
+        }
+        assert all(c.resource == "vehicle" for c in changes)
+        assert all(c.user_id == TEST_USER_ID for c in changes)
+
+    async def test_commit_publishes_and_rollback_discards(self) -> None:
+        """コミットした変更だけを配信する."""
+        broker = ChangeEventBroker()
+        broker.install(EventSession)
+        subscription = broker.subscribe(TEST_USER_ID)
+        session = sqlite_session()
+
+        session.add(vehicle(1))
+        session.flush()
+        session.rollback()
+        note = Note(id=UUID(int=2), user_id=TEST_USER_ID, title="メモ", body="本文")
+        session.add(note)
+        session.commit()
+        session.delete(note)
+        session.commit()
+
+        first, second = subscription.get(), subscription.get()
+        assert (await first).op == "create"  # type: ignore[union-attr]
+        deleted = await second
+        assert isinstance(deleted, ChangeEvent)
+        assert (deleted.resource, deleted.id, deleted.op) == ("note", note.id, "delete")
+        assert subscription._queue.empty()
+
+
+class TestChangeEventBroker:
+    """ChangeEventBroker の購読・配信のテストケース."""
+
+    async def test_publish_only_to_same_user(self) -> None:
+        """変更は同じユーザーの購読にだけ届く."""
+        broker = ChangeEventBroker()
+        mine, other = broker.subscribe(TEST_USER_ID), broker.subscribe(OTHER_USER_ID)
+
+        broker.publish(change())
+
+        assert await mine.get() == change()
+        assert other._queue.empty()
+
+    async def test_overflow_replaces_backlog_with_reset(self) -> None:
+        """読み込みが追いつかない購読は溜まった変更を捨てて RESET を受け取る."""
+        broker = ChangeEventBroker(queue_size=2)
+        subscription = broker.subscribe(TEST_USER_ID)
+
+        for n in range(3):
+            broker.publish(change(n=n))
+        broker.publish(change(n=9))
+
+        assert await subscription.get() is RESET
+        assert await subscription.get() == change(n=9)
+
+    def test_connection_limits(self) -> None:
+        """接続数の上限を超えると拒否し、解除すると再び受け付ける."""
+        broker = ChangeEventBroker(max_connections=3, max_connections_per_user=2)
+        first = broker.subscribe(TEST_USER_ID)
+        broker.subscribe(TEST_USER_ID)
+
+        with pytest.raises(ServiceUnavailableException):
+            broker.subscribe(TEST_USER_ID)
+        broker.subscribe(OTHER_USER_ID)
+        with pytest.raises(ServiceUnavailableException):
+            broker.subscribe(UUID(int=3))
+
+        broker.unsubscribe(first)
+        broker.unsubscribe(first)
+        assert broker.connection_count == 2
+        broker.subscribe(TEST_USER_ID)
+
+    async def test_stream_formats_events_and_unsubscribes(self) -> None:
+        """変更・RESET を SSE で送り、終了時に購読を解除する."""
+        broker = ChangeEventBroker()
+        subscription = broker.subscribe(TEST_USER_ID)
+        stream = broker.stream(subscription, heartbeat=1.0)
+        broker.publish(change())
+        subscription.put(RESET)
+
+        messages = [await anext(stream) for _ in range(3)]
+        broker.close_all()
+        messages += [m async for m in stream]
+
+        assert messages[0] == ": connected\n\n"
+        event_line, data_line = messages[1].strip().split("\n")
+        assert event_line == "event: change"
+        assert json.loads(data_line.removeprefix("data: ")) == {
+            "resource": "vehicle",
+            "id": str(UUID(int=1)),
+            "op": "update",
+            "version": UPDATED_AT.isoformat(),
+        }
+        assert messages[2:] == ["event: reset\ndata: {}\n\n"]
+        assert broker.connection_count == 0
+
+    async def test_stream_heartbeat_and_cancel(self) -> None:
+        """変更がなければコメント行を送り、切断（キャンセル）で購読を解除する."""
+        broker = ChangeEventBroker()
+        subscription = broker.subscribe(TEST_USER_ID)
+        received: list[str] = []
+
+        async def consume() -> None:
+            async for message in broker.stream(subscription, heartbeat=0.01):
+                received.append(message)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert ": keepalive\n\n" in received
+        assert broker.connection_count == 0
+        assert subscription.closed
+
+
+class TestPostgresChangeEventBroker:
+    """PostgresChangeEventBroker の NOTIFY・配信のテストケース."""
+
+    def test_stage_notifies_in_transaction(self) -> None:
+        """変更は flush と同じ接続で pg_notify() に渡す."""
+        broker = PostgresChangeEventBroker("postgresql+asyncpg://localhost/test")
+        session = MagicMock()
+
+        broker._stage(session, [change(n=1), change(n=2)])
+
+        connection = session.connection.return_value
+        connection.execute.assert_called_once()
+        stmt = connection.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT pg_notify(")
+        payload = json.loads(stmt.compile().params["pg_notify_3"])
+        assert [item["id"] for item in payload] == [str(UUID(int=1)), str(UUID(int=2))]
+        assert payload[0]["user_id"] == str(TEST_USER_ID)
+
+    def test_encode_batches_respects_payload_limit(self) -> None:
+        """NOTIFY の payload の上限を超えないように分割する."""
+        changes = [change(n=n) for n in range(100)]
+
+        batches = encode_batches(changes, max_bytes=1000)
+
+        assert len(batches) > 1
+        assert all(len(batch) <= 1000 for batch in batches)
+        decoded = [ChangeEvent.from_payload(i) for b in batches for i in json.loads(b)]
+        assert decoded == changes
+
+    async def test_dispatch(self) -> None:
+        """受け取った変更を配信し、壊れた payload は捨てる."""
+        broker = PostgresChangeEventBroker("postgresql+asyncpg://localhost/test")
+        subscription = broker.subscribe(TEST_USER_ID)
+
+        broker.dispatch("not json")
+        broker.dispatch('[{"user_id": "x"}]')
+        broker.dispatch(encode_batches([change()])[0])
+
+        assert await subscription.get() == change()
+        assert subscription._queue.empty()
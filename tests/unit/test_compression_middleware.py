@@ -0,0 +1,157 @@
+"""CompressionMiddleware のユニットテスト."""
+
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware import compression
+from app.middleware.compression import CompressionMiddleware, select_encoding
+
+LARGE_TEXT = "ノート本文" * 500
+
+
+def create_app(minimum_size: int = 1024) -> FastAPI:
+    """テスト用アプリを作成."""
+    test_app = FastAPI()
+    test_app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @test_app.get("/large")
+    async def large() -> dict:
+        return {"data": LARGE_TEXT}
+
+    @test_app.get("/small")
+    async def small() -> dict:
+        return {"data": "ok"}
+
+    @test_app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def generate():
+            for i in range(3):
+                yield f"line-{i}\n".encode()
+
+        return StreamingResponse(generate(), media_type="text/plain")
+
+    @test_app.get("/events")
+    async def events() -> StreamingResponse:
+        async def generate():
+            yield b"data: ping\n\n"
+
+        return StreamingResponse(generate(), media_type="text/event-stream")
+
+    @test_app.get("/encoded")
+    async def encoded() -> PlainTextResponse:
+        return PlainTextResponse(
+            LARGE_TEXT, headers={"Content-Encoding": "identity"}
+        )
+
+    return test_app
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """圧縮ミドルウェア付きテストクライアント."""
+    return TestClient(create_app())
+
+
+class TestSelectEncoding:
+    """select_encoding() のテストケース."""
+
+    def test_gzip_only(self) -> None:
+        """gzip のみ受け付ける場合は gzip."""
+        assert select_encoding("gzip") == "gzip"
+
+    def test_empty_header(self) -> None:
+        """ヘッダ未指定なら圧縮しない."""
+        assert select_encoding("") is None
+
+    def test_q_zero_is_refused(self) -> None:
+        """q=0 のエンコーディングは選ばない."""
+        assert select_encoding("gzip;q=0, br;q=0") is None
+
+    def test_prefers_br_when_available(self, monkeypatch) -> None:
+        """brotli が使える場合、同じ q 値なら br を優先."""
+        monkeypatch.setattr(compression, "brotli", object())
+        assert select_encoding("gzip, deflate, br") == "br"
+
+    def test_higher_quality_wins(self, monkeypatch) -> None:
+        """q 値が高いエンコーディングを選ぶ."""
+        monkeypatch.setattr(compression, "brotli", object())
+        assert select_encoding("br;q=0.5, gzip;q=0.9") == "gzip"
+
+    def test_br_ignored_without_brotli(self, monkeypatch) -> None:
+        """brotli が無い場合は br を選ばない."""
+        monkeypatch.setattr(compression, "brotli", None)
+        assert select_encoding("br") is None
+
+    def test_wildcard(self, monkeypatch) -> None:
+        """* 指定でもサポートするエンコーディングを選ぶ."""
+        monkeypatch.setattr(compression, "brotli", None)
+        assert select_encoding("*") == "gzip"
+
+
+class TestCompressionMiddleware:
+    """CompressionMiddleware のテストケース."""
+
+    def test_large_json_is_gzipped(self, client: TestClient) -> None:
+        """大きな JSON レスポンスは gzip 圧縮される."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == {"data": LARGE_TEXT}
+
+    def test_content_length_matches_compressed_body(self, client: TestClient) -> None:
+        """Content-Length は圧縮後のサイズになる."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        content_length = int(response.headers["content-length"])
+        assert content_length < len(LARGE_TEXT.encode())
+
+    def test_small_payload_is_not_compressed(self, client: TestClient) -> None:
+        """しきい値未満のレスポンスは圧縮しない."""
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"data": "ok"}
+
+    def test_no_accept_encoding(self, client: TestClient) -> None:
+        """Accept-Encoding が identity なら圧縮しない."""
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_response_is_compressed(self, client: TestClient) -> None:
+        """StreamingResponse はストリーム圧縮される."""
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == "line-0\nline-1\nline-2\n"
+
+    def test_event_stream_is_not_compressed(self, client: TestClient) -> None:
+        """SSE は圧縮しない."""
+        response = client.get("/events", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    def test_already_encoded_response_is_untouched(self, client: TestClient) -> None:
+        """Content-Encoding 付きのレスポンスは二重圧縮しない."""
+        response = client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "identity"
+
+
+class TestGzipCompressor:
+    """gzip ストリーム圧縮器のテストケース."""
+
+    def test_stream_roundtrip(self) -> None:
+        """分割して圧縮した結果を一括で展開できる."""
+        compressor = compression._GzipCompressor(6)
+        data = compressor.compress(b"abc") + compressor.flush()
+        data += compressor.compress(b"def") + compressor.finish()
+        assert gzip.decompress(data) == b"abcdef"
+
+    def test_flush_is_decodable(self) -> None:
+        """フラッシュ済みのチャンクは単独で展開できる."""
+        compressor = compression._GzipCompressor(6)
+        chunk = compressor.compress(b"partial") + compressor.flush()
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert decompressor.decompress(chunk) == b"partial"
@@ -0,0 +1,253 @@
+"""DashboardService のユニットテスト."""
+
+import asyncio
+import time
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.base import JST
+from app.models.fuel_record import FuelRecord
+from app.models.task import Task
+from app.models.vehicle import Vehicle
+from app.services.dashboard_service import DashboardService
+
+# テスト用ユーザー ID（固定値）
+TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+
+
+class FakeSessionFactory:
+    """セッションごとに実行された SQL を記録するセッションファクトリ."""
+
+    def __init__(self, result: MagicMock) -> None:
+        self.result = result
+        self.sessions: list[AsyncMock] = []
+
+    def __call__(self) -> MagicMock:
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=self.result)
+        self.sessions.append(session)
+
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        return session_cm
+
+    def compiled_sql(self) -> list[str]:
+        """実行された SQL を PostgreSQL 方言でコンパイルして返す."""
+        return [
+            str(
+                session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+            )
+            for session in self.sessions
+        ]
+
+
+class TestDashboardServiceGetSummary:
+    """DashboardService.get_summary() のテストケース."""
+
+    async def test_summary_is_assembled(self) -> None:
+        """各サブクエリの結果が集約される."""
+        service = DashboardService(MagicMock())
+        service._count_tasks = AsyncMock(return_value=(7, 2))
+        upcoming = Task(user_id=TEST_USER_ID, title="買い物", due_date=date(2026, 1, 2))
+        service._list_upcoming_tasks = AsyncMock(return_value=[upcoming])
+        service._list_occurrences = AsyncMock(return_value=[])
+        service._list_vehicles_with_latest_refuel = AsyncMock(return_value=["vehicle"])
+        service._list_recent_notes = AsyncMock(return_value=["note"])
+
+        summary = await service.get_summary(TEST_USER_ID, today=date(2026, 1, 1))
+
+        assert summary.open_task_count == 7
+        assert summary.overdue_task_count == 2
+        assert summary.upcoming_tasks == [upcoming]
+        assert summary.vehicles == ["vehicle"]
+        assert summary.recent_notes == ["note"]
+        service._count_tasks.assert_awaited_once_with(TEST_USER_ID, date(2026, 1, 1))
+
+    async def test_sub_queries_run_concurrently(self) -> None:
+        """サブクエリは並行実行され、合計時間は 1 クエリ分程度になる."""
+
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return []
+
+        async def slow_count(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return (0, 0)
+
+        service = DashboardService(MagicMock())
+        service._count_tasks = slow_count
+        service._list_upcoming_tasks = slow
+        service._list_occurrences = slow
+        service._list_vehicles_with_latest_refuel = slow
+        service._list_recent_notes = slow
+
+        started = time.perf_counter()
+        await service.get_summary(TEST_USER_ID)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.15
+
+    async def test_each_sub_query_uses_its_own_session(self) -> None:
+        """サブクエリごとに別のセッションを使う."""
+        result = MagicMock()
+        result.one.return_value = (3, 1)
+        result.scalars().all.return_value = []
+        result.all.return_value = []
+        factory = FakeSessionFactory(result)
+
+        summary = await DashboardService(factory).get_summary(TEST_USER_ID)
+
+        assert len(factory.sessions) == 5
+        assert all(s.execute.await_count == 1 for s in factory.sessions)
+        assert summary.open_task_count == 3
+        assert summary.overdue_task_count == 1
+
+
+    async def test_recurring_occurrences_are_counted_and_listed(self) -> None:
+        """繰り返しタスクの発生分を件数と期日が近いタスクに含める."""
+        today = date(2026, 10, 19)
+        created_at = datetime(2026, 10, 1, tzinfo=JST)
+
+        def task(title: str, due_date: date) -> Task:
+            return Task(
+                user_id=TEST_USER_ID,
+                title=title,
+                due_date=due_date,
+                created_at=created_at,
+            )
+
+        service = DashboardService(MagicMock())
+        service._count_tasks = AsyncMock(return_value=(1, 0))
+        service._list_upcoming_tasks = AsyncMock(
+            return_value=[task("通常", date(2026, 10, 20))]
+        )
+        service._list_occurrences = AsyncMock(
+            return_value=[
+                task("繰り返し", date(2026, 10, 18)),
+                task("繰り返し", date(2026, 10, 25)),
+            ]
+        )
+        service._list_vehicles_with_latest_refuel = AsyncMock(return_value=[])
+        service._list_recent_notes = AsyncMock(return_value=[])
+
+        summary = await service.get_summary(TEST_USER_ID, task_limit=2, today=today)
+
+        assert summary.open_task_count == 3
+        assert summary.overdue_task_count == 1
+        assert [t.due_date for t in summary.upcoming_tasks] == [
+            date(2026, 10, 18),
+            date(2026, 10, 20),
+        ]
+
+
+class TestDashboardServiceQueries:
+    """DashboardService のサブクエリのテストケース."""
+
+    async def test_count_tasks_uses_filtered_aggregates(self) -> None:
+        """タスク件数は FILTER 付き集計 1 クエリで取得する."""
+        result = MagicMock()
+        result.one.return_value = (None, None)
+        factory = FakeSessionFactory(result)
+
+        counts = await DashboardService(factory)._count_tasks(
+            TEST_USER_ID, date(2026, 1, 1)
+        )
+
+        assert counts == (0, 0)
+        sql = factory.compiled_sql()[0]
+        assert sql.count("FILTER (WHERE") == 2
+
+    async def test_vehicles_join_latest_refuel(self) -> None:
+        """車は DISTINCT ON で求めた最新給油と外部結合される."""
+        vehicle = MagicMock(spec=Vehicle)
+        refuel = MagicMock(spec=FuelRecord)
+        result = MagicMock()
+        result.all.return_value = [(vehicle, refuel), (vehicle, None)]
+        factory = FakeSessionFactory(result)
+
+        items = await DashboardService(factory)._list_vehicles_with_latest_refuel(
+            TEST_USER_ID
+        )
+
+        assert items[0].latest_refuel is refuel
+        assert items[1].latest_refuel is None
+        sql = factory.compiled_sql()[0]
+        assert "DISTINCT ON (fuel_record.vehicle_id)" in sql
+        assert "LEFT OUTER JOIN" in sql
+
+    async def test_recent_notes_do_not_select_body(self) -> None:
+        """最近のノートは本文を取得しない."""
+        result = MagicMock()
+        result.all.return_value = []
+        factory = FakeSessionFactory(result)
+
+        await DashboardService(factory)._list_recent_notes(TEST_USER_ID, 5)
+
+        sql = factory.compiled_sql()[0]
+        assert "notes.body" not in sql
+        assert "ORDER BY notes.updated_at DESC" in sql
+
+    @staticmethod
+    def occurrence_service(series: Task) -> DashboardService:
+        """series だけを持ち、10/15 の発生分が保存済みのセッションを使うサービス."""
+        series_result = MagicMock()
+        series_result.scalars.return_value.all.return_value = [series]
+        materialized_result = MagicMock()
+        materialized_result.all.return_value = [(series.id, date(2026, 10, 15))]
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[series_result, materialized_result])
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        return DashboardService(lambda: session_cm)
+
+    @staticmethod
+    def weekly_series() -> Task:
+        """10/1 から毎週の繰り返しシリーズ."""
+        return Task(
+            id=UUID("11111111-1111-1111-1111-111111111111"),
+            user_id=TEST_USER_ID,
+            title="ゴミ出し",
+            due_date=date(2026, 10, 1),
+            recurrence_rule="FREQ=WEEKLY",
+            created_at=datetime(2026, 9, 1, tzinfo=JST),
+        )
+
+    async def test_occurrences_are_expanded_around_today(self) -> None:
+        """繰り返しタスクは TaskService と同じく今日の前後の発生分を展開する."""
+        series = self.weekly_series()
+
+        occurrences = await self.occurrence_service(series)._list_occurrences(
+            TEST_USER_ID, date(2026, 10, 19)
+        )
+
+        # 10/15 は保存済み（完了など）のため展開しない
+        assert [t.due_date for t in occurrences] == [
+            date(2026, 10, 1),
+            date(2026, 10, 8),
+            date(2026, 10, 22),
+            date(2026, 10, 29),
+            date(2026, 11, 5),
+            date(2026, 11, 12),
+        ]
+        assert all(t.recurrence_parent_id == series.id for t in occurrences)
+
+    async def test_occurrence_horizon_follows_setting(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """展開する期間はタスク一覧と同じ TASK_RECURRENCE_HORIZON_DAYS を使う."""
+        monkeypatch.setattr(
+            "app.services.dashboard_service.get_settings",
+            lambda: MagicMock(TASK_RECURRENCE_HORIZON_DAYS=7),
+        )
+
+        occurrences = await self.occurrence_service(
+            self.weekly_series()
+        )._list_occurrences(TEST_USER_ID, date(2026, 10, 19))
+
+        assert [t.due_date for t in occurrences] == [date(2026, 10, 22)]
@@ -0,0 +1,147 @@
+"""満タン法の燃費計算（fuel_efficiency）のユニットテスト."""
+
+import random
+from typing import Optional
+from uuid import UUID, uuid4
+
+from app.services.fuel_efficiency import (
+    FuelHistoryCache,
+    FuelHistoryMetrics,
+    compute_fuel_history,
+    fuel_amount,
+    fuel_centilitres,
+)
+
+
+def reference_efficiencies(
+    mileages: list[int], costs: list[int], prices: list[int], fulls: list[bool]
+) -> list[Optional[float]]:
+    """満タン給油ごとに区間を走査する素朴な実装（比較用）."""
+    efficiencies: list[Optional[float]] = []
+    previous_full: Optional[int] = None
+    for j, full in enumerate(fulls):
+        efficiency = None
+        if full and previous_full is not None:
+            interval = range(previous_full + 1, j + 1)
+            amounts = [fuel_amount(costs[k], prices[k]) for k in interval]
+            litres = sum(fuel_centilitres(costs[k], prices[k]) for k in interval) / 100
+            if None not in amounts and litres > 0:
+                efficiency = round((mileages[j] - mileages[previous_full]) / litres, 2)
+        if full:
+            previous_full = j
+        efficiencies.append(efficiency)
+    return efficiencies
+
+
+class TestComputeFuelHistory:
+    """compute_fuel_history のテストケース."""
+
+    def test_full_to_full_intervals(self) -> None:
+        """一部給油は次の満タン給油の区間に合算する."""
+        ids = [uuid4() for _ in range(5)]
+
+        history = compute_fuel_history(
+            ids,
+            [1000, 1300, 1500, 1900, 2100],
+            [8500, 3400, 5100, 6800, 1700],  # 50L, 20L, 30L, 40L, 10L
+            [170, 170, 170, 170, 170],
+            [True, False, True, True, False],
+        )
+
+        assert history.distances == [1000, 300, 200, 400, 200]
+        assert history.fuel_amounts == [50.0, 20.0, 30.0, 40.0, 10.0]
+        # 最初の満タン・一部給油は None、(1500-1000)/(20+30)、(1900-1500)/40
+        assert history.fuel_efficiencies == [None, None, 10.0, 10.0, None]
+        assert history.get(ids[2]) == (200, 30.0, 10.0)
+        assert history.get(uuid4()) == (None, None, None)
+
+    def test_unknown_amount_in_interval(self) -> None:
+        """区間内に給油量が不明な記録があれば燃費は None、次の区間からは計算する."""
+        history = compute_fuel_history(
+            [uuid4() for _ in range(4)],
+            [1000, 1200, 1500, 2000],
+            [8500, 3400, 8500, 8500],
+            [170, 0, 170, 170],
+            [True, False, True, True],
+        )
+
+        assert history.fuel_amounts[1] is None
+        assert history.fuel_efficiencies == [None, None, None, 10.0]
+
+    def test_empty_history(self) -> None:
+        """記録がない場合は空の結果."""
+        history = compute_fuel_history([], [], [], [], [])
+
+        assert history.index == {}
+        assert history.fuel_efficiencies == []
+
+    def test_matches_reference(self) -> None:
+        """ランダムな履歴で素朴な実装と同じ結果になる."""
+        rng = random.Random(46)
+        n = 2000
+        mileages = [1000]
+        for _ in range(n - 1):
+            mileages.append(mileages[-1] + rng.randint(0, 800))
+        prices = [rng.choice([0, 150, 163, 171, 189]) for _ in range(n)]
+        costs = [rng.randint(0, 12000) for _ in range(n)]
+        fulls = [rng.random() < 0.6 for _ in range(n)]
+
+        history = compute_fuel_history(
+            [uuid4() for _ in range(n)], mileages, costs, prices, fulls
+        )
+
+        assert history.fuel_efficiencies == reference_efficiencies(
+            mileages, costs, prices, fulls
+        )
+
+
+class TestFuelHistoryCache:
+    """FuelHistoryCache のテストケース."""
+
+    user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
+
+    @staticmethod
+    def metrics() -> FuelHistoryMetrics:
+        return compute_fuel_history([uuid4()], [100], [1700], [170], [True])
+
+    def test_token_must_match(self) -> None:
+        """保存時と異なるトークンでは取得できない."""
+        cache = FuelHistoryCache()
+        vehicle_id = uuid4()
+        metrics = self.metrics()
+        cache.set(self.user_id, vehicle_id, b"v1", metrics, cache.generation)
+
+        assert cache.get(self.user_id, vehicle_id, b"v1") is metrics
+        assert cache.get(self.user_id, vehicle_id, b"v2") is None
+        assert cache.get(uuid4(), vehicle_id, b"v1") is None
+
+    def test_invalidate_user(self) -> None:
+        """車を指定しない無効化はユーザーのすべての車を削除する."""
+        cache = FuelHistoryCache()
+        other_user = uuid4()
+        for user_id in (self.user_id, self.user_id, other_user):
+            cache.set(user_id, uuid4(), b"", self.metrics(), cache.generation)
+
+        cache.invalidate(self.user_id)
+
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        """上限を超えると最も長く使われていない車から削除する."""
+        cache = FuelHistoryCache(max_vehicles=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.set(self.user_id, first, b"", self.metrics(), cache.generation)
+        cache.set(self.user_id, second, b"", self.metrics(), cache.generation)
+        cache.get(self.user_id, first, b"")
+
+        cache.set(self.user_id, third, b"", self.metrics(), cache.generation)
+
+        assert cache.get(self.user_id, first, b"") is not None
+        assert cache.get(self.user_id, second, b"") is None
+
+    def test_disabled(self) -> None:
+        """max_vehicles=0 の場合は保存しない."""
+        cache = FuelHistoryCache(max_vehicles=0)
+        cache.set(self.user_id, uuid4(), b"", self.metrics(), cache.generation)
+
+        assert len(cache) == 0
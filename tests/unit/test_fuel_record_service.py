@@ -1,16 +1,31 @@
 """FuelRecord（燃費記録）サービステスト."""
 
 import pytest
+from collections import namedtuple
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
 from app.models.fuel_record import FuelRecord
 from app.schemas.fuel_record import FuelRecordCreate, FuelRecordUpdate
-from app.services.fuel_record_service import FuelRecordService
+from app.services import fuel_record_service
+from app.services.fuel_efficiency import FuelHistoryCache
+from app.services.fuel_rollup_service import RollupRecord
+from app.services.fuel_record_service import (
+    FUEL_HISTORY_COLUMNS,
+    FUEL_RECORD_ROW_COLUMNS,
+    FuelRecordService,
+    _known_partition_years,
+)
 
 JST = timezone(timedelta(hours=9))
 
+# FUEL_HISTORY_COLUMNS を select した燃費計算用の履歴の行
+HistoryRow = namedtuple("HistoryRow", [column.key for column in FUEL_HISTORY_COLUMNS])
+
 
 @pytest.fixture
 def mock_db_session() -> AsyncMock:
@@ -18,6 +33,29 @@ def mock_db_session() -> AsyncMock:
     return AsyncMock()
 
 
+@pytest.fixture(autouse=True)
+def history_cache(monkeypatch: pytest.MonkeyPatch) -> FuelHistoryCache:
+    """テストごとに空の燃費計算結果キャッシュを使う."""
+    cache = FuelHistoryCache()
+    monkeypatch.setattr(fuel_record_service, "fuel_history_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def rollups(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """期間別集計の更新を記録するモック（集計の計算は test_fuel_rollup_service で確認）."""
+    service = AsyncMock()
+    monkeypatch.setattr(fuel_record_service, "FuelRollupService", lambda _: service)
+    return service
+
+
+def history_result(*rows: tuple) -> MagicMock:
+    """燃費計算用の履歴クエリの結果."""
+    result = MagicMock()
+    result.all.return_value = list(rows)
+    return result
+
+
 class TestFuelRecordServiceListFuelRecords:
     """FuelRecordService.list_fuel_records テスト."""
 
@@ -72,7 +110,7 @@ class TestFuelRecordServiceListFuelRecords:
 
         mock_result = MagicMock()
         mock_result.scalars().all.return_value = [record1, record2]
-        mock_db_session.execute.return_value = mock_result
+        mock_db_session.execute.side_effect = [mock_result, history_result()]
 
         service = FuelRecordService(mock_db_session)
         records = await service.list_fuel_records(user_id=user_id, vehicle_id=vehicle_id)
@@ -83,93 +121,94 @@ class TestFuelRecordServiceListFuelRecords:
 
 
 class TestFuelRecordServiceFuelEfficiencyCalculation:
-    """燃費計算テスト."""
-
-    @pytest.mark.asyncio
-    async def test_fuel_efficiency_first_record(self, mock_db_session: AsyncMock) -> None:
-        """最初のレコードは総走行距離がそのまま走行距離になる."""
-        user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
-        vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
+    """燃費計算テスト（満タン法）."""
+
+    user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
+    vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
+
+    def record(
+        self,
+        record_id: UUID,
+        total_mileage: int,
+        total_cost: int,
+        is_full_tank: bool = True,
+    ) -> FuelRecord:
+        """単価 170 円の燃費記録."""
         now = datetime.now(JST)
-
-        record1 = FuelRecord(
-            id=UUID("550e8400-e29b-41d4-a716-446655440101"),
-            vehicle_id=vehicle_id,
-            user_id=user_id,
+        return FuelRecord(
+            id=record_id,
+            vehicle_id=self.vehicle_id,
+            user_id=self.user_id,
             refuel_datetime=now,
-            total_mileage=500,
+            total_mileage=total_mileage,
             fuel_type="ハイオク",
             unit_price=170,
-            total_cost=8500,  # 8500 / 170 = 50L
+            total_cost=total_cost,
+            is_full_tank=is_full_tank,
             created_at=now,
             updated_at=now,
         )
 
-        mock_result = MagicMock()
-        mock_result.scalars().all.return_value = [record1]
-        mock_db_session.execute.return_value = mock_result
+    @staticmethod
+    def history_row(record: FuelRecord) -> tuple:
+        """燃費記録に対応する履歴の行."""
+        return HistoryRow(
+            record.id,
+            record.total_mileage,
+            record.total_cost,
+            record.unit_price,
+            record.is_full_tank,
+        )
 
+    async def list_records(
+        self,
+        mock_db_session: AsyncMock,
+        page: list[FuelRecord],
+        history: list[FuelRecord],
+    ) -> list:
+        """page を一覧、history（昇順）を燃費計算用の履歴として一覧を取得."""
+        mock_result = MagicMock()
+        mock_result.scalars().all.return_value = page
+        mock_db_session.execute.side_effect = [
+            mock_result,
+            history_result(*map(self.history_row, history)),
+        ]
         service = FuelRecordService(mock_db_session)
-        records = await service.list_fuel_records(user_id=user_id, vehicle_id=vehicle_id)
+        return await service.list_fuel_records(
+            user_id=self.user_id, vehicle_id=self.vehicle_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_fuel_efficiency_first_record(self, mock_db_session: AsyncMock) -> None:
+        """最初のレコードは総走行距離がそのまま走行距離になり、燃費は計算しない."""
+        record1 = self.record(
+            UUID("550e8400-e29b-41d4-a716-446655440101"), 500, 8500  # 50L
+        )
+
+        records = await self.list_records(mock_db_session, [record1], [record1])
 
         assert len(records) == 1
         # 最初の記録なので走行距離 = 総走行距離
         assert records[0].distance_traveled == 500
         # 給油量 = 8500 / 170 = 50L
         assert records[0].fuel_amount == 50.0
-        # 燃費 = 500 / 50 = 10.0 km/L
-        assert records[0].fuel_efficiency == 10.0
+        # 直前の満タン給油がないため燃費は不明
+        assert records[0].fuel_efficiency is None
 
     @pytest.mark.asyncio
     async def test_fuel_efficiency_with_previous_record(
         self, mock_db_session: AsyncMock
     ) -> None:
         """前回データがある場合は差分が走行距離になる."""
-        user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
-        vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
-        now = datetime.now(JST)
-        yesterday = now - timedelta(days=1)
-
-        # 最新レコード（総走行距離 1000km）
-        record_new = FuelRecord(
-            id=UUID("550e8400-e29b-41d4-a716-446655440102"),
-            vehicle_id=vehicle_id,
-            user_id=user_id,
-            refuel_datetime=now,
-            total_mileage=1000,
-            fuel_type="ハイオク",
-            unit_price=170,
-            total_cost=8500,  # 50L
-            created_at=now,
-            updated_at=now,
-        )
+        old_id = UUID("550e8400-e29b-41d4-a716-446655440101")
+        new_id = UUID("550e8400-e29b-41d4-a716-446655440102")
+        record_old = self.record(old_id, 500, 8250)
+        record_new = self.record(new_id, 1000, 8500)  # 50L
 
-        # 前回レコード（総走行距離 500km）
-        record_old = FuelRecord(
-            id=UUID("550e8400-e29b-41d4-a716-446655440101"),
-            vehicle_id=vehicle_id,
-            user_id=user_id,
-            refuel_datetime=yesterday,
-            total_mileage=500,
-            fuel_type="ハイオク",
-            unit_price=165,
-            total_cost=8250,
-            created_at=yesterday,
-            updated_at=yesterday,
+        records = await self.list_records(
+            mock_db_session, [record_new], [record_old, record_new]
         )
 
-        # execute が2回呼ばれる（list用、全件取得用）
-        mock_result_list = MagicMock()
-        mock_result_list.scalars().all.return_value = [record_new]
-
-        mock_result_all = MagicMock()
-        mock_result_all.scalars().all.return_value = [record_old, record_new]  # 昇順
-
-        mock_db_session.execute.side_effect = [mock_result_list, mock_result_all]
-
-        service = FuelRecordService(mock_db_session)
-        records = await service.list_fuel_records(user_id=user_id, vehicle_id=vehicle_id)
-
         assert len(records) == 1
         # 走行距離 = 1000 - 500 = 500km
         assert records[0].distance_traveled == 500
@@ -181,43 +220,176 @@ class TestFuelRecordServiceFuelEfficiencyCalculation:
     @pytest.mark.asyncio
     async def test_fuel_efficiency_rounding(self, mock_db_session: AsyncMock) -> None:
         """燃費は小数点2桁で丸められる."""
-        user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
-        vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
-        now = datetime.now(JST)
+        old_id = UUID("550e8400-e29b-41d4-a716-446655440101")
+        new_id = UUID("550e8400-e29b-41d4-a716-446655440102")
+        record_old = self.record(old_id, 1000, 8500)
+        record_new = self.record(new_id, 1450, 8330)  # 49.0L
 
-        record1 = FuelRecord(
-            id=UUID("550e8400-e29b-41d4-a716-446655440101"),
-            vehicle_id=vehicle_id,
-            user_id=user_id,
-            refuel_datetime=now,
-            total_mileage=450,
+        records = await self.list_records(
+            mock_db_session, [record_new], [record_old, record_new]
+        )
+
+        # 給油量 = 8330 / 170 = 49.0
+        assert records[0].fuel_amount == 49.0
+        # 燃費 = 450 / 49.0 = 9.18367... → 9.18
+        assert records[0].fuel_efficiency == 9.18
+
+    @pytest.mark.asyncio
+    async def test_partial_fills_are_summed_until_next_full_tank(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """一部給油の給油量は次の満タン給油の区間に合算し、一部給油自体の燃費は None."""
+        full = self.record(UUID("550e8400-e29b-41d4-a716-446655440101"), 1000, 8500)
+        partial = self.record(
+            UUID("550e8400-e29b-41d4-a716-446655440102"),
+            1200,
+            3400,  # 20L
+            is_full_tank=False,
+        )
+        next_full = self.record(
+            UUID("550e8400-e29b-41d4-a716-446655440103"), 1600, 5100  # 30L
+        )
+
+        records = await self.list_records(
+            mock_db_session, [next_full, partial], [full, partial, next_full]
+        )
+
+        assert [r.distance_traveled for r in records] == [400, 200]
+        assert [r.fuel_amount for r in records] == [30.0, 20.0]
+        # (1600 - 1000)km / (20 + 30)L
+        assert [r.fuel_efficiency for r in records] == [12.0, None]
+
+
+class TestFuelRecordServiceListFuelRecordRows:
+    """list_fuel_record_rows メソッドテスト."""
+
+    # FUEL_RECORD_ROW_COLUMNS を select した行
+    Row = namedtuple("Row", [column.key for column in FUEL_RECORD_ROW_COLUMNS])
+
+    user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
+    vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
+
+    def row(
+        self, record_id: UUID, refuel_datetime: datetime, total_mileage: int
+    ) -> tuple:
+        """燃費記録 1 件分の行."""
+        return self.Row(
+            id=record_id,
+            vehicle_id=self.vehicle_id,
+            user_id=self.user_id,
+            refuel_datetime=refuel_datetime,
+            total_mileage=total_mileage,
             fuel_type="ハイオク",
             unit_price=170,
-            total_cost=8330,  # 8330 / 170 = 49.0
-            created_at=now,
-            updated_at=now,
+            total_cost=8500,
+            is_full_tank=True,
+            gas_station_name=None,
+            created_at=refuel_datetime,
+            updated_at=refuel_datetime,
         )
 
-        mock_result = MagicMock()
-        mock_result.scalars().all.return_value = [record1]
-        mock_db_session.execute.return_value = mock_result
+    @pytest.mark.asyncio
+    async def test_calculates_from_projected_history(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """燃費計算の履歴は計算に使う列だけを取得して計算する."""
+        now = datetime(2026, 5, 1, tzinfo=JST)
+        new_id = UUID("550e8400-e29b-41d4-a716-446655440102")
+        old_id = UUID("550e8400-e29b-41d4-a716-446655440101")
+        page = MagicMock()
+        page.all.return_value = [self.row(new_id, now, 1000)]
+        history = history_result(
+            HistoryRow(old_id, 500, 8500, 170, True),
+            HistoryRow(new_id, 1000, 8500, 170, True),
+        )
+        mock_db_session.execute.side_effect = [page, history]
 
         service = FuelRecordService(mock_db_session)
-        records = await service.list_fuel_records(user_id=user_id, vehicle_id=vehicle_id)
+        rows = await service.list_fuel_record_rows(
+            user_id=self.user_id, vehicle_id=self.vehicle_id
+        )
 
-        assert len(records) == 1
-        # 給油量 = 8330 / 170 = 49.0
-        assert records[0].fuel_amount == 49.0
-        # 燃費 = 450 / 49.0 = 9.18367... → 9.18
-        assert records[0].fuel_efficiency == 9.18
+        assert len(rows) == 1
+        assert rows[0].id == new_id
+        assert rows[0].created_at == now
+        # (1000 - 500)km / (8500 / 170)L
+        assert (rows[0].distance_traveled, rows[0].fuel_amount) == (500, 50.0)
+        assert rows[0].fuel_efficiency == 10.0
+
+        page_sql, history_sql = (
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in mock_db_session.execute.call_args_list
+        )
+        assert "fuel_record.deleted_at" not in page_sql.split("FROM")[0]
+        assert history_sql.startswith(
+            "SELECT fuel_record.id, fuel_record.total_mileage, fuel_record.total_cost, "
+            "fuel_record.unit_price, fuel_record.is_full_tank \nFROM"
+        )
+
+    @pytest.mark.asyncio
+    async def test_without_vehicle_uses_window_query(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """車を指定しない場合は、全車の燃費を 1 回の窓関数クエリで計算する."""
+        now = datetime(2026, 5, 1, tzinfo=JST)
+        WindowRow = namedtuple(
+            "WindowRow",
+            [
+                *self.Row._fields[:-2],
+                "created_at",
+                "updated_at",
+                "distance_traveled",
+                "full_tanks_before",
+                "interval_distance",
+                "interval_centilitres",
+                "interval_unknown",
+            ],
+        )
+        full = self.row(UUID("550e8400-e29b-41d4-a716-446655440102"), now, 1600)
+        first = self.row(UUID("550e8400-e29b-41d4-a716-446655440101"), now, 500)
+        page = MagicMock()
+        page.all.return_value = [
+            # 直前の満タン給油から 600km、その間に 30L + 50L
+            WindowRow(*full, 400, 1, 600, 8000, 0),
+            # 車の最初の満タン給油
+            WindowRow(*first, 500, 0, 500, 5000, 0),
+        ]
+        mock_db_session.execute.return_value = page
+
+        service = FuelRecordService(mock_db_session)
+        rows = await service.list_fuel_record_rows(user_id=self.user_id)
+
+        assert [r.distance_traveled for r in rows] == [400, 500]
+        assert [r.fuel_amount for r in rows] == [50.0, 50.0]
+        assert [r.fuel_efficiency for r in rows] == [7.5, None]
+        assert rows[0].updated_at == now
+        mock_db_session.execute.assert_called_once()
+        sql = str(
+            mock_db_session.execute.call_args.args[0].compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert (
+            "lag(fuel_record.total_mileage, %(lag_1)s, %(lag_2)s) OVER "
+            "(PARTITION BY fuel_record.vehicle_id "
+            "ORDER BY fuel_record.refuel_datetime, fuel_record.id)"
+        ) in sql
+        assert "count(*) FILTER (WHERE fuel_record.is_full_tank) OVER" in sql
+        assert (
+            "OVER (PARTITION BY history.vehicle_id, history.full_tanks_before)"
+        ) in sql
+        assert "fuel_record.vehicle_id =" not in sql
+        assert ") AS history ORDER BY history.refuel_datetime DESC \n LIMIT" in sql
 
 
 class TestFuelRecordServiceCreateFuelRecord:
     """FuelRecordService.create_fuel_record テスト."""
 
     @pytest.mark.asyncio
-    async def test_create_fuel_record_success(self, mock_db_session: AsyncMock) -> None:
-        """燃費記録作成成功."""
+    async def test_create_fuel_record_success(
+        self, mock_db_session: AsyncMock, rollups: AsyncMock
+    ) -> None:
+        """燃費記録作成成功（期間別集計に追加する）."""
         user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
         vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
         now = datetime.now(JST)
@@ -239,6 +411,7 @@ class TestFuelRecordServiceCreateFuelRecord:
         assert result.user_id == user_id
         assert result.vehicle_id == vehicle_id
         assert result.fuel_type == "ハイオク"
+        rollups.record_added.assert_awaited_once_with(RollupRecord.of(result))
 
     @pytest.mark.asyncio
     async def test_create_fuel_record_with_minimal_fields(
@@ -269,8 +442,10 @@ class TestFuelRecordServiceUpdateFuelRecord:
     """FuelRecordService.update_fuel_record テスト."""
 
     @pytest.mark.asyncio
-    async def test_update_fuel_record_success(self, mock_db_session: AsyncMock) -> None:
-        """燃費記録更新成功."""
+    async def test_update_fuel_record_success(
+        self, mock_db_session: AsyncMock, rollups: AsyncMock
+    ) -> None:
+        """燃費記録更新成功（期間別集計に更新前後の値を渡す）."""
         user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
         vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
         fuel_record_id = UUID("550e8400-e29b-41d4-a716-446655440101")
@@ -293,7 +468,8 @@ class TestFuelRecordServiceUpdateFuelRecord:
         mock_result.scalar_one_or_none.return_value = fuel_record
         mock_db_session.execute.return_value = mock_result
 
-        fuel_record_update = FuelRecordUpdate(fuel_type="レギュラー")
+        before = RollupRecord.of(fuel_record)
+        fuel_record_update = FuelRecordUpdate(fuel_type="レギュラー", total_cost=7000)
 
         service = FuelRecordService(mock_db_session)
         result = await service.update_fuel_record(
@@ -302,14 +478,20 @@ class TestFuelRecordServiceUpdateFuelRecord:
 
         assert result is not None
         assert result.fuel_type == "レギュラー"
+        rollups.record_updated.assert_awaited_once_with(
+            before, RollupRecord.of(fuel_record)
+        )
+        assert rollups.record_updated.await_args.args[1].total_cost == 7000
 
 
 class TestFuelRecordServiceDeleteFuelRecord:
     """FuelRecordService.delete_fuel_record テスト."""
 
     @pytest.mark.asyncio
-    async def test_delete_fuel_record_success(self, mock_db_session: AsyncMock) -> None:
-        """燃費記録削除成功."""
+    async def test_delete_fuel_record_success(
+        self, mock_db_session: AsyncMock, rollups: AsyncMock
+    ) -> None:
+        """燃費記録削除成功（期間別集計から除く）."""
         user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
         vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
         fuel_record_id = UUID("550e8400-e29b-41d4-a716-446655440101")
@@ -337,3 +519,266 @@ class TestFuelRecordServiceDeleteFuelRecord:
 
         assert result is True
         assert fuel_record.deleted_at is not None
+        rollups.record_removed.assert_awaited_once_with(RollupRecord.of(fuel_record))
+
+
+class TestFuelRecordServicePartitioning:
+    """fuel_record パーティション対応のテスト."""
+
+    @pytest.fixture(autouse=True)
+    def clear_known_partition_years(self) -> None:
+        """プロセス内のパーティションキャッシュを初期化."""
+        _known_partition_years.clear()
+
+    @staticmethod
+    def _executed_sql(mock_db_session: AsyncMock) -> list[str]:
+        return [
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in mock_db_session.execute.call_args_list
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_ensures_partition_once_per_year(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """未確認の年への作成時のみパーティション作成関数を呼ぶ."""
+        fuel_record_create = FuelRecordCreate(
+            vehicle_id=UUID("550e8400-e29b-41d4-a716-446655440001"),
+            refuel_datetime=datetime(2026, 12, 31, 23, 30, tzinfo=JST),
+            total_mileage=100,
+            fuel_type="ハイオク",
+            unit_price=165,
+            total_cost=6600,
+        )
+        user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
+        service = FuelRecordService(mock_db_session)
+
+        await service.create_fuel_record(fuel_record_create, user_id)
+        await service.create_fuel_record(fuel_record_create, user_id)
+
+        sql = self._executed_sql(mock_db_session)
+        assert len(sql) == 1
+        assert "ensure_fuel_record_partition" in sql[0]
+        assert _known_partition_years == {2026}
+
+    @pytest.mark.asyncio
+    async def test_partition_year_uses_jst(self, mock_db_session: AsyncMock) -> None:
+        """パーティションの年は JST で判定する."""
+        service = FuelRecordService(mock_db_session)
+
+        year = await service._ensure_partition(
+            datetime(2026, 12, 31, 16, 0, tzinfo=timezone.utc)
+        )
+
+        assert year == 2027
+
+    @pytest.mark.asyncio
+    async def test_update_refuel_datetime_ensures_partition(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """給油日時を変更する更新ではパーティションを確認する."""
+        now = datetime(2026, 5, 1, tzinfo=JST)
+        fuel_record = FuelRecord(
+            id=UUID("550e8400-e29b-41d4-a716-446655440101"),
+            vehicle_id=UUID("550e8400-e29b-41d4-a716-446655440001"),
+            user_id=UUID("550e8400-e29b-41d4-a716-446655440000"),
+            refuel_datetime=now,
+            total_mileage=100,
+            fuel_type="ハイオク",
+            unit_price=165,
+            total_cost=6600,
+            created_at=now,
+            updated_at=now,
+        )
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = fuel_record
+        mock_db_session.execute.return_value = mock_result
+
+        service = FuelRecordService(mock_db_session)
+        await service.update_fuel_record(
+            fuel_record.id,
+            FuelRecordUpdate(refuel_datetime=datetime(2025, 3, 1, tzinfo=JST)),
+            fuel_record.user_id,
+        )
+
+        sql = self._executed_sql(mock_db_session)
+        assert "ensure_fuel_record_partition" in sql[-1]
+        assert _known_partition_years == {2025}
+
+
+    @pytest.mark.asyncio
+    async def test_create_retries_when_partition_was_detached(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """確認済みの年のパーティションが切り離されていた場合は作り直して再実行する."""
+        _known_partition_years.add(2026)
+        missing = MagicMock(sqlstate="23514")
+        mock_db_session.commit.side_effect = [
+            IntegrityError("INSERT INTO fuel_record", {}, missing),
+            None,
+        ]
+        service = FuelRecordService(mock_db_session)
+
+        await service.create_fuel_record(
+            FuelRecordCreate(
+                vehicle_id=UUID("550e8400-e29b-41d4-a716-446655440001"),
+                refuel_datetime=datetime(2026, 5, 1, tzinfo=JST),
+                total_mileage=100,
+                fuel_type="ハイオク",
+                unit_price=165,
+                total_cost=6600,
+            ),
+            UUID("550e8400-e29b-41d4-a716-446655440000"),
+        )
+
+        mock_db_session.rollback.assert_awaited_once()
+        sql = self._executed_sql(mock_db_session)
+        assert len(sql) == 1
+        assert "ensure_fuel_record_partition" in sql[0]
+        assert mock_db_session.add.call_count == 2
+        assert _known_partition_years == {2026}
+
+    @pytest.mark.asyncio
+    async def test_other_integrity_errors_are_raised(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """パーティション以外の整合性エラーは再実行しない."""
+        _known_partition_years.add(2026)
+        mock_db_session.commit.side_effect = IntegrityError(
+            "INSERT INTO fuel_record", {}, MagicMock(sqlstate="23505")
+        )
+        service = FuelRecordService(mock_db_session)
+
+        with pytest.raises(IntegrityError):
+            await service.create_fuel_record(
+                FuelRecordCreate(
+                    vehicle_id=UUID("550e8400-e29b-41d4-a716-446655440001"),
+                    refuel_datetime=datetime(2026, 5, 1, tzinfo=JST),
+                    total_mileage=100,
+                    fuel_type="ハイオク",
+                    unit_price=165,
+                    total_cost=6600,
+                ),
+                UUID("550e8400-e29b-41d4-a716-446655440000"),
+            )
+
+        mock_db_session.rollback.assert_not_awaited()
+
+
+class TestFuelRecordServiceFuelHistoryCache:
+    """燃費計算結果の車ごとのキャッシュのテスト."""
+
+    user_id = UUID("550e8400-e29b-41d4-a716-446655440000")
+    vehicle_id = UUID("550e8400-e29b-41d4-a716-446655440001")
+    history = (
+        HistoryRow(UUID("550e8400-e29b-41d4-a716-446655440101"), 500, 8500, 170, True),
+        HistoryRow(UUID("550e8400-e29b-41d4-a716-446655440102"), 1000, 8500, 170, True),
+    )
+
+    @pytest.fixture(autouse=True)
+    def shared_cache(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """共有のレスポンスキャッシュ（redis）が有効な状態にする."""
+        cache = MagicMock(shared=True, bump=AsyncMock())
+        cache.version = AsyncMock(return_value=b"v1")
+        monkeypatch.setattr(fuel_record_service, "response_cache", cache)
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_history_is_loaded_once_per_vehicle(
+        self, mock_db_session: AsyncMock, history_cache: FuelHistoryCache
+    ) -> None:
+        """2 回目以降は履歴を取得せずにキャッシュ済みの結果を使う."""
+        mock_db_session.execute.return_value = history_result(*self.history)
+        service = FuelRecordService(mock_db_session)
+
+        first = await service.get_fuel_history(self.user_id, self.vehicle_id)
+        second = await service.get_fuel_history(self.user_id, self.vehicle_id)
+
+        assert second is first
+        assert first.get(self.history[1].id) == (500, 50.0, 10.0)
+        mock_db_session.execute.assert_called_once()
+        history_sql = str(
+            mock_db_session.execute.call_args.args[0].compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert "fuel_record.vehicle_id = %(vehicle_id_1)s" in history_sql
+        assert history_sql.endswith(
+            "ORDER BY fuel_record.refuel_datetime ASC, fuel_record.id ASC"
+        )
+        assert len(history_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_vehicle(
+        self, mock_db_session: AsyncMock, history_cache: FuelHistoryCache
+    ) -> None:
+        """燃費記録の作成で同じ車のキャッシュを無効化する."""
+        mock_db_session.execute.return_value = history_result(*self.history)
+        service = FuelRecordService(mock_db_session)
+        await service.get_fuel_history(self.user_id, self.vehicle_id)
+        _known_partition_years.add(2026)
+
+        await service.create_fuel_record(
+            FuelRecordCreate(
+                vehicle_id=self.vehicle_id,
+                refuel_datetime=datetime(2026, 5, 1, tzinfo=JST),
+                total_mileage=1500,
+                fuel_type="ハイオク",
+                unit_price=170,
+                total_cost=8500,
+                is_full_tank=True,
+            ),
+            self.user_id,
+        )
+
+        assert len(history_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_is_not_cached(
+        self, mock_db_session: AsyncMock, history_cache: FuelHistoryCache
+    ) -> None:
+        """履歴の取得中に無効化された場合は、取得した結果をキャッシュしない."""
+
+        async def execute(*args: object, **kwargs: object) -> MagicMock:
+            history_cache.invalidate(self.user_id, self.vehicle_id)
+            return history_result(*self.history)
+
+        mock_db_session.execute.side_effect = execute
+        service = FuelRecordService(mock_db_session)
+
+        await service.get_fuel_history(self.user_id, self.vehicle_id)
+
+        assert len(history_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_write_on_other_worker_is_detected(
+        self, mock_db_session: AsyncMock, shared_cache: MagicMock
+    ) -> None:
+        """共有のバージョンが変わった場合は履歴を取得し直す."""
+        mock_db_session.execute.return_value = history_result(*self.history)
+        service = FuelRecordService(mock_db_session)
+
+        await service.get_fuel_history(self.user_id, self.vehicle_id)
+        shared_cache.version.return_value = b"v2"
+        await service.get_fuel_history(self.user_id, self.vehicle_id)
+
+        assert mock_db_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_cached_without_shared_cache(
+        self,
+        mock_db_session: AsyncMock,
+        shared_cache: MagicMock,
+        history_cache: FuelHistoryCache,
+    ) -> None:
+        """バージョンがプロセス内にしかない場合（none・memory）はキャッシュしない."""
+        shared_cache.shared = False
+        mock_db_session.execute.return_value = history_result(*self.history)
+        service = FuelRecordService(mock_db_session)
+
+        await service.get_fuel_history(self.user_id, self.vehicle_id)
+        await service.get_fuel_history(self.user_id, self.vehicle_id)
+
+        assert mock_db_session.execute.call_count == 2
+        assert len(history_cache) == 0
+        shared_cache.version.assert_not_called()
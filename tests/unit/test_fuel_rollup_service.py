@@ -0,0 +1,189 @@
+"""FuelRollupService（燃費記録の期間別集計）のユニットテスト."""
+
+from collections import namedtuple
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.base import JST
+from app.services.fuel_rollup_service import (
+    FuelRollupService,
+    RollupRecord,
+    fuel_centilitres,
+    period_start,
+    rollup_deltas,
+)
+
+TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+TEST_VEHICLE_ID = UUID("550e8400-e29b-41d4-a716-446655440001")
+
+# list_rollups で select する行
+RollupRow = namedtuple(
+    "RollupRow",
+    [
+        "period_start",
+        "record_count",
+        "total_cost",
+        "fuel_centilitres",
+        "distance_traveled",
+    ],
+)
+
+
+def rollup_record(
+    refuel_datetime: datetime, total_mileage: int, total_cost: int = 3400
+) -> RollupRecord:
+    """単価 170 円の記録."""
+    return RollupRecord(
+        id=UUID("550e8400-e29b-41d4-a716-446655440101"),
+        vehicle_id=TEST_VEHICLE_ID,
+        user_id=TEST_USER_ID,
+        refuel_datetime=refuel_datetime,
+        total_mileage=total_mileage,
+        total_cost=total_cost,
+        unit_price=170,
+    )
+
+
+class TestPeriods:
+    """期間と給油量の計算のテストケース."""
+
+    def test_period_start_uses_jst(self) -> None:
+        """期間は JST の日付で決まり、週は月曜日から始まる."""
+        # JST では 2026-06-01（月）00:30
+        refuel_datetime = datetime(2026, 5, 31, 15, 30, tzinfo=timezone.utc)
+
+        assert period_start(refuel_datetime, "month") == date(2026, 6, 1)
+        assert period_start(refuel_datetime, "week") == date(2026, 6, 1)
+        sunday = datetime(2026, 6, 7, tzinfo=JST)
+        assert period_start(sunday, "week") == date(2026, 6, 1)
+
+    def test_fuel_centilitres_rounds_half_up(self) -> None:
+        """給油量は 0.01L 単位で四捨五入した整数."""
+        assert fuel_centilitres(8500, 170) == 5000
+        assert fuel_centilitres(4436, 160) == 2773  # 27.725L
+        assert fuel_centilitres(1000, 0) == 0
+
+
+class TestRollupDeltas:
+    """rollup_deltas のテストケース."""
+
+    def test_insert_between_records(self) -> None:
+        """間への追加では、次の給油の走行距離も付け替える."""
+        record = rollup_record(datetime(2026, 5, 20, tzinfo=JST), 1200)
+        following = (1600, datetime(2026, 6, 3, tzinfo=JST))
+
+        deltas = rollup_deltas(record, 1000, following, sign=1)
+
+        assert deltas == {
+            ("month", date(2026, 5, 1)): [1, 3400, 2000, 200],
+            ("week", date(2026, 5, 18)): [1, 3400, 2000, 200],
+            # 次の給油: 1600 - 1000 = 600km → 1600 - 1200 = 400km
+            ("month", date(2026, 6, 1)): [0, 0, 0, -200],
+            ("week", date(2026, 6, 1)): [0, 0, 0, -200],
+        }
+
+    def test_remove_is_inverse_of_insert(self) -> None:
+        """削除は同じ前後の給油での追加を打ち消す."""
+        record = rollup_record(datetime(2026, 5, 20, tzinfo=JST), 1200)
+        following = (1600, datetime(2026, 5, 21, tzinfo=JST))
+
+        added = rollup_deltas(record, 1000, following, sign=1)
+        removed = rollup_deltas(record, 1000, following, sign=-1)
+
+        # 同じ月に次の給油があれば、走行距離の差分は打ち消し合う
+        assert added[("month", date(2026, 5, 1))] == [1, 3400, 2000, 0]
+        assert {key: [-v for v in values] for key, values in added.items()} == removed
+
+    def test_first_record(self) -> None:
+        """車の最初の給油の走行距離は 0 で、次の給油が最初でなくなる."""
+        record = rollup_record(datetime(2026, 5, 20, tzinfo=JST), 1200)
+        following = (1600, datetime(2026, 7, 1, tzinfo=JST))
+
+        deltas = rollup_deltas(record, None, following, sign=1)
+
+        assert deltas[("month", date(2026, 5, 1))] == [1, 3400, 2000, 0]
+        assert deltas[("month", date(2026, 7, 1))] == [0, 0, 0, 400]
+
+
+class TestFuelRollupService:
+    """FuelRollupService のテストケース."""
+
+    async def test_record_added_upserts_affected_periods(self) -> None:
+        """前後の給油を取得し、影響する期間の行だけを加算で upsert する."""
+        previous = MagicMock()
+        previous.scalar_one_or_none.return_value = 1000
+        following = MagicMock()
+        following.one_or_none.return_value = None
+        session = AsyncMock()
+        session.execute.side_effect = [MagicMock(), previous, following, MagicMock()]
+
+        await FuelRollupService(session).record_added(
+            rollup_record(datetime(2026, 5, 20, tzinfo=JST), 1200)
+        )
+
+        lock, previous_sql, following_sql, upsert = (
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in session.execute.call_args_list
+        )
+        assert "pg_advisory_xact_lock(hashtext(" in lock
+        assert "(fuel_record.refuel_datetime, fuel_record.id) <" in previous_sql
+        assert "fuel_record.id != %(id_1)s" in previous_sql
+        assert "(fuel_record.refuel_datetime, fuel_record.id) >" in following_sql
+        assert upsert.startswith("INSERT INTO fuel_rollup")
+        assert (
+            "ON CONFLICT (vehicle_id, granularity, period_start) DO UPDATE SET "
+            "record_count = (fuel_rollup.record_count + excluded.record_count)"
+        ) in upsert
+        params = session.execute.call_args_list[3].args[0].compile().params
+        assert sorted(v for k, v in params.items() if k.startswith("period_start")) == [
+            date(2026, 5, 1),
+            date(2026, 5, 18),
+        ]
+
+    async def test_record_updated_without_changes(self) -> None:
+        """集計に関わる値が変わらない更新では何もしない."""
+        session = AsyncMock()
+        record = rollup_record(datetime(2026, 5, 20, tzinfo=JST), 1200)
+
+        await FuelRollupService(session).record_updated(record, record)
+
+        session.execute.assert_not_called()
+
+    async def test_list_rollups(self) -> None:
+        """給油量は L、平均単価は給油量で重み付けして返す."""
+        result = MagicMock()
+        result.all.return_value = [
+            RollupRow(date(2026, 5, 1), 2, 11900, 7000, 600),
+            RollupRow(date(2026, 6, 1), 1, 0, 0, 300),
+        ]
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        rows = await FuelRollupService(session).list_rollups(
+            TEST_USER_ID, TEST_VEHICLE_ID, "month"
+        )
+
+        assert rows[0].fuel_amount == 70.0
+        assert rows[0].average_unit_price == 170.0
+        assert rows[1].average_unit_price is None
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "fuel_rollup.record_count > %(record_count_1)s" in sql
+        assert sql.endswith("ORDER BY fuel_rollup.period_start ASC")
+
+
+@pytest.mark.parametrize("sign", [1, -1])
+def test_deltas_are_balanced(sign: int) -> None:
+    """前後の給油がある場合、走行距離の差分の合計は 0."""
+    record = rollup_record(datetime(2026, 5, 20, tzinfo=JST), 1200)
+    following = (1600, datetime(2026, 8, 1, tzinfo=JST))
+    deltas = rollup_deltas(record, 1000, following, sign)
+
+    monthly = [values[3] for key, values in deltas.items() if key[0] == "month"]
+
+    # 前後の給油の間の距離（600km）は追加前後で変わらない
+    assert sum(monthly) == 0
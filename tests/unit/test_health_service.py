@@ -0,0 +1,135 @@
+"""HealthChecker（readiness チェック）のユニットテスト."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.health_service import HealthChecker
+
+
+class FakeClock:
+    """手動で進められる時計."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_mock_engine(checkedout: int = 0) -> MagicMock:
+    """engine.connect() と pool.checkedout() をモックしたエンジン."""
+    conn = AsyncMock()
+    connect_cm = MagicMock()
+    connect_cm.__aenter__ = AsyncMock(return_value=conn)
+    connect_cm.__aexit__ = AsyncMock(return_value=False)
+
+    engine = MagicMock()
+    engine.connect.return_value = connect_cm
+    engine.pool.checkedout.return_value = checkedout
+    engine.conn = conn
+    return engine
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """テスト用の時計."""
+    return FakeClock()
+
+
+class TestHealthCheckerReadiness:
+    """HealthChecker.check_readiness() のテストケース."""
+
+    async def test_ready_when_db_responds(self, clock: FakeClock) -> None:
+        """DB ping が成功しプールに余裕があれば ready."""
+        engine = create_mock_engine()
+        checker = HealthChecker(engine, pool_capacity=15, clock=clock)
+
+        result = await checker.check_readiness()
+
+        assert result.ready is True
+        assert result.checks == {"pool": "ok", "database": "ok"}
+        engine.conn.execute.assert_awaited_once()
+
+    async def test_result_is_cached_within_interval(self, clock: FakeClock) -> None:
+        """キャッシュ間隔内のプローブは DB に問い合わせない."""
+        engine = create_mock_engine()
+        checker = HealthChecker(engine, pool_capacity=15, cache_interval=5, clock=clock)
+
+        await checker.check_readiness()
+        clock.now += 4
+        await checker.check_readiness()
+
+        assert engine.connect.call_count == 1
+
+    async def test_cache_expires_after_interval(self, clock: FakeClock) -> None:
+        """キャッシュ間隔を過ぎると再チェックする."""
+        engine = create_mock_engine()
+        checker = HealthChecker(engine, pool_capacity=15, cache_interval=5, clock=clock)
+
+        await checker.check_readiness()
+        clock.now += 5
+        await checker.check_readiness()
+
+        assert engine.connect.call_count == 2
+
+    async def test_concurrent_probes_share_one_check(self, clock: FakeClock) -> None:
+        """同時に来たプローブは 1 回のチェック結果を共有する."""
+        engine = create_mock_engine()
+        checker = HealthChecker(engine, pool_capacity=15, clock=clock)
+
+        results = await asyncio.gather(*(checker.check_readiness() for _ in range(5)))
+
+        assert all(result.ready for result in results)
+        assert engine.connect.call_count == 1
+
+    async def test_not_ready_when_pool_exhausted(self, clock: FakeClock) -> None:
+        """プール枯渇時は DB に接続せず not ready."""
+        engine = create_mock_engine(checkedout=15)
+        checker = HealthChecker(engine, pool_capacity=15, clock=clock)
+
+        result = await checker.check_readiness()
+
+        assert result.ready is False
+        assert result.checks == {"pool": "exhausted", "database": "skipped"}
+        engine.connect.assert_not_called()
+
+    async def test_not_ready_when_db_fails(self, clock: FakeClock) -> None:
+        """DB ping が失敗した場合は not ready."""
+        engine = create_mock_engine()
+        engine.conn.execute.side_effect = OSError("connection refused")
+        checker = HealthChecker(engine, pool_capacity=15, clock=clock)
+
+        result = await checker.check_readiness()
+
+        assert result.ready is False
+        assert result.checks["database"] == "error"
+
+    async def test_not_ready_when_db_times_out(self, clock: FakeClock) -> None:
+        """DB ping がタイムアウトした場合は not ready."""
+
+        async def slow_execute(*args, **kwargs) -> None:
+            await asyncio.sleep(1)
+
+        engine = create_mock_engine()
+        engine.conn.execute.side_effect = slow_execute
+        checker = HealthChecker(engine, pool_capacity=15, timeout=0.01, clock=clock)
+
+        result = await checker.check_readiness()
+
+        assert result.ready is False
+        assert result.checks["database"] == "timeout"
+
+    async def test_not_ready_while_draining(self, clock: FakeClock) -> None:
+        """ドレイン中はキャッシュに関係なく not ready."""
+        engine = create_mock_engine()
+        checker = HealthChecker(engine, pool_capacity=15, clock=clock)
+        await checker.check_readiness()
+
+        checker.start_draining()
+        result = await checker.check_readiness()
+
+        assert checker.draining is True
+        assert result.ready is False
+        assert result.checks == {"app": "draining"}
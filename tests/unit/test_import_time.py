@@ -0,0 +1,83 @@
+"""app.main の import 時間（コールドスタート）のユニットテスト."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# app.main の import にかける時間の上限（ミリ秒）。CI 環境に合わせて環境変数で調整可能
+IMPORT_TIME_BUDGET_MS = int(os.environ.get("IMPORT_TIME_BUDGET_MS", "2000"))
+
+# 起動時には読み込まず、初回利用時まで遅延させるモジュール
+LAZY_MODULES = ("httpx", "passlib")
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """新しいインタプリタでコードを実行（import キャッシュの影響を受けない）."""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_cumulative_us(importtime_output: str, module: str) -> int:
+    """`-X importtime` の出力からモジュールの累積 import 時間（µs）を取得."""
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        if name == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} の import 時間が出力に含まれていません")
+
+
+class TestImportTime:
+    """app.main の import 時間のテストケース."""
+
+    def test_parse_cumulative_us(self) -> None:
+        """importtime の出力行から累積時間を取り出せる."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        300 |   app.core\n"
+            "import time:      1500 |     900000 | app.main\n"
+        )
+        assert parse_cumulative_us(output, "app.main") == 900000
+
+    def test_import_app_main_within_budget(self) -> None:
+        """app.main の import が予算内に収まる."""
+        # 1 回目は .pyc 生成を含むため、計測は 2 回目の実行で行う
+        run_python("-c", "import app.main")
+        result = run_python("-X", "importtime", "-c", "import app.main")
+
+        elapsed_ms = parse_cumulative_us(result.stderr, "app.main") / 1000
+        assert elapsed_ms < IMPORT_TIME_BUDGET_MS, (
+            f"app.main の import に {elapsed_ms:.0f}ms かかりました"
+            f"（予算 {IMPORT_TIME_BUDGET_MS}ms）"
+        )
+
+    def test_lazy_modules_not_imported_at_startup(self) -> None:
+        """OAuth クライアントやパスワードハッシュは起動時に読み込まれない."""
+        code = (
+            "import sys, app.main; "
+            f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+        )
+        result = run_python("-c", code)
+        assert result.stdout.strip() == ""
+
+    def test_no_settings_or_engine_at_import(self) -> None:
+        """import だけでは Settings もデータベースエンジンも生成しない."""
+        code = (
+            "import sys, app.main; "
+            "from app.core.config import get_settings; "
+            "from app.database import get_engine; "
+            "print(get_settings.cache_info().currsize, "
+            "get_engine.cache_info().currsize, 'asyncpg' in sys.modules)"
+        )
+        result = run_python("-c", code)
+        assert result.stdout.split() == ["0", "0", "False"]
@@ -0,0 +1,211 @@
+"""JobQueue / PostgresJobQueue のユニットテスト."""
+
+import asyncio
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.job_queue import (
+    JobQueue,
+    PostgresJobQueue,
+    QueuedJob,
+    get_job_queue,
+    job_handler,
+    retry_delay,
+)
+from app.utils.exceptions import ServiceUnavailableException
+
+TEST_JOB_ID = UUID("88888888-8888-8888-8888-888888888888")
+
+
+def create_session_factory(session: AsyncMock) -> MagicMock:
+    """async with session_factory() as session を返すファクトリ."""
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=session_cm)
+
+
+def create_queue(**kwargs: Any) -> JobQueue:
+    """再実行の待ちを 0 秒にしたキュー."""
+    options: Dict[str, Any] = {"workers": 2, "retry_backoff": 0, "max_attempts": 3}
+    options.update(kwargs)
+    return JobQueue(create_session_factory(AsyncMock()), **options)
+
+
+class TestRetryDelay:
+    """retry_delay() のテストケース."""
+
+    def test_exponential_backoff_with_cap(self) -> None:
+        """失敗ごとに 2 倍になり、上限で頭打ち."""
+        delays = [retry_delay(attempts, 1.0, 5.0) for attempts in range(1, 6)]
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+class TestJobQueue:
+    """JobQueue（プロセス内）のテストケース."""
+
+    async def test_runs_registered_job(self) -> None:
+        """積んだジョブをワーカーが payload 付きで実行する."""
+        queue = create_queue()
+        handler = AsyncMock()
+        queue.register("greet", handler)
+
+        await queue.start()
+        await queue.enqueue("greet", name="ynym")
+        await queue.stop(drain_timeout=1)
+
+        handler.assert_awaited_once()
+        assert handler.await_args.args[1] == {"name": "ynym"}
+
+    async def test_retries_until_success(self) -> None:
+        """失敗したジョブは再実行される."""
+        queue = create_queue()
+        handler = AsyncMock(side_effect=[OSError("db down"), OSError("db down"), None])
+        queue.register("flaky", handler)
+
+        await queue.start()
+        await queue.enqueue("flaky")
+        await queue.stop(drain_timeout=1)
+
+        assert handler.await_count == 3
+
+    async def test_gives_up_after_max_attempts(self) -> None:
+        """max_attempts 回失敗したジョブは破棄される."""
+        queue = create_queue(max_attempts=2)
+        handler = AsyncMock(side_effect=OSError("db down"))
+        queue.register("broken", handler)
+
+        await queue.start()
+        await queue.enqueue("broken")
+        await queue.stop(drain_timeout=1)
+
+        assert handler.await_count == 2
+
+    async def test_stop_drains_queued_jobs(self) -> None:
+        """停止時は積まれているジョブを処理してから終了する."""
+        queue = create_queue(workers=1)
+        done: list[int] = []
+
+        async def slow(session: Any, payload: Dict[str, Any]) -> None:
+            await asyncio.sleep(0.01)
+            done.append(payload["n"])
+
+        queue.register("slow", slow)
+        await queue.start()
+        for n in range(3):
+            await queue.enqueue("slow", n=n)
+        await queue.stop(drain_timeout=1)
+
+        assert done == [0, 1, 2]
+
+    async def test_stop_gives_up_after_timeout(self) -> None:
+        """drain_timeout を過ぎたらワーカーをキャンセルして終了する."""
+        queue = create_queue(workers=1)
+        queue.register("hang", AsyncMock(side_effect=lambda *_: asyncio.sleep(10)))
+
+        await queue.start()
+        await queue.enqueue("hang")
+        await asyncio.wait_for(queue.stop(drain_timeout=0.05), timeout=1)
+
+        assert not queue.running
+
+    async def test_enqueue_rejected_when_not_running(self) -> None:
+        """起動前・停止後（workers=0 を含む）は受け付けない."""
+        queue = create_queue(workers=0)
+        queue.register("noop", AsyncMock())
+
+        await queue.start()
+        with pytest.raises(ServiceUnavailableException):
+            await queue.enqueue("noop")
+
+    async def test_enqueue_rejected_when_full(self) -> None:
+        """キューが満杯なら受け付けない."""
+        queue = create_queue(workers=1, maxsize=1)
+        queue.register("hang", AsyncMock(side_effect=lambda *_: asyncio.sleep(10)))
+
+        await queue.start()
+        await queue.enqueue("hang")
+        await asyncio.sleep(0)  # 1 件目をワーカーが取り出す
+        await queue.enqueue("hang")
+        with pytest.raises(ServiceUnavailableException):
+            await queue.enqueue("hang")
+        await queue.stop(drain_timeout=0)
+
+    async def test_unknown_job_fails(self) -> None:
+        """未登録のジョブ名は ValueError."""
+        queue = create_queue()
+        await queue.start()
+
+        with pytest.raises(ValueError):
+            await queue.enqueue("missing")
+        await queue.stop(drain_timeout=0)
+
+
+class TestJobHandler:
+    """job_handler()（キューの生成前のハンドラ登録）のテストケース."""
+
+    def test_registers_on_queue_created_before_and_after(self) -> None:
+        """キューの生成前後どちらで登録したハンドラもキューに登録される."""
+        before, after = AsyncMock(), AsyncMock()
+        job_handler("test_registered_before")(before)
+        queue = get_job_queue()
+        job_handler("test_registered_after")(after)
+
+        assert queue._handlers["test_registered_before"] is before
+        assert queue._handlers["test_registered_after"] is after
+        with pytest.raises(ValueError):
+            job_handler("test_registered_after")(AsyncMock())
+
+
+class TestPostgresJobQueue:
+    """PostgresJobQueue（永続）のテストケース."""
+
+    async def test_claim_locks_one_job_and_extends_lease(self) -> None:
+        """SKIP LOCKED で 1 件取得し、試行回数と run_at（リース）を進める."""
+        row = MagicMock(id=TEST_JOB_ID, payload={"n": 1}, attempts=1)
+        row.name = "greet"
+        result = MagicMock()
+        result.one_or_none.return_value = row
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=result)
+        queue = PostgresJobQueue(create_session_factory(session), lease=60)
+
+        job = await queue._claim()
+
+        assert job is not None
+        assert (job.id, job.name, job.payload, job.attempts) == (
+            TEST_JOB_ID,
+            "greet",
+            {"n": 1},
+            1,
+        )
+        sql = str(
+            session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert sql.startswith("UPDATE job SET")
+        assert "attempts=(job.attempts +" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "job.failed_at IS NULL" in sql
+        assert "RETURNING job.id" in sql
+        session.commit.assert_awaited_once()
+
+    async def test_failed_job_is_rescheduled(self) -> None:
+        """失敗したジョブは行を残して run_at をバックオフ後へ戻す."""
+        session = AsyncMock()
+        queue = PostgresJobQueue(
+            create_session_factory(session), retry_backoff=2, max_attempts=3
+        )
+        queue.register("flaky", AsyncMock(side_effect=OSError("db down")))
+
+        await queue._process(QueuedJob(name="flaky", attempts=1, id=TEST_JOB_ID))
+
+        sql = str(
+            session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert sql.startswith("UPDATE job SET")
+        assert "run_at=(now() +" in sql
+        assert "last_error" in sql
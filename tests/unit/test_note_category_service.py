@@ -1,9 +1,11 @@
 """NoteCategoryService のユニットテスト."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.models.note_category import NoteCategory
 from app.schemas.note_category import NoteCategoryCreate, NoteCategoryUpdate
@@ -32,35 +34,69 @@ class TestNoteCategoryServiceListCategories:
         return AsyncMock()
 
     async def test_list_categories_empty(self, mock_db_session: AsyncMock) -> None:
-        """カテゴリが存在しない場合、空リストを返す."""
-        mock_db_session.execute = AsyncMock(return_value=create_mock_result([]))
+        """カテゴリが存在しない場合、空リストと未分類件数を返す."""
+        empty_result = MagicMock()
+        empty_result.all.return_value = []
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 3
+        mock_db_session.execute = AsyncMock(side_effect=[empty_result, count_result])
 
         service = NoteCategoryService(mock_db_session)
-        categories = await service.list_categories(TEST_USER_ID)
+        category_list = await service.list_categories(TEST_USER_ID)
 
-        assert categories == []
-        mock_db_session.execute.assert_called_once()
+        assert category_list.categories == []
+        assert category_list.uncategorized_count == 3
+        assert mock_db_session.execute.await_count == 2
 
     async def test_list_categories_with_multiple(
         self, mock_db_session: AsyncMock
     ) -> None:
-        """複数カテゴリが存在する場合、カテゴリリストを返す."""
+        """複数カテゴリが存在する場合、ノート件数付きのカテゴリリストを返す."""
         category1 = MagicMock(spec=NoteCategory)
         category1.name = "仕事"
 
         category2 = MagicMock(spec=NoteCategory)
         category2.name = "個人"
 
-        mock_db_session.execute = AsyncMock(
-            return_value=create_mock_result([category1, category2])
-        )
+        result = MagicMock()
+        result.all.return_value = [
+            SimpleNamespace(NoteCategory=category1, note_count=4, uncategorized_count=2),
+            SimpleNamespace(NoteCategory=category2, note_count=0, uncategorized_count=2),
+        ]
+        mock_db_session.execute = AsyncMock(return_value=result)
 
         service = NoteCategoryService(mock_db_session)
-        categories = await service.list_categories(TEST_USER_ID)
+        category_list = await service.list_categories(TEST_USER_ID)
+
+        assert len(category_list.categories) == 2
+        assert category_list.categories[0].category.name == "仕事"
+        assert category_list.categories[0].note_count == 4
+        assert category_list.categories[1].category.name == "個人"
+        assert category_list.categories[1].note_count == 0
+        assert category_list.uncategorized_count == 2
+        mock_db_session.execute.assert_called_once()
 
-        assert len(categories) == 2
-        assert categories[0].name == "仕事"
-        assert categories[1].name == "個人"
+    async def test_list_categories_counts_with_single_group_by(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """件数は 1 回の GROUP BY から求め、未分類は NULL グループから取得する."""
+        result = MagicMock()
+        result.all.return_value = [
+            SimpleNamespace(
+                NoteCategory=MagicMock(spec=NoteCategory),
+                note_count=1,
+                uncategorized_count=0,
+            )
+        ]
+        mock_db_session.execute = AsyncMock(return_value=result)
+
+        await NoteCategoryService(mock_db_session).list_categories(TEST_USER_ID)
+
+        stmt = mock_db_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.count("GROUP BY") == 1
+        assert "LEFT OUTER JOIN note_counts" in sql
+        assert "note_counts.category_id IS NULL" in sql
 
 
 class TestNoteCategoryServiceGetCategory:
@@ -167,10 +203,16 @@ class TestNoteCategoryServiceDeleteCategory:
         service.get_category = AsyncMock(return_value=category)
         mock_db_session.execute = AsyncMock()
         mock_db_session.delete = AsyncMock()
+        mock_db_session.add = MagicMock()
         mock_db_session.commit = AsyncMock()
 
         await service.delete_category(category_id, TEST_USER_ID)
 
-        mock_db_session.execute.assert_called_once()
+        assert mock_db_session.execute.await_count == 2
         mock_db_session.delete.assert_called_once_with(category)
+        params = mock_db_session.execute.call_args.args[0].compile().params
+        assert (params["resource_m0"], params["record_id_m0"]) == (
+            "note_category",
+            category_id,
+        )
         mock_db_session.commit.assert_called_once()
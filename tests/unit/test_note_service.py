@@ -1,14 +1,28 @@
 """NoteService のユニットテスト."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.models.note import Note
-from app.schemas.note import NoteCreate, NoteUpdate
+from app.schemas.note import (
+    NoteBodyEdit,
+    NoteBodyPatch,
+    NoteCreate,
+    NoteDetailResponse,
+    NoteResponse,
+    NoteUpdate,
+    compute_body_hash,
+)
 from app.services.note_service import NoteService
-from app.utils.exceptions import NotFoundException
+from app.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
 
 TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
 
@@ -34,7 +48,9 @@ class TestNoteServiceListNotes:
 
     async def test_list_notes_empty(self, mock_db_session: AsyncMock) -> None:
         """ノートが存在しない場合、空リストを返す."""
-        mock_db_session.execute = AsyncMock(return_value=create_mock_result([]))
+        result = MagicMock()
+        result.all.return_value = []
+        mock_db_session.execute = AsyncMock(return_value=result)
 
         service = NoteService(mock_db_session)
         notes = await service.list_notes(TEST_USER_ID)
@@ -45,23 +61,85 @@ class TestNoteServiceListNotes:
     async def test_list_notes_with_multiple_notes(
         self, mock_db_session: AsyncMock
     ) -> None:
-        """複数ノートが存在する場合、ノートリストを返す."""
+        """複数ノートが存在する場合、カテゴリ名付きのノートリストを返す."""
         note1 = MagicMock(spec=Note)
         note1.title = "ノート1"
 
         note2 = MagicMock(spec=Note)
         note2.title = "ノート2"
 
-        mock_db_session.execute = AsyncMock(
-            return_value=create_mock_result([note1, note2])
-        )
+        result = MagicMock()
+        result.all.return_value = [
+            SimpleNamespace(Note=note1, category_name="仕事"),
+            SimpleNamespace(Note=note2, category_name=None),
+        ]
+        mock_db_session.execute = AsyncMock(return_value=result)
 
         service = NoteService(mock_db_session)
         notes = await service.list_notes(TEST_USER_ID)
 
         assert len(notes) == 2
-        assert notes[0].title == "ノート1"
-        assert notes[1].title == "ノート2"
+        assert notes[0].note.title == "ノート1"
+        assert notes[0].category_name == "仕事"
+        assert notes[1].note.title == "ノート2"
+        assert notes[1].category_name is None
+
+    async def test_list_notes_selects_joined_category_name(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """並び替え用に結合したカテゴリ名を同じクエリで取得する."""
+        result = MagicMock()
+        result.all.return_value = []
+        mock_db_session.execute = AsyncMock(return_value=result)
+
+        await NoteService(mock_db_session).list_notes(TEST_USER_ID)
+
+        stmt = mock_db_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "note_categories.name AS category_name" in sql
+        assert "LEFT OUTER JOIN note_categories" in sql
+
+    async def test_list_notes_summary_defers_body(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """要約モードでは本文を取得せず、SQL で求めた抜粋のみ取得する."""
+        note = MagicMock(spec=Note)
+        result = MagicMock()
+        result.all.return_value = [
+            SimpleNamespace(Note=note, category_name=None, excerpt="先頭")
+        ]
+        mock_db_session.execute = AsyncMock(return_value=result)
+
+        notes = await NoteService(mock_db_session).list_notes(
+            TEST_USER_ID, summary=True, excerpt_length=20
+        )
+
+        assert notes[0].excerpt == "先頭"
+        stmt = mock_db_session.execute.call_args.args[0]
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        assert "left(notes.body, 20) AS excerpt" in sql
+        assert sql.count("notes.body") == 1
+        assert "notes.title" in sql
+
+    async def test_list_notes_full_mode_has_no_excerpt(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """通常モードでは本文を取得し、抜粋は計算しない."""
+        result = MagicMock()
+        result.all.return_value = []
+        mock_db_session.execute = AsyncMock(return_value=result)
+
+        await NoteService(mock_db_session).list_notes(TEST_USER_ID)
+
+        stmt = mock_db_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "notes.body" in sql
+        assert "left(" not in sql
 
 
 class TestNoteServiceGetNote:
@@ -202,6 +280,176 @@ class TestNoteServiceUpdateNote:
         mock_db_session.commit.assert_not_called()
 
 
+class TestNoteServicePatchNoteBody:
+    """NoteService.patch_note_body のテストケース."""
+
+    @pytest.fixture
+    def mock_db_session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @staticmethod
+    def _setup_note(mock_db_session: AsyncMock, body: str) -> MagicMock:
+        note = MagicMock(spec=Note)
+        note.id = UUID("66666666-6666-6666-6666-666666666666")
+        note.body = body
+
+        mock_result = MagicMock()
+        mock_result.scalars().one_or_none.return_value = note
+        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        mock_db_session.commit = AsyncMock()
+        mock_db_session.refresh = AsyncMock()
+        return note
+
+    async def test_patch_applies_edits_against_base(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """複数の範囲置換を更新前の位置基準で適用する."""
+        note = self._setup_note(mock_db_session, "今日は晴れ。明日は雨。")
+        patch = NoteBodyPatch(
+            base_hash=compute_body_hash("今日は晴れ。明日は雨。"),
+            edits=[
+                NoteBodyEdit(start=3, end=5, text="曇り"),
+                NoteBodyEdit(start=9, end=10, text="雪"),
+            ],
+        )
+
+        updated = await NoteService(mock_db_session).patch_note_body(
+            note.id, patch, TEST_USER_ID
+        )
+
+        assert updated.body == "今日は曇り。明日は雪。"
+        mock_db_session.commit.assert_awaited_once()
+
+    async def test_patch_locks_row(self, mock_db_session: AsyncMock) -> None:
+        """ハッシュ比較から更新までの間、行ロックを取得する."""
+        note = self._setup_note(mock_db_session, "本文")
+        patch = NoteBodyPatch(
+            base_hash=compute_body_hash("本文"),
+            edits=[NoteBodyEdit(start=2, end=2, text="追記")],
+        )
+
+        await NoteService(mock_db_session).patch_note_body(
+            note.id, patch, TEST_USER_ID
+        )
+
+        stmt = mock_db_session.execute.call_args.args[0]
+        assert "FOR UPDATE" in str(stmt.compile(dialect=postgresql.dialect()))
+
+    async def test_patch_with_stale_base_conflicts(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """基準の本文が更新されている場合は競合例外."""
+        note = self._setup_note(mock_db_session, "他の端末で更新された本文")
+        patch = NoteBodyPatch(
+            base_hash=compute_body_hash("古い本文"),
+            edits=[NoteBodyEdit(start=0, end=2, text="新しい")],
+        )
+
+        with pytest.raises(ConflictException):
+            await NoteService(mock_db_session).patch_note_body(
+                note.id, patch, TEST_USER_ID
+            )
+
+        mock_db_session.commit.assert_not_called()
+
+    async def test_patch_out_of_range_fails(self, mock_db_session: AsyncMock) -> None:
+        """本文の長さを超える範囲は検証例外."""
+        note = self._setup_note(mock_db_session, "短い")
+        patch = NoteBodyPatch(
+            base_hash=compute_body_hash("短い"),
+            edits=[NoteBodyEdit(start=1, end=10, text="x")],
+        )
+
+        with pytest.raises(ValidationException):
+            await NoteService(mock_db_session).patch_note_body(
+                note.id, patch, TEST_USER_ID
+            )
+
+        mock_db_session.commit.assert_not_called()
+
+    async def test_patch_to_empty_body_fails(self, mock_db_session: AsyncMock) -> None:
+        """本文が空になる差分は検証例外."""
+        note = self._setup_note(mock_db_session, "本文")
+        patch = NoteBodyPatch(
+            base_hash=compute_body_hash("本文"),
+            edits=[NoteBodyEdit(start=0, end=2, text="")],
+        )
+
+        with pytest.raises(ValidationException):
+            await NoteService(mock_db_session).patch_note_body(
+                note.id, patch, TEST_USER_ID
+            )
+
+    async def test_patch_offsets_are_utf16_code_units(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """位置はブラウザと同じ UTF-16 コードユニット単位（絵文字は 2 単位）."""
+        note = self._setup_note(mock_db_session, "🍣と🍺を買う")
+        patch = NoteBodyPatch(
+            base_hash=compute_body_hash("🍣と🍺を買う"),
+            # JavaScript: "🍣と🍺を買う".indexOf("🍺") === 3
+            edits=[NoteBodyEdit(start=3, end=5, text="🍵")],
+        )
+
+        updated = await NoteService(mock_db_session).patch_note_body(
+            note.id, patch, TEST_USER_ID
+        )
+
+        assert updated.body == "🍣と🍵を買う"
+
+    async def test_patch_inside_surrogate_pair_fails(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """サロゲートペアの途中を指す範囲は検証例外."""
+        note = self._setup_note(mock_db_session, "🍣と")
+        patch = NoteBodyPatch(
+            base_hash=compute_body_hash("🍣と"),
+            edits=[NoteBodyEdit(start=1, end=3, text="x")],
+        )
+
+        with pytest.raises(ValidationException):
+            await NoteService(mock_db_session).patch_note_body(
+                note.id, patch, TEST_USER_ID
+            )
+
+        mock_db_session.commit.assert_not_called()
+
+    def test_overlapping_edits_are_rejected(self) -> None:
+        """重複する範囲はスキーマで拒否する."""
+        with pytest.raises(ValueError):
+            NoteBodyPatch(
+                base_hash="0" * 64,
+                edits=[
+                    NoteBodyEdit(start=0, end=5, text="a"),
+                    NoteBodyEdit(start=4, end=6, text="b"),
+                ],
+            )
+
+
+class TestNoteResponseBodyHash:
+    """本文のバージョンハッシュを含めるレスポンスのテストケース."""
+
+    note = {
+        "id": UUID("66666666-6666-6666-6666-666666666666"),
+        "user_id": TEST_USER_ID,
+        "category_id": None,
+        "title": "メモ",
+        "body": "本文",
+        "created_at": "2026-02-10T10:00:00+09:00",
+        "updated_at": "2026-02-10T10:00:00+09:00",
+    }
+
+    def test_list_response_does_not_hash_body(self) -> None:
+        """一覧用の NoteResponse は body_hash を計算しない."""
+        assert "body_hash" not in NoteResponse(**self.note).model_dump()
+
+    def test_detail_response_includes_body_hash(self) -> None:
+        """1 件のレスポンスは差分更新の base_hash に使う body_hash を含める."""
+        dumped = NoteDetailResponse(**self.note).model_dump()
+
+        assert dumped["body_hash"] == compute_body_hash("本文")
+
+
 class TestNoteServiceDeleteNote:
     """NoteService.delete_note のテストケース."""
 
@@ -218,9 +466,18 @@ class TestNoteServiceDeleteNote:
         service = NoteService(mock_db_session)
         service.get_note = AsyncMock(return_value=note)
         mock_db_session.delete = AsyncMock()
+        mock_db_session.add = MagicMock()
         mock_db_session.commit = AsyncMock()
 
         await service.delete_note(note_id, TEST_USER_ID)
 
         mock_db_session.delete.assert_called_once_with(note)
+        # 差分同期用に削除を記録する
+        upsert = mock_db_session.execute.call_args.args[0]
+        assert str(upsert.compile(dialect=postgresql.dialect())).startswith(
+            "INSERT INTO sync_tombstone"
+        )
+        params = upsert.compile().params
+        assert (params["resource_m0"], params["record_id_m0"]) == ("note", note_id)
+        assert params["user_id_m0"] == TEST_USER_ID
         mock_db_session.commit.assert_called_once()
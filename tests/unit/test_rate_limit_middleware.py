@@ -0,0 +1,191 @@
+"""RateLimitMiddleware のユニットテスト."""
+
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.rate_limit import (
+    EXPORT,
+    READ,
+    WRITE,
+    InMemoryRateLimitStore,
+    RateLimitMiddleware,
+    RateLimitRule,
+    SharedRateLimitStore,
+    TOKEN_BUCKET_SCRIPT,
+    classify_request,
+)
+from app.security.jwt import create_access_token
+
+RULES = {
+    READ: RateLimitRule(per_minute=60, burst=3),
+    WRITE: RateLimitRule(per_minute=6, burst=1),
+    EXPORT: RateLimitRule(per_minute=1, burst=1),
+}
+
+
+class FakeClock:
+    """進め方をテストから制御できる時計."""
+
+    def __init__(self) -> None:
+        """初期化."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻."""
+        return self.now
+
+
+def create_app(store: Any, opened_sessions: List[int]) -> FastAPI:
+    """テスト用アプリを作成（DB セッションを開いた回数を記録）."""
+    test_app = FastAPI()
+    test_app.add_middleware(RateLimitMiddleware, store=store, rules=RULES)
+
+    async def get_session():
+        opened_sessions.append(1)
+        yield None
+
+    @test_app.get("/api/tasks")
+    async def list_tasks(db_session: Any = Depends(get_session)) -> dict:
+        return {"data": [], "message": "ok"}
+
+    @test_app.post("/api/tasks")
+    async def create_task(db_session: Any = Depends(get_session)) -> dict:
+        return {"data": None, "message": "ok"}
+
+    @test_app.get("/livez")
+    async def livez() -> dict:
+        return {"status": "ok"}
+
+    return test_app
+
+
+def login_cookie(email: str) -> Dict[str, str]:
+    """access_token Cookie."""
+    return {"access_token": create_access_token({"sub": email})}
+
+
+class TestClassifyRequest:
+    """classify_request() のテストケース."""
+
+    @pytest.mark.parametrize(
+        ("method", "path", "group"),
+        [
+            ("GET", "/api/tasks", READ),
+            ("HEAD", "/api/tasks", READ),
+            ("POST", "/api/tasks", WRITE),
+            ("PATCH", "/api/notes/1/body", WRITE),
+            ("DELETE", "/api/vehicles/1", WRITE),
+            ("GET", "/api/vehicles/1/export", EXPORT),
+            ("GET", "/api/exporter", READ),
+            ("OPTIONS", "/api/tasks", None),
+            ("GET", "/readyz", None),
+        ],
+    )
+    def test_groups(self, method: str, path: str, group: Any) -> None:
+        """メソッドとパスからルートグループを判定する."""
+        assert classify_request(method, path) == group
+
+
+class TestInMemoryRateLimitStore:
+    """InMemoryRateLimitStore のテストケース."""
+
+    async def test_burst_then_refill(self) -> None:
+        """burst 回まで通し、以降は補充を待つ."""
+        clock = FakeClock()
+        store = InMemoryRateLimitStore(clock=clock)
+        rule = RateLimitRule(per_minute=60, burst=2)
+
+        assert await store.take("k", rule) == 0
+        assert await store.take("k", rule) == 0
+        assert await store.take("k", rule) == pytest.approx(1.0)
+
+        clock.now = 0.5
+        assert await store.take("k", rule) == pytest.approx(0.5)
+        clock.now = 1.0
+        assert await store.take("k", rule) == 0
+
+    async def test_keys_are_independent_and_bounded(self) -> None:
+        """バケットはキーごとに独立し、上限を超えると古いものから削除する."""
+        store = InMemoryRateLimitStore(max_keys=2, clock=FakeClock())
+        rule = RateLimitRule(per_minute=60, burst=1)
+
+        for key in ("a", "b", "c"):
+            assert await store.take(key, rule) == 0
+        assert len(store._buckets) == 2
+        assert await store.take("c", rule) > 0
+
+
+class TestSharedRateLimitStore:
+    """SharedRateLimitStore のテストケース（クライアントはフェイク）."""
+
+    async def test_runs_token_bucket_script(self) -> None:
+        """接頭辞付きのキーと予算を Lua スクリプトに渡し、待ち秒数を返す."""
+        client = AsyncMock()
+        client.eval = AsyncMock(return_value=b"1.5")
+        store = SharedRateLimitStore(client, prefix="test:")
+
+        wait = await store.take("ratelimit:read:user:a", RateLimitRule(60, 5))
+
+        assert wait == 1.5
+        client.eval.assert_awaited_once_with(
+            TOKEN_BUCKET_SCRIPT, 1, "test:ratelimit:read:user:a", 1.0, 5
+        )
+
+
+class TestRateLimitMiddleware:
+    """RateLimitMiddleware のテストケース."""
+
+    def test_rejects_over_budget_before_opening_session(self) -> None:
+        """予算を超えたら 429 と Retry-After を返し、DB セッションは開かない."""
+        opened: List[int] = []
+        client = TestClient(create_app(InMemoryRateLimitStore(clock=FakeClock()), opened))
+        client.cookies.update(login_cookie("user@example.com"))
+
+        statuses = [client.get("/api/tasks").status_code for _ in range(4)]
+        response = client.get("/api/tasks")
+
+        assert statuses == [200, 200, 200, 429]
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+        assert response.json()["error"] == "Too Many Requests"
+        assert len(opened) == 3
+
+    def test_writes_have_separate_stricter_budget(self) -> None:
+        """書き込みは読み込みとは別の、より厳しい予算."""
+        client = TestClient(create_app(InMemoryRateLimitStore(clock=FakeClock()), []))
+        client.cookies.update(login_cookie("user@example.com"))
+
+        assert client.post("/api/tasks").status_code == 200
+        response = client.post("/api/tasks")
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "10"
+        assert client.get("/api/tasks").status_code == 200
+
+    def test_budget_is_per_user(self) -> None:
+        """ユーザーごとに別の予算."""
+        client = TestClient(create_app(InMemoryRateLimitStore(clock=FakeClock()), []))
+
+        client.cookies.update(login_cookie("a@example.com"))
+        assert client.post("/api/tasks").status_code == 200
+        assert client.post("/api/tasks").status_code == 429
+
+        client.cookies.update(login_cookie("b@example.com"))
+        assert client.post("/api/tasks").status_code == 200
+
+    def test_exempt_paths_are_not_limited(self) -> None:
+        """ヘルスチェックは制限しない."""
+        client = TestClient(create_app(InMemoryRateLimitStore(clock=FakeClock()), []))
+
+        assert all(client.get("/livez").status_code == 200 for _ in range(10))
+
+    def test_store_error_allows_request(self) -> None:
+        """ストアのエラー時は制限せずに通す."""
+        store = AsyncMock()
+        store.take = AsyncMock(side_effect=ConnectionError("redis down"))
+        client = TestClient(create_app(store, []))
+
+        assert client.get("/api/tasks").status_code == 200
@@ -0,0 +1,152 @@
+"""繰り返しルール（RecurrenceRule）のユニットテスト."""
+
+from datetime import date
+
+import pytest
+
+from app.utils.recurrence import RecurrenceRule
+
+
+def expand(rule: str, start: date, window_start: date, window_end: date) -> list:
+    """ルール文字列を解析して期間内の発生日を返す."""
+    return list(RecurrenceRule.parse(rule).occurrences(start, window_start, window_end))
+
+
+class TestRecurrenceRuleParse:
+    """RecurrenceRule.parse() のテストケース."""
+
+    def test_parse_normalizes_rule(self) -> None:
+        """接頭辞・大文字小文字・曜日の順序を正規化する."""
+        rule = RecurrenceRule.parse("RRULE:freq=weekly;byday=fr,mo;interval=2")
+
+        assert rule.freq == "WEEKLY"
+        assert rule.interval == 2
+        assert rule.by_day == (0, 4)
+        assert str(rule) == "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR"
+
+    def test_parse_until_datetime(self) -> None:
+        """UNTIL は日時形式でも日付として扱う."""
+        rule = RecurrenceRule.parse("FREQ=DAILY;UNTIL=20261031T235959Z")
+
+        assert rule.until == date(2026, 10, 31)
+        assert str(rule) == "FREQ=DAILY;UNTIL=20261031"
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            "",
+            "FREQ=HOURLY",
+            "FREQ=DAILY;INTERVAL=0",
+            "FREQ=DAILY;INTERVAL=1000",
+            "FREQ=DAILY;BYDAY=MO",
+            "FREQ=WEEKLY;BYDAY=XX",
+            "FREQ=DAILY;COUNT=5;UNTIL=20261231",
+            "FREQ=DAILY;COUNT=1001",
+            "FREQ=DAILY;BYMONTH=1",
+            "FREQ=DAILY;FREQ=WEEKLY",
+            "FREQ=DAILY;UNTIL=2026-12-31",
+        ],
+    )
+    def test_parse_invalid_rule_fails(self, rule: str) -> None:
+        """未対応・不正なルールは ValueError."""
+        with pytest.raises(ValueError):
+            RecurrenceRule.parse(rule)
+
+
+class TestRecurrenceRuleOccurrences:
+    """RecurrenceRule.occurrences() のテストケース."""
+
+    def test_daily_interval_seeks_to_window(self) -> None:
+        """開始日が古くても期間内の発生日だけを返す."""
+        occurrences = expand(
+            "FREQ=DAILY;INTERVAL=3",
+            date(2020, 1, 1),
+            date(2026, 10, 19),
+            date(2026, 10, 25),
+        )
+
+        assert occurrences == [date(2026, 10, 20), date(2026, 10, 23)]
+
+    def test_weekly_by_day(self) -> None:
+        """BYDAY の曜日ごとに発生し、開始日より前は含めない."""
+        occurrences = expand(
+            "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+            date(2026, 10, 21),  # 水曜日
+            date(2026, 10, 1),
+            date(2026, 10, 30),
+        )
+
+        assert occurrences == [
+            date(2026, 10, 21),
+            date(2026, 10, 23),
+            date(2026, 10, 26),
+            date(2026, 10, 28),
+            date(2026, 10, 30),
+        ]
+
+    def test_weekly_defaults_to_start_weekday(self) -> None:
+        """BYDAY 省略時は開始日の曜日."""
+        occurrences = expand(
+            "FREQ=WEEKLY;INTERVAL=2",
+            date(2026, 10, 5),
+            date(2026, 10, 1),
+            date(2026, 11, 30),
+        )
+
+        assert occurrences == [
+            date(2026, 10, 5),
+            date(2026, 10, 19),
+            date(2026, 11, 2),
+            date(2026, 11, 16),
+            date(2026, 11, 30),
+        ]
+
+    def test_monthly_skips_months_without_day(self) -> None:
+        """31 日が存在しない月はスキップする."""
+        occurrences = expand(
+            "FREQ=MONTHLY", date(2026, 1, 31), date(2026, 1, 1), date(2026, 6, 30)
+        )
+
+        assert occurrences == [date(2026, 1, 31), date(2026, 3, 31), date(2026, 5, 31)]
+
+    def test_yearly_leap_day(self) -> None:
+        """2/29 はうるう年のみ."""
+        occurrences = expand(
+            "FREQ=YEARLY", date(2024, 2, 29), date(2024, 1, 1), date(2032, 12, 31)
+        )
+
+        assert occurrences == [date(2024, 2, 29), date(2028, 2, 29), date(2032, 2, 29)]
+
+    def test_count_is_counted_from_start(self) -> None:
+        """COUNT は期間ではなく開始日からの回数."""
+        occurrences = expand(
+            "FREQ=DAILY;COUNT=5",
+            date(2026, 10, 1),
+            date(2026, 10, 4),
+            date(2026, 10, 31),
+        )
+
+        assert occurrences == [date(2026, 10, 4), date(2026, 10, 5)]
+
+    def test_until_is_inclusive(self) -> None:
+        """UNTIL の日を含む."""
+        occurrences = expand(
+            "FREQ=DAILY;UNTIL=20261021",
+            date(2026, 10, 19),
+            date(2026, 10, 1),
+            date(2026, 10, 31),
+        )
+
+        assert occurrences == [
+            date(2026, 10, 19),
+            date(2026, 10, 20),
+            date(2026, 10, 21),
+        ]
+
+    def test_is_occurrence(self) -> None:
+        """指定日が発生日かどうか."""
+        rule = RecurrenceRule.parse("FREQ=WEEKLY;BYDAY=TU")
+
+        assert rule.is_occurrence(date(2026, 10, 20), date(2026, 10, 27))
+        assert not rule.is_occurrence(date(2026, 10, 20), date(2026, 10, 28))
+        assert not rule.is_occurrence(date(2026, 10, 20), date(2026, 10, 13))
@@ -0,0 +1,115 @@
+"""JsonBody（リクエストボディの読み込みとバリデーション）のユニットテスト."""
+
+from typing import Iterator, List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field, model_validator
+
+from app.api.body import JsonBody, request_body_exception_handler
+from app.utils.exceptions import RequestBodyException
+
+
+class Item(BaseModel):
+    """テスト用のボディ."""
+
+    name: str = Field(..., min_length=1)
+    quantity: int = 1
+    tags: List[str] = []
+
+    @model_validator(mode="after")
+    def validate_tags(self) -> "Item":
+        """タグの数は数量以下."""
+        if len(self.tags) > self.quantity:
+            raise ValueError("タグが多すぎます")
+        return self
+
+
+def create_app(max_bytes: int = 64) -> FastAPI:
+    """テスト用アプリを作成."""
+    test_app = FastAPI()
+    test_app.add_exception_handler(RequestBodyException, request_body_exception_handler)
+
+    @test_app.post("/items")
+    async def create_item(item: Item = JsonBody(Item, max_bytes=max_bytes)) -> dict:
+        return {"data": item.model_dump(), "message": "ok"}
+
+    return test_app
+
+
+class TestJsonBody:
+    """JsonBody のテストケース."""
+
+    def test_valid_body(self) -> None:
+        """JSON をモデルとして受け取る."""
+        client = TestClient(create_app())
+
+        response = client.post("/items", content=b'{"name": "a", "quantity": 2}')
+
+        assert response.status_code == 200
+        assert response.json()["data"] == {"name": "a", "quantity": 2, "tags": []}
+
+    def test_field_errors(self) -> None:
+        """フィールドの検証エラーは「フィールド: メッセージ」の形式で 400."""
+        client = TestClient(create_app())
+
+        response = client.post("/items", content=b'{"name": "", "quantity": "x"}')
+
+        assert response.status_code == 400
+        body = response.json()
+        assert body["message"] == "入力データが正しくありません"
+        assert [error.split(":")[0] for error in body["errors"]] == ["name", "quantity"]
+
+    def test_model_validator_error(self) -> None:
+        """モデル全体の検証エラーは unknown として返す."""
+        client = TestClient(create_app())
+
+        response = client.post("/items", content=b'{"name": "a", "tags": ["x", "y"]}')
+
+        assert response.status_code == 400
+        assert response.json() == {
+            "errors": ["unknown: Value error, タグが多すぎます"],
+            "message": "入力データが正しくありません",
+        }
+
+    def test_malformed_json(self) -> None:
+        """JSON として読めないボディは「リクエストボディが不正です」."""
+        client = TestClient(create_app())
+
+        for content in (b"", b"{", b"[]", b"null"):
+            response = client.post("/items", content=content)
+
+            assert response.status_code == 400
+            assert response.json()["message"] == "リクエストボディが不正です"
+            assert len(response.json()["errors"]) == 1
+
+    def test_content_length_over_limit(self) -> None:
+        """Content-Length が上限を超える場合は 413."""
+        client = TestClient(create_app(max_bytes=16))
+
+        response = client.post("/items", content=b'{"name": "' + b"a" * 32 + b'"}')
+
+        assert response.status_code == 413
+        assert response.json()["message"] == "リクエストボディが大きすぎます"
+
+    def test_streamed_body_over_limit(self) -> None:
+        """Content-Length がない場合も読み込み中に上限を超えたら 413."""
+        client = TestClient(create_app(max_bytes=16))
+
+        def chunks() -> Iterator[bytes]:
+            yield b'{"name": "'
+            yield b"a" * 32
+            yield b'"}'
+
+        response = client.post("/items", content=chunks())
+
+        assert response.status_code == 413
+
+    def test_endpoint_uses_same_error_envelope(self, client: TestClient) -> None:
+        """エンドポイントでも従来と同じ形式のエラーを返す."""
+        response = client.post("/api/tasks", content=b'{"title": ""}')
+
+        assert response.status_code == 400
+        body = response.json()
+        assert body["message"] == "入力データが正しくありません"
+        assert body["errors"][0].startswith("title: ")
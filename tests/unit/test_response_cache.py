@@ -0,0 +1,352 @@
+"""ResponseCache / cached_response のユニットテスト."""
+
+import asyncio
+import inspect
+from dataclasses import asdict
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+from fastapi import Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.endpoints.tasks import list_tasks
+from app.schemas.note_category import NoteCategoryCreate
+from app.schemas.task import TaskResponse
+from app.services.note_category_service import NoteCategoryService
+from app.services.response_cache import (
+    NOTE,
+    NOTE_CATEGORY,
+    TASK,
+    InMemoryCacheBackend,
+    ResponseCache,
+    SharedCacheBackend,
+    cached_response,
+    encode_json,
+    response_cache,
+)
+from app.services.task_service import TaskRow
+
+TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+OTHER_USER_ID = UUID("660e8400-e29b-41d4-a716-446655440000")
+
+
+class FakeClock:
+    """進め方をテストから制御できる時計."""
+
+    def __init__(self) -> None:
+        """初期化."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻."""
+        return self.now
+
+
+class FakeSharedClient:
+    """redis.asyncio.Redis の get / set（ex, nx）だけを持つフェイク."""
+
+    def __init__(self, clock: FakeClock) -> None:
+        """初期化."""
+        self.clock = clock
+        self.data: Dict[str, tuple] = {}
+
+    async def get(self, name: str) -> Optional[bytes]:
+        """値を取得."""
+        entry = self.data.get(name)
+        if entry is None or (entry[0] is not None and entry[0] <= self.clock()):
+            return None
+        return entry[1]
+
+    async def set(
+        self,
+        name: str,
+        value: bytes,
+        ex: Optional[int] = None,
+        nx: bool = False,
+    ) -> Optional[bool]:
+        """値を保存."""
+        if nx and await self.get(name) is not None:
+            return None
+        expires_at = self.clock() + ex if ex is not None else None
+        self.data[name] = (expires_at, value)
+        return True
+
+
+class TestInMemoryCacheBackend:
+    """InMemoryCacheBackend のテストケース."""
+
+    async def test_evicts_least_recently_used(self) -> None:
+        """上限を超えると最も長く使われていないキーから削除する."""
+        backend = InMemoryCacheBackend(max_entries=2)
+        await backend.set("a", b"1")
+        await backend.set("b", b"2")
+        await backend.get("a")
+        await backend.set("c", b"3")
+
+        assert await backend.get("a") == b"1"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == b"3"
+        assert len(backend) == 2
+
+    async def test_entries_expire(self) -> None:
+        """ttl を過ぎたキーは返さない."""
+        clock = FakeClock()
+        backend = InMemoryCacheBackend(clock=clock)
+        await backend.set("a", b"1", ttl=10)
+
+        clock.now = 9.9
+        assert await backend.get("a") == b"1"
+        clock.now = 10
+        assert await backend.get("a") is None
+
+    async def test_add_only_when_absent(self) -> None:
+        """add() は存在しないキーにのみ保存する."""
+        backend = InMemoryCacheBackend()
+
+        assert await backend.add("a", b"1") is True
+        assert await backend.add("a", b"2") is False
+        assert await backend.get("a") == b"1"
+
+
+class TestResponseCache:
+    """ResponseCache のテストケース（共有バックエンドはフェイクで確認）."""
+
+    @staticmethod
+    def create_caches() -> list:
+        """プロセス内と共有（フェイク）のキャッシュ."""
+        clock = FakeClock()
+        return [
+            ResponseCache(InMemoryCacheBackend(clock=clock)),
+            ResponseCache(SharedCacheBackend(FakeSharedClient(clock))),
+        ]
+
+    async def test_bump_invalidates_entries(self) -> None:
+        """バージョンを更新すると以前のエントリは参照されない."""
+        for cache in self.create_caches():
+            version = await cache.version(TEST_USER_ID, TASK)
+            await cache.set(TEST_USER_ID, TASK, version, {"skip": 0}, b"old")
+            assert await cache.version(TEST_USER_ID, TASK) == version
+            assert await cache.get(TEST_USER_ID, TASK, version, {"skip": 0}) == b"old"
+
+            await cache.bump(TEST_USER_ID, TASK)
+
+            new_version = await cache.version(TEST_USER_ID, TASK)
+            assert new_version != version
+            assert await cache.get(TEST_USER_ID, TASK, new_version, {"skip": 0}) is None
+
+    async def test_bump_is_scoped_to_user_and_resource(self) -> None:
+        """他のユーザー・リソースのバージョンは変わらない."""
+        for cache in self.create_caches():
+            task_version = await cache.version(TEST_USER_ID, TASK)
+            note_version = await cache.version(TEST_USER_ID, NOTE)
+            other_version = await cache.version(OTHER_USER_ID, TASK)
+
+            await cache.bump(TEST_USER_ID, TASK)
+
+            assert await cache.version(TEST_USER_ID, TASK) != task_version
+            assert await cache.version(TEST_USER_ID, NOTE) == note_version
+            assert await cache.version(OTHER_USER_ID, TASK) == other_version
+
+    async def test_entries_are_keyed_by_params(self) -> None:
+        """パラメータが異なれば別のエントリ."""
+        for cache in self.create_caches():
+            version = await cache.version(TEST_USER_ID, TASK)
+            await cache.set(TEST_USER_ID, TASK, version, {"skip": 0}, b"page1")
+
+            assert await cache.get(TEST_USER_ID, TASK, version, {"skip": 100}) is None
+
+    async def test_shared_backend_prefixes_keys_and_ttl(self) -> None:
+        """共有バックエンドには接頭辞付きのキーと秒単位の期限で保存する."""
+        client = FakeSharedClient(FakeClock())
+        cache = ResponseCache(SharedCacheBackend(client, prefix="test:"), ttl=0.5)
+        version = await cache.version(TEST_USER_ID, TASK)
+        await cache.set(TEST_USER_ID, TASK, version, {}, b"body")
+
+        assert all(key.startswith("test:") for key in client.data)
+        assert {entry[0] for entry in client.data.values()} == {1, None}
+
+    async def test_disabled_cache_bump_is_noop(self) -> None:
+        """バックエンドなし（CACHE_BACKEND=none）では何もしない."""
+        cache = ResponseCache(None)
+
+        assert not cache.enabled
+        await cache.bump(TEST_USER_ID, TASK)
+
+    def test_shared_only_with_shared_backend(self) -> None:
+        """バージョンを全ワーカーで共有するのは SharedCacheBackend の場合のみ."""
+        assert ResponseCache(SharedCacheBackend(MagicMock())).shared
+        assert not ResponseCache(InMemoryCacheBackend()).shared
+        assert not ResponseCache(None).shared
+
+
+class TestCachedResponse:
+    """cached_response デコレータのテストケース."""
+
+    @staticmethod
+    def create_endpoint(result: Any) -> AsyncMock:
+        """呼び出し回数を数えるエンドポイント."""
+
+        async def list_items(
+            current_user: Any,
+            skip: int = Query(0),
+            db_session: Any = None,
+        ) -> Any:
+            return await calls(skip=skip)
+
+        calls = AsyncMock(return_value=result)
+        list_items.calls = calls  # type: ignore[attr-defined]
+        return list_items  # type: ignore[return-value]
+
+    async def test_serves_second_request_from_cache(self) -> None:
+        """同じパラメータの 2 回目はエンドポイントを呼ばない."""
+        endpoint = self.create_endpoint({"data": [1], "message": "ok"})
+        cached = cached_response(TASK)(endpoint)
+        user = MagicMock(id=TEST_USER_ID)
+
+        with patch(
+            "app.services.response_cache.response_cache",
+            ResponseCache(InMemoryCacheBackend()),
+        ):
+            first = await cached(current_user=user, skip=0, db_session=MagicMock())
+            second = await cached(current_user=user, skip=0, db_session=MagicMock())
+            await cached(current_user=user, skip=1, db_session=MagicMock())
+
+        assert endpoint.calls.await_count == 2
+        assert first.body == second.body == b'{"data":[1],"message":"ok"}'
+        assert second.media_type == "application/json"
+
+    async def test_bump_refetches(self) -> None:
+        """バージョン更新後はエンドポイントを呼び直す."""
+        endpoint = self.create_endpoint({"data": [], "message": "ok"})
+        cached = cached_response(TASK)(endpoint)
+        user = MagicMock(id=TEST_USER_ID)
+        cache = ResponseCache(InMemoryCacheBackend())
+
+        with patch("app.services.response_cache.response_cache", cache):
+            await cached(current_user=user, skip=0, db_session=None)
+            await cache.bump(TEST_USER_ID, TASK)
+            await cached(current_user=user, skip=0, db_session=None)
+
+        assert endpoint.calls.await_count == 2
+
+    async def test_error_responses_are_not_cached(self) -> None:
+        """JSONResponse（404 など）はキャッシュしない."""
+        not_found = JSONResponse(status_code=404, content={"error": "x"})
+        endpoint = self.create_endpoint(not_found)
+        cached = cached_response(TASK)(endpoint)
+        user = MagicMock(id=TEST_USER_ID)
+
+        with patch(
+            "app.services.response_cache.response_cache",
+            ResponseCache(InMemoryCacheBackend()),
+        ):
+            assert await cached(current_user=user, skip=0, db_session=None) is not_found
+            await cached(current_user=user, skip=0, db_session=None)
+
+        assert endpoint.calls.await_count == 2
+
+    async def test_coalesces_concurrent_requests(self) -> None:
+        """coalesce=True なら同時に来た同一リクエストは 1 回だけ実行する."""
+        release = asyncio.Event()
+        calls = AsyncMock(return_value={"data": [], "message": "ok"})
+
+        async def list_items(current_user: Any, skip: int = 0) -> Any:
+            await release.wait()
+            return await calls()
+
+        cached = cached_response(TASK, coalesce=True)(list_items)
+        user = MagicMock(id=TEST_USER_ID)
+
+        # キャッシュ無効（CACHE_BACKEND=none）でもまとめる
+        with patch("app.services.response_cache.response_cache", ResponseCache(None)):
+            requests = [
+                asyncio.create_task(cached(current_user=user, skip=0))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            responses = await asyncio.gather(*requests)
+
+        assert calls.await_count == 1
+        assert {response.body for response in responses} == {
+            b'{"data":[],"message":"ok"}'
+        }
+
+    async def test_coalesced_run_uses_own_session(self) -> None:
+        """まとめた実行はリクエストのセッションではなく専用のセッションで行う."""
+        sessions = []
+
+        async def list_items(current_user: Any, db_session: Any) -> Any:
+            sessions.append(db_session)
+            return {"data": [], "message": "ok"}
+
+        cached = cached_response(TASK, coalesce=True)(list_items)
+        own_session = MagicMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=own_session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        with (
+            patch("app.services.response_cache.response_cache", ResponseCache(None)),
+            patch("app.services.response_cache.async_session_factory", factory),
+        ):
+            await cached(current_user=MagicMock(id=TEST_USER_ID), db_session="request")
+
+        assert sessions == [own_session]
+        factory.return_value.__aexit__.assert_awaited_once()
+
+    def test_keeps_endpoint_signature(self) -> None:
+        """FastAPI が依存関係・クエリパラメータを解決できるよう引数を引き継ぐ."""
+        parameters = inspect.signature(list_tasks).parameters
+
+        assert {"current_user", "skip", "limit", "db_session"} <= set(parameters)
+
+
+class TestEncodeJson:
+    """encode_json のテストケース."""
+
+    def test_matches_fastapi_default_encoding(self) -> None:
+        """Pydantic モデルと一覧用の dataclass は FastAPI の既定と同じ JSON になる."""
+        now = datetime(2026, 10, 19, 1, 2, 3, 456000, tzinfo=timezone.utc)
+        row = TaskRow(
+            id=TEST_USER_ID,
+            user_id=TEST_USER_ID,
+            title="牛乳を \"買う\"",
+            description=None,
+            is_completed=False,
+            completed_at=None,
+            due_date=date(2026, 10, 20),
+            order=0,
+            created_at=now,
+            updated_at=now,
+            recurrence_rule=None,
+            recurrence_parent_id=None,
+            occurrence_date=None,
+        )
+        expected = JSONResponse(
+            content=jsonable_encoder(
+                {"data": [TaskResponse(**asdict(row))], "message": "ok"}
+            )
+        ).body
+
+        assert encode_json({"data": [row], "message": "ok"}) == expected
+
+
+class TestServiceInvalidation:
+    """サービスの書き込みによる無効化のテストケース."""
+
+    async def test_category_write_bumps_notes_and_categories(self) -> None:
+        """カテゴリの作成でノート・カテゴリのバージョンを更新する."""
+        session = AsyncMock()
+        session.add = MagicMock()
+
+        with patch.object(response_cache, "bump", AsyncMock()) as bump:
+            await NoteCategoryService(session).create_category(
+                NoteCategoryCreate(name="仕事"), TEST_USER_ID
+            )
+
+        session.commit.assert_awaited_once()
+        bump.assert_awaited_once_with(TEST_USER_ID, NOTE_CATEGORY, NOTE)
@@ -0,0 +1,65 @@
+"""アーカイブ復元コマンドのユニットテスト."""
+
+from typing import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from app.models.vehicle import Vehicle
+from app.restore import main, parse_args
+from app.utils.exceptions import NotFoundException
+
+TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+TEST_RECORD_ID = UUID("77777777-7777-7777-7777-777777777777")
+ARGV = ["vehicle", str(TEST_RECORD_ID), str(TEST_USER_ID)]
+
+
+@pytest.fixture
+def environment() -> Iterator[MagicMock]:
+    """セッション・キャッシュ設定・接続プールをモック."""
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.dispose = AsyncMock()
+    with (
+        patch("app.restore.async_session_factory", return_value=session_cm),
+        patch("app.restore.get_engine", return_value=engine),
+        patch("app.restore.configure_response_cache") as configure_cache,
+    ):
+        yield MagicMock(engine=engine, configure_cache=configure_cache)
+
+
+class TestRestoreCommand:
+    """python -m app.restore のテストケース."""
+
+    def test_only_archived_tables_are_accepted(self) -> None:
+        """アーカイブ対象外のテーブル（タスク）は指定できない."""
+        with pytest.raises(SystemExit):
+            parse_args(["task", str(TEST_RECORD_ID), str(TEST_USER_ID)])
+
+    def test_restores_row_and_updates_shared_cache(
+        self, environment: MagicMock
+    ) -> None:
+        """共有キャッシュを設定してから復元し、接続プールを閉じる."""
+        restore = AsyncMock()
+
+        with patch("app.restore.ArchiveService.restore", restore):
+            assert main(ARGV) == 0
+
+        restore.assert_awaited_once_with(Vehicle, TEST_RECORD_ID, TEST_USER_ID)
+        environment.configure_cache.assert_called_once()
+        environment.engine.dispose.assert_awaited_once()
+
+    def test_missing_row_exits_with_error(
+        self, environment: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """アーカイブにない場合はメッセージを出して終了コード 1."""
+        restore = AsyncMock(side_effect=NotFoundException("見つかりません"))
+
+        with patch("app.restore.ArchiveService.restore", restore):
+            assert main(ARGV) == 1
+
+        assert "見つかりません" in capsys.readouterr().err
+        environment.engine.dispose.assert_awaited_once()
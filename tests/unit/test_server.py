@@ -0,0 +1,141 @@
+"""本番サーバーエントリポイント（app.server）のユニットテスト."""
+
+from pathlib import Path
+
+import pytest
+
+from app.core.config import Settings, get_settings
+from app.server import (
+    available_cpu_count,
+    build_uvicorn_config,
+    check_worker_settings,
+    resolve_worker_count,
+)
+
+
+def make_settings(**overrides) -> Settings:
+    """テスト用に一部の値を上書きした設定を作成."""
+    return get_settings().model_copy(update=overrides)
+
+
+class TestAvailableCpuCount:
+    """available_cpu_count() のテストケース."""
+
+    def test_without_cgroup_limit(self, tmp_path: Path) -> None:
+        """cgroup クォータが無い場合はアフィニティのコア数."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+        assert available_cpu_count(cpu_max) >= 1
+
+    def test_cgroup_quota_limits_count(self, tmp_path: Path, monkeypatch) -> None:
+        """cgroup クォータがコア数の上限になる."""
+        monkeypatch.setattr("os.sched_getaffinity", lambda pid: set(range(16)))
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("200000 100000\n")
+        assert available_cpu_count(cpu_max) == 2
+
+    def test_fractional_quota_is_at_least_one(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """1 コア未満のクォータでも 1 を返す."""
+        monkeypatch.setattr("os.sched_getaffinity", lambda pid: set(range(4)))
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("50000 100000\n")
+        assert available_cpu_count(cpu_max) == 1
+
+    def test_missing_cgroup_file(self, tmp_path: Path) -> None:
+        """cpu.max が無い環境でも動作する."""
+        assert available_cpu_count(tmp_path / "missing") >= 1
+
+
+class TestResolveWorkerCount:
+    """resolve_worker_count() のテストケース."""
+
+    def test_explicit_workers(self) -> None:
+        """SERVER_WORKERS 指定時はその値を使う."""
+        assert resolve_worker_count(make_settings(SERVER_WORKERS=3)) == 3
+
+    def test_auto_workers(self, monkeypatch) -> None:
+        """SERVER_WORKERS=0 の場合は CPU コア数."""
+        monkeypatch.setattr("app.server.available_cpu_count", lambda: 6)
+        assert resolve_worker_count(make_settings(SERVER_WORKERS=0)) == 6
+
+
+class TestBuildUvicornConfig:
+    """build_uvicorn_config() のテストケース."""
+
+    @pytest.fixture
+    def asgi_app(self):
+        """ダミー ASGI アプリ."""
+
+        async def app(scope, receive, send) -> None:
+            return None
+
+        return app
+
+    def test_settings_are_applied(self, asgi_app) -> None:
+        """keep-alive / backlog が設定から反映される."""
+        config = build_uvicorn_config(
+            make_settings(SERVER_KEEPALIVE_TIMEOUT=15, SERVER_BACKLOG=512), asgi_app
+        )
+        assert config.timeout_keep_alive == 15
+        assert config.backlog == 512
+        assert config.limit_max_requests is None
+
+    def test_forwarded_headers_trust_only_configured_proxies(self, asgi_app) -> None:
+        """X-Forwarded-For は設定したプロキシからのものだけを信頼し、アクセスログを残す."""
+        config = build_uvicorn_config(make_settings(), asgi_app)
+        assert config.forwarded_allow_ips == "127.0.0.1"
+        assert config.access_log is True
+
+        config = build_uvicorn_config(
+            make_settings(SERVER_FORWARDED_ALLOW_IPS="10.0.0.1,10.0.0.2"), asgi_app
+        )
+        assert config.forwarded_allow_ips == "10.0.0.1,10.0.0.2"
+
+    def test_max_requests_with_jitter(self, asgi_app) -> None:
+        """最大リクエスト数はゆらぎの範囲内に収まる."""
+        settings = make_settings(SERVER_MAX_REQUESTS=1000, SERVER_MAX_REQUESTS_JITTER=50)
+        for _ in range(20):
+            config = build_uvicorn_config(settings, asgi_app)
+            assert 1000 <= config.limit_max_requests <= 1050
+
+    def test_prefers_uvloop_and_httptools(self, asgi_app, monkeypatch) -> None:
+        """uvloop / httptools が使える場合はそれを選ぶ."""
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: object())
+        config = build_uvicorn_config(make_settings(), asgi_app)
+        assert config.loop == "uvloop"
+        assert config.http == "httptools"
+
+    def test_falls_back_without_optional_packages(self, asgi_app, monkeypatch) -> None:
+        """uvloop / httptools が無い場合は標準実装を使う."""
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+        config = build_uvicorn_config(make_settings(), asgi_app)
+        assert config.loop == "asyncio"
+        assert config.http == "h11"
+
+
+class TestCheckWorkerSettings:
+    """check_worker_settings() のテストケース."""
+
+    def test_memory_events_need_single_worker(self) -> None:
+        """プロセス内の変更通知は複数ワーカーでは起動しない."""
+        with pytest.raises(ValueError, match="EVENTS_BACKEND=memory"):
+            check_worker_settings(
+                make_settings(EVENTS_BACKEND="memory", SERVER_WORKERS=2)
+            )
+
+        check_worker_settings(make_settings(EVENTS_BACKEND="memory", SERVER_WORKERS=1))
+        check_worker_settings(
+            make_settings(EVENTS_BACKEND="postgres", SERVER_WORKERS=4)
+        )
+
+    def test_memory_cache_needs_single_worker(self) -> None:
+        """プロセス内のレスポンスキャッシュは複数ワーカーでは起動しない."""
+        with pytest.raises(ValueError, match="CACHE_BACKEND=memory"):
+            check_worker_settings(
+                make_settings(CACHE_BACKEND="memory", SERVER_WORKERS=2)
+            )
+
+        check_worker_settings(make_settings(CACHE_BACKEND="memory", SERVER_WORKERS=1))
+        check_worker_settings(make_settings(CACHE_BACKEND="redis", SERVER_WORKERS=4))
@@ -0,0 +1,113 @@
+"""SingleFlight のユニットテスト."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from app.utils.singleflight import SingleFlight
+
+
+class Loader:
+    """呼び出し回数を数え、release されるまで完了しない処理."""
+
+    def __init__(self, result: str = "rows") -> None:
+        """初期化."""
+        self.result = result
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        """release を待って結果を返す."""
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        return f"{self.result}-{call}"
+
+
+class TestSingleFlight:
+    """SingleFlight のテストケース."""
+
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        """同じキーの同時呼び出しは 1 回だけ実行し、結果を共有する."""
+        flights = SingleFlight()
+        loader = Loader()
+
+        calls = [asyncio.create_task(flights.do("user", "q", loader)) for _ in range(3)]
+        await asyncio.sleep(0)
+        loader.release.set()
+
+        assert await asyncio.gather(*calls) == ["rows-1"] * 3
+        assert loader.calls == 1
+        assert len(flights) == 0
+
+    async def test_different_keys_run_separately(self) -> None:
+        """キーが異なれば別々に実行する."""
+        flights = SingleFlight()
+        loader = Loader()
+        loader.release.set()
+
+        await asyncio.gather(
+            flights.do("user", "page1", loader), flights.do("user", "page2", loader)
+        )
+
+        assert loader.calls == 2
+
+    async def test_completed_key_runs_again(self) -> None:
+        """完了後の呼び出しは結果を再利用せず新たに実行する."""
+        flights = SingleFlight()
+        loader = Loader()
+        loader.release.set()
+
+        assert await flights.do("user", "q", loader) == "rows-1"
+        assert await flights.do("user", "q", loader) == "rows-2"
+
+    async def test_exception_is_shared(self) -> None:
+        """失敗は合流したすべての呼び出しに伝わる."""
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def fail() -> None:
+            await release.wait()
+            raise ConnectionError("db down")
+
+        calls = [asyncio.create_task(flights.do("user", "q", fail)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert len(flights) == 0
+
+    async def test_forget_detaches_running_flights(self) -> None:
+        """forget() 後の呼び出しは実行中のものに合流しない."""
+        flights = SingleFlight()
+        loader = Loader()
+
+        before = asyncio.create_task(flights.do("user", "q", loader))
+        await asyncio.sleep(0)
+        flights.forget("user")
+        after = asyncio.create_task(flights.do("user", "q", loader))
+        await asyncio.sleep(0)
+        loader.release.set()
+
+        assert await asyncio.gather(before, after) == ["rows-1", "rows-2"]
+        assert loader.calls == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        """先行の呼び出し元がキャンセルされても合流した呼び出しは結果を受け取る."""
+        flights = SingleFlight()
+        loader = Loader()
+        results: List[str] = []
+
+        first = asyncio.create_task(flights.do("user", "q", loader))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flights.do("user", "q", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        loader.release.set()
+        results.append(await second)
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert results == ["rows-1"]
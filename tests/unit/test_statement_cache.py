@@ -0,0 +1,114 @@
+"""lambda ステートメントと SQL キャッシュメトリクスのユニットテスト."""
+
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS, NO_CACHE_KEY
+from sqlalchemy.util import LRUCache
+
+from app.database import StatementCacheStats
+from app.services.task_service import TaskService
+from app.services.vehicle_service import VehicleService
+
+DIALECT = postgresql.asyncpg.dialect()  # type: ignore[attr-defined]
+
+
+def capture_session() -> Any:
+    """実行されたステートメントを記録するモックセッション."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    result.scalars.return_value.one_or_none.return_value = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def executed(session: Any) -> List[Any]:
+    """execute() に渡されたステートメント."""
+    return [call.args[0] for call in session.execute.call_args_list]
+
+
+def compile_cached(stmt: Any, cache: LRUCache) -> Any:
+    """キャッシュ付きでコンパイルし、キャッシュ結果を返す."""
+    _, _, cache_hit = stmt._compile_w_cache(DIALECT, compiled_cache=cache, column_keys=[])
+    return cache_hit
+
+
+class TestStatementCacheStats:
+    """StatementCacheStats のテストケース."""
+
+    def test_counts_hits_and_misses(self) -> None:
+        """キャッシュのヒット・ミスを数え、対象外の実行は数えない."""
+        stats = StatementCacheStats()
+
+        for cache_hit in (CACHE_MISS, CACHE_HIT, CACHE_HIT, CACHE_HIT, NO_CACHE_KEY):
+            stats.record(SimpleNamespace(cache_hit=cache_hit))
+
+        assert (stats.hits, stats.misses) == (3, 1)
+        assert stats.hit_rate == 0.75
+
+    def test_hit_rate_without_executions(self) -> None:
+        """実行がない場合のヒット率は 0."""
+        assert StatementCacheStats().hit_rate == 0.0
+
+
+class TestCachedStatements:
+    """サービスのクエリがコンパイル済みキャッシュを再利用することのテストケース."""
+
+    async def test_get_task_reuses_compiled_statement(self) -> None:
+        """ID が異なっても同じコンパイル結果を使い、値はバインドパラメータになる."""
+        session = capture_session()
+        service = TaskService(session)
+        task_ids = [uuid4(), uuid4()]
+        for task_id in task_ids:
+            await service.get_task(task_id, uuid4())
+
+        cache = LRUCache(10)
+        first, second = executed(session)
+        assert compile_cached(first, cache) is CACHE_MISS
+        assert compile_cached(second, cache) is CACHE_HIT
+        assert str(task_ids[1]) not in str(second.compile(dialect=DIALECT))
+
+    async def test_list_tasks_reuses_compiled_statement_per_filter_shape(self) -> None:
+        """同じ条件の組み合わせは検索語やページが違っても同じコンパイル結果を使う."""
+        session = capture_session()
+        service = TaskService(session)
+        user_id = uuid4()
+        await service.list_tasks(user_id, q="牛乳", is_completed=True, skip=0, limit=10)
+        await service.list_tasks(user_id, q="50%_off", is_completed=True, skip=20, limit=5)
+        await service.list_tasks(user_id, is_completed=True)
+
+        cache = LRUCache(10)
+        first, second, third = executed(session)
+        assert compile_cached(first, cache) is CACHE_MISS
+        assert compile_cached(second, cache) is CACHE_HIT
+        # 検索語の有無で SQL の形が変わるため別のエントリ
+        assert compile_cached(third, cache) is CACHE_MISS
+
+    async def test_list_tasks_escapes_like_wildcards(self) -> None:
+        """検索語の % と _ はワイルドカードとして扱わない."""
+        session = capture_session()
+        await TaskService(session).list_tasks(uuid4(), q="50%_off", is_completed=True)
+
+        sql = str(
+            executed(session)[0].compile(
+                dialect=DIALECT, compile_kwargs={"literal_binds": True}
+            )
+        )
+        assert "task.title ILIKE '%' || '50/%/_off' || '%' ESCAPE '/'" in sql
+
+    async def test_get_vehicle_reuses_compiled_statement(self) -> None:
+        """車両の取得も ID によらず同じコンパイル結果を使う."""
+        session = capture_session()
+        service = VehicleService(session)
+        user_id = uuid4()
+        await service.get_vehicle(uuid4(), user_id)
+        await service.get_vehicle(uuid4(), user_id)
+
+        cache = LRUCache(10)
+        first, second = executed(session)
+        assert compile_cached(first, cache) is CACHE_MISS
+        assert compile_cached(second, cache) is CACHE_HIT
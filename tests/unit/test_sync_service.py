@@ -0,0 +1,216 @@
+"""SyncService（差分同期）のユニットテスト."""
+
+import base64
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.base import JST
+from app.models.note import Note
+from app.models.task import Task
+from app.models.vehicle import Vehicle
+from app.services.sync_service import (
+    SYNC_MODELS,
+    SyncPosition,
+    SyncService,
+    decode_sync_token,
+    encode_sync_token,
+)
+from app.utils.exceptions import ValidationException
+
+TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=JST)
+
+
+def scalars_result(rows: list) -> MagicMock:
+    """scalars().all() の結果."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+def position_result(xmin: int, now: datetime) -> MagicMock:
+    """スナップショットの xmin とデータベースの時刻の結果."""
+    result = MagicMock()
+    result.one.return_value = (xmin, now)
+    return result
+
+
+def tombstones_result(rows: list) -> MagicMock:
+    """物理削除の記録（(resource, record_id) の行）の結果."""
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def compiled(call) -> str:
+    """execute に渡された SQL を PostgreSQL 方言でコンパイル."""
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+class TestSyncToken:
+    """同期トークンのテストケース."""
+
+    def test_round_trip(self) -> None:
+        """トークンは URL でそのまま使え、同期の位置に戻せる."""
+        position = SyncPosition(xmin=754321, synced_at=NOW)
+        token = encode_sync_token(position)
+
+        assert "=" not in token and "+" not in token and "/" not in token
+        assert decode_sync_token(token) == position
+
+    def test_legacy_token_resets(self) -> None:
+        """同期日時だけの以前の形式のトークンは全件の再同期（None）."""
+        legacy = base64.urlsafe_b64encode(NOW.isoformat().encode()).decode()
+
+        assert decode_sync_token(legacy.rstrip("=")) is None
+
+    @pytest.mark.parametrize(
+        "raw",
+        ["not-a-token!", "1@2026-10-19T12:00:00", "-1@" + NOW.isoformat(), "x@y"],
+    )
+    def test_invalid_token(self, raw: str) -> None:
+        """壊れたトークン・タイムゾーンのない日時・負の ID は不正."""
+        token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+        with pytest.raises(ValidationException):
+            decode_sync_token(token if raw != "not-a-token!" else raw)
+
+
+class TestSyncServiceGetChanges:
+    """SyncService.get_changes() のテストケース."""
+
+    async def test_initial_sync_returns_live_rows(self) -> None:
+        """トークンなしでは論理削除されていない全行を返し、reset を True にする."""
+        vehicle = Vehicle(id=UUID(int=1), user_id=TEST_USER_ID, name="車", seq=1)
+        session = AsyncMock()
+        session.execute.side_effect = [
+            position_result(100, NOW),
+            *(
+                scalars_result([vehicle] if model is Vehicle else [])
+                for model in SYNC_MODELS.values()
+            ),
+        ]
+
+        changes = await SyncService(session).get_changes(TEST_USER_ID)
+
+        assert changes.reset is True
+        assert decode_sync_token(changes.token) == SyncPosition(xmin=100, synced_at=NOW)
+        assert changes.changed["vehicles"] == [vehicle]
+        assert all(not ids for ids in changes.deleted.values())
+        # 行を読む前にスナップショットの xmin とデータベースの時刻を取得する
+        position_sql = compiled(session.execute.call_args_list[0])
+        assert "pg_snapshot_xmin(pg_current_snapshot())" in position_sql
+        assert "now()" in position_sql
+        # 物理削除の記録は読まない
+        assert session.execute.await_count == len(SYNC_MODELS) + 1
+        vehicle_sql = compiled(session.execute.call_args_list[2])
+        assert "vehicle.deleted_at IS NULL" in vehicle_sql
+        assert "sync_xid" not in vehicle_sql
+        note_sql = compiled(session.execute.call_args_list[4])
+        assert "deleted_at" not in note_sql.split("WHERE")[1]
+
+    async def test_incremental_sync(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """トークン以降のトランザクションの変更を返し、削除は deleted に ID を返す."""
+        monkeypatch.setattr(
+            "app.services.sync_service.get_settings",
+            lambda: MagicMock(ARCHIVE_RETENTION_DAYS=90),
+        )
+        since = SyncPosition(xmin=90, synced_at=NOW - timedelta(hours=1))
+        live = Vehicle(id=UUID(int=1), user_id=TEST_USER_ID, name="車", seq=1)
+        removed = Vehicle(
+            id=UUID(int=2), user_id=TEST_USER_ID, name="旧車", seq=2, deleted_at=NOW
+        )
+        note = Note(id=UUID(int=3), user_id=TEST_USER_ID, title="メモ", body="本文")
+        results = {
+            Vehicle: scalars_result([live, removed]),
+            Note: scalars_result([note]),
+        }
+        session = AsyncMock()
+        session.execute.side_effect = [
+            position_result(120, NOW),
+            *(results.get(model, scalars_result([])) for model in SYNC_MODELS.values()),
+            tombstones_result([("note", UUID(int=4)), ("task", UUID(int=5))]),
+        ]
+
+        changes = await SyncService(session).get_changes(TEST_USER_ID, since)
+
+        assert changes.reset is False
+        assert decode_sync_token(changes.token) == SyncPosition(xmin=120, synced_at=NOW)
+        assert changes.changed["vehicles"] == [live]
+        assert changes.changed["notes"] == [note]
+        assert changes.deleted["vehicles"] == [UUID(int=2)]
+        assert changes.deleted["notes"] == [UUID(int=4)]
+        assert changes.deleted["tasks"] == [UUID(int=5)]
+
+        calls = session.execute.call_args_list
+        task_sql = compiled(calls[1])
+        assert "task.user_id = %(user_id_1)s::UUID" in task_sql
+        # 時計ではなく、前回の xmin 以降のトランザクションで書き込まれた行を取得する
+        assert "task.sync_xid >= %(task_sync_xid_1)s" in task_sql
+        assert calls[1].args[0].compile().params["task_sync_xid_1"] == 90
+        assert task_sql.endswith("ORDER BY task.updated_at, task.id")
+        assert "sync_tombstone.sync_xid >=" in compiled(calls[-1])
+
+    async def test_live_row_wins_over_tombstone(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """同じ ID で作り直された行は、削除の記録があっても changed にだけ返す."""
+        monkeypatch.setattr(
+            "app.services.sync_service.get_settings",
+            lambda: MagicMock(ARCHIVE_RETENTION_DAYS=90),
+        )
+        occurrence = Task(id=UUID(int=7), user_id=TEST_USER_ID, title="ゴミ出し")
+        session = AsyncMock()
+        session.execute.side_effect = [
+            position_result(120, NOW),
+            *(
+                scalars_result([occurrence] if model is Task else [])
+                for model in SYNC_MODELS.values()
+            ),
+            tombstones_result([("task", UUID(int=7)), ("task", UUID(int=8))]),
+        ]
+
+        changes = await SyncService(session).get_changes(
+            TEST_USER_ID, SyncPosition(xmin=90, synced_at=NOW - timedelta(hours=1))
+        )
+
+        assert changes.changed["tasks"] == [occurrence]
+        assert changes.deleted["tasks"] == [UUID(int=8)]
+
+    async def test_expired_token_resets(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """データベースの時刻で保管期間より古いトークンでは全件を返す."""
+        monkeypatch.setattr(
+            "app.services.sync_service.get_settings",
+            lambda: MagicMock(ARCHIVE_RETENTION_DAYS=30),
+        )
+        session = AsyncMock()
+        session.execute.side_effect = [
+            position_result(500, NOW),
+            *(scalars_result([]) for _ in SYNC_MODELS),
+        ]
+
+        changes = await SyncService(session).get_changes(
+            TEST_USER_ID, SyncPosition(xmin=400, synced_at=NOW - timedelta(days=31))
+        )
+
+        assert changes.reset is True
+        assert session.execute.await_count == len(SYNC_MODELS) + 1
+
+
+async def test_prune_tombstones() -> None:
+    """保管期間を過ぎた物理削除の記録を削除してコミットする."""
+    result = MagicMock()
+    result.rowcount = 3
+    session = AsyncMock()
+    session.execute.return_value = result
+
+    pruned = await SyncService(session).prune_tombstones(NOW)
+
+    assert pruned == 3
+    assert compiled(session.execute.call_args).startswith(
+        "DELETE FROM sync_tombstone WHERE sync_tombstone.deleted_at <"
+    )
+    session.commit.assert_awaited_once()
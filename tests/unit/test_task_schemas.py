@@ -187,3 +187,32 @@ class TestTaskValidationEdgeCases:
         """TaskUpdate で title が None の場合、バリデーション成功."""
         task_data = TaskUpdate(title=None)
         assert task_data.title is None
+
+
+class TestTaskRecurrenceSchema:
+    """繰り返しルールのバリデーションテスト."""
+
+    def test_task_create_recurrence_rule_normalized(self) -> None:
+        """recurrence_rule は正規化して保持."""
+        task_data = TaskCreate(
+            title="ゴミ出し",
+            due_date=date(2026, 10, 19),
+            recurrence_rule="rrule:freq=weekly;byday=th,mo",
+        )
+        assert task_data.recurrence_rule == "FREQ=WEEKLY;BYDAY=MO,TH"
+
+    def test_task_create_recurrence_rule_requires_due_date(self) -> None:
+        """繰り返しタスクは開始日となる期日が必須."""
+        with pytest.raises(ValidationError):
+            TaskCreate(title="ゴミ出し", recurrence_rule="FREQ=DAILY")
+
+    def test_task_update_invalid_recurrence_rule(self) -> None:
+        """未対応のルールはバリデーションエラー."""
+        with pytest.raises(ValidationError):
+            TaskUpdate(recurrence_rule="FREQ=HOURLY")
+
+    def test_task_update_recurrence_rule_null_clears(self) -> None:
+        """recurrence_rule の null 指定は解除として扱う."""
+        task_data = TaskUpdate(recurrence_rule=None)
+        assert task_data.model_dump(exclude_unset=True) == {"recurrence_rule": None}
+
@@ -2,14 +2,16 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from uuid import UUID
-from datetime import date, timedelta
+from uuid import UUID, uuid5
+from datetime import date, datetime, timedelta
 from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
 
+from app.models.base import JST
 from app.models.task import Task
 from app.schemas.task import TaskCreate, TaskUpdate
-from app.services.task_service import TaskService
-from app.utils.exceptions import NotFoundException
+from app.services.task_service import TASK_ROW_COLUMNS, TaskRow, TaskService
+from app.utils.exceptions import NotFoundException, ValidationException
 
 # テスト用ユーザー ID（固定値）
 TEST_USER_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
@@ -30,6 +32,11 @@ def create_mock_result(data: list) -> MagicMock:
     return mock_result
 
 
+def list_results(tasks: list) -> list:
+    """list_tasks の execute 結果（繰り返しシリーズなし → 通常のタスク）."""
+    return [create_mock_result([]), create_mock_result(tasks)]
+
+
 class TestTaskServiceListTasks:
     """TaskService.list_tasks() のテストケース."""
 
@@ -41,7 +48,7 @@ class TestTaskServiceListTasks:
     async def test_list_tasks_empty(self, mock_db_session) -> None:
         """タスクが存在しない場合、空リストを返す."""
         # モック設定: 空の結果
-        mock_db_session.execute = AsyncMock(return_value=create_mock_result([]))
+        mock_db_session.execute = AsyncMock(side_effect=list_results([]))
 
         # テスト実行
         service = TaskService(mock_db_session)
@@ -49,7 +56,7 @@ class TestTaskServiceListTasks:
 
         # 検証
         assert tasks == []
-        mock_db_session.execute.assert_called_once()
+        assert mock_db_session.execute.await_count == 2
 
     async def test_list_tasks_with_multiple_tasks(self, mock_db_session) -> None:
         """複数のタスクが存在する場合、タスクリストを返す."""
@@ -63,7 +70,7 @@ class TestTaskServiceListTasks:
         task2.title = "タスク2"
 
         # モック設定
-        mock_db_session.execute = AsyncMock(return_value=create_mock_result([task1, task2]))
+        mock_db_session.execute = AsyncMock(side_effect=list_results([task1, task2]))
 
         # テスト実行
         service = TaskService(mock_db_session)
@@ -93,7 +100,7 @@ class TestTaskServiceListTasks:
 
         # モック設定: nulls_last でソートされた順序で返す
         mock_db_session.execute = AsyncMock(
-            return_value=create_mock_result([task_earliest, task_middle, task_latest])
+            side_effect=list_results([task_earliest, task_middle, task_latest])
         )
 
         # テスト実行
@@ -123,7 +130,7 @@ class TestTaskServiceListTasks:
 
         # モック設定: nulls_last で期日ありが最初、期日なしが後
         mock_db_session.execute = AsyncMock(
-            return_value=create_mock_result([task_with_due, task_without_due])
+            side_effect=list_results([task_with_due, task_without_due])
         )
 
         # テスト実行
@@ -147,7 +154,7 @@ class TestTaskServiceListTasks:
 
         # モック設定: 未完了のみ返す
         mock_db_session.execute = AsyncMock(
-            return_value=create_mock_result([task_incomplete])
+            side_effect=list_results([task_incomplete])
         )
 
         # テスト実行
@@ -197,7 +204,7 @@ class TestTaskServiceListTasks:
 
         # モック設定: 全タスク返す
         mock_db_session.execute = AsyncMock(
-            return_value=create_mock_result([task_complete, task_incomplete])
+            side_effect=list_results([task_complete, task_incomplete])
         )
 
         # テスト実行
@@ -208,6 +215,177 @@ class TestTaskServiceListTasks:
         assert len(tasks) == 2
 
 
+class TestTaskServiceListTasksFilters:
+    """TaskService.list_tasks() の期日・完了日時・テキスト検索フィルタのテストケース."""
+
+    @pytest.fixture
+    def mock_db_session(self):
+        """モック DB セッション."""
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=create_mock_result([]))
+        return session
+
+    @staticmethod
+    async def compiled_where(mock_db_session, **filters) -> str:
+        """list_tasks が組み立てた SQL の WHERE 句を返す."""
+        await TaskService(mock_db_session).list_tasks(
+            TEST_USER_ID, today=date(2026, 10, 19), **filters
+        )
+        stmt = mock_db_session.execute.call_args.args[0]
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        return sql.split("WHERE", 1)[1].split("ORDER BY", 1)[0]
+
+    async def test_due_date_range_is_inclusive(self, mock_db_session) -> None:
+        """due_before / due_after は両端を含む範囲で絞り込む."""
+        where = await self.compiled_where(
+            mock_db_session,
+            due_after=date(2026, 10, 19),
+            due_before=date(2026, 10, 25),
+        )
+
+        assert "task.due_date <= '2026-10-25'" in where
+        assert "task.due_date >= '2026-10-19'" in where
+
+    async def test_overdue_true(self, mock_db_session) -> None:
+        """overdue=True は未完了かつ期日が基準日より前のタスク."""
+        where = await self.compiled_where(mock_db_session, overdue=True)
+
+        assert "task.is_completed = false" in where
+        assert "task.due_date < '2026-10-19'" in where
+
+    async def test_overdue_false_keeps_undated_tasks(self, mock_db_session) -> None:
+        """overdue=False は期日なしのタスクも含める."""
+        where = await self.compiled_where(mock_db_session, overdue=False)
+
+        assert "task.is_completed IS true" in where
+        assert "task.due_date IS NULL" in where
+        assert "task.due_date >= '2026-10-19'" in where
+
+    async def test_completed_since(self, mock_db_session) -> None:
+        """completed_since は完了日時で絞り込む."""
+        where = await self.compiled_where(
+            mock_db_session, completed_since=datetime(2026, 10, 1, tzinfo=JST)
+        )
+
+        assert "task.completed_at >= '2026-10-01 00:00:00+09:00'" in where
+
+    async def test_text_query_matches_title_or_description(
+        self, mock_db_session
+    ) -> None:
+        """q はタイトルまたは説明の部分一致（LIKE の特殊文字はエスケープ）."""
+        where = await self.compiled_where(mock_db_session, q="50%_off")
+
+        assert "task.title ILIKE" in where
+        assert "task.description ILIKE" in where
+        assert "50/%%/_off" in where
+        assert " OR " in where
+
+    async def test_no_filters_adds_no_conditions(self, mock_db_session) -> None:
+        """フィルタ未指定時はユーザーと論理削除の条件のみ."""
+        where = await self.compiled_where(mock_db_session)
+
+        assert "due_date" not in where
+        assert "completed_at" not in where
+        assert "ILIKE" not in where
+
+
+class TestTaskServiceListTaskRows:
+    """TaskService.list_task_rows() のテストケース."""
+
+    @staticmethod
+    def rows_result(tasks: list) -> MagicMock:
+        """TASK_ROW_COLUMNS を select した結果（列の値のタプル）."""
+        result = MagicMock()
+        result.all.return_value = [
+            tuple(getattr(task, column.key) for column in TASK_ROW_COLUMNS)
+            for task in tasks
+        ]
+        return result
+
+    async def test_selects_response_columns_only(self) -> None:
+        """レスポンスの列だけを取得し、行を TaskRow にする."""
+        task = Task(
+            user_id=TEST_USER_ID,
+            title="牛乳を買う",
+            due_date=date(2026, 10, 20),
+            created_at=datetime(2026, 10, 2, tzinfo=JST),
+            updated_at=datetime(2026, 10, 2, tzinfo=JST),
+        )
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[self.rows_result([task])])
+
+        rows = await TaskService(session).list_task_rows(
+            TEST_USER_ID, is_completed=True
+        )
+
+        assert rows == [
+            TaskRow(
+                id=task.id,
+                user_id=TEST_USER_ID,
+                title="牛乳を買う",
+                description=None,
+                is_completed=False,
+                completed_at=None,
+                due_date=date(2026, 10, 20),
+                order=0,
+                created_at=datetime(2026, 10, 2, tzinfo=JST),
+                updated_at=datetime(2026, 10, 2, tzinfo=JST),
+                recurrence_rule=None,
+                recurrence_parent_id=None,
+                occurrence_date=None,
+            )
+        ]
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        select_list = sql.split("FROM")[0]
+        assert "task.deleted_at" not in select_list
+        assert select_list.count("task.") == len(TASK_ROW_COLUMNS)
+
+    async def test_occurrences_are_merged_as_rows(self) -> None:
+        """展開した発生分も TaskRow として同じ並び順に合流する."""
+        series = Task(
+            id=UUID("44444444-4444-4444-4444-444444444444"),
+            user_id=TEST_USER_ID,
+            title="ゴミ出し",
+            due_date=date(2026, 10, 5),
+            recurrence_rule="FREQ=WEEKLY;BYDAY=MO",
+            created_at=datetime(2026, 10, 1, tzinfo=JST),
+            updated_at=datetime(2026, 10, 1, tzinfo=JST),
+        )
+        undated = Task(
+            user_id=TEST_USER_ID,
+            title="期日なしタスク",
+            created_at=datetime(2026, 10, 3, tzinfo=JST),
+            updated_at=datetime(2026, 10, 3, tzinfo=JST),
+        )
+        materialized = MagicMock()
+        materialized.all.return_value = []
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                create_mock_result([series]),
+                materialized,
+                self.rows_result([undated]),
+            ]
+        )
+
+        rows = await TaskService(session).list_task_rows(
+            TEST_USER_ID, today=date(2026, 10, 19), recurrence_horizon_days=7
+        )
+
+        assert all(isinstance(row, TaskRow) for row in rows)
+        assert [(row.title, row.due_date) for row in rows] == [
+            ("ゴミ出し", date(2026, 10, 19)),
+            ("ゴミ出し", date(2026, 10, 26)),
+            ("期日なしタスク", None),
+        ]
+        assert rows[0].recurrence_parent_id == series.id
+
+
 class TestTaskServiceCreateTask:
     """TaskService.create_task() のテストケース."""
 
@@ -445,3 +623,318 @@ class TestTaskServiceUpdateTask:
         assert result.title == "買い物"  # 変更されていない
         mock_db_session.add.assert_called_once()
         mock_db_session.commit.assert_called_once()
+
+
+class TestTaskServiceRecurringTasks:
+    """繰り返しタスクの展開と発生分の保存のテストケース."""
+
+    SERIES_ID = UUID("44444444-4444-4444-4444-444444444444")
+    TODAY = date(2026, 10, 19)  # 月曜日
+
+    @pytest.fixture
+    def series(self) -> Task:
+        """毎週月曜日の繰り返しシリーズ."""
+        return Task(
+            id=self.SERIES_ID,
+            user_id=TEST_USER_ID,
+            title="ゴミ出し",
+            due_date=date(2026, 10, 5),
+            recurrence_rule="FREQ=WEEKLY;BYDAY=MO",
+            created_at=datetime(2026, 10, 1, tzinfo=JST),
+            updated_at=datetime(2026, 10, 1, tzinfo=JST),
+        )
+
+    @staticmethod
+    def create_session(*results: MagicMock) -> AsyncMock:
+        """execute が順に results を返すセッション."""
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=list(results))
+        session.add = MagicMock()
+        return session
+
+    @staticmethod
+    def materialized_result(rows: list) -> MagicMock:
+        """保存済み発生日の結果（(recurrence_parent_id, occurrence_date) の行）."""
+        result = MagicMock()
+        result.all.return_value = rows
+        return result
+
+    @staticmethod
+    def one_or_none_result(task) -> MagicMock:
+        """scalars().one_or_none() の結果."""
+        result = MagicMock()
+        result.scalars.return_value.one_or_none.return_value = task
+        return result
+
+    def regular_tasks(self) -> list:
+        """期日ありと期日なしの通常タスク."""
+        dated = Task(
+            user_id=TEST_USER_ID,
+            title="期日ありタスク",
+            due_date=date(2026, 10, 20),
+            created_at=datetime(2026, 10, 2, tzinfo=JST),
+        )
+        undated = Task(
+            user_id=TEST_USER_ID,
+            title="期日なしタスク",
+            created_at=datetime(2026, 10, 3, tzinfo=JST),
+        )
+        return [dated, undated]
+
+    async def test_occurrences_are_merged_in_list_order(self, series) -> None:
+        """展開した発生分を期日順に合流し、保存済みの発生日は展開しない."""
+        session = self.create_session(
+            create_mock_result([series]),
+            self.materialized_result([(self.SERIES_ID, date(2026, 10, 19))]),
+            create_mock_result(self.regular_tasks()),
+        )
+
+        tasks = await TaskService(session).list_tasks(
+            TEST_USER_ID, today=self.TODAY, recurrence_horizon_days=14
+        )
+
+        assert [(task.title, task.due_date) for task in tasks] == [
+            ("期日ありタスク", date(2026, 10, 20)),
+            ("ゴミ出し", date(2026, 10, 26)),
+            ("ゴミ出し", date(2026, 11, 2)),
+            ("期日なしタスク", None),
+        ]
+        occurrence = tasks[1]
+        assert occurrence.id == uuid5(self.SERIES_ID, "2026-10-26")
+        assert occurrence.recurrence_parent_id == self.SERIES_ID
+        assert occurrence.occurrence_date == date(2026, 10, 26)
+        assert occurrence.is_completed is False
+
+        regular_sql = str(
+            session.execute.call_args.args[0].compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        assert "task.recurrence_rule IS NULL" in regular_sql
+        assert "OFFSET" not in regular_sql
+
+    async def test_pagination_is_applied_after_merge(self, series) -> None:
+        """skip / limit は合流後に適用し、通常タスクは skip + limit 件だけ取得."""
+        session = self.create_session(
+            create_mock_result([series]),
+            self.materialized_result([]),
+            create_mock_result(self.regular_tasks()),
+        )
+
+        tasks = await TaskService(session).list_tasks(
+            TEST_USER_ID,
+            skip=1,
+            limit=2,
+            today=self.TODAY,
+            recurrence_horizon_days=14,
+        )
+
+        assert [task.due_date for task in tasks] == [
+            date(2026, 10, 20),
+            date(2026, 10, 26),
+        ]
+        regular_sql = str(
+            session.execute.call_args.args[0].compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        assert regular_sql.rstrip().endswith("LIMIT 3")
+
+    async def test_completed_only_does_not_expand(self) -> None:
+        """完了済みのみの一覧では繰り返しシリーズを取得しない."""
+        session = self.create_session(create_mock_result([]))
+
+        await TaskService(session).list_tasks(
+            TEST_USER_ID, is_completed=True, today=self.TODAY
+        )
+
+        session.execute.assert_awaited_once()
+
+    async def test_update_occurrence_materializes_row(self, series) -> None:
+        """未保存の発生分を完了すると、展開時と同じ ID の行を保存する."""
+        session = self.create_session(
+            self.one_or_none_result(series),
+            self.one_or_none_result(None),
+            MagicMock(),
+        )
+
+        task = await TaskService(session).update_occurrence(
+            self.SERIES_ID,
+            date(2026, 10, 26),
+            TaskUpdate(is_completed=True),
+            TEST_USER_ID,
+        )
+
+        assert task.id == uuid5(self.SERIES_ID, "2026-10-26")
+        assert task.recurrence_parent_id == self.SERIES_ID
+        assert task.is_completed is True
+        assert task.completed_at is not None
+        session.add.assert_called_once_with(task)
+        session.commit.assert_awaited_once()
+
+    async def test_update_occurrence_rejects_non_occurrence_date(self, series) -> None:
+        """発生日でない日付は 404."""
+        session = self.create_session(
+            self.one_or_none_result(series), self.one_or_none_result(None)
+        )
+
+        with pytest.raises(NotFoundException):
+            await TaskService(session).update_occurrence(
+                self.SERIES_ID,
+                date(2026, 10, 27),
+                TaskUpdate(is_completed=True),
+                TEST_USER_ID,
+            )
+
+        session.commit.assert_not_called()
+
+    async def test_skip_occurrence_saves_deleted_row(self, series) -> None:
+        """スキップは論理削除した発生分の行として保存する."""
+        session = self.create_session(
+            self.one_or_none_result(series),
+            self.one_or_none_result(None),
+            MagicMock(),
+        )
+
+        await TaskService(session).skip_occurrence(
+            self.SERIES_ID, date(2026, 10, 26), TEST_USER_ID
+        )
+
+        skipped = session.add.call_args.args[0]
+        assert skipped.occurrence_date == date(2026, 10, 26)
+        assert skipped.deleted_at is not None
+        session.commit.assert_awaited_once()
+
+    @staticmethod
+    def ids_result(*ids: UUID) -> MagicMock:
+        """scalars().all() が ids を返す結果."""
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(ids)
+        return result
+
+    @staticmethod
+    def tombstone_ids(session: AsyncMock) -> list[UUID]:
+        """execute した sync_tombstone の upsert の record_id（記録した順）."""
+        ids = []
+        for call in session.execute.call_args_list:
+            compiled = call.args[0].compile(dialect=postgresql.dialect())
+            if str(compiled).startswith("INSERT INTO sync_tombstone"):
+                assert "ON CONFLICT (resource, record_id) DO UPDATE" in str(compiled)
+                ids += [
+                    value
+                    for key, value in compiled.params.items()
+                    if key.startswith("record_id")
+                ]
+        return ids
+
+    async def test_removing_rule_detaches_occurrences(self, series) -> None:
+        """繰り返しを解除すると保存済みの発生分を新しい ID の通常のタスクとして残す."""
+        completed_id = uuid5(self.SERIES_ID, "2026-10-19")
+        session = self.create_session(
+            self.one_or_none_result(series),
+            self.ids_result(),
+            self.ids_result(completed_id),
+            MagicMock(),
+            MagicMock(),
+        )
+
+        task = await TaskService(session).update_task(
+            self.SERIES_ID, TaskUpdate(recurrence_rule=None), TEST_USER_ID
+        )
+
+        assert task.recurrence_rule is None
+        statements = [
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in session.execute.call_args_list[1:]
+        ]
+        assert statements[0].startswith("DELETE FROM task")
+        assert statements[1].startswith("SELECT task.id")
+        assert statements[3].startswith("UPDATE task SET")
+        assert "id=uuid_generate_v4()" in statements[3]
+        assert "recurrence_parent_id=" in statements[3]
+        assert "updated_at=" in statements[3]
+        # 元の ID は差分同期で削除として返す
+        assert self.tombstone_ids(session) == [completed_id]
+
+    async def test_deleting_series_records_tombstones(self, series) -> None:
+        """シリーズと削除したスキップの記録を差分同期用に記録する."""
+        skipped_id = UUID("55555555-5555-5555-5555-555555555555")
+        completed_id = uuid5(self.SERIES_ID, "2026-10-19")
+        session = self.create_session(
+            self.one_or_none_result(series),
+            self.ids_result(skipped_id),
+            self.ids_result(completed_id),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+        )
+
+        await TaskService(session).delete_task(self.SERIES_ID, TEST_USER_ID)
+
+        delete_sql = str(
+            session.execute.call_args_list[1].args[0].compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert delete_sql.endswith("RETURNING task.id")
+        session.delete.assert_awaited_once_with(series)
+        assert self.tombstone_ids(session) == [
+            skipped_id,
+            completed_id,
+            self.SERIES_ID,
+        ]
+        session.commit.assert_awaited_once()
+
+    async def test_detaching_same_series_twice(self, series) -> None:
+        """繰り返しを戻して同じ発生分を保存し、再び切り離しても記録は上書きする."""
+        completed_id = uuid5(self.SERIES_ID, "2026-10-19")
+        session = self.create_session(
+            self.ids_result(),
+            self.ids_result(completed_id),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            self.ids_result(),
+            self.ids_result(completed_id),
+            MagicMock(),
+            MagicMock(),
+        )
+        service = TaskService(session)
+
+        await service._detach_occurrences(series)
+        # 同じ発生日の発生分を再び保存すると、その ID の削除の記録を消す
+        await service._save_occurrence(
+            Task(
+                id=completed_id,
+                user_id=TEST_USER_ID,
+                title="ゴミ出し",
+                recurrence_parent_id=self.SERIES_ID,
+                occurrence_date=date(2026, 10, 19),
+            )
+        )
+        await service._detach_occurrences(series)
+
+        clear_sql = str(
+            session.execute.call_args_list[4].args[0].compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert clear_sql.startswith("DELETE FROM sync_tombstone")
+        assert "sync_tombstone.record_id IN" in clear_sql
+        # 同じ (resource, record_id) を 2 回記録しても主キーの重複にならない
+        assert self.tombstone_ids(session) == [completed_id, completed_id]
+
+    async def test_rule_requires_due_date(self) -> None:
+        """期日のないタスクに繰り返しは設定できない."""
+        task = Task(id=self.SERIES_ID, user_id=TEST_USER_ID, title="期日なし")
+        session = self.create_session(self.one_or_none_result(task))
+
+        with pytest.raises(ValidationException):
+            await TaskService(session).update_task(
+                self.SERIES_ID,
+                TaskUpdate(recurrence_rule="FREQ=DAILY"),
+                TEST_USER_ID,
+            )
+
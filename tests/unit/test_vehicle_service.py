@@ -1,14 +1,20 @@
 """Vehicle（車）サービス単体テスト."""
 
+from collections import namedtuple
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.models.vehicle import Vehicle
 from app.schemas.vehicle import VehicleCreate, VehicleUpdate
-from app.services.vehicle_service import VehicleService
+from app.services.vehicle_service import (
+    VEHICLE_ROW_COLUMNS,
+    VehicleRow,
+    VehicleService,
+)
 from app.utils.exceptions import NotFoundException
 
 JST = timezone(timedelta(hours=9))
@@ -22,57 +28,139 @@ def mock_db_session() -> AsyncMock:
     return AsyncMock()
 
 
-class TestVehicleServiceListVehicles:
-    """list_vehicles メソッドテスト."""
+class TestVehicleServiceListVehicleRows:
+    """list_vehicle_rows メソッドテスト."""
+
+    # VEHICLE_ROW_COLUMNS と最新給油・最新の満タン給油の区間の列を select した行
+    Row = namedtuple(
+        "Row",
+        [column.key for column in VEHICLE_ROW_COLUMNS]
+        + [
+            "total_mileage",
+            "refuel_datetime",
+            "full_tanks_before",
+            "interval_distance",
+            "interval_centilitres",
+            "interval_unknown",
+        ],
+    )
+
+    def row(self, **fuel: object) -> tuple:
+        """車 1 台分の行."""
+        created_at = datetime(2026, 10, 1, tzinfo=JST)
+        return self.Row(
+            id=TEST_VEHICLE_ID,
+            user_id=TEST_USER_ID,
+            name="マイカー1",
+            seq=1,
+            maker="Toyota",
+            model="Prius",
+            year=None,
+            number=None,
+            tank_capacity=43.0,
+            created_at=created_at,
+            updated_at=created_at,
+            total_mileage=fuel.get("total_mileage"),
+            refuel_datetime=fuel.get("refuel_datetime"),
+            full_tanks_before=fuel.get("full_tanks_before"),
+            interval_distance=fuel.get("interval_distance"),
+            interval_centilitres=fuel.get("interval_centilitres"),
+            interval_unknown=fuel.get("interval_unknown"),
+        )
 
     @pytest.mark.asyncio
-    async def test_list_vehicles_empty(self, mock_db_session: AsyncMock) -> None:
-        """車一覧が空の場合."""
-        # モック設定
+    async def test_selects_response_columns_only(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """レスポンスの列だけを取得し、日時は VehicleResponse と同じ文字列にする."""
         mock_result = MagicMock()
-        mock_result.scalars().all.return_value = []
+        mock_result.all.return_value = [self.row()]
         mock_db_session.execute.return_value = mock_result
 
         service = VehicleService(mock_db_session)
-        vehicles = await service.list_vehicles(TEST_USER_ID)
+        rows = await service.list_vehicle_rows(TEST_USER_ID)
+
+        assert rows == [
+            VehicleRow(
+                id=TEST_VEHICLE_ID,
+                user_id=TEST_USER_ID,
+                name="マイカー1",
+                seq=1,
+                maker="Toyota",
+                model="Prius",
+                year=None,
+                number=None,
+                tank_capacity=43.0,
+                created_at="2026-10-01T00:00:00+09:00",
+                updated_at="2026-10-01T00:00:00+09:00",
+            )
+        ]
+        stmt = mock_db_session.execute.call_args.args[0]
+        select_list = str(stmt.compile(dialect=postgresql.dialect())).split("FROM")[0]
+        assert "vehicle.deleted_at" not in select_list
+        assert "LATERAL" not in str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_includes_fuel_summary(self, mock_db_session: AsyncMock) -> None:
+        """include_fuel_summary=True で最新給油サマリーを同じクエリで取得する."""
+        now = datetime.now(JST)
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            self.row(
+                total_mileage=10500,
+                refuel_datetime=now,
+                full_tanks_before=1,
+                interval_distance=500,
+                interval_centilitres=4000,
+                interval_unknown=0,
+            ),
+            self.row(),
+        ]
+        mock_db_session.execute.return_value = mock_result
 
-        assert vehicles == []
+        service = VehicleService(mock_db_session)
+        rows = await service.list_vehicle_rows(TEST_USER_ID, include_fuel_summary=True)
+
+        assert rows[0].fuel_summary.latest_mileage == 10500
+        assert rows[0].fuel_summary.last_refuel_datetime == now
+        # 500km / 40L
+        assert rows[0].fuel_summary.recent_fuel_efficiency == 12.5
+        assert rows[1].fuel_summary is None
+        stmt = mock_db_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "LEFT OUTER JOIN LATERAL" in sql
+        assert "ORDER BY fuel_record.refuel_datetime DESC" in sql
+        # 直近燃費は燃費記録一覧と同じ満タン法の区間の集計から求める
+        assert "SELECT DISTINCT ON (intervals.vehicle_id)" in sql
+        assert "WHERE intervals.is_full_tank" in sql
+        assert "ON latest_full_tank.vehicle_id = vehicle.id" in sql
+        mock_db_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_list_vehicles_with_multiple_vehicles(
+    async def test_recent_efficiency_needs_complete_interval(
         self, mock_db_session: AsyncMock
     ) -> None:
-        """複数の車がある場合."""
-        # テスト用車データ
-        vehicle1 = Vehicle(
-            id=UUID("550e8400-e29b-41d4-a716-446655440001"),
-            user_id=TEST_USER_ID,
-            name="マイカー1",
-            maker="Toyota",
-            model="Prius",
-            created_at=datetime.now(JST),
-            updated_at=datetime.now(JST),
-        )
-        vehicle2 = Vehicle(
-            id=UUID("550e8400-e29b-41d4-a716-446655440002"),
-            user_id=TEST_USER_ID,
-            name="マイカー2",
-            maker="Honda",
-            model="Fit",
-            created_at=datetime.now(JST),
-            updated_at=datetime.now(JST),
-        )
-
+        """満タン給油が 1 回だけ・区間に給油量が不明な記録がある場合は None."""
+        fuel = {
+            "total_mileage": 10500,
+            "refuel_datetime": datetime.now(JST),
+            "interval_distance": 500,
+            "interval_centilitres": 4000,
+        }
         mock_result = MagicMock()
-        mock_result.scalars().all.return_value = [vehicle1, vehicle2]
+        mock_result.all.return_value = [
+            self.row(**fuel, full_tanks_before=0, interval_unknown=0),
+            self.row(**fuel, full_tanks_before=3, interval_unknown=1),
+        ]
         mock_db_session.execute.return_value = mock_result
 
         service = VehicleService(mock_db_session)
-        vehicles = await service.list_vehicles(TEST_USER_ID)
+        rows = await service.list_vehicle_rows(TEST_USER_ID, include_fuel_summary=True)
 
-        assert len(vehicles) == 2
-        assert vehicles[0].name == "マイカー1"
-        assert vehicles[1].name == "マイカー2"
+        assert [row.fuel_summary.recent_fuel_efficiency for row in rows] == [
+            None,
+            None,
+        ]
 
 
 class TestVehicleServiceGetVehicle: